@@ -9,14 +9,47 @@ Kullanım:
     python RMVC-csv.py
     veya
     python RMVC-csv.py dosya.csv
+    veya (bellekten büyük CSV dosyaları için iki geçişli akış modu)
+    python RMVC-csv.py dosya.csv --stream --chunksize 5000 --output matris.csv
+    veya (rmvc_dataset.py ile dönüştürülmüş ikili veri seti)
+    python RMVC-csv.py veri.rmvcd
+    veya (dizindeki / glob desenine uyan tüm dosyalar, süreç havuzunda)
+    python RMVC-csv.py --batch "exports/*.csv" --batch-output sonuclar --workers 8
 """
 
+import argparse
+import logging
+import numpy as np
 import pandas as pd
 from fractions import Fraction
 from io import StringIO
 import sys
 import os
 
+from rmvc_batch import collect_inputs, run_batch
+from rmvc_cache import content_hash, path_fingerprint
+from rmvc_dataset import is_dataset, load_dataset, table_to_mask
+from rmvc_engine import (
+    SoftSetView,
+    build_incidence,
+    exact_scores,
+    incidence_from_mask,
+    plan_delta,
+    top_k_scores,
+)
+from rmvc_parallel import parallel_exact_scores
+from rmvc_profile import StageProfiler, format_report, reference_pair_checks
+from rmvc_profile import write_report as write_profile_report
+from rmvc_sensitivity import leave_one_element_out, leave_one_parameter_out
+from rmvc_store import is_result, load_result, prune_store, result_path, write_result
+from rmvc_stream import DEFAULT_CHUNKSIZE, stream_rmvc_csv
+from rmvc_threshold import rank_stability, sweep_summary, threshold_sweep
+from rmvc_variants import DEFAULT_BASELINE, ranking_diffs, variant_scores, variant_summary
+
+
+# Sonuç tablosunda gösterilen eleman sayısı (kesimdeki eşitlikler dahil edilir)
+ILK_K = 20
+
 
 def csv_to_soft_set(csv_data):
     """
@@ -29,7 +62,8 @@ def csv_to_soft_set(csv_data):
     
     Returns:
         U: Evren kümesi (tüm satır ID'leri)
-        E_named: Kriter kümeleri sözlüğü {e_1: {elemanlar}, e_2: {...}, ...}
+        E_named: Kriter kümeleri {e_1: {elemanlar}, e_2: {...}, ...}
+                 (rmvc_engine.SoftSetView - sözlük uyumlu tembel görünüm)
     """
     # CSV'yi DataFrame'e oku
     if isinstance(csv_data, str):
@@ -37,42 +71,27 @@ def csv_to_soft_set(csv_data):
     else:
         df = csv_data
     
-    # Satır ve sütun ID'lerini al
-    satir_ids = df.index.tolist()
-    sutun_ids = df.columns.tolist()
+    # Tablo tek adımda sayıya çevrilir; > 0 hücreleri insidans matrisini oluşturur
+    mask, _, sutun_ids, satir_ids, _ = table_to_mask(df)
     
     # U kümesi: Tüm satır ID'leri (string olarak)
-    U = set(str(sid) for sid in satir_ids)
+    elements = [str(sid) for sid in satir_ids]
+    U = set(elements)
     
-    # E kümeleri: Her sütun bir kriter kümesi
-    E_named = {}
-    for i, sutun_id in enumerate(sutun_ids):
-        e_key = f"e_{i+1}"
-        sutun_verisi = df[sutun_id]
-        
-        # Değeri > 0 olan satırları bu kümeye ekle
-        alt_kume = set()
-        for satir_id, deger in sutun_verisi.items():
-            try:
-                if pd.to_numeric(deger, errors='coerce') > 0:
-                    alt_kume.add(str(satir_id))
-            except:
-                pass
-        
-        E_named[e_key] = alt_kume
+    # E kümeleri: Her sütun bir kriter kümesi (Φ kümeleri erişildiğinde üretilir)
+    incidence = incidence_from_mask(mask, [f"e_{i+1}" for i in range(len(sutun_ids))], elements)
+    E_named = SoftSetView(incidence)
     
     # Eşleştirme bilgilerini yazdır
     print("\n" + "="*60)
     print("CSV -> SOFT SET DÖNÜŞÜMÜ")
     print("="*60)
     print(f"\n📊 Evren Kümesi U ({len(U)} eleman):")
-    print(f"   {sorted(U, key=lambda x: int(x) if x.isdigit() else x)}")
+    print(f"   {[incidence.elements[j] for j in incidence.element_order()]}")
     
     print(f"\n📋 Kriter Kümeleri E ({len(E_named)} kriter):")
-    for e_key, alt_kume in E_named.items():
-        sutun_idx = int(e_key.split('_')[1]) - 1
-        orijinal_ad = sutun_ids[sutun_idx]
-        print(f"   {e_key} (Sütun: {orijinal_ad}): {len(alt_kume)} eleman")
+    for e_key, orijinal_ad, boyut in zip(E_named, sutun_ids, incidence.set_sizes().tolist()):
+        print(f"   {e_key} (Sütun: {orijinal_ad}): {boyut} eleman")
     
     return U, E_named, satir_ids, sutun_ids
 
@@ -200,29 +219,101 @@ def print_results(membership_matrix, U, E_named, satir_ids, sutun_ids):
     return scores, best_choices
 
 
-def run_rmvc_from_csv(csv_source):
+def _kayitli_skorlar(anahtar, store_dir):
+    """
+    Sonuç deposunda (rmvc_store) anahtara ait artefakt varsa açar.
+    
+    Returns:
+        (artefakt yolu, StoredResult veya None); depo kapalıysa (None, None)
+    """
+    if not store_dir:
+        return None, None
+    yol = result_path(anahtar, store_dir)
+    if not is_result(yol):
+        return yol, None
+    print(f"\n💾 Kayıtlı sonuç açılıyor: {yol}")
+    return yol, load_result(yol)
+
+
+def _skorlari_kaydet(yol, exact, param_keys, param_names, options):
+    """
+    Skorları sonuç deposuna yazar; depo yazılamazsa yalnızca uyarır. Depo
+    boyut sınırını aşarsa en uzun süredir kullanılmayan sonuçlar silinir.
+    """
+    if yol is None:
+        return
+    try:
+        write_result(yol, exact, param_keys, param_names=param_names, options=options)
+        print(f"\n💾 Sonuç kaydedildi: {yol}")
+    except OSError as e:
+        print(f"\n⚠️  Sonuç kaydedilemedi: {e}")
+        return
+    silinen = prune_store(os.path.dirname(yol), keep=yol)
+    if silinen:
+        print(f"🧹 Depo boyut sınırı: {len(silinen)} eski sonuç silindi")
+
+
+def run_rmvc_from_csv(csv_source, rows_are_params=False, tam_matris=False, workers=1,
+                      memory_budget=None, store_dir=None, profiler=None):
     """
     CSV kaynağından RMVC analizi çalıştırır.
     
+    Varsayılan olarak üyelik matrisi oluşturulmaz: skorlar sütun toplamları
+    olarak biriktirilir ve ilk ILK_K eleman kısmi seçimle bulunur.
+    
     Args:
         csv_source: Dosya yolu (str) veya CSV içeriği (str)
+        rows_are_params: True ise satırlar=parametreler (dosya transpose edilir)
+        tam_matris: True ise tam üyelik matrisiyle (sözlük döngüleri) hesaplanır
+        workers: İşçi süreç sayısı (> 1 ise parametre satırları paralel hesaplanır)
+        memory_budget: Ara matris (C veya O) için bayt sınırı; aşılırsa bloklu hesap
+        store_dir: Sonuç deposu dizini; verilirse skorlar girdi özeti +
+                   seçeneklerle saklanır ve sonraki çalıştırmalarda açılır
+        profiler: rmvc_profile.StageProfiler; verilirse aşamalar ölçülür
     """
+    prof = profiler or StageProfiler(enabled=False)
+    yol = None
+    secenekler = dict(rows_are_params=rows_are_params, any_set=True, bos_filtrele=True)
+    # Depo kapalıyken girdi okunup özetlenmez; hızlı yolda fazladan G/Ç olmasın
+    if store_dir and not tam_matris:
+        with prof.stage("özet + depo araması"):
+            if os.path.isfile(csv_source):
+                with open(csv_source, 'rb') as f:
+                    kaynak = content_hash(f.read())
+            else:
+                kaynak = content_hash(csv_source)
+            yol, stored = _kayitli_skorlar(content_hash(kaynak, asama="skorlar", **secenekler), store_dir)
+        if stored is not None:
+            with prof.stage("yazdırma"):
+                return print_exact_results(stored.scores(), stored.m, baslik="RMVC ANALİZ SONUÇLARI")
+    
     # CSV'yi oku
-    if os.path.isfile(csv_source):
-        print(f"\n📁 Dosya okunuyor: {csv_source}")
-        df = pd.read_csv(csv_source, index_col=0)
-    elif csv_source.endswith('.xlsx') or csv_source.endswith('.xls'):
-        print(f"\n📁 Excel dosyası okunuyor: {csv_source}")
-        df = pd.read_excel(csv_source, index_col=0)
-    else:
-        # String olarak CSV içeriği
-        df = pd.read_csv(StringIO(csv_source), index_col=0)
+    with prof.stage("okuma (ayrıştırma)") as asama:
+        if os.path.isfile(csv_source):
+            print(f"\n📁 Dosya okunuyor: {csv_source}")
+            df = pd.read_csv(csv_source, index_col=0)
+        elif csv_source.endswith('.xlsx') or csv_source.endswith('.xls'):
+            print(f"\n📁 Excel dosyası okunuyor: {csv_source}")
+            df = pd.read_excel(csv_source, index_col=0)
+        else:
+            # String olarak CSV içeriği
+            df = pd.read_csv(StringIO(csv_source), index_col=0)
+        
+        if rows_are_params:
+            df = df.T
+        asama.count(rows=df.shape[0], cols=df.shape[1], cells=df.size)
     
     # Soft Set'e dönüştür
-    U, E_named, satir_ids, sutun_ids = csv_to_soft_set(df)
-    
-    # Boş kümeleri filtrele (opsiyonel)
-    E_named_filtered = {k: v for k, v in E_named.items() if len(v) > 0}
+    with prof.stage("csv_to_soft_set") as asama:
+        U, E_named, satir_ids, sutun_ids = csv_to_soft_set(df)
+        
+        # Boş kümeleri filtrele (opsiyonel)
+        E_named_filtered = E_named.nonempty()
+        incidence = E_named_filtered.incidence
+        asama.count(m=incidence.m, n=incidence.n, nnz=int(incidence.set_sizes().sum()))
+    # Referans döngülerin eşdeğer ikili kontrol sayısı ve üretilen üyelik hücreleri
+    is_sayaclari = dict(pair_checks=reference_pair_checks(incidence.set_sizes(), incidence.n),
+                        cells=incidence.m * incidence.n)
     
     if len(E_named_filtered) < 2:
         print("\n❌ HATA: En az 2 boş olmayan kriter kümesi gerekli!")
@@ -231,30 +322,602 @@ def run_rmvc_from_csv(csv_source):
     
     print(f"\n⚙️  {len(E_named_filtered)} kriter ile RMVC hesaplanıyor...")
     
-    # Üyelik matrisini hesapla
-    membership_matrix = create_membership_matrix(E_named_filtered, U)
+    if not tam_matris:
+        # Yalnızca skorlar: "break" semantiği, tam sayı paylarla
+        with prof.stage("skorlar (δ + toplamlar)", **is_sayaclari):
+            if workers > 1:
+                incidence = build_incidence(E_named_filtered, U)
+                plan = plan_delta(incidence, any_set=True, memory_budget=memory_budget)
+                exact = parallel_exact_scores(incidence, workers=workers, any_set=True, plan=plan)
+            else:
+                exact, _ = top_k_scores(E_named_filtered, U, ILK_K, any_set=True,
+                                        memory_budget=memory_budget)
+        if yol is not None:
+            with prof.stage("depoya yazma"):
+                param_keys = list(E_named_filtered)
+                _skorlari_kaydet(yol, exact, param_keys,
+                                 [sutun_ids[int(k.split('_')[1]) - 1] for k in param_keys], secenekler)
+        with prof.stage("yazdırma"):
+            return print_exact_results(exact, len(E_named_filtered), baslik="RMVC ANALİZ SONUÇLARI")
+    
+    # Referans döngüler kümelere tekrar tekrar eriştiğinden sözlüğe açılır
+    E_named_filtered = E_named_filtered.incidence.to_soft_set()
+    
+    # Üyelik matrisini hesapla (δ referans döngüleri dahil)
+    with prof.stage("create_membership_matrix", **is_sayaclari):
+        membership_matrix = create_membership_matrix(E_named_filtered, U)
+    
+    # Sonuçları yazdır (skorlar create_sum_dictionary ile)
+    with prof.stage("print_results (skorlar)", cells=is_sayaclari["cells"]):
+        scores, best_choices = print_results(
+            membership_matrix, U, E_named_filtered, satir_ids, sutun_ids
+        )
+    
+    return scores, best_choices
+
+
+def run_rmvc_from_dataset(yol, workers=1, memory_budget=None, store_dir=None, profiler=None):
+    """
+    İkili veri setinden (rmvc_dataset) RMVC analizi çalıştırır.
+    
+    CSV ayrıştırılmaz; insidans matrisi bellek eşlemeli dizilerden açılır.
+    Konsol versiyonundaki gibi boş kümeler filtrelenir ve "break" semantiği
+    kullanılır. store_dir verilirse skorlar sonuç deposunda saklanır.
+    """
+    prof = profiler or StageProfiler(enabled=False)
+    secenekler = dict(any_set=True, bos_filtrele=True)
+    sonuc_yolu = None
+    if store_dir:
+        with prof.stage("özet + depo araması"):
+            sonuc_yolu, stored = _kayitli_skorlar(
+                content_hash(path_fingerprint(yol), asama="skorlar", **secenekler), store_dir)
+        if stored is not None:
+            with prof.stage("yazdırma"):
+                return print_exact_results(stored.scores(), stored.m, baslik="RMVC ANALİZ SONUÇLARI")
+    
+    with prof.stage("veri seti açma") as asama:
+        print(f"\n📁 İkili veri seti açılıyor: {yol}")
+        dataset = load_dataset(yol)
+        incidence = dataset.incidence(drop_empty=True)
+        asama.count(m=incidence.m, n=incidence.n, nnz=int(incidence.set_sizes().sum()))
+    print(f"   {dataset.m} kriter × {dataset.n} eleman ({dataset.meta['layout']} düzeni)")
+    
+    if incidence.m < 2:
+        print("\n❌ HATA: En az 2 boş olmayan kriter kümesi gerekli!")
+        print(f"   Mevcut boş olmayan küme sayısı: {incidence.m}")
+        return None, None
+    
+    print(f"\n⚙️  {incidence.m} kriter ile RMVC hesaplanıyor...")
+    with prof.stage("skorlar (δ + toplamlar)",
+                    pair_checks=reference_pair_checks(incidence.set_sizes(), incidence.n),
+                    cells=incidence.m * incidence.n):
+        plan = plan_delta(incidence, any_set=True, memory_budget=memory_budget)
+        if workers > 1:
+            exact = parallel_exact_scores(incidence, workers=workers, any_set=True, plan=plan)
+        else:
+            exact = exact_scores(incidence, any_set=True, plan=plan)
+    if sonuc_yolu is not None:
+        with prof.stage("depoya yazma"):
+            names = dataset.meta["param_names"]
+            _skorlari_kaydet(sonuc_yolu, exact, incidence.param_keys,
+                             [names[int(k.split('_')[1]) - 1] for k in incidence.param_keys], secenekler)
+    with prof.stage("yazdırma"):
+        return print_exact_results(exact, incidence.m, baslik="RMVC ANALİZ SONUÇLARI")
+
+
+def print_exact_results(exact, m, baslik="RMVC ANALİZ SONUÇLARI (AKIŞ MODU)"):
+    """
+    ExactScores sonuçlarını print_results formatında yazdırır.
     
-    # Sonuçları yazdır
-    scores, best_choices = print_results(
-        membership_matrix, U, E_named_filtered, satir_ids, sutun_ids
-    )
+    Tam sıralama yapılmaz: ilk ILK_K eleman (kesimdeki eşitlik grubu dahil)
+    kısmi seçimle bulunur; sıralama ve eşitlikler tam sayılar üzerindendir.
+    """
     
+    print("\n" + "="*60)
+    print(baslik)
+    print("="*60)
+    
+    score_values = exact.to_float()
+    top = exact.top_k(ILK_K)
+    best_idx = exact.best()
+    best_set = set(best_idx.tolist())
+    
+    print("\n📈 ELEMAN SKORLARI (Yüksekten Düşüğe):")
+    print("-" * 40)
+    print(f"{'Sıra':<6}{'Eleman':<15}{'Skor':<12}{'Durum'}")
+    print("-" * 40)
+    
+    for i, j in enumerate(top, 1):  # İlk 20'yi göster (eşitlikler dahil)
+        status = "⭐ EN İYİ" if j in best_set else ""
+        print(f"{i:<6}{exact.elements[j]:<15}{score_values[j]:<12.4f}{status}")
+    
+    if len(exact.elements) > len(top):
+        print(f"... ve {len(exact.elements) - len(top)} eleman daha")
+    
+    best_choices = [exact.elements[j] for j in best_idx]
+    best_score = float(score_values[best_idx[0]])
+    
+    print("\n" + "="*60)
+    print("🏆 KARAR")
+    print("="*60)
+    print(f"\n✅ En Yüksek Skor: {best_score:.4f} ({exact.fraction(best_idx[0])})")
+    print(f"✅ Optimal Seçim(ler): {best_choices}")
+    
+    if len(best_choices) > 1:
+        print(f"\n⚠️  {len(best_choices)} eleman eşit skora sahip.")
+        print("   Ek kriterlerle aralarında seçim yapılabilir.")
+    
+    print("\n📊 İSTATİSTİKLER:")
+    print(f"   - Toplam eleman sayısı: {len(exact.elements)}")
+    print(f"   - Toplam kriter sayısı: {m}")
+    print(f"   - Ortalama skor: {score_values.mean():.4f}")
+    print(f"   - Min skor: {score_values.min():.4f}")
+    print(f"   - Max skor: {score_values.max():.4f}")
+    
+    scores = dict(zip(exact.elements, score_values.tolist()))
     return scores, best_choices
 
 
+def run_rmvc_streaming(dosya_yolu, rows_are_params=False, chunksize=DEFAULT_CHUNKSIZE, output=None,
+                       profiler=None):
+    """
+    Bellekten büyük CSV dosyaları için iki geçişli akış modu.
+    
+    Dosya parça parça okunur; tepe bellek kullanımı birliktelik matrisiyle
+    sınırlıdır. Boş kümeler (konsol versiyonunda olduğu gibi) filtrelenir.
+    Elemanlar varsayılan yoldaki gibi özgün etiketleriyle adlandırılır.
+    
+    Varsayılan yol gibi "break" semantiği kullanılır ({u, v} ikilisi en az
+    bir kümede birlikte ise bir kez sayılır); sonuçlar aynıdır.
+    
+    Args:
+        dosya_yolu: CSV dosya yolu
+        rows_are_params: True ise satırlar=parametreler (Hocanın formatı)
+        chunksize: Parça başına okunacak satır sayısı
+        output: Üyelik matrisinin yazılacağı CSV dosyası (isteğe bağlı)
+        profiler: rmvc_profile.StageProfiler; verilirse aşamalar ölçülür
+    """
+    prof = profiler or StageProfiler(enabled=False)
+    print(f"\n📁 Akış modu: {dosya_yolu} (parça boyutu: {chunksize} satır)")
+    
+    def ilerleme(asama, islenen, toplam):
+        if toplam:
+            print(f"   ⏳ {asama}. geçiş: {islenen}/{toplam} satır (%{100 * islenen / toplam:.0f})", end="\r")
+        else:
+            print(f"   ⏳ {asama}. geçiş: {islenen} satır okundu", end="\r")
+    
+    with prof.stage("akış (iki geçiş)") as asama:
+        exact, E_info = stream_rmvc_csv(
+            dosya_yolu, rows_are_params=rows_are_params, chunksize=chunksize,
+            bos_filtrele=True, output=output, progress=ilerleme, original_labels=True,
+            any_set=True
+        )
+        asama.count(m=len(E_info), n=len(exact.elements), cells=len(E_info) * len(exact.elements))
+    print()
+    
+    if len(E_info) < 2:
+        print("\n❌ HATA: En az 2 boş olmayan kriter kümesi gerekli!")
+        print(f"   Mevcut boş olmayan küme sayısı: {len(E_info)}")
+        return None, None
+    
+    if output:
+        print(f"💾 Üyelik matrisi yazıldı: {output}")
+    
+    with prof.stage("yazdırma"):
+        return print_exact_results(exact, len(E_info))
+
+
+def run_rmvc_batch(kaynak, cikti_dizini, workers=1, rows_are_params=False, ilk_k=ILK_K,
+                   matris=False, memory_budget=None, yeniden=False):
+    """
+    Dizindeki veya glob desenine uyan tüm girdileri toplu işler (rmvc_batch).
+    
+    Her dosyanın durumu tamamlandıkça yazdırılır; hatalı dosyalar toplu işi
+    durdurmaz. Çıktılar ve summary.csv / summary.json cikti_dizini'ne yazılır.
+    
+    Returns:
+        Kayıt listesi (girdi sırasıyla); girdi bulunamazsa boş liste
+    """
+    yollar = collect_inputs(kaynak)
+    if not yollar:
+        print(f"❌ Girdi bulunamadı: {kaynak}")
+        return []
+    print(f"\n📦 Toplu çalıştırma: {len(yollar)} girdi, {workers} işçi → {cikti_dizini}")
+    
+    simgeler = {"ok": "✅", "skipped": "⏭️ ", "error": "❌"}
+    
+    def ilerleme(kayit, tamamlanan, toplam):
+        sure = kayit["seconds"].get("total", 0.0)
+        satir = f"   [{tamamlanan}/{toplam}] {simgeler[kayit['status']]} {os.path.basename(kayit['input'])}"
+        if kayit["status"] == "error":
+            satir += f" - {kayit['error']}"
+        elif kayit["status"] == "ok":
+            satir += f" ({kayit['m']}×{kayit['n']}, {sure:.2f} sn)"
+        else:
+            satir += " (değişmedi, atlandı)"
+        print(satir)
+    
+    kayitlar = run_batch(yollar, cikti_dizini, workers=workers, rows_are_params=rows_are_params,
+                         top_k=ilk_k, matrix=matris, memory_budget=memory_budget, force=yeniden,
+                         progress=ilerleme)
+    sayilar = {d: sum(k["status"] == d for k in kayitlar) for d in simgeler}
+    print(f"\n📊 {sayilar['ok']} hesaplandı, {sayilar['skipped']} atlandı, {sayilar['error']} hatalı")
+    print(f"💾 Özet: {os.path.join(cikti_dizini, 'summary.csv')}")
+    return kayitlar
+
+
+def _girdi_insidansi(kaynak, rows_are_params=False, bos_filtrele=False):
+    """
+    CSV / Excel dosyasını veya .rmvcd veri setini insidans matrisine çevirir.
+    
+    Returns:
+        (IncidenceMatrix, parametre özgün adları)
+    """
+    if is_dataset(kaynak):
+        dataset = load_dataset(kaynak)
+        incidence = dataset.incidence(drop_empty=bos_filtrele)
+        adlar = dataset.meta["param_names"]
+        return incidence, [adlar[int(k.split('_')[1]) - 1] for k in incidence.param_keys]
+    if kaynak.lower().endswith(('.xlsx', '.xls')):
+        df = pd.read_excel(kaynak, index_col=0)
+    else:
+        df = pd.read_csv(kaynak, index_col=0)
+    if rows_are_params:
+        df = df.T
+    mask, _, sutun_ids, satir_ids, _ = table_to_mask(df)
+    satirlar = np.flatnonzero(mask.any(axis=1)) if bos_filtrele else np.arange(mask.shape[0])
+    incidence = incidence_from_mask(mask[satirlar], [f"e_{i+1}" for i in satirlar],
+                                    [str(s) for s in satir_ids])
+    return incidence, [str(sutun_ids[i]) for i in satirlar]
+
+
+def _girdi_degerleri(kaynak, rows_are_params=False):
+    """
+    CSV / Excel dosyasının veya .rmvcd veri setinin özgün hücre değerleri.
+    
+    Returns:
+        (m×n değer matrisi, eleman etiketleri); veri seti değer saklamıyorsa
+        (None, None)
+    """
+    if is_dataset(kaynak):
+        dataset = load_dataset(kaynak)
+        degerler = dataset.value_matrix()
+        if degerler is None:
+            return None, None
+        return degerler, list(dataset.elements)
+    if kaynak.lower().endswith(('.xlsx', '.xls')):
+        df = pd.read_excel(kaynak, index_col=0)
+    else:
+        df = pd.read_csv(kaynak, index_col=0)
+    if rows_are_params:
+        df = df.T
+    _, degerler, _, satir_ids, _ = table_to_mask(df)
+    return degerler, [str(s) for s in satir_ids]
+
+
+def run_rmvc_variants(kaynak, rows_are_params=False, memory_budget=None, output=None,
+                      baseline=DEFAULT_BASELINE):
+    """
+    δ semantiği (her küme / en az bir küme) × boş küme (dahil / hariç)
+    varyantlarını tek geçişte hesaplar (rmvc_variants) ve sıralama
+    farklarını yazdırır.
+    
+    Args:
+        kaynak: CSV / Excel dosyası veya .rmvcd veri seti
+        output: Eleman bazında sıra farkları tablosunun yazılacağı CSV (isteğe bağlı)
+        baseline: Farkların hesaplandığı varyant
+    
+    Returns:
+        {varyant adı: ExactScores}
+    """
+    print(f"\n📁 Varyant karşılaştırması: {kaynak}")
+    incidence, _ = _girdi_insidansi(kaynak, rows_are_params)
+    bos = int((incidence.set_sizes() == 0).sum())
+    print(f"   {incidence.m} kriter ({bos} boş) × {incidence.n} eleman")
+    
+    sonuclar = variant_scores(incidence, memory_budget=memory_budget)
+    ozet = variant_summary(sonuclar, baseline=baseline)
+    
+    print("\n" + "="*60)
+    print(f"⚖️  VARYANTLAR (temel: {baseline})")
+    print("="*60)
+    for _, r in ozet.iterrows():
+        durum = "✅" if r['En iyi aynı'] else "⚠️ "
+        print(f"\n{durum} {r['Varyant']}: {r['Açıklama']}")
+        print(f"   En iyi: {r['En iyi']}")
+        print(f"   Sırası değişen: {r['Sırası değişen']}, en büyük kayma: {r['En büyük kayma']}, "
+              f"Spearman ρ = {r['Spearman ρ']:.4f}")
+    
+    farklar = ranking_diffs(sonuclar, baseline=baseline)
+    kayma = farklar.filter(like='Δ sıra').abs().max(axis=1)
+    degisen = farklar.loc[kayma[kayma > 0].sort_values(ascending=False, kind='stable').index]
+    if len(degisen):
+        print(f"\n📉 En çok yer değiştiren elemanlar (ilk {min(ILK_K, len(degisen))}):")
+        print(degisen.head(ILK_K).filter(regex='^(Eleman|Sıra)').to_string(index=False))
+    if output:
+        farklar.to_csv(output, index=False)
+        print(f"\n💾 Sıra farkları: {output}")
+    return sonuclar
+
+
+def run_rmvc_sensitivity(kaynak, rows_are_params=False, memory_budget=None, output=None):
+    """
+    Bir parametre çıkarıldığında kararın nasıl değiştiğini raporlar
+    (rmvc_sensitivity; konsol versiyonundaki gibi boş kümeler filtrelenir
+    ve "break" semantiği kullanılır).
+    
+    Args:
+        kaynak: CSV / Excel dosyası veya .rmvcd veri seti
+        output: Parametre bazında duyarlılık tablosunun yazılacağı CSV (isteğe bağlı)
+    
+    Returns:
+        Duyarlılık tablosu (DataFrame); en az 2 boş olmayan küme yoksa None
+    """
+    print(f"\n📁 Duyarlılık analizi (bir parametre çıkarılınca): {kaynak}")
+    incidence, adlar = _girdi_insidansi(kaynak, rows_are_params, bos_filtrele=True)
+    if incidence.m < 2:
+        print("\n❌ HATA: En az 2 boş olmayan kriter kümesi gerekli!")
+        return None
+    print(f"   {incidence.m} kriter × {incidence.n} eleman")
+    
+    def ilerleme(tamamlanan, toplam):
+        print(f"   ⏳ {tamamlanan}/{toplam} parametre", end="\r")
+    
+    exact, tablo = leave_one_parameter_out(incidence, any_set=True, names=adlar,
+                                           memory_budget=memory_budget, progress=ilerleme)
+    print()
+    kazanan = [exact.elements[j] for j in exact.best()]
+    degistiren = tablo[tablo['Karar değişir']]
+    
+    print("\n" + "="*60)
+    print("🧪 DUYARLILIK (bir parametre çıkarılınca)")
+    print("="*60)
+    print(f"\n🏆 Tüm parametrelerle en iyi: {kazanan}")
+    if degistiren.empty:
+        print(f"✅ Hiçbir parametrenin çıkarılması kararı değiştirmiyor ({incidence.m} parametre).")
+    else:
+        print(f"⚠️  {len(degistiren)} / {incidence.m} parametre çıkarılınca karar değişiyor:")
+        for _, r in degistiren.head(ILK_K).iterrows():
+            print(f"   - {r['Parametre']} (|Φ|={r['|Φ|']}): en iyi → {r['En iyi']}, "
+                  f"kazananın sırası {r['Kazananın sırası']}")
+        if len(degistiren) > ILK_K:
+            print(f"   ... ve {len(degistiren) - ILK_K} parametre daha")
+    print(f"\n📊 Sıralamayı en çok değiştiren parametreler (Spearman ρ):")
+    for _, r in tablo.sort_values('Spearman ρ', kind='stable').head(5).iterrows():
+        print(f"   - {r['Parametre']}: ρ = {r['Spearman ρ']:.4f}, sırası değişen {r['Sırası değişen']}, "
+              f"en büyük kayma {r['En büyük kayma']}")
+    if output:
+        tablo.to_csv(output, index=False)
+        print(f"\n💾 Duyarlılık tablosu: {output}")
+    return tablo
+
+
+def run_rmvc_influence(kaynak, rows_are_params=False, memory_budget=None, output=None):
+    """
+    Her eleman U'dan çıkarıldığında diğer elemanların skorlarını hesaplar ve
+    elemanları etkilerine (diğerlerinin toplam skor kaybı) göre sıralar
+    (rmvc_sensitivity; konsol versiyonundaki gibi boş kümeler filtrelenir ve
+    "break" semantiği kullanılır).
+    
+    Args:
+        kaynak: CSV / Excel dosyası veya .rmvcd veri seti
+        output: Eleman etkisi tablosunun yazılacağı CSV (isteğe bağlı)
+    
+    Returns:
+        Eleman etkisi tablosu (DataFrame); en az 2 boş olmayan küme yoksa None
+    """
+    print(f"\n📁 Eleman etkisi (bir eleman çıkarılınca): {kaynak}")
+    incidence, _ = _girdi_insidansi(kaynak, rows_are_params, bos_filtrele=True)
+    if incidence.m < 2:
+        print("\n❌ HATA: En az 2 boş olmayan kriter kümesi gerekli!")
+        return None
+    print(f"   {incidence.m} kriter × {incidence.n} eleman")
+    
+    def ilerleme(tamamlanan, toplam):
+        print(f"   ⏳ {tamamlanan}/{toplam} eleman", end="\r")
+    
+    exact, tablo = leave_one_element_out(incidence, any_set=True, memory_budget=memory_budget,
+                                         progress=ilerleme)
+    print()
+    degistiren = tablo[tablo['Karar değişir']]
+    
+    print("\n" + "="*60)
+    print("🧲 ELEMAN ETKİSİ (bir eleman çıkarılınca)")
+    print("="*60)
+    print(f"\n🏆 Tüm elemanlarla en iyi: {[exact.elements[j] for j in exact.best()]}")
+    print(f"\n📊 Diğer elemanları en çok destekleyenler (toplam skor kaybı):")
+    for _, r in tablo.head(ILK_K).iterrows():
+        print(f"   - {r['Eleman']}: etki {r['Etki']:+.4f} (skor {r['Skor']:.4f}, sıra {r['Sıra']}), "
+              f"sırası değişen {r['Sırası değişen']}")
+    if degistiren.empty:
+        print(f"\n✅ Hiçbir elemanın çıkarılması diğerleri arasındaki kararı değiştirmiyor.")
+    else:
+        print(f"\n⚠️  {len(degistiren)} / {incidence.n} eleman çıkarılınca diğerleri arasındaki karar değişiyor:")
+        for _, r in degistiren.head(ILK_K).iterrows():
+            print(f"   - {r['Eleman']}: en iyi → {r['En iyi (v hariç)']}")
+        if len(degistiren) > ILK_K:
+            print(f"   ... ve {len(degistiren) - ILK_K} eleman daha")
+    if output:
+        tablo.to_csv(output, index=False)
+        print(f"\n💾 Eleman etkisi tablosu: {output}")
+    return tablo
+
+
+def run_rmvc_threshold_sweep(kaynak, esikler, kantil=False, rows_are_params=False, output=None):
+    """
+    İkilileştirme eşiği listesi için skorları tek geçişte hesaplar
+    (rmvc_threshold) ve eşikler boyunca sıralama kararlılığını yazdırır.
+    Konsol versiyonundaki gibi boşalan kümeler m'ye katılmaz ve "break"
+    semantiği kullanılır.
+    
+    Args:
+        kaynak: CSV / Excel dosyası veya değer saklayan .rmvcd veri seti
+        esikler: Genel eşikler (değer > t) veya kantil=True ise parametre
+                 satırı içindeki kantiller
+        output: Eleman bazında eşik sıraları tablosunun yazılacağı CSV (isteğe bağlı)
+    
+    Returns:
+        SweepStep listesi; değerler yoksa None
+    """
+    print(f"\n📁 Eşik taraması ({'parametre kantilleri' if kantil else 'genel eşikler'}): {kaynak}")
+    degerler, elemanlar = _girdi_degerleri(kaynak, rows_are_params)
+    if degerler is None:
+        print("\n❌ HATA: Veri seti hücre değerlerini saklamıyor (rmvc_dataset.py --values)")
+        return None
+    print(f"   {degerler.shape[0]} kriter × {degerler.shape[1]} eleman, {len(esikler)} eşik")
+    
+    def ilerleme(tamamlanan, toplam):
+        print(f"   ⏳ {tamamlanan}/{toplam} eşik", end="\r")
+    
+    try:
+        adimlar = threshold_sweep(degerler, esikler, per_parameter=kantil, any_set=True,
+                                  drop_empty=True, elements=elemanlar, progress=ilerleme)
+    except ValueError as e:
+        print(f"\n❌ HATA: {e}")
+        return None
+    print()
+    ozet = sweep_summary(adimlar)
+    
+    print("\n" + "="*60)
+    print("🎚️  EŞİK TARAMASI (ilk eşiğe göre)")
+    print("="*60)
+    for _, r in ozet.iterrows():
+        durum = "✅" if r['En iyi aynı'] else "⚠️ "
+        print(f"\n{durum} {r['Eşik']}: {r['Dolu hücre']} dolu hücre, {r['Boş küme']} boş küme")
+        print(f"   En iyi: {r['En iyi']}")
+        print(f"   Önceki eşiğe göre sırası değişen: {r['Sırası değişen']}, en büyük kayma: "
+              f"{r['En büyük kayma']}, Spearman ρ = {r['Spearman ρ (önceki)']:.4f} "
+              f"(ilk eşiğe göre {r['Spearman ρ (ilk)']:.4f})")
+    
+    tablo = rank_stability(adimlar)
+    oynak = tablo[tablo['Sıra aralığı'] > 0].sort_values('Sıra aralığı', ascending=False, kind='stable')
+    if len(oynak):
+        print(f"\n📉 Sırası en çok oynayan elemanlar (ilk {min(ILK_K, len(oynak))}):")
+        print(oynak.head(ILK_K).to_string(index=False))
+    if output:
+        tablo.to_csv(output, index=False)
+        print(f"\n💾 Eşik sıraları: {output}")
+    return adimlar
+
+
 # ============================================================
 # ANA ÇALIŞTIRMA BLOĞU
 # ============================================================
 
 if __name__ == "__main__":
     
+    parser = argparse.ArgumentParser(description="CSV/Excel dosyasından RMVC analizi")
+    parser.add_argument("dosya", nargs="?", help="CSV veya Excel dosyası (verilmezse örnek veri kullanılır)")
+    parser.add_argument("--rows-are-params", action="store_true",
+                        help="Satırlar=Parametreler, Sütunlar=Elemanlar (Hocanın formatı)")
+    parser.add_argument("--stream", action="store_true",
+                        help="CSV dosyasını parça parça iki geçişte işle (bellekten büyük dosyalar)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Akış modunda parça başına satır sayısı (varsayılan: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--output", help="Akış modunda üyelik matrisinin yazılacağı CSV dosyası")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Paralel işçi süreç sayısı (0: tüm çekirdekler, varsayılan: 1)")
+    parser.add_argument("--memory-budget", type=float, default=None,
+                        help="Ara matris (C veya O) için bellek bütçesi, MB (aşılırsa bloklu hesap)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Hesap planı gibi ayrıntıları göster (logging INFO)")
+    parser.add_argument("--tam-matris", action="store_true",
+                        help="Skorları tam üyelik matrisi üzerinden hesapla (referans yol, yavaş)")
+    parser.add_argument("--store", metavar="DIZIN",
+                        help="Skorları bu sonuç deposunda sakla ve sonraki çalıştırmalarda oradan aç "
+                             "(varsayılan: depo kullanılmaz)")
+    parser.add_argument("--batch", metavar="KAYNAK",
+                        help="Dizindeki veya glob desenine uyan tüm CSV/Excel/.rmvcd girdilerini "
+                             "toplu işle (--workers süreç sayısı)")
+    parser.add_argument("--batch-output", default="rmvc_batch",
+                        help="Toplu çıktıların dizini (varsayılan: rmvc_batch)")
+    parser.add_argument("--top-k", type=int, default=ILK_K,
+                        help=f"Toplu çıktıda ilk K eleman (varsayılan: {ILK_K})")
+    parser.add_argument("--matrix", action="store_true",
+                        help="Toplu çıktıya üyelik matrisini de yaz (<ad>.matrix.csv)")
+    parser.add_argument("--force", action="store_true",
+                        help="Toplu işte değişmeyen girdileri de yeniden hesapla")
+    parser.add_argument("--variants", action="store_true",
+                        help="δ semantiği (her küme / en az bir küme) × boş küme (dahil / hariç) "
+                             "varyantlarını tek geçişte hesapla ve sıralama farklarını yazdır")
+    parser.add_argument("--variants-output", metavar="DOSYA",
+                        help="Varyant sıra farkları tablosunu CSV olarak yaz")
+    parser.add_argument("--sensitivity", action="store_true",
+                        help="Her parametre tek tek çıkarıldığında kararın ve sıralamanın nasıl "
+                             "değiştiğini raporla")
+    parser.add_argument("--sensitivity-output", metavar="DOSYA",
+                        help="Parametre bazında duyarlılık tablosunu CSV olarak yaz")
+    parser.add_argument("--influence", action="store_true",
+                        help="Her eleman tek tek çıkarıldığında diğer elemanların skorlarını hesapla "
+                             "ve elemanları etkilerine göre sırala")
+    parser.add_argument("--influence-output", metavar="DOSYA",
+                        help="Eleman etkisi tablosunu CSV olarak yaz")
+    parser.add_argument("--thresholds", metavar="T1,T2,...",
+                        help="Üyelik için değer > t eşiklerini tek geçişte tara (ör. 0,1000,5000) "
+                             "ve eşikler boyunca sıralama kararlılığını yazdır")
+    parser.add_argument("--quantiles", metavar="Q1,Q2,...",
+                        help="--thresholds gibi, ancak eşikler her parametrenin pozitif değerleri "
+                             "içindeki kantillerdir (ör. 0,0.25,0.5)")
+    parser.add_argument("--sweep-output", metavar="DOSYA",
+                        help="Eşik taramasında eleman bazında sıralar tablosunu CSV olarak yaz")
+    parser.add_argument("--profile", action="store_true",
+                        help="Aşama sürelerini, tepe belleği ve iş sayaçlarını yazdır")
+    parser.add_argument("--profile-json", metavar="DOSYA",
+                        help="Profil raporunu JSON olarak yaz (--profile ile aynı ölçümler)")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="Aşamaları cProfile ile kaydet (en pahalı fonksiyonlar rapora eklenir)")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Aşama içi tepe ayırmayı ve en çok bellek ayıran satırları tracemalloc ile ölç")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+    memory_budget = args.memory_budget * 1024 ** 2 if args.memory_budget else None
+    store_dir = args.store
+    profil_acik = args.profile or bool(args.profile_json) or args.cprofile or args.tracemalloc
+    profiler = StageProfiler(enabled=profil_acik, cprofile=args.cprofile, trace_memory=args.tracemalloc)
+    
+    if args.batch:
+        kayitlar = run_rmvc_batch(args.batch, args.batch_output,
+                                  workers=args.workers or os.cpu_count() or 1,
+                                  rows_are_params=args.rows_are_params, ilk_k=args.top_k,
+                                  matris=args.matrix, memory_budget=memory_budget,
+                                  yeniden=args.force)
+        sys.exit(1 if not kayitlar or any(k["status"] == "error" for k in kayitlar) else 0)
+    
     # Komut satırından dosya adı verilmişse onu kullan
-    if len(sys.argv) > 1:
-        dosya_yolu = sys.argv[1]
-        if os.path.isfile(dosya_yolu):
-            run_rmvc_from_csv(dosya_yolu)
-        else:
+    if args.dosya:
+        dosya_yolu = args.dosya
+        varyantlar = args.variants or bool(args.variants_output)
+        duyarlilik = args.sensitivity or bool(args.sensitivity_output)
+        etki = args.influence or bool(args.influence_output)
+        tarama = args.thresholds or args.quantiles
+        if is_dataset(dosya_yolu) and not (varyantlar or duyarlilik or etki or tarama):
+            run_rmvc_from_dataset(dosya_yolu, workers=args.workers or os.cpu_count() or 1,
+                                  memory_budget=memory_budget, store_dir=store_dir, profiler=profiler)
+        elif not (os.path.isfile(dosya_yolu) or is_dataset(dosya_yolu)):
             print(f"❌ Dosya bulunamadı: {dosya_yolu}")
+        elif varyantlar:
+            run_rmvc_variants(dosya_yolu, rows_are_params=args.rows_are_params,
+                              memory_budget=memory_budget, output=args.variants_output)
+        elif duyarlilik:
+            run_rmvc_sensitivity(dosya_yolu, rows_are_params=args.rows_are_params,
+                                 memory_budget=memory_budget, output=args.sensitivity_output)
+        elif etki:
+            run_rmvc_influence(dosya_yolu, rows_are_params=args.rows_are_params,
+                               memory_budget=memory_budget, output=args.influence_output)
+        elif tarama:
+            run_rmvc_threshold_sweep(dosya_yolu, [float(t) for t in tarama.split(',') if t.strip()],
+                                     kantil=not args.thresholds, rows_are_params=args.rows_are_params,
+                                     output=args.sweep_output)
+        elif args.stream:
+            run_rmvc_streaming(dosya_yolu, rows_are_params=args.rows_are_params,
+                               chunksize=args.chunksize, output=args.output, profiler=profiler)
+        else:
+            run_rmvc_from_csv(dosya_yolu, rows_are_params=args.rows_are_params,
+                              tam_matris=args.tam_matris,
+                              workers=args.workers or os.cpu_count() or 1,
+                              memory_budget=memory_budget, store_dir=store_dir, profiler=profiler)
     
     else:
         # Varsayılan: Örnek veri ile çalıştır
@@ -289,4 +952,22 @@ if __name__ == "__main__":
 9206,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0
 6372,0,7450,0,0,0,0,0,5500,0,0,0,0,0,6100,0,0,0,0,1000,0"""
         
-        run_rmvc_from_csv(ornek_csv)
+        run_rmvc_from_csv(ornek_csv, profiler=profiler)
+    
+    if profil_acik:
+        rapor = profiler.report()
+        profiler.close()
+        print("\n" + "="*60)
+        print("⏱️  PERFORMANS")
+        print("="*60)
+        print(format_report(rapor))
+        if rapor.get('tracemalloc'):
+            print("\n🧠 En çok bellek ayıran satırlar (tracemalloc):")
+            for satir in rapor['tracemalloc'][:10]:
+                print(f"   {satir['bytes'] / 1024 ** 2:>9.2f} MB  {satir['location']}")
+        if rapor.get('cprofile'):
+            print("\n🔬 cProfile (kümülatif süreye göre):")
+            print(rapor['cprofile'])
+        if args.profile_json:
+            write_profile_report(rapor, args.profile_json)
+            print(f"💾 Profil raporu: {args.profile_json}")
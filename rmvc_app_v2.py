@@ -19,6 +19,12 @@ Düzeltmeler (v2.1):
     streamlit run rmvc_app_v2.py --server.port 8515
 """
 
+import json
+import logging
+import os
+import time
+import uuid
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -27,6 +33,55 @@ from io import StringIO
 import plotly.express as px
 import plotly.graph_objects as go
 
+from rmvc_engine import (
+    ExactMembership,
+    ParamInfoView,
+    SoftSetView,
+    build_incidence,
+    choose_backend,
+    element_sort_key,
+    exact_membership,
+    gamma_vector,
+    incidence_from_mask,
+    natural_elements,
+    param_sort_key,
+    soft_set_sizes,
+    top_k_scores,
+)
+from rmvc_cache import ResultCache, content_hash, path_fingerprint
+from rmvc_dataset import is_dataset, load_dataset, table_to_mask
+from rmvc_jobs import JobCancelled, JobRunner
+from rmvc_profile import StageProfiler, reference_pair_checks, report_frame
+from rmvc_plot import (
+    HEATMAP_MAX_COLS,
+    HEATMAP_MAX_ROWS,
+    HEATMAP_TEXT_CELLS,
+    block_labels,
+    box_stats,
+    downsample_membership,
+    histogram,
+)
+from rmvc_table import (
+    DEFAULT_PAGE_SIZE,
+    PAGE_SIZES,
+    filter_labels,
+    filter_range,
+    page_count,
+    page_slice,
+    score_page,
+    score_ranks,
+    score_table,
+    write_matrix_csv,
+)
+from rmvc_sensitivity import leave_one_element_out, leave_one_parameter_out
+from rmvc_store import is_result, load_result, prune_store, result_path, write_result
+from rmvc_threshold import rank_stability, sweep_summary, threshold_sweep
+from rmvc_variants import DEFAULT_BASELINE, DELTA_VARIANTS, VARIANT_LABELS, ranking_diffs, variant_scores, variant_summary
+from rmvc_stream import stream_rmvc_csv
+from rmvc_bitset import BitsetSoftSet, bitset_delta_rows
+
+logger = logging.getLogger(__name__)
+
 # Sayfa Konfigürasyonu
 st.set_page_config(
     page_title="RMVC Analiz Aracı v2",
@@ -75,25 +130,13 @@ st.markdown("""
 # RMVC FONKSİYONLARI - MAKALEYE UYGUN DÜZELTILMIŞ VERSİYON
 # ============================================================
 
-def safe_sort_key(x):
-    """Güvenli sıralama - hem sayı hem string için çalışır."""
-    try:
-        return (0, int(str(x)))  # Sayılar önce
-    except (ValueError, TypeError):
-        return (1, str(x))  # Stringler sonra
-
-
-def param_sort_key(x):
-    """Parametre sıralama - e1, e2, e_1, e_2 gibi formatları destekler."""
-    import re
-    # Sayıyı bul (e1 -> 1, e_1 -> 1, param_10 -> 10)
-    match = re.search(r'(\d+)', str(x))
-    if match:
-        return int(match.group(1))
-    return str(x)
+# Güvenli sıralama - hem sayı hem string için çalışır (sayılar önce).
+# Anahtarlar rmvc_engine'de; insidans matrisi doğal sıraları bir kez hesaplar
+# (IncidenceMatrix.param_order / element_order).
+safe_sort_key = element_sort_key
 
 
-def csv_to_soft_set(df, rows_are_params=False):
+def csv_to_soft_set(df, rows_are_params=False, sparse=False):
     """
     CSV verisini Soft Set formatına dönüştürür.
     Hocanın Colab koduna tam uyumlu.
@@ -103,109 +146,30 @@ def csv_to_soft_set(df, rows_are_params=False):
     - E: Parametre kümesi (kriterler)
     - Φ(e_i): e_i parametresine ait elemanlar kümesi
     
+    Tablo tek adımda sayıya çevrilir (rmvc_dataset.table_to_mask); insidans
+    matrisi ve toplam_deger dizi işlemleriyle üretilir. E_named ve E_info
+    sözlük uyumlu tembel görünümlerdir (SoftSetView / ParamInfoView):
+    Φ(e_i) kümeleri yalnızca erişildiğinde oluşturulur.
+    
     Args:
         df: DataFrame
         rows_are_params: True ise satırlar=parametreler, sütunlar=elemanlar (Hocanın formatı)
                         False ise satırlar=elemanlar, sütunlar=parametreler
+        sparse: True ise görünümlerin altındaki insidans matrisi seyrek (CSR)
+                formda tutulur
     """
-    if rows_are_params:
-        # Hocanın formatı: Satırlar=Parametreler (e1,e2..), Sütunlar=Elemanlar (1,2..)
-        
-        parametre_ids = df.index.tolist()
-        original_columns = df.columns.tolist()
-        
-        # Hocanın kodu: Sadece sayısal verileri olan sütunları al
-        # Boş, NaN, Unnamed ve tamamen 0 olan sütunları filtrele
-        valid_columns = []
-        for col in original_columns:
-            col_str = str(col).strip()
-            # Boş string, NaN, Unnamed sütunları atla
-            if not col_str or col_str.lower() == 'nan' or col_str.startswith('Unnamed'):
-                continue
-            # Sütunda en az bir sayısal değer olmalı
-            try:
-                col_data = pd.to_numeric(df[col], errors='coerce')
-                if col_data.notna().any():
-                    valid_columns.append(col)
-            except:
-                pass
-        
-        # Ürün sayısını belirle (hocanın yaklaşımı: 1'den başla)
-        num_products = len(valid_columns)
-        
-        # U: Evrensel küme - 1'den num_products'a kadar
-        eleman_ids = [str(i) for i in range(1, num_products + 1)]
-        U = set(eleman_ids)
-        
-        # Sütun eşleştirmesi: simple_id -> original_col
-        col_mapping = {str(i+1): valid_columns[i] for i in range(num_products)}
-        
-        # E: Parametre kümeleri
-        E_named = {}
-        E_info = {}
-        
-        for i, param_id in enumerate(parametre_ids):
-            # Hocanın formatı: e_1, e_2, ... şeklinde adlandır
-            e_key = f"e_{i+1}"
-            satir_verisi = df.loc[param_id]
-            
-            phi_e = set()
-            toplam_deger = 0
-            
-            # Her ürünü kontrol et
-            for simple_id, orig_col in col_mapping.items():
-                try:
-                    deger = satir_verisi[orig_col]
-                    numeric_val = pd.to_numeric(deger, errors='coerce')
-                    if pd.notna(numeric_val) and numeric_val > 0:
-                        phi_e.add(simple_id)
-                        toplam_deger += numeric_val
-                except:
-                    pass
-            
-            E_named[e_key] = phi_e
-            E_info[e_key] = {
-                'orijinal_ad': str(param_id),
-                'eleman_sayisi': len(phi_e),
-                'toplam_deger': toplam_deger,
-                'elemanlar': phi_e
-            }
-    else:
-        # Varsayılan format: Satırlar=Elemanlar, Sütunlar=Parametreler
-        eleman_ids = df.index.tolist()
-        parametre_ids = df.columns.tolist()
-        
-        # U: Evrensel küme (satırlar)
-        U = set(str(eid) for eid in eleman_ids)
-        
-        # E: Parametre kümeleri
-        E_named = {}
-        E_info = {}
-        
-        for i, param_id in enumerate(parametre_ids):
-            e_key = f"e_{i+1}"
-            sutun_verisi = df[param_id]
-            
-            phi_e = set()
-            toplam_deger = 0
-            
-            for eleman_id, deger in sutun_verisi.items():
-                try:
-                    numeric_val = pd.to_numeric(deger, errors='coerce')
-                    if numeric_val > 0:
-                        phi_e.add(str(eleman_id))
-                        toplam_deger += numeric_val
-                except:
-                    pass
-            
-            E_named[e_key] = phi_e
-            E_info[e_key] = {
-                'orijinal_ad': str(param_id),
-                'eleman_sayisi': len(phi_e),
-                'toplam_deger': toplam_deger,
-                'elemanlar': phi_e
-            }
+    mask, values, parametre_ids, eleman_ids, _ = table_to_mask(df, rows_are_params=rows_are_params)
+    toplamlar = np.where(mask, values, 0).sum(axis=1)
     
+    # Hocanın formatı: e_1, e_2, ... şeklinde adlandır
+    param_keys = [f"e_{i+1}" for i in range(len(parametre_ids))]
+    elements = [str(eid) for eid in eleman_ids]
+    # Sütunlar yüklemede bir kez doğal sıraya (1, 2, ..., 10) dizilir
+    incidence = incidence_from_mask(mask, param_keys, elements, sparse=sparse).natural_columns()
+    
+    U = set(elements)
+    E_named = SoftSetView(incidence)
+    E_info = ParamInfoView(incidence, parametre_ids, toplamlar)
     return U, E_named, E_info, eleman_ids, parametre_ids
 
 
@@ -247,7 +211,7 @@ def delta_function(e_i, E_named, U):
     return results
 
 
-def create_membership_matrix(E_named, U):
+def create_membership_matrix(E_named, U, engine="auto", progress=None):
     """
     Üyelik matrisini oluşturur - Makaledeki formüle göre.
     
@@ -262,34 +226,58 @@ def create_membership_matrix(E_named, U):
     - |Φ(e_i)|: e_i kümesindeki eleman sayısı
     - m: Toplam parametre sayısı
     - (m - 1): Diğer parametrelerin sayısı
+    
+    Args:
+        engine: "numpy" ise vektörize backend (rmvc_engine) kullanılır,
+                "sparse" ise seyrek (CSR) backend kullanılır,
+                "bitset" ise bit vektörü + popcount backend'i kullanılır,
+                "auto" ise nnz'ye göre numpy/sparse arasından seçim yapılır,
+                "python" ise δ payları aşağıdaki referans döngülerle
+                hesaplanır.
+        progress: Her parametre satırı (veya satır bloğu) bittiğinde
+                  progress(tamamlanan, toplam) çağrılır.
+    
+    Returns:
+        ExactMembership: δ payları ve γ paydaları dizilerde; m[e_i][u]
+        erişimi referans {e_i: {u: Fraction}} sözlüğüyle aynı kesri verir.
+        Sütunlar elemanların doğal sırasıyla (1, 2, ..., 10) dizilir.
     """
+    if engine == "auto":
+        engine = choose_backend(soft_set_sizes(E_named), len(U))
+    
+    elements = natural_elements(E_named, U)
+    incidence = build_incidence(E_named, U, elements=elements, sparse=(engine == "sparse"))
+    if engine in ("numpy", "sparse"):
+        return exact_membership(incidence, progress=progress)
+    if engine == "bitset":
+        # δ payları AND + popcount ile hesaplanır
+        bitset = BitsetSoftSet.from_soft_set(E_named, U, elements=elements)
+        D = np.array(bitset_delta_rows(bitset, progress=progress),
+                     dtype=np.int64).reshape(incidence.m, incidence.n)
+        return ExactMembership(incidence, D, gamma_vector(incidence))
+    
+    if isinstance(E_named, SoftSetView):
+        # Referans döngüler kümelere tekrar tekrar eriştiğinden sözlüğe açılır
+        E_named = E_named.incidence.to_soft_set()
     m = len(E_named)  # Toplam parametre sayısı
     
-    # Matris: Satırlar = Parametreler (e_i), Sütunlar = Elemanlar (u)
-    membership_matrix = {}
+    # δ payları: Satırlar = Parametreler (e_i), Sütunlar = Elemanlar (u)
+    D = np.zeros((incidence.m, incidence.n), dtype=np.int64)
+    gamma = np.zeros(incidence.m, dtype=np.int64)
+    column = incidence.element_index()
     
-    for e_i in E_named.keys():
-        phi_e_i = E_named[e_i]
-        delta_results = delta_function(e_i, E_named, U)
-        
+    for i, e_i in enumerate(incidence.param_keys):
         # γ(e_i) = |Φ(e_i)| × (m - 1)
-        gamma = len(phi_e_i) * (m - 1)
+        gamma[i] = len(E_named[e_i]) * (m - 1)
         
-        membership_matrix[e_i] = {}
+        # u ∉ Φ(e_i) → Kısmi üyelik δ(u, e_i) / γ(e_i); u ∈ Φ(e_i) hücreleri B'den 1
+        for u, delta_val in delta_function(e_i, E_named, U).items():
+            D[i, column[u]] = delta_val
         
-        for u in U:
-            if u in phi_e_i:
-                # u ∈ Φ(e_i) → Tam üyelik
-                membership_matrix[e_i][u] = Fraction(1, 1)
-            else:
-                # u ∉ Φ(e_i) → Kısmi üyelik
-                if gamma > 0 and u in delta_results:
-                    delta_val = delta_results[u]
-                    membership_matrix[e_i][u] = Fraction(delta_val, gamma)
-                else:
-                    membership_matrix[e_i][u] = Fraction(0, 1)
+        if progress:
+            progress(i + 1, m)
     
-    return membership_matrix
+    return ExactMembership(incidence, D, gamma)
 
 
 def calculate_scores(membership_matrix, U):
@@ -298,6 +286,10 @@ def calculate_scores(membership_matrix, U):
     
     S(u) = Σ_{e_i ∈ E} M(u, e_i)
     """
+    if isinstance(membership_matrix, ExactMembership):
+        # Sütun toplamları ortak payda üzerinden tam sayılarla
+        return membership_matrix.scores().to_dict()
+    
     scores = {}
     
     for u in U:
@@ -309,55 +301,866 @@ def calculate_scores(membership_matrix, U):
     return scores
 
 
-def matrix_to_dataframe(membership_matrix, U, E_info):
+def compute_rmvc(E_named, U, engine="auto", progress=None):
     """
-    Üyelik matrisini DataFrame'e dönüştürür.
-    Satırlar = Parametreler, Sütunlar = Elemanlar (Hocanın formatı)
+    Üyelik matrisini ve skorları tam (exact) modda hesaplar.
     
-    Format:
-    SETS    1       2       3       ...
-    e_1     0.0000  0.1111  0.0000  ...
-    e_2     0.0000  1.0000  0.0278  ...
-    """
-    # Elemanları sayısal sıraya göre sırala (1, 2, 3, ...)
-    sorted_elements = sorted(U, key=safe_sort_key)
+    Hücre başına Fraction oluşturulmaz: δ payları ve γ paydaları tam sayı
+    dizilerinde tutulur, skorlar ortak payda üzerinden toplanır.
     
-    data = []
-    for e_i in sorted(membership_matrix.keys(), key=param_sort_key):
-        row = {'SETS': e_i}  # İlk sütun parametre adı
-        for u in sorted_elements:
-            val = membership_matrix[e_i].get(u, Fraction(0, 1))
-            row[u] = float(val)
-        data.append(row)
+    progress(tamamlanan, toplam) parametre satırları bittikçe çağrılır;
+    fırlattığı istisna (ör. JobCancelled) hesabı durdurur.
     
-    # DataFrame oluştur - sütun sırası: SETS, 1, 2, 3, ...
-    df = pd.DataFrame(data)
+    Returns:
+        membership: ExactMembership
+        exact_scores: ExactScores
+    """
+    membership = create_membership_matrix(E_named, U, engine=engine, progress=progress)
+    return membership, membership.scores()
+
+
+def matrix_view(membership_matrix):
+    """
+    Üyelik matrisinin gösterim sırası.
+    Satırlar = Parametreler (e_1, e_2, ...), Sütunlar = Elemanlar (1, 2, 3, ...)
     
-    # Sütunları doğru sıraya koy
-    cols = ['SETS'] + sorted_elements
-    df = df[cols]
+    Yalnızca etiketler ve permütasyonlar döner (O(m + n)); değerler her
+    görünümde membership_matrix.float_block ile dilim dilim okunur.
     
-    return df
+    Returns:
+        (row_labels, col_labels, row_order, col_order)
+    """
+    incidence = membership_matrix.incidence
+    # Permütasyonlar insidans matrisinde bir kez hesaplanır
+    row_order = incidence.param_order()
+    col_order = incidence.element_order()
+    return ([incidence.param_keys[i] for i in row_order], [incidence.elements[j] for j in col_order],
+            row_order, col_order)
 
 
 def get_element_detail(u, membership_matrix, E_info):
     """Bir elemanın tüm parametrelerdeki üyelik değerlerini döndürür."""
-    details = []
-    for e_i in sorted(membership_matrix.keys(), key=param_sort_key):
-        val = membership_matrix[e_i].get(u, Fraction(0, 1))
-        details.append({
+    # Kesirler yalnızca seçilen eleman için (m hücre) oluşturulur
+    incidence = membership_matrix.incidence
+    j = incidence.element_index()[u]
+    values = membership_matrix.column(u)
+    order = incidence.param_order()
+    return pd.DataFrame({
+        'Parametre': [incidence.param_keys[i] for i in order],
+        'Orijinal Ad': [E_info[incidence.param_keys[i]]['orijinal_ad'] for i in order],
+        'Üyelik (Kesir)': [str(membership_matrix.fraction(i, j)) for i in order],
+        'Üyelik (Ondalık)': np.round(values[order], 4),
+    })
+
+
+def parameter_table(E_info, m):
+    """
+    Parametre analizi tablosu (|Φ(e_i)|, γ(e_i) ve eleman listeleri).
+
+    ParamInfoView'da sıralama insidans indeksleriyle yapılır; eleman
+    etiketleri yalnızca metin oluşturulurken kullanılır.
+    """
+    if isinstance(E_info, ParamInfoView):
+        incidence = E_info.incidence
+        ranks = incidence.element_ranks()
+        rows = incidence.param_order()
+        sizes = E_info.set_sizes()[rows]
+        elements = incidence.elements
+
+        def eleman_listesi(i):
+            cols = incidence.row_indices(i)
+            return ', '.join(elements[j] for j in cols[np.argsort(ranks[cols], kind='stable')])
+
+        return pd.DataFrame({
+            'Parametre': [incidence.param_keys[i] for i in rows],
+            'Orijinal ID': [E_info.names[i] for i in rows],
+            'Eleman Sayısı |Φ(eᵢ)|': sizes,
+            'γ(eᵢ)': sizes * (m - 1),
+            'Elemanlar': [eleman_listesi(i) for i in rows],
+        })
+    param_data = []
+    for e_i in sorted(E_info.keys(), key=param_sort_key):
+        info = E_info[e_i]
+        param_data.append({
             'Parametre': e_i,
-            'Orijinal Ad': E_info[e_i]['orijinal_ad'],
-            'Üyelik (Kesir)': str(val),
-            'Üyelik (Ondalık)': round(float(val), 4)
+            'Orijinal ID': info['orijinal_ad'],
+            'Eleman Sayısı |Φ(eᵢ)|': info['eleman_sayisi'],
+            'γ(eᵢ)': info['eleman_sayisi'] * (m - 1),
+            'Elemanlar': ', '.join(sorted(info['elemanlar'], key=safe_sort_key))
         })
-    return pd.DataFrame(details)
+    return pd.DataFrame(param_data)
 
 
 # ============================================================
 # STREAMLIT ARAYÜZÜ
 # ============================================================
 
+def open_stored_result(anahtar, hesapla, E_info, secenekler):
+    """
+    Anahtarın diskteki sonuç artefaktını (rmvc_store) açar; yoksa hesaplayıp
+    yazar. hesapla() → (ExactScores, ExactMembership veya None).
+    
+    Yeni sonuç yazıldıktan sonra depo boyut sınırına (rmvc_store.prune_store)
+    göre en uzun süredir kullanılmayan artefaktlar silinir. Depo
+    yazılamıyorsa sonuç bellekte tutulan bir artefakt gibi döndürülür.
+    Arka plan işinde çalıştığı için arayüze değil günlüğe yazar.
+    """
+    yol = result_path(anahtar)
+    if not is_result(yol):
+        exact, membership = hesapla()
+        param_keys = membership.incidence.param_keys if membership is not None else list(E_info)
+        try:
+            write_result(yol, exact, param_keys,
+                         param_names=[E_info[k]['orijinal_ad'] for k in param_keys],
+                         totals=[E_info[k]['toplam_deger'] for k in param_keys],
+                         membership=membership, options=secenekler)
+        except OSError as e:
+            logger.warning("Sonuç diske kaydedilemedi (%s); yalnızca bellekte tutuluyor.", e)
+            return _InMemoryResult(exact, membership, E_info)
+        prune_store(os.path.dirname(yol), keep=yol)
+    return load_result(yol)
+
+
+class _InMemoryResult:
+    """Depo yazılamadığında StoredResult yerine kullanılan bellek içi sonuç."""
+    
+    __slots__ = ('_exact', '_membership', '_info')
+    
+    def __init__(self, exact, membership, E_info):
+        self._exact = exact
+        self._membership = membership
+        self._info = E_info
+    
+    @property
+    def m(self):
+        return len(self._info)
+    
+    def scores(self):
+        return self._exact
+    
+    def membership(self):
+        if self._membership is not None and self._membership.info is None:
+            self._membership.info = self._info
+        return self._membership
+    
+    def param_info(self):
+        return self._info
+
+
+@st.cache_resource
+def get_result_cache():
+    """
+    Sunucudaki tüm oturumların paylaştığı sonuç önbelleği (rmvc_cache).
+    
+    Anahtar girdi içeriğinin özeti ve hesaplama seçenekleridir; yalnızca
+    gösterimi değiştiren ayarlar yeniden hesaplama tetiklemez.
+    """
+    return ResultCache()
+
+
+@st.cache_resource
+def get_job_runner():
+    """
+    Sunucudaki tüm oturumların paylaştığı iş parçacığı havuzu (rmvc_jobs).
+    
+    Havuz bir kez kurulur; yeniden çalıştırmalar çalışan işlere bağlanır.
+    """
+    return JobRunner()
+
+
+def _sure_metni(saniye):
+    """Kalan süre için kısa metin (ör. '1 dk 05 sn')."""
+    saniye = int(round(saniye))
+    if saniye < 60:
+        return f"{saniye} sn"
+    return f"{saniye // 60} dk {saniye % 60:02d} sn"
+
+
+def run_in_background(anahtar, hesapla, cache, mesaj="🔄 RMVC analizi yapılıyor..."):
+    """
+    hesapla(progress) işini paylaşılan havuzda yürütür ve sonucu önbelleğe
+    yazar; beklerken ilerleme çubuğu, kalan süre tahmini ve iptal düğmesi
+    gösterir.
+    
+    Oturum işe abone olarak bağlanır. Oturumun önceki işi farklı bir
+    anahtara aitse (ör. satır/sütun yönü değiştirildi) ya da iptal düğmesine
+    basılırsa oturum işten ayrılır; iş yalnızca onu bekleyen başka oturum
+    kalmadıysa iptal edilir. İptal edilen analiz, kullanıcı yeniden
+    başlatana kadar bu oturumda tekrar kuyruğa alınmaz.
+    
+    Returns:
+        Sonuç; iptal durumunda betik st.stop() ile sonlandırılır.
+    """
+    missing = object()
+    sonuc = cache.get(anahtar, missing)
+    if sonuc is not missing:
+        return sonuc
+    
+    runner = get_job_runner()
+    oturum = st.session_state.setdefault('oturum_id', uuid.uuid4().hex)
+    onceki = st.session_state.get('aktif_is')
+    if onceki is not None and onceki != anahtar:
+        runner.detach(onceki, oturum)
+    
+    if st.session_state.get('iptal_edilen') == anahtar:
+        if not st.button("▶️ Analizi yeniden başlat", key=f"yeniden_{anahtar}"):
+            st.warning("⏹️ Analiz iptal edildi. Ayarları değiştirin veya yeniden başlatın.")
+            st.stop()
+        st.session_state['iptal_edilen'] = None
+    
+    st.session_state['aktif_is'] = anahtar
+    job = runner.submit(anahtar, lambda progress: cache.put(anahtar, hesapla(progress)), oturum)
+    
+    if st.button("⏹️ Hesaplamayı iptal et", key=f"iptal_{anahtar}"):
+        runner.detach(anahtar, oturum)
+        st.session_state['aktif_is'] = None
+        st.session_state['iptal_edilen'] = anahtar
+        st.rerun()
+    
+    progress_bar = st.progress(0.0, text=mesaj)
+    while not job.finished:
+        eta = job.eta()
+        kalan = f" · kalan ~{_sure_metni(eta)}" if eta is not None else ""
+        progress_bar.progress(job.fraction, text=f"{mesaj} %{job.fraction * 100:.0f}{kalan}")
+        time.sleep(0.25)
+    progress_bar.empty()
+    
+    # Biten iş havuzdan kendiliğinden çıkar; sonuç önbellekte (cache.put iş içinde)
+    if st.session_state.get('aktif_is') == anahtar:
+        st.session_state['aktif_is'] = None
+    try:
+        return job.result()
+    except JobCancelled:
+        st.session_state['iptal_edilen'] = anahtar
+        st.warning("⏹️ Analiz iptal edildi.")
+        st.stop()
+
+
+def _heatmap_figure(values, x, y, title):
+    """Isı haritası; hücre sayısı HEATMAP_TEXT_CELLS'u aşarsa hücre yazısı çizilmez."""
+    fig = px.imshow(
+        values,
+        x=x,
+        y=y,
+        title=title,
+        color_continuous_scale='Viridis',
+        zmin=0.0,
+        zmax=1.0,
+        aspect='auto',
+        text_auto='.2f' if values.size <= HEATMAP_TEXT_CELLS else False
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def membership_window(membership_matrix, view):
+    """
+    Üyelik matrisinin gösterim sırasıyla (matrix_view) dilimlenmesi.
+    
+    Returns:
+        row_labels, col_labels: Satır (SETS) ve sütun (eleman) etiketleri
+        pencere(R, J): Gösterim sırasındaki satır/sütun dilimlerinin float
+                       değerleri; yalnızca o hücreler okunur
+        ozetle(how): Blok max/ortalama özeti (rmvc_plot)
+    """
+    row_labels, col_labels, row_order, col_order = view
+    
+    def pencere(R, J):
+        return membership_matrix.float_block(row_order[R], col_order[J])
+    
+    def ozetle(how):
+        return downsample_membership(membership_matrix, row_order, col_order, how=how)
+    
+    return row_labels, col_labels, pencere, ozetle
+
+
+def render_heatmap(membership_matrix, view, cache=None, anahtar=None):
+    """
+    Üyelik matrisi ısı haritası.
+    
+    HEATMAP_MAX_ROWS × HEATMAP_MAX_COLS'a sığan matrisler hücre hücre
+    çizilir. Daha büyük matrisler sunucuda blok max/ortalamaya indirgenir
+    (rmvc_plot); ayrıntı için seçilen satır/sütun penceresi tam üyelik
+    matrisinden tembel dilimlenir. cache ve anahtar verilirse blok özeti
+    önbelleklenir.
+    """
+    row_labels, col_labels, pencere, ozetle = membership_window(membership_matrix, view)
+    m, n = len(row_labels), len(col_labels)
+    
+    if m <= HEATMAP_MAX_ROWS and n <= HEATMAP_MAX_COLS:
+        st.plotly_chart(_heatmap_figure(pencere(slice(None), slice(None)), col_labels, row_labels,
+                                        'Üyelik Değerleri (Sarı=1, Mor=0)'), use_container_width=True)
+        return
+    
+    secim = st.radio("Blok özeti:", ["En büyük (max)", "Ortalama"], horizontal=True, key="heatmap_ozet")
+    how = "max" if secim.startswith("En büyük") else "mean"
+    if cache is None:
+        ozet, row_edges, col_edges = ozetle(how)
+    else:
+        ozet, row_edges, col_edges = cache.get_or_compute(
+            content_hash(anahtar, asama="heatmap", how=how), lambda: ozetle(how))
+    st.caption(f"{m}×{n} matris sunucuda {ozet.shape[0]}×{ozet.shape[1]} bloğa indirgendi "
+               f"(blok {'max' if how == 'max' else 'ortalama'}).")
+    st.plotly_chart(_heatmap_figure(ozet, block_labels(col_labels, col_edges), block_labels(row_labels, row_edges),
+                                    'Üyelik Değerleri - Blok Özeti (Sarı=1, Mor=0)'), use_container_width=True)
+    
+    with st.expander("🔎 Yakınlaştır (satır/sütun penceresi)", expanded=False):
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            r0 = st.number_input("İlk satır", 1, m, 1, key="heatmap_r0") - 1
+        with c2:
+            rn = st.number_input("Satır sayısı", 1, min(m, HEATMAP_MAX_ROWS), min(m, 30), key="heatmap_rn")
+        with c3:
+            c0 = st.number_input("İlk sütun", 1, n, 1, key="heatmap_c0") - 1
+        with c4:
+            cn = st.number_input("Sütun sayısı", 1, min(n, HEATMAP_MAX_COLS), min(n, 30), key="heatmap_cn")
+        R = slice(r0, min(r0 + rn, m))
+        J = slice(c0, min(c0 + cn, n))
+        st.plotly_chart(_heatmap_figure(pencere(R, J), col_labels[J], row_labels[R],
+                                        f'Satır {R.start + 1}–{R.stop}, Sütun {J.start + 1}–{J.stop}'),
+                        use_container_width=True)
+
+
+def _page_controls(total, key):
+    """
+    Sayfa boyutu ve sayfa seçimi.
+    
+    Returns:
+        Görünür satırların dilimi
+    """
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        boyut = st.selectbox("Sayfa boyutu", PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+                             key=f"{key}_boyut")
+    sayfalar = page_count(total, boyut)
+    if st.session_state.get(f"{key}_sayfa", 1) > sayfalar:
+        # Filtre satır sayısını azalttıysa son sayfaya dön
+        st.session_state[f"{key}_sayfa"] = sayfalar
+    with col2:
+        sayfa = st.number_input(f"Sayfa (toplam {sayfalar})", 1, sayfalar, 1, key=f"{key}_sayfa")
+    R = page_slice(total, sayfa - 1, boyut)
+    with col3:
+        st.caption(f"{R.start + 1}–{R.stop} / {total} satır" if total else "Eşleşen satır yok")
+    return R
+
+
+def render_score_table(exact, order, kesir_goster, key="skorlar"):
+    """
+    Sayfalı skor tablosu.
+    
+    Sıralama ve filtreler indeks dizileri üzerinde yapılır; yalnızca görünür
+    sayfa DataFrame'e (ve kesir metnine) çevrilir (rmvc_table).
+    """
+    score_values = exact.to_float()
+    n = len(exact.elements)
+    best_mask = np.zeros(n, dtype=bool)
+    best_mask[exact.best()] = True
+    order = np.asarray(order, dtype=np.intp)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        siralama = st.selectbox("Sırala:", ["Skor (azalan)", "Skor (artan)", "Eleman"], key=f"{key}_sirala")
+    with col2:
+        arama = st.text_input("Eleman ara:", key=f"{key}_ara")
+    with col3:
+        en_dusuk = st.number_input("En düşük skor:", value=0.0, step=0.1, key=f"{key}_min")
+    
+    if siralama == "Skor (artan)":
+        rows = order[::-1]
+    elif siralama == "Eleman":
+        rows = np.sort(order)
+    else:
+        rows = order
+    rows = filter_labels(rows, exact.elements, arama)
+    if en_dusuk > 0:
+        rows = filter_range(rows, score_values, low=en_dusuk)
+    
+    R = _page_controls(len(rows), key)
+    st.dataframe(
+        score_page(exact, rows[R], score_ranks(order, n), score_values, best_mask, kesir_goster),
+        use_container_width=True,
+        hide_index=True,
+        column_config={'Skor (Ondalık)': st.column_config.NumberColumn(format="%.4f")}
+    )
+
+
+def render_matrix_table(membership_matrix, view, exact):
+    """
+    Sayfalı üyelik matrisi tablosu ve SUM s(x) satırı.
+    
+    Parametre satırları ve eleman sütunları ayrı ayrı sayfalanır; görünür
+    pencere membership_window ile dilimlenir, ondalıklar tarayıcıda
+    biçimlendirilir. Sütun toplamları skorların kendisidir (s(x) = S(u)).
+    """
+    row_labels, col_labels, pencere, _ = membership_window(membership_matrix, view)
+    score_values = exact.to_float()
+    score_index = {u: j for j, u in enumerate(exact.elements)}
+    col_scores = score_values[[score_index[u] for u in col_labels]]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        arama = st.text_input("Parametre ara:", key="matris_ara")
+    with col2:
+        sutun_sirasi = st.selectbox("Sütun sırası:", ["Eleman", "Skor (azalan)"], key="matris_sutun_sirasi")
+    
+    rows = filter_labels(np.arange(len(row_labels)), row_labels, arama)
+    cols = np.argsort(-col_scores, kind='stable') if sutun_sirasi == "Skor (azalan)" \
+        else np.arange(len(col_labels))
+    
+    st.caption("Parametre satırları")
+    R = _page_controls(len(rows), "matris_satir")
+    st.caption("Eleman sütunları")
+    J = _page_controls(len(cols), "matris_sutun")
+    
+    row_page, col_page = rows[R], cols[J]
+    if len(col_page) and len(row_page):
+        values = pencere(row_page, col_page)
+    else:
+        values = np.empty((len(row_page), len(col_page)))
+    columns = [col_labels[j] for j in col_page]
+    formats = {c: st.column_config.NumberColumn(format="%.4f") for c in columns}
+    
+    st.dataframe(
+        pd.DataFrame(values, index=pd.Index([row_labels[i] for i in row_page], name='SETS'), columns=columns),
+        use_container_width=True,
+        column_config=formats
+    )
+    
+    st.markdown("### 📊 SUM s(x) - Sütun Toplamları")
+    st.dataframe(
+        pd.DataFrame([col_scores[col_page]], columns=columns, index=['SUM s(x)']),
+        use_container_width=True,
+        column_config=formats
+    )
+
+
+def render_matrix_download(membership_matrix, view, exact, label, file_name, key, with_sum=False):
+    """
+    Üyelik matrisi CSV indirmesi.
+    
+    CSV yalnızca istendiğinde, satır blokları hâlinde geçici dosyaya yazılır
+    (rmvc_table.write_matrix_csv); önbelleğe alınmaz. with_sum: SUM s(x)
+    satırı (sütun toplamları = skorlar) eklenir.
+    """
+    import tempfile
+    
+    if not st.button(f"📄 {label}: CSV'yi hazırla", key=f"{key}_hazirla"):
+        return
+    _, _, row_order, col_order = view
+    sums = exact.to_float()[col_order] if with_sum else None
+    with st.spinner("🔄 CSV hazırlanıyor..."), \
+            tempfile.TemporaryFile(mode='w+', encoding='utf-8', newline='') as f:
+        write_matrix_csv(f, membership_matrix, row_order, col_order, sums=sums)
+        f.seek(0)
+        st.download_button(f"📥 {label}", f.read(), file_name, "text/csv", key=f"{key}_indir")
+
+
+def render_score_charts(exact, score_values, order, best_score):
+    """
+    Skor grafikleri: ilk N elemanın çubuk grafiği ile sunucuda hesaplanan
+    histogram ve kutu grafiği (tarayıcıya eleman başına nokta gönderilmez).
+    """
+    n = len(order)
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Bar chart - Skorlar (ilk N)
+        ilk_n = st.slider("Gösterilecek eleman sayısı (ilk N)", 1, min(n, 200), min(n, 20),
+                          key="grafik_ilk_n") if n > 1 else n
+        top = order[:ilk_n]
+        top_df = pd.DataFrame({
+            'Eleman': [str(exact.elements[j]) for j in top],
+            'Skor (Ondalık)': score_values[top],
+        })
+        fig_bar = px.bar(
+            top_df,
+            x='Eleman',
+            y='Skor (Ondalık)',
+            title=f'🏅 Eleman Skorları (Top {ilk_n})',
+            color='Skor (Ondalık)',
+            color_continuous_scale='Viridis'
+        )
+        fig_bar.update_layout(xaxis_tickangle=-45, xaxis_type='category')
+        st.plotly_chart(fig_bar, use_container_width=True)
+    
+    with col2:
+        # Histogram - kutular sunucuda sayılır
+        counts, centers, width = histogram(score_values)
+        fig_hist = go.Figure(go.Bar(x=centers, y=counts, width=width, marker_color='#1f77b4'))
+        fig_hist.update_layout(title='📈 Skor Dağılımı', xaxis_title='Skor (Ondalık)',
+                               yaxis_title='Eleman sayısı', bargap=0)
+        fig_hist.add_vline(x=best_score, line_dash="dash", line_color="red",
+                           annotation_text=f"Max: {best_score:.2f}")
+        st.plotly_chart(fig_hist, use_container_width=True)
+    
+    # Box plot - çeyrekler sunucuda, yalnızca en uçtaki aykırı değerler çizilir
+    stats = box_stats(score_values)
+    fig_box = go.Figure(go.Box(
+        name='Skor (Ondalık)', q1=[stats['q1']], median=[stats['median']], q3=[stats['q3']],
+        lowerfence=[stats['lowerfence']], upperfence=[stats['upperfence']], mean=[stats['mean']],
+        boxpoints=False
+    ))
+    if len(stats['outliers']):
+        fig_box.add_trace(go.Scatter(x=['Skor (Ondalık)'] * len(stats['outliers']), y=stats['outliers'],
+                                     mode='markers', name='Aykırı değerler'))
+    fig_box.update_layout(title='📦 Skor Box Plot', showlegend=False)
+    st.plotly_chart(fig_box, use_container_width=True)
+
+
+def render_stream_analysis(uploaded_file, rows_are_params, bos_filtrele, kesir_goster, ilk_k=0,
+                           cache=None, kaynak=None):
+    """
+    Büyük CSV dosyaları için akış modu: dosya iki geçişte parça parça
+    işlenir, tam üyelik matrisi bellekte tutulmaz. Yalnızca skorlar ve
+    karar gösterilir; üyelik matrisi geçici dosyaya yazılıp indirilebilir.
+    
+    Hesap run_in_background ile paylaşılan havuzda yürür (ilerleme, kalan
+    süre ve iptal); sonuç girdi özeti (kaynak) ve seçeneklerle önbelleklenir.
+    """
+    import tempfile
+    
+    def hesapla(progress):
+        # 1. geçişte satır sayısı bilinmez; iki geçiş eşit ağırlıklı sayılır
+        def ilerleme(asama, islenen, toplam):
+            if asama == 1:
+                progress(0, 0)
+            else:
+                progress(toplam + islenen, 2 * max(toplam, 1))
+        
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
+            output_path = tmp.name
+        try:
+            uploaded_file.seek(0)
+            exact, E_info = stream_rmvc_csv(
+                uploaded_file, rows_are_params=rows_are_params,
+                bos_filtrele=bos_filtrele, output=output_path, progress=ilerleme
+            )
+            with open(output_path, 'rb') as f:
+                matrix_csv = f.read()
+        finally:
+            os.remove(output_path)
+        return exact, E_info, matrix_csv
+    
+    if cache is None:
+        cache = get_result_cache()
+    if kaynak is None:
+        kaynak = content_hash(uploaded_file.getvalue(), ad=uploaded_file.name)
+    anahtar = content_hash(kaynak, asama="akis", rows_are_params=rows_are_params, bos_filtrele=bos_filtrele)
+    exact, E_info, matrix_csv = run_in_background(anahtar, hesapla, cache,
+                                                  mesaj="🔄 Akış modu: iki geçiş...")
+    
+    if len(E_info) < 2:
+        st.error("❌ En az 2 boş olmayan parametre kümesi gerekli!")
+        return
+    
+    st.success(f"✅ Akış modu: {uploaded_file.name} ({len(E_info)} parametre × {len(exact.elements)} eleman)")
+    order = render_score_summary(exact, len(E_info), kesir_goster, ilk_k)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        csv_scores = score_table(exact, order, kesir_goster).to_csv(index=False).encode('utf-8')
+        st.download_button("📥 Skorları İndir", csv_scores, "rmvc_skorlar.csv", "text/csv")
+    with col2:
+        st.download_button("📥 Matrisi İndir", matrix_csv, "rmvc_matris.csv", "text/csv")
+
+
+def render_score_summary(exact, m, kesir_goster, ilk_k=0):
+    """
+    Yalnızca skorlara dayanan özet görünüm (metrikler, karar, skor tablosu).
+    
+    ilk_k > 0 ise tam sıralama yapılmaz; ilk k eleman (kesimdeki eşitlik
+    grubu dahil) kısmi seçimle bulunur.
+    
+    Returns:
+        Gösterilen elemanların sıralı indeksleri
+    """
+    score_values = exact.to_float()
+    order = exact.top_k(ilk_k) if ilk_k > 0 else exact.ranking()
+    best_idx = exact.best()
+    best_score = float(score_values[best_idx[0]])
+    best_choices = [exact.elements[j] for j in best_idx]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Toplam Eleman (|U|)", len(exact.elements))
+    with col2:
+        st.metric("Toplam Parametre (m)", m)
+    with col3:
+        st.metric("Ortalama Skor", f"{score_values.mean():.3f}")
+    with col4:
+        st.metric("Max Skor", f"{best_score:.3f}")
+    
+    st.markdown(f"""
+    <div class="best-choice">
+        🏆 <b>Optimal Seçim:</b> {', '.join(best_choices)}<br>
+        <small>Skor: {best_score:.4f}</small>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if ilk_k > 0:
+        st.markdown(f"### 📋 İlk {ilk_k} Eleman (Sıralı)")
+        if len(order) > ilk_k:
+            st.caption(f"Kesim noktasındaki eşitlik nedeniyle {len(order)} eleman gösteriliyor.")
+    else:
+        st.markdown("### 📋 Eleman Skorları (Sıralı)")
+    render_score_table(exact, order, kesir_goster)
+    return order
+
+
+def render_variant_tab(E_named, U, kaynak, rows_are_params, cache):
+    """
+    δ semantiği × boş küme varyantlarının karşılaştırması (rmvc_variants).
+    
+    Dört varyant, boş kümeler filtrelenmemiş soft set üzerinde tek geçişte
+    hesaplanır; sonuç boş küme filtresinden bağımsız olduğundan tek
+    anahtarla önbelleğe alınır.
+    """
+    st.markdown("### ⚖️ δ Varyantları")
+    st.caption("Her küme sayılır (rmvc_app_v2, RMVC-git.py) / en az bir küme (RMVC-csv.py, break) × "
+               "boş kümeler m'ye dahil / hariç. Dört varyant ortak birliktelik verisiyle tek geçişte hesaplanır.")
+    anahtar = content_hash(kaynak, asama="varyantlar", rows_are_params=rows_are_params)
+    if anahtar not in cache and not st.checkbox("Varyantları hesapla", value=False, key="varyant_hesapla"):
+        return
+    
+    def hesapla(progress):
+        inc = E_named.incidence if isinstance(E_named, SoftSetView) else build_incidence(E_named, U)
+        return variant_scores(inc, progress=progress)
+    
+    sonuclar = run_in_background(anahtar, hesapla, cache, mesaj="🔄 Varyantlar hesaplanıyor...")
+    temel = st.selectbox("Temel varyant", list(DELTA_VARIANTS), index=list(DELTA_VARIANTS).index(DEFAULT_BASELINE),
+                         format_func=lambda v: f"{v} - {VARIANT_LABELS[v]}", key="varyant_temel")
+    st.dataframe(
+        variant_summary(sonuclar, baseline=temel),
+        use_container_width=True,
+        hide_index=True,
+        column_config={'Spearman ρ': st.column_config.NumberColumn(format="%.4f")}
+    )
+    
+    farklar = cache.get_or_compute(content_hash(anahtar, asama="varyant_farklari", temel=temel),
+                                   lambda: ranking_diffs(sonuclar, baseline=temel))
+    goster = farklar
+    if st.checkbox("Yalnızca sırası değişen elemanlar", value=True, key="varyant_degisen"):
+        goster = farklar[farklar.filter(like='Δ sıra').abs().max(axis=1).to_numpy() > 0]
+    if goster.empty:
+        st.success("✅ Tüm varyantlarda sıralama aynı.")
+    else:
+        R = _page_controls(len(goster), "varyant")
+        st.dataframe(goster.iloc[R], use_container_width=True, hide_index=True,
+                     column_config={c: st.column_config.NumberColumn(format="%.4f")
+                                    for c in goster.columns if c.startswith('Skor')})
+    st.download_button("📥 Varyant Sıra Farklarını İndir", farklar.to_csv(index=False).encode('utf-8'),
+                       "rmvc_varyantlar.csv", "text/csv")
+
+
+def render_sensitivity_tab(E_named, E_info, U, kaynak, secenekler, cache):
+    """
+    Bir parametre çıkarıldığında karar ve sıralama (rmvc_sensitivity).
+    
+    m adet "e_j hariç" skor vektörü tam hesabın birliktelik verisinden
+    e_j'nin katkısı çıkarılarak (m kez yeniden hesaplamadan) üretilir.
+    """
+    st.markdown("### 🧪 Duyarlılık: Bir Parametre Çıkarılınca")
+    st.caption("Her eⱼ için eⱼ çıkarılmış soft setin skorları (m − 1 parametre, γ = |Φ|·(m − 2)). "
+               "Kararı değiştiren parametreler önce, sonra sıralamayı en çok değiştirenler (en düşük ρ).")
+    anahtar = content_hash(kaynak, asama="duyarlilik", **secenekler)
+    if anahtar not in cache and not st.checkbox("Duyarlılığı hesapla", value=False, key="duyarlilik_hesapla"):
+        return
+    
+    def hesapla(progress):
+        inc = E_named.incidence if isinstance(E_named, SoftSetView) else build_incidence(E_named, U)
+        adlar = [E_info[k]['orijinal_ad'] for k in inc.param_keys]
+        return leave_one_parameter_out(inc, names=adlar, progress=progress)
+    
+    exact, tablo = run_in_background(anahtar, hesapla, cache, mesaj="🔄 Duyarlılık hesaplanıyor...")
+    degistiren = tablo[tablo['Karar değişir']]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Kararı değiştiren parametre", f"{len(degistiren)}/{len(tablo)}")
+    with col2:
+        st.metric("En düşük Spearman ρ", f"{tablo['Spearman ρ'].min():.4f}")
+    with col3:
+        st.metric("En büyük sıra kayması", int(tablo['En büyük kayma'].max()))
+    kazanan = ', '.join(str(exact.elements[j]) for j in exact.best())
+    if degistiren.empty:
+        st.success(f"✅ Hiçbir parametrenin çıkarılması kararı ({kazanan}) değiştirmiyor.")
+    else:
+        adlar = degistiren['Parametre'].tolist()
+        st.warning(f"⚠️ Çıkarılınca kararı ({kazanan}) değiştiren parametreler: " + ', '.join(adlar[:10]) +
+                   (f" ... (+{len(adlar) - 10})" if len(adlar) > 10 else ""))
+    
+    goster = tablo
+    if not degistiren.empty and st.checkbox("Yalnızca kararı değiştiren parametreler", value=False,
+                                            key="duyarlilik_degisen"):
+        goster = degistiren
+    R = _page_controls(len(goster), "duyarlilik")
+    st.dataframe(goster.iloc[R], use_container_width=True, hide_index=True,
+                 column_config={'Spearman ρ': st.column_config.NumberColumn(format="%.4f")})
+    st.download_button("📥 Duyarlılık Tablosunu İndir", tablo.to_csv(index=False).encode('utf-8'),
+                       "rmvc_duyarlilik.csv", "text/csv")
+
+
+def influence_key(kaynak, secenekler):
+    """Eleman etkisi sonucunun önbellek anahtarı (Detaylı Analiz sekmesi de okur)."""
+    return content_hash(kaynak, asama="eleman_etkisi", **secenekler)
+
+
+def render_influence_section(E_named, U, kaynak, secenekler, cache):
+    """
+    Bir eleman U'dan çıkarıldığında diğer elemanların skorları (rmvc_sensitivity).
+    
+    Etki: v çıkarılınca diğer elemanların toplam skor kaybı (v'nin onları ne
+    kadar desteklediği); tablo ana skor ve sıralamayla birlikte verilir.
+    """
+    st.markdown("### 🧲 Eleman Etkisi: Bir Eleman Çıkarılınca")
+    st.caption("Her v için v'siz U ile skorlar (parametre kümeleri aynı, Φ(eᵢ) ∋ v kümeleri bir küçülür). "
+               "Etki = diğer elemanların toplam skor kaybı; pozitif: v diğerlerinin δ değerlerini destekliyor.")
+    anahtar = influence_key(kaynak, secenekler)
+    if anahtar not in cache and not st.checkbox("Eleman etkisini hesapla", value=False, key="etki_hesapla"):
+        return
+    
+    def hesapla(progress):
+        inc = E_named.incidence if isinstance(E_named, SoftSetView) else build_incidence(E_named, U)
+        return leave_one_element_out(inc, progress=progress)
+    
+    _, tablo = run_in_background(anahtar, hesapla, cache, mesaj="🔄 Eleman etkisi hesaplanıyor...")
+    degistiren = tablo[tablo['Karar değişir']]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("En etkili eleman", tablo['Eleman'].iloc[0], f"{tablo['Etki'].iloc[0]:+.4f}")
+    with col2:
+        st.metric("Kararı değiştiren eleman", f"{len(degistiren)}/{len(tablo)}")
+    goster = tablo
+    if not degistiren.empty and st.checkbox("Yalnızca kararı değiştiren elemanlar", value=False,
+                                            key="etki_degisen"):
+        goster = degistiren
+    R = _page_controls(len(goster), "etki")
+    st.dataframe(goster.iloc[R], use_container_width=True, hide_index=True,
+                 column_config={c: st.column_config.NumberColumn(format="%.4f")
+                                for c in ('Skor', 'Etki', 'Spearman ρ')})
+    st.download_button("📥 Eleman Etkisi Tablosunu İndir", tablo.to_csv(index=False).encode('utf-8'),
+                       "rmvc_eleman_etkisi.csv", "text/csv")
+
+
+def threshold_values(df, dataset, rows_are_params):
+    """
+    Eşik taraması için m×n özgün değerler ve eleman etiketleri
+    (csv_to_soft_set ile aynı etiketler); veri seti değer saklamıyorsa (None, None).
+    """
+    if dataset is not None:
+        degerler = dataset.value_matrix()
+        if degerler is None:
+            return None, None
+        return degerler, list(dataset.elements)
+    _, degerler, _, eleman_ids, _ = table_to_mask(df, rows_are_params=rows_are_params)
+    return degerler, eleman_ids
+
+
+def render_threshold_tab(df, dataset, kaynak, secenekler, cache):
+    """
+    İkilileştirme eşiği taraması (rmvc_threshold).
+    
+    Hücre değerleri bir kez sıralanır; eşikler arasında düşen hücrelerin
+    katkısı birliktelik sayılarından toplu olarak çıkarılır. "Boş kümeleri
+    filtrele" seçeneği her eşikte boşalan kümelere uygulanır.
+    """
+    st.markdown("### 🎚️ Eşik Taraması: Üyelik Eşiği Değişince")
+    st.caption("Üyelik değer > 0 yerine değer > t (genel eşik) veya parametre satırındaki pozitif değerlerin "
+               "q kantili ile belirlenir. Tüm eşikler tek geçişte hesaplanır; t = 0 / q = 0 ana sonuçtur.")
+    # Değerler (yeniden ayrıştırma) yalnızca tarama istenince okunur
+    if not st.checkbox("Eşik taramasını hesapla", value=False, key="esik_hesapla"):
+        return
+    degerler, elemanlar = cache.get_or_compute(
+        content_hash(kaynak, asama="degerler", rows_are_params=secenekler['rows_are_params']),
+        lambda: threshold_values(df, dataset, secenekler['rows_are_params']))
+    if degerler is None:
+        st.info("ℹ️ Bu veri seti hücre değerlerini saklamıyor (rmvc_dataset.py --values ile dönüştürün).")
+        return
+    pozitif = degerler[degerler > 0]
+    if pozitif.size == 0:
+        st.info("ℹ️ Pozitif değerli hücre yok.")
+        return
+    kantil = st.radio("Eşik türü", ["Genel eşik (değer > t)", "Parametre kantili (q)"], horizontal=True,
+                      key="esik_turu") != "Genel eşik (değer > t)"
+    varsayilan = "0, 0.25, 0.5, 0.75" if kantil else \
+        ", ".join(["0"] + [f"{t:g}" for t in np.unique(np.quantile(pozitif, [0.25, 0.5, 0.75]))])
+    metin = st.text_input("Eşikler (virgülle)", value=varsayilan, key=f"esikler_{int(kantil)}")
+    try:
+        esikler = tuple(sorted({float(t) for t in metin.split(',') if t.strip()}))
+    except ValueError:
+        st.error("❌ Eşikler sayı olmalı.")
+        return
+    if not esikler:
+        return
+    if esikler[0] < 0 or (kantil and esikler[-1] > 1):
+        st.error("❌ Kantiller [0, 1] aralığında olmalı." if kantil else "❌ Eşikler negatif olamaz.")
+        return
+    anahtar = content_hash(kaynak, asama="esik_taramasi", kantil=kantil, esikler=esikler, **secenekler)
+    
+    def hesapla(progress):
+        adimlar = threshold_sweep(degerler, esikler, per_parameter=kantil,
+                                  drop_empty=secenekler['bos_filtrele'], elements=elemanlar,
+                                  progress=progress)
+        return sweep_summary(adimlar), rank_stability(adimlar)
+    
+    ozet, tablo = run_in_background(anahtar, hesapla, cache, mesaj="🔄 Eşik taraması hesaplanıyor...")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Kararı koruyan eşik", f"{int(ozet['En iyi aynı'].sum())}/{len(ozet)}")
+    with col2:
+        st.metric("En düşük Spearman ρ (ilk eşiğe göre)", f"{ozet['Spearman ρ (ilk)'].min():.4f}")
+    with col3:
+        st.metric("En büyük sıra aralığı", int(tablo['Sıra aralığı'].max()))
+    st.dataframe(ozet, use_container_width=True, hide_index=True,
+                 column_config={c: st.column_config.NumberColumn(format="%.4f")
+                                for c in ('Spearman ρ (önceki)', 'Spearman ρ (ilk)')})
+    
+    goster = tablo
+    if st.checkbox("Yalnızca sırası değişen elemanlar", value=True, key="esik_degisen"):
+        goster = tablo[tablo['Sıra aralığı'].to_numpy() > 0]
+    if goster.empty:
+        st.success("✅ Tüm eşiklerde sıralama aynı.")
+    else:
+        R = _page_controls(len(goster), "esik")
+        st.dataframe(goster.iloc[R], use_container_width=True, hide_index=True)
+    st.download_button("📥 Eşik Sıralarını İndir", tablo.to_csv(index=False).encode('utf-8'),
+                       "rmvc_esik_taramasi.csv", "text/csv")
+
+
+def render_performance_panel(profiler):
+    """
+    "Performans" paneli: aşama süreleri, tepe bellek, iş sayaçları ve
+    JSON raporu (rmvc_profile). Arka plan işinin aşamaları işin raporundan
+    eklenir; önbellekten gelen sonuçlarda ilk hesabın ölçümleri gösterilir.
+    """
+    rapor = profiler.report()
+    with st.expander("⏱️ Performans", expanded=False):
+        if not rapor['stages']:
+            st.caption("Ölçülen aşama yok.")
+            return
+        st.dataframe(
+            report_frame(rapor),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Süre (sn)': st.column_config.NumberColumn(format="%.4f"),
+                'Pay (%)': st.column_config.NumberColumn(format="%.1f"),
+                'Tepe bellek (MB)': st.column_config.NumberColumn(format="%.1f"),
+            }
+        )
+        st.caption(f"Toplam: {rapor['total_seconds']:.3f} sn. ✓ işaretli aşamalar önbellekteki sonucun "
+                   "ilk hesabına aittir ve toplama katılmaz. pair_checks: referans δ döngülerinin "
+                   "{u, v} ⊆ Φ(eⱼ) kontrol sayısı; cells: üretilen üyelik hücresi.")
+        st.download_button("📥 Profil raporunu indir (JSON)",
+                           json.dumps(rapor, ensure_ascii=False, indent=2).encode('utf-8'),
+                           "rmvc_profil.json", "application/json")
+        if rapor.get('tracemalloc'):
+            st.markdown("**En çok bellek ayıran satırlar (tracemalloc)**")
+            st.dataframe(pd.DataFrame(rapor['tracemalloc']), use_container_width=True, hide_index=True)
+        if rapor.get('cprofile'):
+            st.markdown("**cProfile (kümülatif süreye göre)**")
+            st.code(rapor['cprofile'], language=None)
+
+
 def main():
     # Başlık
     st.markdown('<div class="main-header">📊 RMVC Analiz Aracı v2</div>', unsafe_allow_html=True)
@@ -372,6 +1175,11 @@ def main():
             type=['csv', 'xlsx', 'xls'],
             help="Satırlar=Elemanlar, Sütunlar=Parametreler. Değerler: 0=yok, >0=var"
         )
+        veri_seti_yolu = st.text_input(
+            "veya ikili veri seti yolu (.rmvcd)",
+            value="",
+            help="rmvc_dataset.py ile dönüştürülmüş veri seti dizini. Diziler bellek eşlemeli açılır; CSV ayrıştırılmaz. Yön dönüştürme sırasında belirlenir."
+        ).strip()
         
         st.markdown("---")
         st.markdown("### ⚙️ Ayarlar")
@@ -387,6 +1195,43 @@ def main():
             help="İşaretlenirse hiç elemanı olmayan parametreler (boş kümeler) hesaplamadan çıkarılır. Hocanın yaklaşımı: dahil et (işaretsiz)"
         )
         kesir_goster = st.checkbox("Kesir olarak göster", value=True)
+        akis_modu = st.checkbox(
+            "Akış modu (büyük CSV)",
+            value=False,
+            help="CSV dosyası parça parça iki geçişte işlenir; tam üyelik matrisi belleğe alınmaz. Yalnızca skorlar ve karar gösterilir."
+        )
+        ilk_k = st.number_input(
+            "Yalnızca ilk K eleman (0 = tam analiz)",
+            min_value=0,
+            value=0,
+            step=5,
+            help="0'dan büyükse üyelik matrisi oluşturulmaz; skorlar doğrudan biriktirilir ve yalnızca en iyi K eleman (eşitlikler dahil) gösterilir."
+        )
+        engine = st.selectbox(
+            "Hesaplama motoru",
+            options=["auto", "numpy", "sparse", "bitset", "python"],
+            format_func=lambda x: {
+                "auto": "Otomatik (nnz'ye göre)",
+                "numpy": "NumPy (yoğun)",
+                "sparse": "Seyrek (CSR)",
+                "bitset": "Bitset (popcount)",
+                "python": "Python (referans)"
+            }[x],
+            help="Otomatik: Çok seyrek verilerde seyrek (CSR) backend, diğerlerinde NumPy kullanılır."
+        )
+        
+        st.markdown("---")
+        st.markdown("### ⏱️ Performans")
+        profil_cprofile = st.checkbox(
+            "cProfile kaydı",
+            value=False,
+            help="Tam analiz bir kez cProfile ile yeniden hesaplanır (önbellek ve kayıtlı sonuç kullanılmaz); en pahalı fonksiyonlar Performans panelinde listelenir."
+        )
+        profil_bellek = st.checkbox(
+            "tracemalloc kaydı",
+            value=False,
+            help="Aşama içi tepe bellek tracemalloc ile ölçülür ve en çok bellek ayıran satırlar listelenir (hesap yavaşlar)."
+        )
         
         st.markdown("---")
         st.markdown("### 📖 Formüller")
@@ -402,58 +1247,175 @@ def main():
         """)
     
     # Ana içerik
-    if uploaded_file is not None:
+    dataset = None
+    if veri_seti_yolu:
+        if is_dataset(veri_seti_yolu):
+            dataset = load_dataset(veri_seti_yolu)
+        else:
+            st.error(f"❌ İkili veri seti bulunamadı: {veri_seti_yolu}")
+    
+    if uploaded_file is not None or dataset is not None:
+        # Aşama süreleri (Performans paneli); cProfile/tracemalloc yalnızca istenirse.
+        # tracemalloc süreç genelinde açılır; her çıkış yolunda (return, st.stop(),
+        # hata) finally ile kapatılır
+        profiler = StageProfiler(cprofile=profil_cprofile, trace_memory=profil_bellek)
         try:
-            # Dosyayı oku
-            if uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file, index_col=0)
-            else:
-                df = pd.read_excel(uploaded_file, index_col=0)
+            # Sonuçlar girdi içeriğinin özeti + hesaplama seçenekleriyle önbelleklenir
+            cache = get_result_cache()
             
-            # Format bilgisi
-            if rows_are_params:
-                st.info("📊 Format: Satırlar=Parametreler, Sütunlar=Elemanlar (Hocanın formatı)")
-                st.success(f"✅ Dosya yüklendi: {uploaded_file.name} ({df.shape[0]} parametre × {df.shape[1]} eleman)")
+            if dataset is not None:
+                # İkili veri seti: ayrıştırma yok, diziler bellek eşlemeli
+                kaynak = path_fingerprint(veri_seti_yolu)
+                yon = "Satırlar=Parametreler" if dataset.meta["rows_are_params"] else "Satırlar=Elemanlar"
+                st.success(f"✅ İkili veri seti yüklendi: {veri_seti_yolu} "
+                           f"({dataset.m} parametre × {dataset.n} eleman, özgün format: {yon})")
+                def ac():
+                    with profiler.stage("veri seti açma") as asama:
+                        soft_set = dataset.to_soft_set()
+                        asama.count(m=dataset.m, n=dataset.n)
+                    return None, soft_set
+                
+                df, soft_set = cache.get_or_compute(content_hash(kaynak, asama="soft_set"), ac)
             else:
-                st.success(f"✅ Dosya yüklendi: {uploaded_file.name} ({df.shape[0]} eleman × {df.shape[1]} parametre)")
-            
-            # Veri önizleme
-            with st.expander("📋 Yüklenen Veri (Girdi Matrisi)", expanded=False):
-                st.dataframe(df, use_container_width=True)
+                kaynak = content_hash(uploaded_file.getvalue(), ad=uploaded_file.name)
+                
+                # Akış modu: dosya belleğe alınmadan iki geçişte işlenir
+                if akis_modu and uploaded_file.name.endswith('.csv'):
+                    with profiler.stage("akış modu (iki geçiş + görünüm)"):
+                        render_stream_analysis(uploaded_file, rows_are_params, bos_filtrele, kesir_goster, ilk_k,
+                                               cache=cache, kaynak=kaynak)
+                    render_performance_panel(profiler)
+                    return
+                
+                def yukle():
+                    # Dosyayı oku
+                    with profiler.stage("okuma (ayrıştırma)") as asama:
+                        uploaded_file.seek(0)
+                        if uploaded_file.name.endswith('.csv'):
+                            df = pd.read_csv(uploaded_file, index_col=0)
+                        else:
+                            df = pd.read_excel(uploaded_file, index_col=0)
+                        asama.count(rows=df.shape[0], cols=df.shape[1], cells=df.size)
+                    with profiler.stage("csv_to_soft_set") as asama:
+                        soft_set = csv_to_soft_set(df, rows_are_params=rows_are_params)
+                        asama.count(m=len(soft_set[1]), n=len(soft_set[0]))
+                    return df, soft_set
+                
+                df, soft_set = cache.get_or_compute(
+                    content_hash(kaynak, asama="soft_set", rows_are_params=rows_are_params), yukle
+                )
+                
+                # Format bilgisi
+                if rows_are_params:
+                    st.info("📊 Format: Satırlar=Parametreler, Sütunlar=Elemanlar (Hocanın formatı)")
+                    st.success(f"✅ Dosya yüklendi: {uploaded_file.name} ({df.shape[0]} parametre × {df.shape[1]} eleman)")
+                else:
+                    st.success(f"✅ Dosya yüklendi: {uploaded_file.name} ({df.shape[0]} eleman × {df.shape[1]} parametre)")
+                
+                # Veri önizleme
+                with st.expander("📋 Yüklenen Veri (Girdi Matrisi)", expanded=False):
+                    st.dataframe(df.iloc[_page_controls(len(df), "girdi")], use_container_width=True)
             
             # RMVC Analizi
             with st.spinner("🔄 RMVC analizi yapılıyor..."):
-                U, E_named, E_info, eleman_ids, parametre_ids = csv_to_soft_set(df, rows_are_params=rows_are_params)
+                U, E_named, E_info, eleman_ids, parametre_ids = soft_set
                 
                 # Filtreleme
                 if bos_filtrele:
-                    E_named = {k: v for k, v in E_named.items() if len(v) > 0}
-                    E_info = {k: v for k, v in E_info.items() if k in E_named}
+                    E_named = E_named.nonempty()
+                    E_info = E_info.subset(E_named)
                 
                 if len(E_named) < 2:
                     st.error("❌ En az 2 boş olmayan parametre kümesi gerekli!")
                     return
                 
-                # Hesaplamalar
-                membership_matrix = create_membership_matrix(E_named, U)
-                scores = calculate_scores(membership_matrix, U)
+                secenekler = dict(rows_are_params=rows_are_params, bos_filtrele=bos_filtrele)
+                
+                # İlk K modu: üyelik matrisi olmadan yalnızca skorlar (skorlar K'dan bağımsız)
+                if ilk_k > 0:
+                    anahtar = content_hash(kaynak, asama="skorlar", **secenekler)
+                    
+                    def skorla(progress):
+                        stored = open_stored_result(anahtar, lambda: (
+                            top_k_scores(E_named, U, ilk_k, elements=natural_elements(E_named, U),
+                                         progress=progress)[0], None
+                        ), E_info, secenekler)
+                        return stored.scores()
+                    
+                    with profiler.stage("skorlar (ilk K)"):
+                        exact = run_in_background(anahtar, skorla, cache)
+                    with profiler.stage("🏆 Sonuçlar"):
+                        render_score_summary(exact, len(E_named), kesir_goster, ilk_k)
+                    render_performance_panel(profiler)
+                    return
+                
+                # Hesaplamalar (tam mod: tam sayı payları + ortak payda)
+                anahtar = content_hash(kaynak, asama="rmvc", engine=engine, **secenekler)
+                # Profil kaydı istenirse sonuç bir kez yeniden hesaplanır (önbellek / depo atlanır)
+                profil_kaydi = profil_cprofile or profil_bellek
+                is_anahtari = content_hash(anahtar, cprofile=profil_cprofile, tracemalloc=profil_bellek) \
+                    if profil_kaydi else anahtar
+                m, n = len(E_named), len(U)
+                is_sayaclari = dict(pair_checks=reference_pair_checks(soft_set_sizes(E_named), n), cells=m * n)
                 
-                # Skorları sırala
-                sorted_scores = sorted(scores.items(), key=lambda x: (-float(x[1]), x[0]))
-                best_score = float(sorted_scores[0][1])
-                best_choices = [u for u, s in sorted_scores if float(s) == best_score]
+                def hesapla(progress):
+                    # İş parçacığında yürür; aşamalar işin kendi profiline yazılır ve
+                    # sonuçla birlikte önbelleğe alınır
+                    is_profili = StageProfiler(cprofile=profil_cprofile, trace_memory=profil_bellek)
+                    
+                    def calistir():
+                        with is_profili.stage("create_membership_matrix", **is_sayaclari):
+                            membership_matrix = create_membership_matrix(E_named, U, engine=engine,
+                                                                         progress=progress)
+                        with is_profili.stage("calculate_scores", cells=m * n):
+                            exact = membership_matrix.scores()
+                        return exact, membership_matrix
+                    
+                    try:
+                        if profil_kaydi:
+                            stored = _InMemoryResult(*calistir(), E_info)
+                        else:
+                            # Kayıtlı sonuç bellek eşlemeli açılır; görünümler yalnızca gereken dilimleri okur
+                            stored = open_stored_result(anahtar, calistir, E_info, dict(engine=engine, **secenekler))
+                        membership_matrix = stored.membership()
+                        view = matrix_view(membership_matrix)
+                        with is_profili.stage("parameter_table", rows=m):
+                            param_df = parameter_table(membership_matrix.info, stored.m)
+                        rapor = is_profili.report()
+                    finally:
+                        # İptal / hata durumunda da tracemalloc açık kalmasın
+                        is_profili.close()
+                    return membership_matrix, stored.scores(), view, param_df, rapor
+                
+                onbellekte = is_anahtari in cache
+                membership_matrix, exact, view, param_df, is_raporu = run_in_background(
+                    is_anahtari, hesapla, cache)
+                profiler.add_report(is_raporu, cached=onbellekte)
+                score_values = exact.to_float()
+                scores = dict(zip(exact.elements, score_values.tolist()))
+                
+                # Skorları sırala - sıralama ve eşitlik tam sayılar üzerinden
+                order = exact.ranking()
+                sorted_scores = [(exact.elements[j], score_values[j]) for j in order]
+                best_idx = exact.best()
+                best_score = float(score_values[best_idx[0]])
+                best_choices = [exact.elements[j] for j in best_idx]
+                best_set = set(best_choices)
             
             # Sonuç Tabları
-            tab1, tab2, tab3, tab4, tab5 = st.tabs([
+            tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
                 "🏆 Sonuçlar", 
                 "🔢 Üyelik Matrisi",
                 "📊 Grafikler",
                 "📈 Parametre Analizi",
-                "🔍 Detaylı Analiz"
+                "🔍 Detaylı Analiz",
+                "⚖️ Varyantlar",
+                "🧪 Duyarlılık",
+                "🎚️ Eşik Taraması"
             ])
             
             # TAB 1: Sonuçlar
-            with tab1:
+            with tab1, profiler.stage("🏆 Sonuçlar"):
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
@@ -461,8 +1423,7 @@ def main():
                 with col2:
                     st.metric("Toplam Parametre (m)", len(E_named))
                 with col3:
-                    avg_score = sum(float(s) for s in scores.values()) / len(scores)
-                    st.metric("Ortalama Skor", f"{avg_score:.3f}")
+                    st.metric("Ortalama Skor", f"{score_values.mean():.3f}")
                 with col4:
                     st.metric("Max Skor", f"{best_score:.3f}")
                 
@@ -477,136 +1438,32 @@ def main():
                 # Skor tablosu
                 st.markdown("### 📋 Eleman Skorları (Sıralı)")
                 
-                score_data = []
-                for i, (u, s) in enumerate(sorted_scores, 1):
-                    score_data.append({
-                        'Sıra': i,
-                        'Eleman': u,
-                        'Skor (Kesir)': str(s) if kesir_goster else '-',
-                        'Skor (Ondalık)': round(float(s), 4),
-                        'Durum': '⭐ EN İYİ' if float(s) == best_score else ''
-                    })
-                
-                score_df = pd.DataFrame(score_data)
-                st.dataframe(score_df, use_container_width=True, height=400)
+                render_score_table(exact, order, kesir_goster)
             
             # TAB 2: Üyelik Matrisi
-            with tab2:
+            with tab2, profiler.stage("🔢 Üyelik Matrisi (tablo + heatmap)"):
                 st.markdown("### 🔢 MEMBERSHIP VALUE MATRIX (BAĞIL ÜYELİK MATRİSİ)")
                 st.markdown("**Satırlar:** Parametreler (SETS) | **Sütunlar:** Elemanlar (1, 2, 3, ...)")
                 
-                # Matrisi DataFrame'e dönüştür
-                matrix_df = matrix_to_dataframe(membership_matrix, U, E_info)
+                render_matrix_table(membership_matrix, view, exact)
                 
-                # Sayısal sütunları al (SETS hariç)
-                numeric_cols = [c for c in matrix_df.columns if c != 'SETS']
-                
-                # Görüntüleme için kopyala
-                display_df = matrix_df.copy()
-                for col in numeric_cols:
-                    display_df[col] = display_df[col].apply(lambda x: f"{x:.4f}")
-                
-                # SETS sütununu index yap (hocanın formatı gibi)
-                display_df = display_df.set_index('SETS')
-                st.dataframe(display_df, use_container_width=True)
-                
-                # SUM satırı ekle
-                st.markdown("### 📊 SUM s(x) - Sütun Toplamları")
-                col_sums = matrix_df[numeric_cols].sum()
-                sum_df = pd.DataFrame([col_sums.values], columns=numeric_cols, index=['SUM s(x)'])
-                sum_df = sum_df.applymap(lambda x: f"{x:.4f}")
-                st.dataframe(sum_df, use_container_width=True)
-                
-                # CSV Export butonu
+                # CSV Export (tam matris, SUM dahil) - istendiğinde satır blokları hâlinde yazılır
                 st.markdown("### 📥 CSV İndir")
-                
-                # Export için tam matris (SUM dahil)
-                export_df = matrix_df.copy()
-                export_df = export_df.set_index('SETS')
-                sum_row = pd.DataFrame([matrix_df[numeric_cols].sum().values], 
-                                       columns=numeric_cols, index=['SUM s(x)'])
-                export_df = pd.concat([export_df, sum_row])
-                
-                csv_data = export_df.to_csv()
-                st.download_button(
-                    label="📥 Üyelik Matrisini CSV olarak indir",
-                    data=csv_data,
-                    file_name="membership_matrix.csv",
-                    mime="text/csv"
-                )
+                render_matrix_download(membership_matrix, view, exact, "Üyelik Matrisini CSV olarak indir",
+                                       "membership_matrix.csv", "matris_toplamli", with_sum=True)
                 
                 # Heatmap
                 st.markdown("### 🗺️ Üyelik Matrisi Heatmap")
-                
-                heatmap_data = matrix_df[numeric_cols].values
-                
-                fig_heatmap = px.imshow(
-                    heatmap_data,
-                    x=numeric_cols,
-                    y=matrix_df['SETS'].tolist(),
-                    title='Üyelik Değerleri (Sarı=1, Mor=0)',
-                    color_continuous_scale='Viridis',
-                    aspect='auto',
-                    text_auto='.2f'
-                )
-                fig_heatmap.update_layout(height=400)
-                st.plotly_chart(fig_heatmap, use_container_width=True)
+                render_heatmap(membership_matrix, view, cache=cache, anahtar=anahtar)
             
             # TAB 3: Grafikler
-            with tab3:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Bar chart - Skorlar
-                    fig_bar = px.bar(
-                        score_df.head(20),
-                        x='Eleman',
-                        y='Skor (Ondalık)',
-                        title='🏅 Eleman Skorları (Top 20)',
-                        color='Skor (Ondalık)',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig_bar.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig_bar, use_container_width=True)
-                
-                with col2:
-                    # Histogram
-                    fig_hist = px.histogram(
-                        score_df,
-                        x='Skor (Ondalık)',
-                        nbins=15,
-                        title='📈 Skor Dağılımı',
-                        color_discrete_sequence=['#1f77b4']
-                    )
-                    fig_hist.add_vline(x=best_score, line_dash="dash", line_color="red",
-                                       annotation_text=f"Max: {best_score:.2f}")
-                    st.plotly_chart(fig_hist, use_container_width=True)
-                
-                # Box plot
-                fig_box = px.box(
-                    score_df,
-                    y='Skor (Ondalık)',
-                    title='📦 Skor Box Plot',
-                    points='all'
-                )
-                st.plotly_chart(fig_box, use_container_width=True)
+            with tab3, profiler.stage("📊 Grafikler", points=len(score_values)):
+                render_score_charts(exact, score_values, order, best_score)
             
             # TAB 4: Parametre Analizi
-            with tab4:
+            with tab4, profiler.stage("📈 Parametre Analizi"):
                 st.markdown("### 📈 Parametre (Kriter) Analizi")
                 
-                param_data = []
-                for e_i in sorted(E_info.keys(), key=param_sort_key):
-                    info = E_info[e_i]
-                    param_data.append({
-                        'Parametre': e_i,
-                        'Orijinal ID': info['orijinal_ad'],
-                        'Eleman Sayısı |Φ(eᵢ)|': info['eleman_sayisi'],
-                        'γ(eᵢ)': info['eleman_sayisi'] * (len(E_named) - 1),
-                        'Elemanlar': ', '.join(sorted(info['elemanlar'], key=safe_sort_key))
-                    })
-                
-                param_df = pd.DataFrame(param_data)
                 st.dataframe(param_df, use_container_width=True)
                 
                 # Parametre boyutları grafiği
@@ -621,17 +1478,17 @@ def main():
                 st.plotly_chart(fig_param, use_container_width=True)
             
             # TAB 5: Detaylı Analiz
-            with tab5:
+            with tab5, profiler.stage("🔍 Detaylı Analiz"):
                 st.markdown("### 🔍 Eleman Detaylı Analizi")
                 
                 selected_u = st.selectbox(
                     "Analiz edilecek elemanı seçin:",
-                    options=sorted(U, key=lambda x: -float(scores.get(x, 0))),
+                    options=[u for u, _ in sorted_scores],
                     format_func=lambda x: f"{x} (Skor: {float(scores.get(x, 0)):.3f})"
                 )
                 
                 if selected_u:
-                    u_score = scores.get(selected_u, Fraction(0, 1))
+                    u_score = scores.get(selected_u, 0.0)
                     u_rank = [i for i, (u, s) in enumerate(sorted_scores, 1) if u == selected_u][0]
                     
                     col1, col2, col3 = st.columns(3)
@@ -643,6 +1500,18 @@ def main():
                         percentile = (1 - u_rank/len(U)) * 100
                         st.metric("Yüzdelik", f"%{percentile:.1f}")
                     
+                    # Eleman etkisi (Duyarlılık sekmesinde hesaplandıysa)
+                    etki = cache.get(influence_key(kaynak, secenekler))
+                    if etki is not None:
+                        satir = etki[1][etki[1]['Eleman'] == str(selected_u)].iloc[0]
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Etki (diğerlerinin skor kaybı)", f"{satir['Etki']:+.4f}")
+                        with col2:
+                            st.metric("Etki sırası", f"{int(satir.name) + 1}/{len(etki[1])}")
+                        with col3:
+                            st.metric("Çıkarılınca en iyi", satir['En iyi (v hariç)'])
+                    
                     # Detay tablosu
                     detail_df = get_element_detail(selected_u, membership_matrix, E_info)
                     st.dataframe(detail_df, use_container_width=True)
@@ -661,25 +1530,45 @@ def main():
                     )
                     st.plotly_chart(fig_radar, use_container_width=True)
             
+            # TAB 6: δ semantiği / boş küme varyantları
+            with tab6, profiler.stage("⚖️ Varyantlar"):
+                render_variant_tab(soft_set[1], U, kaynak, rows_are_params, cache)
+            
+            # TAB 7: Bir parametre çıkarılınca karar
+            with tab7, profiler.stage("🧪 Duyarlılık"):
+                render_sensitivity_tab(E_named, E_info, U, kaynak, secenekler, cache)
+                st.markdown("---")
+                render_influence_section(E_named, U, kaynak, secenekler, cache)
+            
+            # TAB 8: İkilileştirme eşiği taraması
+            with tab8, profiler.stage("🎚️ Eşik Taraması"):
+                render_threshold_tab(df, dataset, kaynak, secenekler, cache)
+            
             # İndirme butonları
             st.markdown("---")
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                csv_scores = score_df.to_csv(index=False).encode('utf-8')
+                csv_scores = cache.get_or_compute(
+                    content_hash(anahtar, asama="skor_csv", kesir=kesir_goster),
+                    lambda: score_table(exact, order, kesir_goster).to_csv(index=False).encode('utf-8'))
                 st.download_button("📥 Skorları İndir", csv_scores, "rmvc_skorlar.csv", "text/csv")
             
             with col2:
-                csv_matrix = matrix_df.to_csv(index=False).encode('utf-8')
-                st.download_button("📥 Matrisi İndir", csv_matrix, "rmvc_matris.csv", "text/csv")
+                render_matrix_download(membership_matrix, view, exact, "Matrisi İndir", "rmvc_matris.csv",
+                                       "matris")
             
             with col3:
                 csv_param = param_df.to_csv(index=False).encode('utf-8')
                 st.download_button("📥 Parametreleri İndir", csv_param, "rmvc_parametreler.csv", "text/csv")
+            
+            render_performance_panel(profiler)
         
         except Exception as e:
             st.error(f"❌ Hata: {str(e)}")
             st.exception(e)
+        finally:
+            profiler.close()
     
     else:
         # Dosya yüklenmemişse
@@ -722,13 +1611,6 @@ def main():
                 'e_3': {'1', '3', '4'},
                 'e_4': {'1', '2', '5'}
             }
-            E_info = {
-                'e_1': {'orijinal_ad': 'e1', 'eleman_sayisi': 4, 'toplam_deger': 4, 'elemanlar': {'1', '2', '3', '5'}},
-                'e_2': {'orijinal_ad': 'e2', 'eleman_sayisi': 3, 'toplam_deger': 3, 'elemanlar': {'2', '4', '5'}},
-                'e_3': {'orijinal_ad': 'e3', 'eleman_sayisi': 3, 'toplam_deger': 3, 'elemanlar': {'1', '3', '4'}},
-                'e_4': {'orijinal_ad': 'e4', 'eleman_sayisi': 3, 'toplam_deger': 3, 'elemanlar': {'1', '2', '5'}}
-            }
-            
             membership_matrix = create_membership_matrix(E_named, U)
             
             st.markdown("### ✅ Example 1 Sonuçları")
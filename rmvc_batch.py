@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Toplu Çalıştırma - Çok Sayıda Girdi Dosyası İçin Süreç Havuzu
+==================================================================
+Bir dizindeki (veya glob desenine uyan) tüm CSV / Excel dosyalarını ve
+.rmvcd veri setlerini RMVC-csv.py ile aynı anlamla (boş kümeler
+filtrelenir, "break" semantiği) işler:
+
+    - Her girdi süreç havuzunda ayrı bir işte hesaplanır; bir dosyanın
+      hatası yalnızca o dosyanın kaydına yazılır, toplu iş sürer.
+    - Her dosya için makinece okunabilir çıktılar yazılır:
+      <ad>.scores.csv (tam sıralama, tam sayı paylar ve kesirler),
+      <ad>.topk.json (ilk K, kesimdeki eşitlikler dahil) ve istenirse
+      <ad>.matrix.csv (üyelik matrisi).
+    - manifest.json girdi başına son başarılı çalıştırmanın anahtarını
+      (içerik özeti + seçenekler) tutar; anahtarı değişmeyen ve çıktıları
+      duran girdiler yeniden hesaplanmaz. İçerik özeti işçide, dosya
+      bir kez okunurken hesaplanır.
+    - summary.csv / summary.json tüm girdilerin durumunu, en iyi
+      seçimlerini ve aşama sürelerini (okuma, hesap, yazma) tek yerde toplar.
+"""
+
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from rmvc_cache import content_hash, path_fingerprint
+from rmvc_dataset import is_dataset, load_dataset, table_to_mask
+from rmvc_engine import (
+    ExactMembership,
+    cooccurrence_matrix,
+    delta_matrix,
+    exact_scores,
+    gamma_vector,
+    incidence_from_mask,
+    plan_delta,
+)
+from rmvc_table import write_matrix_csv
+
+
+# Toplu işte okunan tablo dosyası uzantıları (.rmvcd veri setleri ayrıca tanınır)
+BATCH_SUFFIXES = ('.csv', '.xlsx', '.xls')
+
+# Varsayılan ilk K (RMVC-csv.py ILK_K ile aynı)
+DEFAULT_TOP_K = 20
+
+MANIFEST_NAME = "manifest.json"
+SUMMARY_CSV = "summary.csv"
+SUMMARY_JSON = "summary.json"
+
+# Çıktı biçimi değişirse artırılır (eski manifest kayıtları geçersiz olur)
+_BATCH_FORMAT = 1
+
+
+def collect_inputs(source):
+    """
+    Dizin veya glob deseninden girdi listesi (sıralı, mutlak yollar).
+
+    Dizinde yalnızca en üst düzeydeki tablo dosyaları ve .rmvcd veri setleri
+    alınır; alt dizinler için '**' içeren bir glob deseni verilebilir.
+    """
+    if os.path.isdir(source) and not is_dataset(source):
+        candidates = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        candidates = glob.glob(source, recursive=True)
+    paths = [
+        os.path.abspath(p) for p in candidates
+        if is_dataset(p) or (os.path.isfile(p) and p.lower().endswith(BATCH_SUFFIXES))
+    ]
+    return sorted(paths)
+
+
+def output_names(paths):
+    """
+    Girdi başına çıktı dosyası adı öneki.
+
+    Farklı dizinlerde aynı adı taşıyan girdilere yol özetinden kısa bir ek
+    verilir; adlar çalıştırmalar arasında değişmez.
+    """
+    stems = [os.path.splitext(os.path.basename(p.rstrip(os.sep)))[0] for p in paths]
+    counts = {}
+    for stem in stems:
+        counts[stem] = counts.get(stem, 0) + 1
+    return [
+        stem if counts[stem] == 1 else f"{stem}-{content_hash(path)[:8]}"
+        for stem, path in zip(stems, paths)
+    ]
+
+
+def _output_paths(out_dir, name, matrix):
+    paths = {
+        "scores": os.path.join(out_dir, f"{name}.scores.csv"),
+        "topk": os.path.join(out_dir, f"{name}.topk.json"),
+    }
+    if matrix:
+        paths["matrix"] = os.path.join(out_dir, f"{name}.matrix.csv")
+    return paths
+
+
+def _write_atomic(path, write):
+    """write(dosya_yolu) çıktısını geçici dosyaya yazıp yerine taşır."""
+    fd, tmp = tempfile.mkstemp(prefix=".rmvc-", dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_json(path, obj):
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+    _write_atomic(path, write)
+
+
+def input_key(path, options):
+    """
+    Girdinin içerik özeti + seçenekler anahtarı ve (tablo dosyalarında)
+    okunan baytlar. Veri setleri içerik okunmadan parmak iziyle özetlenir.
+    """
+    if is_dataset(path):
+        data, digest = None, path_fingerprint(path)
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = content_hash(data)
+    return content_hash(digest, asama="toplu", format=_BATCH_FORMAT, **options), data
+
+
+def _load_incidence(path, data, rows_are_params):
+    """
+    Girdiyi boş kümeleri çıkarılmış insidans matrisine çevirir.
+
+    Returns:
+        (IncidenceMatrix, parametre özgün adları)
+    """
+    if data is None:
+        dataset = load_dataset(path)
+        incidence = dataset.incidence(drop_empty=True)
+        names = dataset.meta["param_names"]
+        return incidence, [names[int(k.split('_')[1]) - 1] for k in incidence.param_keys]
+    if path.lower().endswith(('.xlsx', '.xls')):
+        df = pd.read_excel(BytesIO(data), index_col=0)
+    else:
+        df = pd.read_csv(BytesIO(data), index_col=0)
+    if rows_are_params:
+        df = df.T
+    mask, _, sutun_ids, satir_ids, _ = table_to_mask(df)
+    keep = np.flatnonzero(mask.any(axis=1))
+    incidence = incidence_from_mask(mask[keep], [f"e_{i+1}" for i in keep],
+                                    [str(s) for s in satir_ids])
+    return incidence, [str(sutun_ids[i]) for i in keep]
+
+
+def _any_set_membership(incidence):
+    """Üyelik matrisi, "break" semantiğiyle: δ = B·(C > 0)."""
+    C = (cooccurrence_matrix(incidence.B) > 0).astype(np.int64)
+    return ExactMembership(incidence, delta_matrix(incidence, C=C), gamma_vector(incidence))
+
+
+def _write_outputs(paths, source, exact, top_k, membership):
+    order = exact.ranking()
+    score_values = exact.to_float()
+    best = exact.best()
+
+    def scores_csv(tmp):
+        pd.DataFrame({
+            'rank': np.arange(1, len(order) + 1),
+            'element': [exact.elements[j] for j in order],
+            'numerator': [int(exact.numerators[j]) for j in order],
+            'fraction': [str(exact.fraction(j)) for j in order],
+            'score': score_values[order],
+        }).to_csv(tmp, index=False)
+
+    _write_atomic(paths["scores"], scores_csv)
+    top = exact.top_k(top_k)
+    _write_json(paths["topk"], {
+        "input": source,
+        "k": top_k,
+        "denominator": exact.denominator,
+        "best": [exact.elements[j] for j in best],
+        "top": [
+            {"rank": i, "element": exact.elements[j], "numerator": int(exact.numerators[j]),
+             "fraction": str(exact.fraction(j)), "score": float(score_values[j])}
+            for i, j in enumerate(top, 1)
+        ],
+    })
+    if membership is not None:
+        def matrix_csv(tmp):
+            with open(tmp, "w", encoding="utf-8", newline="") as f:
+                write_matrix_csv(f, membership, float_format="%.6f")
+
+        _write_atomic(paths["matrix"], matrix_csv)
+
+
+def process_input(path, out_dir, name, previous_key=None, rows_are_params=False,
+                  top_k=DEFAULT_TOP_K, matrix=False, memory_budget=None):
+    """
+    Tek girdiyi işler (süreç havuzu işçisi).
+
+    Hatalar fırlatılmaz; kayıtta status="error" ve hata iletisi döner.
+
+    Returns:
+        Kayıt sözlüğü: input, name, status ("ok" / "skipped" / "error"),
+        key, m, n, best, best_score, best_fraction, outputs, seconds
+        (read / compute / write / total), error
+    """
+    started = time.perf_counter()
+    record = {"input": path, "name": name, "status": "error", "key": None, "m": None, "n": None,
+              "best": [], "best_score": None, "best_fraction": None, "outputs": {},
+              "seconds": {}, "error": None}
+    seconds = record["seconds"]
+    try:
+        options = dict(rows_are_params=rows_are_params, top_k=top_k, matrix=matrix,
+                       any_set=True, bos_filtrele=True)
+        key, data = input_key(path, options)
+        record["key"] = key
+        paths = _output_paths(out_dir, name, matrix)
+        record["outputs"] = paths
+        if key == previous_key and all(os.path.exists(p) for p in paths.values()):
+            record["status"] = "skipped"
+            return record
+
+        t = time.perf_counter()
+        incidence, _ = _load_incidence(path, data, rows_are_params)
+        seconds["read"] = time.perf_counter() - t
+        record["m"], record["n"] = incidence.m, incidence.n
+        if incidence.m < 2:
+            raise ValueError(f"En az 2 boş olmayan kriter kümesi gerekli (mevcut: {incidence.m})")
+
+        t = time.perf_counter()
+        plan = plan_delta(incidence, any_set=True, memory_budget=memory_budget)
+        exact = exact_scores(incidence, any_set=True, plan=plan)
+        membership = _any_set_membership(incidence) if matrix else None
+        seconds["compute"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        _write_outputs(paths, path, exact, top_k, membership)
+        seconds["write"] = time.perf_counter() - t
+
+        best = exact.best()
+        record["best"] = [exact.elements[j] for j in best]
+        record["best_score"] = float(exact.to_float()[best[0]]) if len(best) else None
+        record["best_fraction"] = str(exact.fraction(best[0])) if len(best) else None
+        record["status"] = "ok"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        seconds["total"] = time.perf_counter() - started
+    return record
+
+
+def load_manifest(out_dir):
+    """Önceki çalıştırmaların {girdi yolu: kayıt} tablosu (yoksa boş)."""
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("inputs", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _summary_frame(records):
+    return pd.DataFrame([{
+        'input': r["input"],
+        'status': r["status"],
+        'm': r["m"],
+        'n': r["n"],
+        'best': ' '.join(map(str, r["best"])),
+        'best_score': r["best_score"],
+        'best_fraction': r["best_fraction"],
+        'read_s': r["seconds"].get("read"),
+        'compute_s': r["seconds"].get("compute"),
+        'write_s': r["seconds"].get("write"),
+        'total_s': r["seconds"].get("total"),
+        'error': r["error"],
+    } for r in records], columns=['input', 'status', 'm', 'n', 'best', 'best_score', 'best_fraction',
+                                  'read_s', 'compute_s', 'write_s', 'total_s', 'error']
+    ).astype({'m': 'Int64', 'n': 'Int64'})
+
+
+def run_batch(paths, out_dir, workers=1, rows_are_params=False, top_k=DEFAULT_TOP_K, matrix=False,
+              memory_budget=None, force=False, progress=None):
+    """
+    Girdileri işleyip çıktıları, manifest.json ve özet dosyalarını yazar.
+
+    Args:
+        paths: Girdi yolları (collect_inputs)
+        workers: Süreç sayısı (> 1 ise süreç havuzu; 0: tüm çekirdekler)
+        force: True ise manifest yok sayılır, tüm girdiler yeniden hesaplanır
+        progress: progress(kayıt, tamamlanan, toplam) geri çağrısı
+
+    Returns:
+        Girdi sırasıyla kayıt listesi (process_input). Atlanan girdilerin
+        m, n, en iyi seçim ve çıktı alanları manifest kaydından gelir.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    manifest = {} if force else load_manifest(out_dir)
+    names = output_names(paths)
+    options = dict(rows_are_params=rows_are_params, top_k=top_k, matrix=matrix,
+                   memory_budget=memory_budget)
+    records = {}
+
+    def finish(record):
+        if record["status"] == "skipped":
+            previous = manifest[record["input"]]
+            record.update({k: previous[k] for k in ("m", "n", "best", "best_score", "best_fraction")})
+        if record["status"] in ("ok", "skipped"):
+            manifest[record["input"]] = record
+        records[record["input"]] = record
+        _write_json(os.path.join(out_dir, MANIFEST_NAME), {"format": _BATCH_FORMAT, "inputs": manifest})
+        if progress:
+            progress(record, len(records), len(paths))
+
+    def previous_key(path):
+        entry = manifest.get(path)
+        return entry["key"] if entry and entry.get("status") in ("ok", "skipped") else None
+
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            futures = {
+                pool.submit(process_input, path, out_dir, name, previous_key(path), **options): path
+                for path, name in zip(paths, names)
+            }
+            for future in as_completed(futures):
+                try:
+                    record = future.result()
+                except Exception as e:  # ör. işçi süreci çöktü (BrokenProcessPool)
+                    path = futures[future]
+                    record = {"input": path, "name": names[paths.index(path)],
+                              "status": "error", "key": None,
+                              "m": None, "n": None, "best": [], "best_score": None,
+                              "best_fraction": None, "outputs": {}, "seconds": {},
+                              "error": f"{type(e).__name__}: {e}"}
+                finish(record)
+    else:
+        for path, name in zip(paths, names):
+            finish(process_input(path, out_dir, name, previous_key(path), **options))
+
+    ordered = [records[p] for p in paths]
+    counts = {status: sum(r["status"] == status for r in ordered) for status in ("ok", "skipped", "error")}
+    _write_atomic(os.path.join(out_dir, SUMMARY_CSV),
+                  lambda tmp: _summary_frame(ordered).to_csv(tmp, index=False))
+    _write_json(os.path.join(out_dir, SUMMARY_JSON), {
+        "options": dict(options, workers=workers, any_set=True, bos_filtrele=True),
+        "counts": counts,
+        "wall_seconds": time.perf_counter() - started,
+        "inputs": ordered,
+    })
+    return ordered
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Ölçekleme Testi - Sentetik Veri Üreteci ve Aşama Süreleri
+==============================================================
+Depodaki örnek dosyalar (10×10 CSV, Example.*.xlsx, 20×20 örnek) büyük
+girdilerde nerede yavaşladığımızı göstermez. Bu modül:
+
+    - Sentetik soft set tabloları üretir: m parametre (ürün), n eleman
+      (firma), doluluk oranı, firma büyüklüklerinde kuvvet yasası çarpıklığı
+      ve boş küme payı ayarlanabilir; aynı tohum aynı tabloyu verir.
+    - Her motor (numpy, sparse, bitset) ve boyut için aşamaları ayrı ayrı
+      ölçer: parse (CSV okuma), soft_set (insidans / bit vektörü), delta
+      (δ payları), membership (tam üyelik + float matris), scores, ranking.
+      Her aşama `repeat` kez çalıştırılır; en kısa ve ortanca süre yazılır.
+    - Bir motorun toplam süresi `budget` saniyeyi aşarsa o motor daha büyük
+      boyutlarda atlanır (kayıtta "skipped"); böylece motorların nerede
+      tıkandığı da sonuçlarda görünür.
+    - Sonuçları JSON / CSV olarak yazar; compare() iki çalıştırmayı (ör. iki
+      commit) aynı yapılandırma + motor + aşama üzerinden karşılaştırır ve
+      tolerans üstü yavaşlamaları raporlar. Ölçekleme eğrileri log-log
+      eğim (süre ∝ (m·n)^eğim) olarak özetlenir, istenirse Plotly HTML'e
+      çizilir.
+
+Kullanım:
+    python rmvc_bench.py run --sizes 50x500,100x2000 --output bench.json --plot bench.html
+    python rmvc_bench.py compare onceki.json bench.json --tolerance 1.25
+    python rmvc_bench.py generate 200x5000 sentetik.csv --density 0.02 --skew 1.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from rmvc_bitset import BitsetSoftSet, bitset_delta_rows
+from rmvc_cache import content_hash
+from rmvc_dataset import table_to_mask
+from rmvc_engine import (
+    ExactMembership,
+    SoftSetView,
+    delta_matrix,
+    gamma_vector,
+    incidence_from_mask,
+)
+
+
+BENCH_ENGINES = ("numpy", "sparse", "bitset")
+BENCH_STAGES = ("parse", "soft_set", "delta", "membership", "scores", "ranking")
+
+# Varsayılan boyutlar (m parametre × n eleman)
+DEFAULT_SIZES = ((20, 100), (50, 500), (100, 2000), (200, 10000))
+
+# Bir motorun bir boyuttaki toplam süresi bunu aşarsa daha büyük boyutlar atlanır (saniye)
+DEFAULT_BUDGET = 30.0
+
+# Karşılaştırmada bu süreden kısa aşamalar gürültü sayılır (saniye)
+COMPARE_MIN_SECONDS = 1e-3
+
+# Sonuç dosyası biçimi (alanlar değişirse artırılır)
+_BENCH_FORMAT = 1
+
+
+def synthetic_table(m, n, density=0.05, skew=1.0, empty_share=0.0, seed=0):
+    """
+    RMVC-csv.py biçiminde sentetik tablo: satırlar elemanlar (firmalar),
+    sütunlar parametreler (ürünler), dolu hücreler pozitif tutarlar.
+
+    Firma ağırlıkları w_u ∝ sıra^(-skew) (kuvvet yasası; skew=0 düzgün)
+    olarak rastgele dağıtılır. Boş olmayan her parametre Binom(n, density)
+    (en az 1) eleman seçer; seçim ağırlıklı ve yerine koymadan yapılır
+    (Gumbel en büyük k). round(empty_share·m) parametre boş bırakılır.
+
+    Returns:
+        DataFrame (n × m, tam sayı değerler)
+    """
+    rng = np.random.default_rng(seed)
+    log_w = -skew * np.log(np.arange(1, n + 1, dtype=np.float64))
+    rng.shuffle(log_w)
+    sizes = np.maximum(rng.binomial(n, density, size=m), 1)
+    sizes[rng.choice(m, size=int(round(empty_share * m)), replace=False)] = 0
+    values = np.zeros((n, m), dtype=np.int64)
+    for i, k in enumerate(sizes):
+        if k:
+            keys = log_w + rng.gumbel(size=n)
+            chosen = np.argpartition(-keys, k - 1)[:k]
+            values[chosen, i] = rng.integers(1, 100_000, size=k)
+    return pd.DataFrame(values, index=pd.Index([f"F{j + 1}" for j in range(n)], name="FirmaID"),
+                        columns=[f"P{i + 1}" for i in range(m)])
+
+
+def _time_stage(fn, repeat):
+    """fn'i repeat kez çalıştırır; (son sonuç, süreler listesi)."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - started)
+    return result, times
+
+
+def _engine_stages(engine, csv_bytes):
+    """
+    Motorun aşama fonksiyonları; her biri önceki aşamanın çıktısını alır.
+
+    Aşamalar uygulamanın (rmvc_app_v2.create_membership_matrix) yolunu izler.
+    """
+    def soft_set(df):
+        mask, _, parametre_ids, eleman_ids, _ = table_to_mask(df)
+        inc = incidence_from_mask(mask, [f"e_{i + 1}" for i in range(len(parametre_ids))],
+                                  [str(e) for e in eleman_ids], sparse=(engine == "sparse"))
+        inc = inc.natural_columns()
+        if engine == "bitset":
+            E_named = SoftSetView(inc)
+            return inc, BitsetSoftSet.from_soft_set(E_named, set(inc.elements), elements=inc.elements)
+        return inc, None
+
+    def delta(state):
+        inc, bs = state
+        if bs is not None:
+            return inc, np.array(bitset_delta_rows(bs), dtype=np.int64).reshape(inc.m, inc.n)
+        return inc, delta_matrix(inc)
+
+    def membership(state):
+        inc, D = state
+        em = ExactMembership(inc, D, gamma_vector(inc))
+        em.float_matrix()
+        return em
+
+    return (
+        ("parse", lambda _: pd.read_csv(BytesIO(csv_bytes), index_col=0)),
+        ("soft_set", soft_set),
+        ("delta", delta),
+        ("membership", membership),
+        ("scores", lambda em: em.scores()),
+        ("ranking", lambda exact: (exact, exact.ranking())),
+    )
+
+
+def run_case(table, engine, repeat=3):
+    """
+    Tek tablo + motor için aşama süreleri.
+
+    Returns:
+        {"stages": {aşama: {"min", "median"}}, "total", "digest"}; digest
+        skorların (pay/payda) özetidir, motorlar arası tutarlılık için.
+    """
+    csv_bytes = table.to_csv().encode("utf-8")
+    stages = {}
+    value = None
+    for name, fn in _engine_stages(engine, csv_bytes):
+        value, times = _time_stage(lambda: fn(value), repeat)
+        stages[name] = {"min": min(times), "median": statistics.median(times)}
+    exact, order = value
+    # Paylar int64'e sığmayabilir (Python int); özet ondalık metinden alınır
+    digest = content_hash(",".join(str(int(x)) for x in exact.numerators),
+                          denominator=exact.denominator, order=content_hash(order.astype(np.int64).tobytes()))
+    return {"stages": stages, "total": sum(s["min"] for s in stages.values()), "digest": digest}
+
+
+def _git_commit():
+    """Çalışılan commit (git yoksa None)."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, engines=BENCH_ENGINES, density=0.05, skew=1.0, empty_share=0.0,
+                  seed=0, repeat=3, budget=DEFAULT_BUDGET, progress=None):
+    """
+    Boyutlar × motorlar ölçekleme testi.
+
+    Args:
+        sizes: (m, n) çiftleri (küçükten büyüğe)
+        budget: Bir motorun toplam süresi bunu aşınca büyük boyutlar atlanır
+        progress: progress(kayıt) geri çağrısı (her motor/boyut bitince)
+
+    Returns:
+        {"format", "meta", "results"}; her sonuç kaydı yapılandırma (m, n,
+        density, skew, empty_share, seed, nnz), motor, aşamalar, toplam,
+        digest, skipped ve consistent (aynı tabloda motorların skor özetleri
+        eşit mi) alanlarını içerir.
+    """
+    results = []
+    over_budget = set()
+    for m, n in sizes:
+        table = synthetic_table(m, n, density=density, skew=skew, empty_share=empty_share, seed=seed)
+        config = dict(m=m, n=n, density=density, skew=skew, empty_share=empty_share, seed=seed,
+                      nnz=int((table.to_numpy() > 0).sum()))
+        group = []
+        for engine in engines:
+            record = dict(config, engine=engine, skipped=engine in over_budget)
+            if not record["skipped"]:
+                record.update(run_case(table, engine, repeat=repeat))
+                if record["total"] > budget:
+                    over_budget.add(engine)
+                group.append(record)
+            results.append(record)
+            if progress:
+                progress(record)
+        digests = {r["digest"] for r in group}
+        for r in group:
+            r["consistent"] = len(digests) == 1
+    meta = {
+        "commit": _git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "budget": budget,
+    }
+    return {"format": _BENCH_FORMAT, "meta": meta, "results": results}
+
+
+def results_frame(report):
+    """Sonuçları düz tabloya çevirir (satır başına yapılandırma + motor + aşama)."""
+    rows = []
+    for r in report["results"]:
+        if r["skipped"]:
+            continue
+        for stage, t in r["stages"].items():
+            rows.append({k: r[k] for k in ("m", "n", "density", "skew", "empty_share", "seed", "nnz",
+                                           "engine")} | {"stage": stage, "min_s": t["min"],
+                                                         "median_s": t["median"]})
+    return pd.DataFrame(rows)
+
+
+def scaling_exponents(report):
+    """
+    Motor ve aşama başına log-log eğim: süre ∝ (m·n)^eğim.
+
+    En az iki boyutta ölçülen aşamalar için hesaplanır.
+
+    Returns:
+        DataFrame (engine, stage, exponent, points)
+    """
+    df = results_frame(report)
+    rows = []
+    if df.empty:
+        return pd.DataFrame(columns=["engine", "stage", "exponent", "points"])
+    for (engine, stage), g in df.groupby(["engine", "stage"], sort=False):
+        g = g[g["min_s"] > 0]
+        cells = np.log(g["m"].to_numpy(dtype=np.float64) * g["n"].to_numpy(dtype=np.float64))
+        if len(g) < 2 or np.ptp(cells) == 0:
+            continue
+        slope = np.polyfit(cells, np.log(g["min_s"].to_numpy()), 1)[0]
+        rows.append({"engine": engine, "stage": stage, "exponent": float(slope), "points": len(g)})
+    return pd.DataFrame(rows, columns=["engine", "stage", "exponent", "points"])
+
+
+def compare(baseline, current, tolerance=1.25, min_seconds=COMPARE_MIN_SECONDS):
+    """
+    İki çalıştırmayı yapılandırma + motor + aşama üzerinden karşılaştırır.
+
+    Returns:
+        DataFrame (anahtar alanlar, baseline_s, current_s, ratio, regression);
+        regression = oran > tolerance ve süre min_seconds'tan uzun
+    """
+    keys = ["m", "n", "density", "skew", "empty_share", "seed", "engine", "stage"]
+    old = results_frame(baseline)
+    new = results_frame(current)
+    if old.empty or new.empty:
+        return pd.DataFrame(columns=keys + ["baseline_s", "current_s", "ratio", "regression"])
+    merged = old[keys + ["min_s"]].merge(new[keys + ["min_s"]], on=keys, suffixes=("_old", "_new"))
+    merged = merged.rename(columns={"min_s_old": "baseline_s", "min_s_new": "current_s"})
+    merged["ratio"] = merged["current_s"] / merged["baseline_s"].clip(lower=min_seconds)
+    merged["regression"] = (merged["ratio"] > tolerance) & (merged["current_s"] > min_seconds)
+    return merged
+
+
+def write_report(report, path):
+    """Sonuçları JSON'a (uzantı .csv ise düz tabloya) yazar."""
+    if path.lower().endswith(".csv"):
+        results_frame(report).to_csv(path, index=False)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_scaling_plot(report, path):
+    """Aşama başına süre - m·n log-log eğrileri (Plotly HTML)."""
+    import plotly.express as px
+
+    df = results_frame(report)
+    df["cells"] = df["m"] * df["n"]
+    fig = px.line(df, x="cells", y="min_s", color="engine", facet_col="stage", facet_col_wrap=3,
+                  markers=True, log_x=True, log_y=True,
+                  labels={"cells": "m·n", "min_s": "süre (sn)", "engine": "motor"},
+                  title=f"RMVC ölçekleme ({report['meta'].get('commit') or 'commit yok'})")
+    fig.update_yaxes(matches=None)
+    fig.write_html(path)
+
+
+def _parse_sizes(text):
+    sizes = []
+    for part in text.split(","):
+        m, n = part.lower().split("x")
+        sizes.append((int(m), int(n)))
+    return sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RMVC sentetik veri üreteci ve ölçekleme testi")
+    sub = parser.add_subparsers(dest="komut", required=True)
+
+    def generator_options(p):
+        p.add_argument("--density", type=float, default=0.05, help="Doluluk oranı (varsayılan: 0.05)")
+        p.add_argument("--skew", type=float, default=1.0,
+                       help="Firma büyüklüğü kuvvet yasası üssü (0: düzgün, varsayılan: 1.0)")
+        p.add_argument("--empty-share", type=float, default=0.0, help="Boş parametre kümesi payı")
+        p.add_argument("--seed", type=int, default=0)
+
+    p_run = sub.add_parser("run", help="Ölçekleme testini çalıştır")
+    p_run.add_argument("--sizes", type=_parse_sizes, default=DEFAULT_SIZES,
+                       help="m×n boyutları, ör. 50x500,100x2000")
+    p_run.add_argument("--engines", default=",".join(BENCH_ENGINES),
+                       help=f"Motorlar (varsayılan: {','.join(BENCH_ENGINES)})")
+    generator_options(p_run)
+    p_run.add_argument("--repeat", type=int, default=3, help="Aşama başına tekrar (en kısa süre kullanılır)")
+    p_run.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                       help=f"Motor başına süre sınırı, sn (aşılırsa büyük boyutlar atlanır; "
+                            f"varsayılan: {DEFAULT_BUDGET:g})")
+    p_run.add_argument("--output", default="rmvc_bench.json", help="Sonuç dosyası (.json veya .csv)")
+    p_run.add_argument("--plot", help="Ölçekleme eğrileri için HTML dosyası")
+    p_run.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç dosyası (.json)")
+    p_run.add_argument("--tolerance", type=float, default=1.25)
+
+    p_cmp = sub.add_parser("compare", help="İki sonuç dosyasını karşılaştır")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--tolerance", type=float, default=1.25,
+                       help="Bu oranın üstündeki yavaşlamalar gerileme sayılır (varsayılan: 1.25)")
+
+    p_gen = sub.add_parser("generate", help="Sentetik CSV üret")
+    p_gen.add_argument("boyut", type=lambda t: _parse_sizes(t)[0], help="m×n, ör. 200x5000")
+    p_gen.add_argument("hedef", help="CSV dosyası")
+    generator_options(p_gen)
+    args = parser.parse_args()
+
+    def print_comparison(baseline, current, tolerance):
+        diff = compare(baseline, current, tolerance=tolerance)
+        regressions = diff[diff["regression"]]
+        print(f"\n📏 Karşılaştırma ({baseline['meta'].get('commit')} → {current['meta'].get('commit')}): "
+              f"{len(diff)} ölçüm, {len(regressions)} gerileme (tolerans ×{tolerance:g})")
+        for _, r in regressions.iterrows():
+            print(f"   ❌ {r['m']}×{r['n']} {r['engine']}/{r['stage']}: "
+                  f"{r['baseline_s'] * 1e3:.1f} ms → {r['current_s'] * 1e3:.1f} ms (×{r['ratio']:.2f})")
+        return len(regressions) == 0
+
+    if args.komut == "generate":
+        m, n = args.boyut
+        table = synthetic_table(m, n, density=args.density, skew=args.skew,
+                                empty_share=args.empty_share, seed=args.seed)
+        table.to_csv(args.hedef)
+        print(f"✅ {args.hedef}: {n} firma × {m} ürün, {(table.to_numpy() > 0).sum()} dolu hücre")
+        sys.exit(0)
+
+    if args.komut == "compare":
+        sys.exit(0 if print_comparison(load_report(args.baseline), load_report(args.current),
+                                       args.tolerance) else 1)
+
+    def ilerleme(r):
+        if r["skipped"]:
+            print(f"   ⏭️  {r['m']}×{r['n']} {r['engine']}: süre sınırı aşıldı, atlandı")
+            return
+        asamalar = " ".join(f"{k}={v['min'] * 1e3:.1f}" for k, v in r["stages"].items())
+        print(f"   ⏱️  {r['m']}×{r['n']} {r['engine']}: {r['total']:.3f} sn ({asamalar} ms)")
+
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    print(f"\n🏁 RMVC ölçekleme testi: {len(args.sizes)} boyut × {len(engines)} motor")
+    report = run_benchmark(args.sizes, engines, density=args.density, skew=args.skew,
+                           empty_share=args.empty_share, seed=args.seed, repeat=args.repeat,
+                           budget=args.budget, progress=ilerleme)
+    write_report(report, args.output)
+    print(f"\n💾 Sonuçlar: {args.output}")
+    inconsistent = [r for r in report["results"] if not r["skipped"] and not r["consistent"]]
+    if inconsistent:
+        print(f"⚠️  {len(inconsistent)} ölçümde motorların skorları uyuşmuyor!")
+
+    exponents = scaling_exponents(report)
+    if not exponents.empty:
+        print("\n📈 Ölçekleme üsleri (süre ∝ (m·n)^üs):")
+        print(exponents.pivot(index="stage", columns="engine", values="exponent")
+              .reindex(BENCH_STAGES).round(2).to_string())
+    if args.plot:
+        write_scaling_plot(report, args.plot)
+        print(f"\n🗺️  Ölçekleme eğrileri: {args.plot}")
+
+    ok = not inconsistent
+    if args.baseline:
+        ok = print_comparison(load_report(args.baseline), report, args.tolerance) and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Bitset Motoru - Sıkıştırılmış Bit Vektörü Gösterimi
+========================================================
+Her Φ(e_i) kümesi, eleman sayısı kadar bitten oluşan tek bir Python int
+olarak saklanır (bit j = 1 ⇔ u_j ∈ Φ(e_i)). String kümeleri yerine bit
+vektörü kullanıldığından E_named'in bellek kullanımı büyük ölçüde düşer.
+
+Birliktelik sayımı AND + popcount ile yapılır:
+    O[i, k] = popcount(Φ(e_i) & Φ(e_k))            (parametre örtüşmesi)
+    δ(u, e_i) = Σ_{e_k ∋ u} O[i, k]
+
+İkinci toplam, O[i, :] satırı bit düzlemlerine ayrılarak hesaplanır:
+    δ(u, e_i) = Σ_b 2^b · popcount(Ψ(u) & W_{i,b})
+Burada Ψ(u) = u'yu içeren parametrelerin bit vektörü, W_{i,b} ise O[i, k]
+değerinin b. biti 1 olan parametrelerin bit vektörüdür.
+
+NumPy/SciPy gerektirmez; orta ölçekli problemler için ağır lineer cebir
+bağımlılığı olmadan hızlıdır.
+"""
+
+from fractions import Fraction
+from math import gcd
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # Python 3.8/3.9
+    def _popcount(x):
+        return bin(x).count('1')
+
+
+def _iter_bits(x):
+    """x'in 1 olan bitlerinin indekslerini küçükten büyüğe döndürür."""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+class BitsetSoftSet:
+    """
+    Soft set'in bit vektörü gösterimi.
+
+    Attributes:
+        param_keys: Parametre etiketleri (e_1, e_2, ...)
+        elements: Eleman etiketleri (bit sırası)
+        param_bits: Her parametre için n bitlik int (Φ(e_i))
+        element_bits: Her eleman için m bitlik int (Ψ(u): u'yu içeren parametreler)
+    """
+
+    __slots__ = ('param_keys', 'elements', 'param_bits', 'element_bits')
+
+    def __init__(self, param_keys, elements, param_bits):
+        self.param_keys = list(param_keys)
+        self.elements = list(elements)
+        self.param_bits = list(param_bits)
+
+        element_bits = [0] * len(self.elements)
+        for i, bits in enumerate(self.param_bits):
+            for j in _iter_bits(bits):
+                element_bits[j] |= 1 << i
+        self.element_bits = element_bits
+
+    @classmethod
+    def from_soft_set(cls, E_named, U, elements=None):
+        """
+        E_named / U yapısından bit vektörü gösterimi oluşturur.
+
+        Args:
+            elements: Bit sırası (verilmezse U string sırasıyla dizilir)
+        """
+        if elements is None:
+            elements = sorted(U, key=str)
+        index = {u: j for j, u in enumerate(elements)}
+        param_bits = []
+        for phi in E_named.values():
+            bits = 0
+            for u in phi:
+                if u in index:
+                    bits |= 1 << index[u]
+            param_bits.append(bits)
+        return cls(E_named.keys(), elements, param_bits)
+
+    @property
+    def m(self):
+        """Parametre sayısı."""
+        return len(self.param_bits)
+
+    @property
+    def n(self):
+        """Eleman sayısı."""
+        return len(self.elements)
+
+    def set_sizes(self):
+        """|Φ(e_i)| listesi."""
+        return [_popcount(bits) for bits in self.param_bits]
+
+    def element_counts(self):
+        """Her elemanın ait olduğu parametre sayısı."""
+        return [_popcount(bits) for bits in self.element_bits]
+
+    def to_soft_set(self):
+        """E_named sözlüğünü ({e_i: Φ(e_i)}) geri üretir."""
+        return {
+            e_i: {self.elements[j] for j in _iter_bits(bits)}
+            for e_i, bits in zip(self.param_keys, self.param_bits)
+        }
+
+
+def bitset_delta_rows(bs, progress=None):
+    """
+    Tüm parametreler için δ(u, e_i) satırlarını hesaplar.
+
+    progress verilirse her satır tamamlandığında progress(i, m) çağrılır.
+
+    Returns:
+        m adet n uzunluğunda int listesi; u ∈ Φ(e_i) hücreleri 0'dır.
+    """
+    n = bs.n
+    full = (1 << n) - 1
+    param_bits = bs.param_bits
+    element_bits = bs.element_bits
+
+    rows = []
+    for p_i in param_bits:
+        row = [0] * n
+        if p_i == 0:
+            rows.append(row)
+            if progress:
+                progress(len(rows), bs.m)
+            continue
+
+        # O[i, k] = |Φ(e_i) ∩ Φ(e_k)|
+        overlaps = [_popcount(p_i & p_k) for p_k in param_bits]
+
+        # O[i, :] satırının bit düzlemleri: W_{i,b}
+        planes = []
+        b = 0
+        max_overlap = max(overlaps)
+        while (1 << b) <= max_overlap:
+            mask = 0
+            for k, o in enumerate(overlaps):
+                if (o >> b) & 1:
+                    mask |= 1 << k
+            if mask:
+                planes.append((b, mask))
+            b += 1
+
+        for j in _iter_bits(full & ~p_i):
+            psi_u = element_bits[j]
+            row[j] = sum(_popcount(psi_u & mask) << b for b, mask in planes)
+        rows.append(row)
+        if progress:
+            progress(len(rows), bs.m)
+
+    return rows
+
+
+def bitset_membership(bs, delta_rows=None):
+    """
+    Bit vektörü gösteriminden referansla aynı {e_i: {u: Fraction}}
+    sözlüğünü üretir.
+    """
+    if delta_rows is None:
+        delta_rows = bitset_delta_rows(bs)
+    m = bs.m
+    one = Fraction(1, 1)
+    zero = Fraction(0, 1)
+
+    membership_matrix = {}
+    for e_i, p_i, row_D in zip(bs.param_keys, bs.param_bits, delta_rows):
+        gamma = _popcount(p_i) * (m - 1)
+        row = {}
+        for j, u in enumerate(bs.elements):
+            if (p_i >> j) & 1:
+                row[u] = one
+            elif gamma > 0:
+                row[u] = Fraction(row_D[j], gamma)
+            else:
+                row[u] = zero
+        membership_matrix[e_i] = row
+    return membership_matrix
+
+
+def bitset_scores(bs, delta_rows=None):
+    """
+    Skorları ortak payda üzerinden tam sayı aritmetiğiyle hesaplar.
+
+    Returns:
+        (paylar listesi, ortak payda) - S(u_j) = paylar[j] / payda
+    """
+    if delta_rows is None:
+        delta_rows = bitset_delta_rows(bs)
+    m = bs.m
+
+    # Aynı γ'ya sahip satırların δ toplamları
+    groups = {}
+    for p_i, row_D in zip(bs.param_bits, delta_rows):
+        gamma = _popcount(p_i) * (m - 1)
+        if gamma <= 0:
+            continue
+        acc = groups.setdefault(gamma, [0] * bs.n)
+        for j, d in enumerate(row_D):
+            if d:
+                acc[j] += d
+
+    denominator = 1
+    for g in groups:
+        denominator = denominator * g // gcd(denominator, g)
+
+    numerators = [c * denominator for c in bs.element_counts()]
+    for g, acc in groups.items():
+        factor = denominator // g
+        for j, d in enumerate(acc):
+            if d:
+                numerators[j] += d * factor
+    return numerators, denominator
+
+
+def create_membership_matrix_bitset(E_named, U):
+    """
+    `create_membership_matrix` ile aynı çıktıyı bitset backend ile üretir.
+    """
+    return bitset_membership(BitsetSoftSet.from_soft_set(E_named, U))
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Sonuç Önbelleği - İçerik Özeti + LRU
+=========================================
+Streamlit her etkileşimde betiği baştan çalıştırır. Bu modül ayrıştırılmış
+soft set'i ve hesap sonuçlarını, girdi baytlarının özeti ile hesaplama
+seçeneklerinden oluşan bir anahtar altında saklar:
+
+    - Anahtar: blake2b(girdi baytları) + sıralı seçenekler (rows_are_params,
+      bos_filtrele, motor, ...). Yalnızca gösterimi etkileyen ayarlar
+      (kesir gösterimi, seçili eleman) anahtara girmez.
+    - Kapasite bayt cinsinden sınırlıdır; dolduğunda en uzun süredir
+      kullanılmayan (LRU) kayıt atılır. Tek başına kapasiteyi aşan kayıt
+      (büyük analizler) LRU'yu boşaltmaz, OVERSIZE_FACTOR·kapasiteye kadar
+      tek kişilik ayrı bir yuvada tutulur; sonraki büyük kayıt onun yerine
+      geçer, daha büyükleri saklanmaz.
+    - İşlemler kilitle korunur; rmvc_app_v2 önbelleği st.cache_resource ile
+      sunucudaki tüm oturumlara paylaştırır.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+# Varsayılan önbellek kapasitesi (bayt). Toplam üst sınır
+# (1 + OVERSIZE_FACTOR)·max_bytes: LRU kayıtları en fazla max_bytes, tek büyük
+# kayıt yuvası en fazla OVERSIZE_FACTOR·max_bytes (varsayılanla 1.5 GB).
+DEFAULT_CACHE_BYTES = 512 * 1024 ** 2
+
+# Büyük kayıt yuvasının sınırı, max_bytes katı; daha büyük kayıtlar saklanmaz
+OVERSIZE_FACTOR = 2
+
+
+def content_hash(data, **options):
+    """
+    Girdi baytları (veya önceki bir özet) ve hesaplama seçeneklerinden
+    kararlı bir anahtar üretir.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    h.update(data)
+    for key in sorted(options):
+        h.update(f"\0{key}={options[key]!r}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def path_fingerprint(path):
+    """
+    Dosya veya dizin (ör. .rmvcd veri seti) için içerik okumadan özet:
+    göreli ad, boyut ve değişiklik zamanı.
+    """
+    path = os.path.abspath(path)
+    if os.path.isdir(path):
+        files = sorted(os.path.join(root, f) for root, _, names in os.walk(path) for f in names)
+    else:
+        files = [path]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(path.encode('utf-8'))
+    for f in files:
+        st = os.stat(f)
+        h.update(f"\0{os.path.relpath(f, path)}:{st.st_size}:{st.st_mtime_ns}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def estimate_nbytes(obj, _seen=None):
+    """
+    Önbellek kaydının yaklaşık bellek boyutu (bayt).
+
+    NumPy dizileri, seyrek matrisler ve DataFrame'ler kendi tampon
+    boyutlarıyla (bellek eşlemeli diziler hariç); __slots__ sınıfları,
+    sözlükler ve diziler özyinelemeli olarak sayılır. Ortak nesneler bir
+    kez sayılır.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, np.memmap):
+        # Disk eşlemeli diziler sayfa önbelleğindedir, yığında yer tutmaz
+        return sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object and obj.size:
+            return obj.nbytes + obj.size * sys.getsizeof(obj.flat[0])
+        return obj.nbytes
+    if sp is not None and sp.issparse(obj):
+        return sum(getattr(obj, a).nbytes for a in ('data', 'indices', 'indptr', 'row', 'col')
+                   if hasattr(obj, a))
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, (str, bytes, int, float, complex, bool, type(None))):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(k, _seen) + estimate_nbytes(v, _seen)
+                                        for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(x, _seen) for x in obj)
+
+    size = sys.getsizeof(obj)
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if hasattr(obj, name):
+                size += estimate_nbytes(getattr(obj, name), _seen)
+    if hasattr(obj, '__dict__'):
+        size += estimate_nbytes(vars(obj), _seen)
+    return size
+
+
+class ResultCache:
+    """
+    Bayt sınırlı, iş parçacığı güvenli LRU önbellek.
+
+    Attributes:
+        max_bytes: LRU kayıtlarının toplam kapasitesi; tek başına bunu aşan
+                   kayıt OVERSIZE_FACTOR·max_bytes'a kadar ayrı yuvada (en
+                   fazla bir tane) tutulur
+        nbytes: LRU kayıtlarının tahmini toplam boyutu (ayrı yuva hariç)
+        hits, misses: İsabet / ıska sayaçları
+    """
+
+    __slots__ = ('max_bytes', 'nbytes', 'hits', 'misses', '_entries', '_oversize', '_lock')
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # anahtar -> (değer, bayt)
+        self._oversize = None  # (anahtar, değer, bayt): kapasiteyi aşan son kayıt
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries) + (self._oversize is not None)
+
+    def __contains__(self, key):
+        oversize = self._oversize
+        return key in self._entries or (oversize is not None and oversize[0] == key)
+
+    def get(self, key, default=None):
+        """Kaydı döndürür ve en son kullanılan olarak işaretler."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._oversize is not None and self._oversize[0] == key:
+                self.hits += 1
+                return self._oversize[1]
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        """
+        Kaydı ekler; kapasite aşılırsa en eski kayıtlar atılır. Tek başına
+        kapasiteyi aşan kayıt ayrı yuvadaki önceki büyük kaydın yerine geçer;
+        OVERSIZE_FACTOR·max_bytes'tan büyük kayıt saklanmaz.
+        """
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            if self._oversize is not None and self._oversize[0] == key:
+                self._oversize = None
+            if nbytes > self.max_bytes:
+                if nbytes <= OVERSIZE_FACTOR * self.max_bytes:
+                    self._oversize = (key, value, nbytes)
+                return value
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, size) = self._entries.popitem(last=False)
+                self.nbytes -= size
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Kayıt varsa döndürür, yoksa compute() ile hesaplayıp saklar.
+
+        Hesaplama kilit dışında yapılır; aynı anahtar için eşzamanlı iki
+        ıska en fazla bir kez gereksiz hesaplama yapar.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._oversize = None
+            self.nbytes = 0
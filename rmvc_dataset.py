@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC İkili Veri Seti Formatı - Bellek Eşlemeli (mmap) İnsidans Matrisi
+=====================================================================
+Büyük CSV/XLSX dosyalarını her çalıştırmada yeniden ayrıştırmak yerine
+insidans matrisi bir kez ikili formata dönüştürülür:
+
+    veri.rmvcd/
+        meta.json     Biçim sürümü, boyutlar, yön, etiket tabloları
+        bits.npy      uint8 m×⌈n/8⌉ bit paketli insidans   (düzen = "bits")
+        indptr.npy    int64 CSR satır göstericileri        (düzen = "csr")
+        indices.npy   int32 CSR sütun indeksleri           (düzen = "csr")
+        values.npy    float64 özgün değerler (isteğe bağlı) - yalnızca dolu
+                      hücreler, satır-öncelikli sırada
+
+Düzen, diskte daha küçük olana göre otomatik seçilir. Yükleyici .npy
+dosyalarını np.load(mmap_mode='r') ile eşler: açılış anında gerçekleşir ve
+aynı dosyayı açan süreçler aynı bellek sayfalarını paylaşır.
+
+Dönüştürme kuralları (sütun filtreleme, e_i / eleman adlandırma, boş
+kümeler dahil) rmvc_app_v2.csv_to_soft_set ile aynıdır.
+
+Kullanım:
+    python rmvc_dataset.py veri.csv veri.rmvcd --rows-are-params --values
+"""
+
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+
+from rmvc_engine import IncidenceMatrix, ParamInfoView, SoftSetView, choose_backend, sparse_incidence
+from rmvc_stream import _is_label_column
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+FORMAT_NAME = "rmvc-dataset"
+FORMAT_VERSION = 1
+DATASET_SUFFIX = ".rmvcd"
+
+# bits düzeninde tek seferde açılan (unpackbits) hücre sayısı; tam m×n dizi
+# yalnızca yoğun insidans istendiğinde oluşturulur
+UNPACK_BLOCK_CELLS = 1 << 24
+
+# Bayt başına 1 bit sayısı (paketli satırlarda |Φ(e_i)|)
+_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.int64)
+
+
+def read_table(source):
+    """CSV veya Excel dosyasını (ilk sütun indeks) okur."""
+    name = getattr(source, 'name', source)
+    if str(name).lower().endswith(('.xlsx', '.xls')):
+        return pd.read_excel(source, index_col=0)
+    return pd.read_csv(source, index_col=0)
+
+
+def table_to_mask(df, rows_are_params=False):
+    """
+    Tabloyu vektörize olarak m×n insidans maskesine dönüştürür.
+
+    rows_are_params=True: boş / NaN / Unnamed ve hiç sayısal değer
+    içermeyen sütunlar atlanır, elemanlar 1..n olarak yeniden adlandırılır.
+    rows_are_params=False: satırlar elemanlar, sütunlar parametrelerdir.
+
+    Returns:
+        mask: m×n bool (değer > 0)
+        values: m×n float64 (sayısal olmayan hücreler NaN)
+        parametre_ids: Özgün parametre etiketleri
+        eleman_ids: Eleman etiketleri (csv_to_soft_set ile aynı)
+        eleman_orijinal: Özgün eleman etiketleri (sütun/satır adları)
+    """
+    if rows_are_params:
+        parametre_ids = df.index.tolist()
+        label_ok = np.array([_is_label_column(c) for c in df.columns], dtype=bool)
+        values = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        valid = label_ok & ~np.isnan(values).all(axis=0)
+        values = values[:, valid]
+        eleman_orijinal = [c for c, ok in zip(df.columns.tolist(), valid) if ok]
+        eleman_ids = [str(i) for i in range(1, len(eleman_orijinal) + 1)]
+    else:
+        eleman_ids = df.index.tolist()
+        eleman_orijinal = eleman_ids
+        parametre_ids = df.columns.tolist()
+        values = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float).T
+
+    mask = values > 0  # NaN karşılaştırması False döner
+    return mask, values, parametre_ids, eleman_ids, eleman_orijinal
+
+
+def write_dataset(path, mask, parametre_ids, eleman_ids, values=None, totals=None,
+                  rows_are_params=False, eleman_orijinal=None, layout="auto"):
+    """
+    İnsidans maskesini ikili veri seti dizinine yazar.
+
+    Args:
+        path: Hedef dizin (yoksa oluşturulur)
+        mask: m×n bool insidans maskesi
+        values: m×n özgün değerler (verilirse dolu hücreler saklanır)
+        totals: Parametre başına toplam_deger (verilmezse values'tan, o da
+                yoksa 0)
+        layout: "bits", "csr" veya "auto" (diskte küçük olan)
+    """
+    mask = np.asarray(mask, dtype=bool)
+    m, n = mask.shape
+    nnz = int(np.count_nonzero(mask))
+
+    if layout == "auto":
+        bits_bytes = m * ((n + 7) // 8)
+        csr_bytes = 4 * nnz + 8 * (m + 1)
+        layout = "csr" if csr_bytes < bits_bytes else "bits"
+    if layout not in ("bits", "csr"):
+        raise ValueError(f"Bilinmeyen düzen: {layout}")
+
+    os.makedirs(path, exist_ok=True)
+    if layout == "bits":
+        np.save(os.path.join(path, "bits.npy"), np.packbits(mask, axis=1))
+    else:
+        rows, cols = np.nonzero(mask)
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=m), out=indptr[1:])
+        np.save(os.path.join(path, "indptr.npy"), indptr)
+        np.save(os.path.join(path, "indices.npy"), cols.astype(np.int32))
+
+    if values is not None:
+        values = np.asarray(values, dtype=np.float64)
+        np.save(os.path.join(path, "values.npy"), values[mask])
+        if totals is None:
+            totals = np.where(mask, values, 0).sum(axis=1)
+    if totals is None:
+        totals = np.zeros(m, dtype=np.float64)
+
+    meta = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "layout": layout,
+        "shape": [m, n],
+        "nnz": nnz,
+        "rows_are_params": bool(rows_are_params),
+        "param_names": [str(p) for p in parametre_ids],
+        "elements": [str(u) for u in eleman_ids],
+        "element_names": [str(u) for u in (eleman_orijinal if eleman_orijinal is not None else eleman_ids)],
+        "totals": np.asarray(totals, dtype=np.float64).tolist(),
+        "has_values": values is not None,
+    }
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return path
+
+
+def convert_table(source, path, rows_are_params=False, keep_values=False, layout="auto"):
+    """
+    CSV/XLSX dosyasını ikili veri setine dönüştürür.
+
+    Args:
+        source: CSV/XLSX dosya yolu veya DataFrame
+        path: Hedef .rmvcd dizini
+        rows_are_params: True ise satırlar=parametreler (Hocanın formatı)
+        keep_values: True ise özgün (> 0) hücre değerleri de saklanır
+    """
+    df = source if isinstance(source, pd.DataFrame) else read_table(source)
+    mask, values, parametre_ids, eleman_ids, eleman_orijinal = table_to_mask(df, rows_are_params)
+    # toplam_deger her zaman saklanır; hücre değerleri yalnızca istenirse
+    totals = np.where(mask, values, 0).sum(axis=1)
+    return write_dataset(path, mask, parametre_ids, eleman_ids,
+                         values=values if keep_values else None, totals=totals,
+                         rows_are_params=rows_are_params, eleman_orijinal=eleman_orijinal,
+                         layout=layout)
+
+
+def is_dataset(path):
+    """Yol bir RMVC ikili veri seti dizini mi?"""
+    return os.path.isfile(os.path.join(str(path), "meta.json"))
+
+
+class SoftSetDataset:
+    """
+    Bellek eşlemeli RMVC veri seti.
+
+    Diziler np.load(mmap_mode='r') ile eşlenir; veriye erişilene kadar
+    diskten okuma yapılmaz ve süreçler aynı sayfaları paylaşır.
+    """
+
+    __slots__ = ('path', 'meta', 'param_keys', 'elements', '_arrays')
+
+    def __init__(self, path, mmap=True):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_NAME or meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen veri seti biçimi: {path}")
+        self.path = path
+        self.meta = meta
+        self.param_keys = [f"e_{i+1}" for i in range(meta["shape"][0])]
+        self.elements = meta["elements"]
+
+        mode = 'r' if mmap else None
+        names = ("bits",) if meta["layout"] == "bits" else ("indptr", "indices")
+        if meta["has_values"]:
+            names += ("values",)
+        self._arrays = {name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mode)
+                        for name in names}
+
+    @property
+    def m(self):
+        """Parametre sayısı."""
+        return self.meta["shape"][0]
+
+    @property
+    def n(self):
+        """Eleman sayısı."""
+        return self.meta["shape"][1]
+
+    def _row_blocks(self, rows):
+        """rows dizisini UNPACK_BLOCK_CELLS hücrelik ardışık dilimlere böler."""
+        step = max(1, UNPACK_BLOCK_CELLS // max(self.n, 1))
+        for start in range(0, len(rows), step):
+            yield start, rows[start:start + step]
+
+    def _unpack_rows(self, rows):
+        """bits düzeninde yalnızca verilen satırları açar (len(rows)×n uint8)."""
+        return np.unpackbits(self._arrays["bits"][rows], axis=1, count=self.n)
+
+    def set_sizes(self):
+        """|Φ(e_i)| vektörü (insidans açılmadan)."""
+        if self.meta["layout"] == "csr":
+            return np.diff(self._arrays["indptr"]).astype(np.int64)
+        bits = self._arrays["bits"]
+        sizes = np.empty(self.m, dtype=np.int64)
+        step = max(1, UNPACK_BLOCK_CELLS // max(bits.shape[1], 1))
+        for start in range(0, self.m, step):
+            sizes[start:start + step] = _POPCOUNT[bits[start:start + step]].sum(axis=1)
+        return sizes
+
+    def incidence(self, sparse=None, drop_empty=False):
+        """
+        IncidenceMatrix döndürür.
+
+        Args:
+            sparse: True/False veya None (otomatik: csr düzeni scipy varsa
+                    yoğunlaştırılmadan CSR açılır, bits düzeni için
+                    choose_backend)
+            drop_empty: True ise boş parametre kümeleri çıkarılır
+        """
+        m, n = self.m, self.n
+        csr_layout = self.meta["layout"] == "csr"
+        sizes = self.set_sizes()
+
+        if sparse is None:
+            if csr_layout:
+                sparse = sp is not None
+            else:
+                sparse = choose_backend(sizes, n) == "sparse"
+
+        param_keys = self.param_keys
+        if csr_layout:
+            indptr, indices = self._arrays["indptr"], self._arrays["indices"]
+            if sparse:
+                B = sparse_incidence(indptr, indices, (m, n))
+            else:
+                B = np.zeros((m, n), dtype=np.uint8)
+                B[np.repeat(np.arange(m), sizes), indices] = 1
+            if drop_empty:
+                keep = np.flatnonzero(sizes > 0)
+                B = B[keep]
+                param_keys = [param_keys[i] for i in keep]
+            return IncidenceMatrix(B, param_keys, self.elements)
+
+        # bits: yalnızca gereken satırlar, satır blokları halinde açılır
+        rows = np.flatnonzero(sizes > 0) if drop_empty else np.arange(m)
+        if sparse:
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(sizes[rows], out=indptr[1:])
+            indices = np.empty(indptr[-1], dtype=np.int32)
+            for start, blok in self._row_blocks(rows):
+                indices[indptr[start]:indptr[start + len(blok)]] = np.nonzero(self._unpack_rows(blok))[1]
+            B = sparse_incidence(indptr, indices, (len(rows), n))
+        else:
+            B = np.empty((len(rows), n), dtype=np.uint8)
+            for start, blok in self._row_blocks(rows):
+                B[start:start + len(blok)] = self._unpack_rows(blok)
+        if drop_empty:
+            param_keys = [param_keys[i] for i in rows]
+        return IncidenceMatrix(B, param_keys, self.elements)
+
+    def values(self):
+        """Dolu hücrelerin özgün değerleri (satır-öncelikli) veya None."""
+        return self._arrays.get("values")
+
+    def cell_indices(self):
+        """Dolu hücrelerin satır ve sütun indeksleri (satır-öncelikli, values() ile aynı sıra)."""
+        if self.meta["layout"] == "csr":
+            indptr = self._arrays["indptr"]
+            return np.repeat(np.arange(self.m), np.diff(indptr)), np.asarray(self._arrays["indices"])
+        satirlar, sutunlar = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for start, blok in self._row_blocks(np.arange(self.m)):
+            r, c = np.nonzero(self._unpack_rows(blok))
+            satirlar.append(r + start)
+            sutunlar.append(c)
+        return np.concatenate(satirlar), np.concatenate(sutunlar)
+
+    def value_matrix(self, rows=None):
+        """
+        Özgün değerlerin matrisi (boş hücreler 0) veya None; insidans
+        yoğunlaştırılmaz, değerler satır blokları halinde hücre indeksleriyle
+        yerleştirilir.
+
+        Args:
+            rows: Yalnızca bu parametre satırları (len(rows)×n); None ise m×n
+        """
+        dolu = self.values()
+        if dolu is None:
+            return None
+        rows = np.arange(self.m) if rows is None else np.asarray(rows, dtype=np.int64)
+        sizes = self.set_sizes()
+        starts = np.zeros(self.m, dtype=np.int64)
+        np.cumsum(sizes[:-1], out=starts[1:])
+        csr_layout = self.meta["layout"] == "csr"
+        degerler = np.zeros((len(rows), self.n))
+        for start, blok in self._row_blocks(rows):
+            # Bloğun hücrelerinin values() içindeki konumları (satır-öncelikli)
+            blok_sizes = sizes[blok]
+            yerel = np.repeat(np.arange(len(blok)), blok_sizes)
+            ofset = np.zeros(len(blok), dtype=np.int64)
+            np.cumsum(blok_sizes[:-1], out=ofset[1:])
+            konum = np.repeat(starts[blok] - ofset, blok_sizes) + np.arange(int(blok_sizes.sum()))
+            if csr_layout:
+                cols = self._arrays["indices"][konum]
+            else:
+                cols = np.nonzero(self._unpack_rows(blok))[1]
+            degerler[start + yerel, cols] = dolu[konum]
+        return degerler
+
+    def to_soft_set(self):
+        """
+        csv_to_soft_set ile aynı çıktı: (U, E_named, E_info, eleman_ids, parametre_ids)
+
+        E_named ve E_info, bellek eşlemeli insidans matrisi üzerinde tembel
+        görünümlerdir (SoftSetView / ParamInfoView).
+        """
+        inc = self.incidence()
+        E_named = SoftSetView(inc)
+        E_info = ParamInfoView(inc, self.meta["param_names"], self.meta["totals"])
+        return set(self.elements), E_named, E_info, list(self.elements), list(self.meta["param_names"])
+
+
+def load_dataset(path, mmap=True):
+    """İkili veri setini (bellek eşlemeli) açar."""
+    return SoftSetDataset(path, mmap=mmap)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CSV/XLSX → RMVC ikili veri seti dönüştürücü")
+    parser.add_argument("kaynak", help="CSV veya Excel dosyası")
+    parser.add_argument("hedef", help=f"Hedef veri seti dizini (ör. veri{DATASET_SUFFIX})")
+    parser.add_argument("--rows-are-params", action="store_true",
+                        help="Satırlar=Parametreler, Sütunlar=Elemanlar (Hocanın formatı)")
+    parser.add_argument("--values", action="store_true", help="Özgün hücre değerlerini de sakla")
+    parser.add_argument("--layout", choices=["auto", "bits", "csr"], default="auto")
+    args = parser.parse_args()
+
+    convert_table(args.kaynak, args.hedef, rows_are_params=args.rows_are_params,
+                  keep_values=args.values, layout=args.layout)
+    ds = load_dataset(args.hedef)
+    print(f"✅ {args.hedef}: {ds.m} parametre × {ds.n} eleman, "
+          f"{ds.meta['nnz']} dolu hücre ({ds.meta['layout']} düzeni)")
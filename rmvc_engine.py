@@ -0,0 +1,1270 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Hesaplama Motoru - Vektörize NumPy Backend
+===============================================
+`rmvc_app_v2.py` içindeki referans `delta_function` / `create_membership_matrix`
+ile birebir aynı sonucu veren, matris işlemleri tabanlı hesaplama motoru.
+
+Yöntem:
+    B: m×n ikili insidans matrisi (satırlar=parametreler e_i, sütunlar=elemanlar u)
+    C = Bᵀ·B: n×n eleman birliktelik (co-occurrence) matrisi
+        C[u, v] = |{e_j ∈ E : {u, v} ⊆ Φ(e_j)}|
+    D = B·C: δ payları
+        D[i, u] = Σ_{v ∈ Φ(e_i)} C[v, u] = δ(u, e_i)        (u ∉ Φ(e_i) için)
+    γ(e_i) = |Φ(e_i)| × (m - 1)
+
+Referans döngüler m²·n² mertebesinde büyürken burada maliyet iki matris
+çarpımına iner. Aynı D, m×m örtüşme matrisi O = B·Bᵀ üzerinden (B·Bᵀ)·B
+olarak da hesaplanabilir; plan_delta m, n ve nnz'ye göre ucuz sırayı seçer
+ve ara matris bellek bütçesini aşarsa bloklu hesaba geçer.
+
+Tam (exact) mod:
+    Hücre başına Fraction oluşturulmaz. δ payları int64 matriste, γ(e_i)
+    paydaları satır vektöründe tutulur; skorlar ortak payda üzerinden tam
+    sayı aritmetiğiyle toplanır. Kesirler yalnızca gösterim için üretilir.
+
+Seyrek backend (scipy.sparse, opsiyonel):
+    B ve C = Bᵀ·B sıkıştırılmış (CSR) formda tutulur; hiçbir adımda yoğun
+    m×n veya n×n matris oluşturulmaz. Bellek ve süre nnz ile ölçeklenir.
+
+İlk k (top-k) modu:
+    Yalnızca skorlar gerektiğinde (exact_scores / top_k_scores) üyelik
+    matrisi oluşturulmaz; sütun toplamları O(n) bellekle biriktirilir ve
+    en iyi k eleman kısmi seçimle (argpartition / heap) bulunur.
+"""
+
+import heapq
+import logging
+import re
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from fractions import Fraction
+from math import gcd
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel - seyrek backend devre dışı kalır
+    sp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# float64 ile tam sayı çarpımı bu sınırın altında kayıpsızdır (2^53)
+_FLOAT_EXACT_LIMIT = 2 ** 53
+
+
+def _exact_matmul(a, b, bound):
+    """
+    Tam sayı matris çarpımı.
+
+    Sonuçtaki en büyük değer `bound` float64 ile kayıpsız temsil edilebiliyorsa
+    BLAS hızlandırmalı float çarpımı kullanılır, değilse int64 çarpımı yapılır.
+    Zaten doğru tipteki işlenenler (bkz. _exact_operand) kopyalanmaz.
+    """
+    if bound < _FLOAT_EXACT_LIMIT:
+        result = a.astype(np.float64, copy=False) @ b.astype(np.float64, copy=False)
+        return np.rint(result).astype(np.int64)
+    return a.astype(np.int64, copy=False) @ b.astype(np.int64, copy=False)
+
+
+def _exact_operand(M, bound):
+    """
+    Tekrar tekrar çarpılan işleneni _exact_matmul'ün (aynı bound ile)
+    kullanacağı tipe bir kez dönüştürür; döngüde yeniden dönüştürülmez.
+    """
+    return np.asarray(M).astype(np.float64 if bound < _FLOAT_EXACT_LIMIT else np.int64, copy=False)
+
+
+# Parametre etiketindeki ilk sayı grubu (e1, e_1, param_10 → 1, 1, 10)
+_FIRST_NUMBER = re.compile(r'(\d+)')
+
+
+def element_sort_key(x):
+    """Eleman doğal sıralama anahtarı: tam sayılar önce (sayısal sırayla), metinler sonra."""
+    try:
+        return (0, int(str(x)))
+    except (ValueError, TypeError):
+        return (1, str(x))
+
+
+def param_sort_key(x):
+    """Parametre sıralama anahtarı: etiketteki ilk sayı; sayı içermeyenler sonra."""
+    match = _FIRST_NUMBER.search(str(x))
+    if match:
+        return (0, int(match.group(1)))
+    return (1, str(x))
+
+
+def natural_order(labels, key=element_sort_key):
+    """
+    Etiketlerin doğal sıralama permütasyonu (kararlı).
+
+    Anahtar etiket başına bir kez hesaplanır; sonraki sıralamalar bu indeks
+    dizisiyle yapılır.
+    """
+    keys = [key(x) for x in labels]
+    return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.intp)
+
+
+class IncidenceMatrix:
+    """
+    Soft set'in m×n ikili insidans matrisi gösterimi.
+
+    Etiketler yalnızca giriş/çıkışta kullanılır: hesaplar satır/sütun
+    indeksleriyle yapılır. Etiket → indeks tabloları ve doğal sıralama
+    permütasyonları ilk istendiğinde bir kez kurulur; aynı sütunları
+    paylaşan türetilmiş matrislere (take_rows) aktarılır.
+
+    Attributes:
+        B: m×n uint8 matris (veya seyrek CSR matris), B[i, u] = 1 ⇔ u ∈ Φ(e_i)
+        param_keys: Satır etiketleri (e_1, e_2, ...)
+        elements: Sütun etiketleri (U elemanları)
+    """
+
+    __slots__ = ('B', 'param_keys', 'elements', '_param_index', '_element_index',
+                 '_param_order', '_element_order')
+
+    def __init__(self, B, param_keys, elements):
+        self.B = B
+        self.param_keys = list(param_keys)
+        self.elements = list(elements)
+        self._param_index = None
+        self._element_index = None
+        self._param_order = None
+        self._element_order = None
+
+    def _share_columns(self, other):
+        """Aynı sütunlara sahip matrise sütun tablolarını aktarır."""
+        other._element_index = self._element_index
+        other._element_order = self._element_order
+        return other
+
+    def param_index(self):
+        """Etiket → satır indeksi tablosu (ilk erişimde kurulur, görünümlerce paylaşılır)."""
+        if self._param_index is None:
+            self._param_index = {e_i: i for i, e_i in enumerate(self.param_keys)}
+        return self._param_index
+
+    def element_index(self):
+        """Eleman → sütun indeksi tablosu (ilk erişimde kurulur)."""
+        if self._element_index is None:
+            self._element_index = {u: j for j, u in enumerate(self.elements)}
+        return self._element_index
+
+    def param_order(self):
+        """Satırların doğal sırası (param_sort_key: e_1, e_2, ..., e_10)."""
+        if self._param_order is None:
+            self._param_order = natural_order(self.param_keys, key=param_sort_key)
+        return self._param_order
+
+    def element_order(self):
+        """Sütunların doğal sırası (element_sort_key: 1, 2, ..., 10, metinler)."""
+        if self._element_order is None:
+            self._element_order = natural_order(self.elements)
+        return self._element_order
+
+    def element_ranks(self):
+        """Sütun indeksi → doğal sıradaki yeri (element_order'ın tersi)."""
+        order = self.element_order()
+        ranks = np.empty(len(order), dtype=np.intp)
+        ranks[order] = np.arange(len(order))
+        return ranks
+
+    @property
+    def m(self):
+        """Parametre sayısı."""
+        return self.B.shape[0]
+
+    @property
+    def n(self):
+        """Eleman sayısı."""
+        return self.B.shape[1]
+
+    @property
+    def is_sparse(self):
+        """B seyrek (scipy.sparse) formda mı?"""
+        return sp is not None and sp.issparse(self.B)
+
+    @property
+    def nnz(self):
+        """Dolu hücre sayısı (Σ |Φ(e_i)|)."""
+        if self.is_sparse:
+            return int(self.B.nnz)
+        return int(np.count_nonzero(self.B))
+
+    def set_sizes(self):
+        """|Φ(e_i)| vektörü."""
+        if self.is_sparse:
+            return np.diff(self.B.indptr).astype(np.int64)
+        return self.B.sum(axis=1, dtype=np.int64)
+
+    def element_counts(self):
+        """Her elemanın ait olduğu parametre sayısı (B sütun toplamları)."""
+        if self.is_sparse:
+            return np.bincount(self.B.indices, minlength=self.n).astype(np.int64)
+        return self.B.sum(axis=0, dtype=np.int64)
+
+    def row_indices(self, i):
+        """Φ(e_i) elemanlarının sütun indeksleri."""
+        if self.is_sparse:
+            return self.B.indices[self.B.indptr[i]:self.B.indptr[i + 1]]
+        return np.flatnonzero(self.B[i])
+
+    def to_soft_set(self):
+        """E_named sözlüğünü ({e_i: Φ(e_i)}) geri üretir."""
+        return {
+            e_i: {self.elements[j] for j in self.row_indices(i)}
+            for i, e_i in enumerate(self.param_keys)
+        }
+
+    def take_rows(self, rows):
+        """Yalnızca verilen parametre satırlarını içeren insidans matrisi."""
+        rows = np.asarray(rows, dtype=np.int64)
+        B = self.B[rows]
+        return self._share_columns(IncidenceMatrix(B, [self.param_keys[i] for i in rows], self.elements))
+
+    def select(self, elements=None, sparse=None):
+        """
+        Sütunları `elements` sırasına dizer ve/veya yoğun ↔ seyrek dönüştürür.
+
+        Matriste bulunmayan elemanlar boş sütun olarak eklenir (build_incidence
+        ile aynı davranış).
+        """
+        B = self.B
+        if elements is not None and list(elements) == self.elements:
+            elements = None
+        if elements is not None:
+            elements = list(elements)
+            index = self.element_index()
+            cols = np.array([index.get(u, -1) for u in elements], dtype=np.int64)
+            if (cols < 0).any():
+                if self.is_sparse:
+                    B = sp.hstack([B, sp.csr_matrix((self.m, 1), dtype=B.dtype)]).tocsr()
+                else:
+                    B = np.hstack([B, np.zeros((self.m, 1), dtype=B.dtype)])
+                cols[cols < 0] = self.n
+            B = B[:, cols]
+            if self.is_sparse:
+                B = B.tocsr()
+                B.sort_indices()
+        else:
+            elements = self.elements
+        if sparse is not None and sparse != self.is_sparse:
+            if sparse:
+                _require_scipy()
+                B = sp.csr_matrix(B, dtype=np.int32)
+            else:
+                B = B.toarray().astype(np.uint8)
+        inc = IncidenceMatrix(B, self.param_keys, elements)
+        return self._share_columns(inc) if elements is self.elements else inc
+
+    def natural_columns(self):
+        """
+        Sütunları elemanların doğal sırasına dizer (yükleme anında bir kez).
+
+        Sonuçta element_order birim permütasyondur; gösterim ve sıralama
+        adımları sütunları yeniden dizmez.
+        """
+        order = self.element_order()
+        if np.array_equal(order, np.arange(self.n)):
+            return self
+        B = self.B[:, order]
+        if self.is_sparse:
+            B = B.tocsr()
+            B.sort_indices()
+        inc = IncidenceMatrix(B, self.param_keys, [self.elements[j] for j in order])
+        inc._param_index = self._param_index
+        inc._param_order = self._param_order
+        inc._element_order = np.arange(self.n, dtype=np.intp)
+        return inc
+
+
+class SoftSetView(Mapping):
+    """
+    IncidenceMatrix üzerinde E_named ({e_i: Φ(e_i)}) ile uyumlu tembel görünüm.
+
+    Φ(e_i) kümeleri yalnızca erişildiğinde ilgili insidans satırından
+    üretilir; build_incidence görünümü tanır ve matrisi yeniden kurmaz.
+    """
+
+    __slots__ = ('incidence', '_index')
+
+    def __init__(self, incidence):
+        self.incidence = incidence
+        self._index = incidence.param_index()
+
+    def __getitem__(self, e_i):
+        elements = self.incidence.elements
+        return {elements[j] for j in self.incidence.row_indices(self._index[e_i])}
+
+    def __contains__(self, e_i):
+        return e_i in self._index
+
+    def __iter__(self):
+        return iter(self.incidence.param_keys)
+
+    def __len__(self):
+        return self.incidence.m
+
+    def set_size(self, e_i):
+        """|Φ(e_i)| (küme oluşturulmadan)."""
+        return int(self.incidence.set_sizes()[self._index[e_i]])
+
+    def subset(self, keys):
+        """Yalnızca verilen parametreleri (özgün sırayla) içeren görünüm."""
+        keys = set(keys)
+        rows = [i for i, e_i in enumerate(self.incidence.param_keys) if e_i in keys]
+        return SoftSetView(self.incidence.take_rows(rows))
+
+    def nonempty(self):
+        """Boş kümeleri (|Φ(e_i)| = 0) çıkarılmış görünüm."""
+        return SoftSetView(self.incidence.take_rows(np.flatnonzero(self.incidence.set_sizes() > 0)))
+
+
+class ParamInfo(Mapping):
+    """
+    Tek parametrenin E_info kaydı: 'orijinal_ad', 'eleman_sayisi',
+    'toplam_deger' ve 'elemanlar'. 'elemanlar' kümesi yalnızca
+    istendiğinde üretilir.
+    """
+
+    __slots__ = ('_incidence', '_row', '_fields')
+
+    _KEYS = ('orijinal_ad', 'eleman_sayisi', 'toplam_deger', 'elemanlar')
+
+    def __init__(self, incidence, row, orijinal_ad, eleman_sayisi, toplam_deger):
+        self._incidence = incidence
+        self._row = row
+        self._fields = {
+            'orijinal_ad': orijinal_ad,
+            'eleman_sayisi': eleman_sayisi,
+            'toplam_deger': toplam_deger,
+        }
+
+    def __getitem__(self, key):
+        if key == 'elemanlar':
+            elements = self._incidence.elements
+            return {elements[j] for j in self._incidence.row_indices(self._row)}
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+
+class ParamInfoView(Mapping):
+    """
+    E_info ({e_i: {...}}) ile uyumlu tembel görünüm; kayıtlar erişildiğinde
+    insidans satırı, özgün adlar ve toplam_deger dizisinden oluşturulur.
+    |Φ(e_i)| verilmezse insidans matrisinden hesaplanır.
+    """
+
+    __slots__ = ('incidence', 'names', 'totals', '_index', '_sizes')
+
+    def __init__(self, incidence, names, totals, sizes=None):
+        self.incidence = incidence
+        self.names = [str(p) for p in names]
+        self.totals = np.asarray(totals, dtype=np.float64)
+        self._index = incidence.param_index()
+        self._sizes = incidence.set_sizes() if sizes is None else np.asarray(sizes, dtype=np.int64)
+
+    def __getitem__(self, e_i):
+        i = self._index[e_i]
+        return ParamInfo(self.incidence, i, self.names[i], int(self._sizes[i]), self.totals[i])
+
+    def __contains__(self, e_i):
+        return e_i in self._index
+
+    def __iter__(self):
+        return iter(self.incidence.param_keys)
+
+    def __len__(self):
+        return self.incidence.m
+
+    def set_sizes(self):
+        """|Φ(e_i)| dizisi (satır sırasıyla)."""
+        return self._sizes
+
+    def subset(self, keys):
+        """Yalnızca verilen parametreleri (özgün sırayla) içeren görünüm."""
+        keys = set(keys)
+        rows = [i for i, e_i in enumerate(self.incidence.param_keys) if e_i in keys]
+        return ParamInfoView(self.incidence.take_rows(rows),
+                             [self.names[i] for i in rows], self.totals[rows], self._sizes[rows])
+
+
+def _require_scipy():
+    if sp is None:
+        raise ImportError("Seyrek backend için scipy gerekli: pip install scipy")
+
+
+def build_incidence(E_named, U, elements=None, sparse=False):
+    """
+    E_named / U yapısından insidans matrisi oluşturur.
+
+    Args:
+        E_named: {e_i: Φ(e_i)} sözlüğü veya SoftSetView
+        U: Evrensel küme
+        elements: Sütun sırası (verilmezse U string sırasıyla dizilir)
+        sparse: True ise B seyrek CSR matris olarak oluşturulur
+    """
+    if elements is None:
+        elements = sorted(U, key=str)
+    if isinstance(E_named, SoftSetView):
+        # Görünümün insidans matrisi yeniden kullanılır: yalnızca sütun sırası
+        return E_named.incidence.select(elements=elements, sparse=sparse)
+    param_keys = list(E_named.keys())
+    index = {u: j for j, u in enumerate(elements)}
+
+    if sparse:
+        _require_scipy()
+        indptr = [0]
+        indices = []
+        for e_i in param_keys:
+            cols = sorted(index[u] for u in E_named[e_i] if u in index)
+            indices.extend(cols)
+            indptr.append(len(indices))
+        B = sparse_incidence(indptr, indices, (len(param_keys), len(elements)))
+        return IncidenceMatrix(B, param_keys, elements)
+
+    B = np.zeros((len(param_keys), len(elements)), dtype=np.uint8)
+    for i, e_i in enumerate(param_keys):
+        cols = [index[u] for u in E_named[e_i] if u in index]
+        B[i, cols] = 1
+
+    return IncidenceMatrix(B, param_keys, elements)
+
+
+def sparse_incidence(indptr, indices, shape):
+    """CSR indptr/indices dizilerinden ikili seyrek insidans matrisi oluşturur."""
+    _require_scipy()
+    indices = np.asarray(indices, dtype=np.int32)
+    data = np.ones(len(indices), dtype=np.int32)
+    return sp.csr_matrix((data, indices, np.asarray(indptr, dtype=np.int64)), shape=shape)
+
+
+def incidence_from_mask(mask, param_keys, elements, sparse=False):
+    """
+    m×n boolean üyelik maskesinden (değer > 0) insidans matrisi oluşturur.
+
+    Seyrek modda yalnızca dolu hücrelerin indeksleri saklanır.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if sparse:
+        _require_scipy()
+        B = sp.csr_matrix(mask, dtype=np.int32)
+    else:
+        B = mask.astype(np.uint8)
+    return IncidenceMatrix(B, param_keys, elements)
+
+
+def natural_elements(E_named, U):
+    """
+    U elemanlarının doğal sırası (element_sort_key).
+
+    E_named bir SoftSetView ise insidans matrisinin önceden hesaplanmış
+    sütun permütasyonu kullanılır; etiketler yeniden sıralanmaz.
+    """
+    if isinstance(E_named, SoftSetView):
+        inc = E_named.incidence
+        if inc.n == len(U) and all(u in U for u in inc.elements):
+            return [inc.elements[j] for j in inc.element_order()]
+    U = list(U)
+    return [U[j] for j in natural_order(U)]
+
+
+def soft_set_sizes(E_named):
+    """|Φ(e_i)| listesi; SoftSetView için kümeler oluşturulmadan okunur."""
+    if isinstance(E_named, SoftSetView):
+        return E_named.incidence.set_sizes()
+    return [len(v) for v in E_named.values()]
+
+
+# Seyrek backend'e geçiş eşiği: C = Bᵀ·B'nin tahmini doluluk oranı
+SPARSE_FILL_THRESHOLD = 0.1
+
+
+def choose_backend(set_sizes, n):
+    """
+    nnz'ye göre backend seçer: "sparse" veya "numpy".
+
+    C = Bᵀ·B'nin dolu hücre sayısı Σ |Φ(e_j)|² ile sınırlıdır. Bu üst sınır
+    n² yoğun hücrenin küçük bir kısmıysa seyrek backend seçilir.
+    """
+    if sp is None or n == 0:
+        return "numpy"
+    sizes = np.asarray(set_sizes, dtype=np.float64)
+    c_nnz_bound = float(np.sum(sizes * sizes))
+    if c_nnz_bound < SPARSE_FILL_THRESHOLD * float(n) * float(n):
+        return "sparse"
+    return "numpy"
+
+
+# Seyrek skor hesabında tek seferde işlenen dolu hücre (i, u) sayısı
+SPARSE_SUPPORT_CHUNK = 65536
+
+
+# Ara matris (C veya O) ve bloklar için varsayılan bellek bütçesi (bayt)
+DEFAULT_MEMORY_BUDGET = 512 * 1024 ** 2
+
+# Yoğun ara matris hücresi (float64 BLAS / int64) ve seyrek dolu hücre (veri + indeks) boyutu
+_DENSE_CELL_BYTES = 8
+_SPARSE_CELL_BYTES = 12
+
+
+class DeltaPlan:
+    """
+    δ hesabı için çarpım sırası ve bloklama kararı.
+
+    Attributes:
+        order: "cooccurrence" → D = B·(Bᵀ·B), ara matris C (n×n)
+               "overlap"      → D = (B·Bᵀ)·B, ara matris O (m×m)
+        tile: None (ara matris tek parça) veya blok boyutu - cooccurrence
+              sırasında eleman sütunu, overlap sırasında parametre satırı
+        costs: {order: (tahmini işlem sayısı, tahmini ara bellek baytı)}
+        reason: Seçimin okunabilir gerekçesi
+    """
+
+    __slots__ = ('order', 'tile', 'costs', 'reason')
+
+    def __init__(self, order, tile, costs, reason):
+        self.order = order
+        self.tile = tile
+        self.costs = costs
+        self.reason = reason
+
+    def __repr__(self):
+        tile = f", blok={self.tile}" if self.tile else ""
+        return f"DeltaPlan({self.order}{tile}: {self.reason})"
+
+
+def plan_delta(inc, any_set=False, memory_budget=None):
+    """
+    m, n ve nnz'ye göre δ için ucuz çarpım sırasını seçer.
+
+    Yoğun girişte maliyet C için 2·m·n², O için 2·m²·n işlemdir. Seyrek
+    girişte ara matrislerin dolu hücre sayısı Σ|Φ(e_i)|² (C) ve
+    Σ_u |{e_i : u ∈ Φ(e_i)}|² (O) ile tahmin edilir. "break" semantiği
+    C > 0 gerektirdiğinden her zaman C kullanır.
+
+    Ara matris bellek bütçesini aşarsa blok (tile) boyutu belirlenir;
+    ara matris bütünüyle hiç oluşturulmaz, blok blok üretilir. Karar
+    logging ile (INFO) kaydedilir.
+
+    Args:
+        any_set: True ise RMVC-csv.py'deki "break" semantiği
+        memory_budget: Ara matris için bayt sınırı (None: DEFAULT_MEMORY_BUDGET)
+
+    Returns:
+        DeltaPlan
+    """
+    if memory_budget is None:
+        memory_budget = DEFAULT_MEMORY_BUDGET
+    m, n = inc.m, inc.n
+
+    if inc.is_sparse:
+        sizes = inc.set_sizes().astype(np.float64)
+        counts = inc.element_counts().astype(np.float64)
+        c_cells = min(float(np.sum(sizes * sizes)), float(n) * n)
+        o_cells = min(float(np.sum(counts * counts)), float(m) * m)
+        costs = {
+            "cooccurrence": (c_cells, c_cells * _SPARSE_CELL_BYTES),
+            "overlap": (o_cells, o_cells * _SPARSE_CELL_BYTES),
+        }
+    else:
+        costs = {
+            "cooccurrence": (2.0 * m * n * n, float(n) * n * _DENSE_CELL_BYTES),
+            "overlap": (2.0 * m * m * n, float(m) * m * _DENSE_CELL_BYTES),
+        }
+
+    if any_set:
+        order = "cooccurrence"
+        reason = "break semantiği C > 0 gerektirir"
+    elif costs["overlap"][0] < costs["cooccurrence"][0]:
+        order = "overlap"
+        reason = f"m={m} < n={n}: O (m×m) daha ucuz"
+    else:
+        order = "cooccurrence"
+        reason = f"n={n} ≤ m={m}: C (n×n) daha ucuz"
+
+    tile = None
+    if costs[order][1] > memory_budget:
+        if inc.is_sparse:
+            # Ara matrisin satırları dolu hücre parçaları için anında üretilir
+            tile = SPARSE_SUPPORT_CHUNK
+        else:
+            side = n if order == "cooccurrence" else m
+            tile = max(1, int(memory_budget // (_DENSE_CELL_BYTES * max(side, 1))))
+        reason += f"; ara matris ~{costs[order][1] / 1024 ** 2:.1f} MB > bütçe, bloklu hesap"
+
+    plan = DeltaPlan(order, tile, costs, reason)
+    logger.info("δ planı (m=%d, n=%d, nnz=%d): %s", m, n, inc.nnz, plan)
+    return plan
+
+
+def cooccurrence_matrix(B):
+    """
+    C = Bᵀ·B: Eleman birliktelik matrisi.
+
+    C[u, v] = {u, v} ikilisini içeren parametre kümesi sayısı.
+    """
+    m = B.shape[0]
+    if sp is not None and sp.issparse(B):
+        B = B.tocsr().astype(np.int64)
+        return (B.T @ B).tocsr()
+    return _exact_matmul(B.T, B, bound=m)
+
+
+def gamma_vector(inc):
+    """γ(e_i) = |Φ(e_i)| × (m - 1) vektörü."""
+    return inc.set_sizes() * max(inc.m - 1, 0)
+
+
+# İlerleme bildirildiğinde hesabın bölündüğü yaklaşık adım sayısı
+PROGRESS_STEPS = 100
+
+
+def _progress_rows(m):
+    """İlerleme bildirimi için satır bloğu boyutu."""
+    return max(1, -(-m // PROGRESS_STEPS))
+
+
+def delta_matrix(inc, C=None, mask_members=True, plan=None, progress=None):
+    """
+    Tüm (e_i, u) çiftleri için δ(u, e_i) matrisini hesaplar.
+
+    D = B·C = (B·Bᵀ)·B; u ∈ Φ(e_i) olan hücreler üyelik değeri 1 olduğundan
+    0'lanır. C verilmezse çarpım sırası ve bloklama plan_delta ile seçilir.
+
+    Args:
+        mask_members: False ise u ∈ Φ(e_i) hücreleri de (B·C)[i, u] olarak
+                      bırakılır (artımlı güncellemeler için)
+        plan: Hazır DeltaPlan (None: plan_delta(inc))
+        progress: progress(tamamlanan, toplam) geri çağrısı; verilirse D
+                  parametre satırı blokları hâlinde (C bloklu planda eleman
+                  sütunu blokları hâlinde) üretilir. Geri çağrının fırlattığı
+                  istisna hesabı durdurur (iptal).
+
+    Returns:
+        m×n int64 matris (seyrek girişte CSR matris)
+    """
+    B = inc.B
+    m, n = inc.m, inc.n
+    if C is None:
+        if plan is None:
+            plan = plan_delta(inc)
+        if inc.is_sparse:
+            B64 = B.tocsr().astype(np.int64)
+            if progress is None:
+                if plan.order == "overlap":
+                    D = ((B64 @ B64.T) @ B64).tocsr()
+                else:
+                    D = (B64 @ (B64.T @ B64)).tocsr()
+            else:
+                overlap = plan.order == "overlap"
+                K = ((B64 @ B64.T) if overlap else (B64.T @ B64)).tocsr()
+                blocks = []
+                step = _progress_rows(m)
+                for start in range(0, m, step):
+                    R = slice(start, min(start + step, m))
+                    blocks.append((K[R] @ B64) if overlap else (B64[R] @ K))
+                    progress(R.stop, m)
+                D = sp.vstack(blocks).tocsr() if blocks else sp.csr_matrix((m, n), dtype=np.int64)
+        elif plan.tile is None and progress is None:
+            if plan.order == "overlap":
+                D = _exact_matmul(_exact_matmul(B, B.T, bound=n + 1), B, bound=m * n + 1)
+            else:
+                D = _exact_matmul(B, cooccurrence_matrix(B), bound=m * n + 1)
+        elif plan.tile is None:
+            # Ara matris bir kez; D satır blokları hâlinde (ilerleme bildirimi)
+            overlap = plan.order == "overlap"
+            K = _exact_matmul(B, B.T, bound=n + 1) if overlap else cooccurrence_matrix(B)
+            D = np.empty((m, n), dtype=np.int64)
+            step = _progress_rows(m)
+            for start in range(0, m, step):
+                R = slice(start, min(start + step, m))
+                D[R] = _exact_matmul(K[R], B, bound=m * n + 1) if overlap \
+                    else _exact_matmul(B[R], K, bound=m * n + 1)
+                progress(R.stop, m)
+        else:
+            D = np.empty((m, n), dtype=np.int64)
+            total = n if plan.order == "cooccurrence" else m
+            for start in range(0, total, plan.tile):
+                stop = min(start + plan.tile, total)
+                if plan.order == "cooccurrence":
+                    J = slice(start, stop)
+                    C_J = _exact_matmul(B.T, B[:, J], bound=m + 1)
+                    D[:, J] = _exact_matmul(B, C_J, bound=m * n + 1)
+                else:
+                    R = slice(start, stop)
+                    O_R = _exact_matmul(B[R], B.T, bound=n + 1)
+                    D[R] = _exact_matmul(O_R, B, bound=m * n + 1)
+                if progress:
+                    progress(stop, total)
+    elif inc.is_sparse:
+        D = (B @ C).tocsr()
+    else:
+        D = _exact_matmul(B, C, bound=m * n + 1)
+
+    if inc.is_sparse:
+        if mask_members:
+            D = (D - D.multiply(B.astype(bool))).tocsr()
+            D.eliminate_zeros()
+        return D
+    if mask_members:
+        D[B.astype(bool)] = 0
+    return D
+
+
+def membership_fractions(inc, D=None):
+    """
+    Vektörize hesaplanan δ/γ değerlerinden referansla aynı
+    {e_i: {u: Fraction}} sözlüğünü üretir.
+    """
+    if D is None:
+        D = delta_matrix(inc)
+    gamma = gamma_vector(inc)
+    one = Fraction(1, 1)
+    zero = Fraction(0, 1)
+
+    membership_matrix = {}
+    for i, e_i in enumerate(inc.param_keys):
+        g = int(gamma[i])
+        if inc.is_sparse:
+            # Satır satır açılır; tüm matris hiçbir zaman yoğunlaştırılmaz
+            row_B = inc.B.getrow(i).toarray().ravel()
+            row_D = D.getrow(i).toarray().ravel().tolist()
+        else:
+            row_B = inc.B[i]
+            row_D = D[i].tolist()
+        row = {}
+        for j, u in enumerate(inc.elements):
+            if row_B[j]:
+                row[u] = one
+            elif g > 0:
+                row[u] = Fraction(row_D[j], g)
+            else:
+                row[u] = zero
+        membership_matrix[e_i] = row
+
+    return membership_matrix
+
+
+def _grouped_column_sums(D, gamma):
+    """
+    δ paylarını aynı γ değerine sahip satırlar için sütun bazında toplar.
+
+    Returns:
+        {γ: n uzunluğunda int64 vektör} (yalnızca γ > 0)
+    """
+    groups = {}
+    for g in np.unique(gamma):
+        if g <= 0:
+            continue
+        rows = np.flatnonzero(gamma == g)
+        if sp is not None and sp.issparse(D):
+            col = np.asarray(D[rows].sum(axis=0), dtype=np.int64).ravel()
+        else:
+            col = D[rows].sum(axis=0, dtype=np.int64)
+        groups[int(g)] = col
+    return groups
+
+
+def _sparse_grouped_delta_sums(inc, any_set=False, plan=None, progress=None):
+    """
+    Seyrek backend: D matrisini hiç oluşturmadan γ gruplarının δ sütun
+    toplamlarını hesaplar.
+
+    Σ_{i ∈ g} (B·C)[i, :] = Bᵀ·(B·(Bᵀ·1_g)) yalnızca vektör × seyrek matris
+    çarpımlarıdır ("break" semantiğinde C > 0 ile (C > 0)·(Bᵀ·1_g)).
+    u ∈ Φ(e_i) hücrelerindeki (B·C)[i, u] katkısı yalnızca B'nin dolu
+    hücrelerinde hesaplanıp bu toplamdan çıkarılır; bunun için plana göre
+    C satırları (B[i]·C[u]) veya O satırları (O[i]·B[:, u]) kullanılır.
+    """
+    if plan is None:
+        plan = plan_delta(inc, any_set=any_set)
+    B = inc.B.tocsr().astype(np.int64)
+    BT = B.T.tocsr()
+    gamma = gamma_vector(inc)
+    n = inc.n
+
+    # Ara matris bütçeye sığıyorsa bir kez, sığmıyorsa parça parça üretilir
+    K = None
+    if plan.tile is None:
+        K = (BT @ B) if plan.order == "cooccurrence" else (B @ BT)
+        K = K.tocsr()
+        if any_set:
+            K.data = np.ones_like(K.data)
+
+    # Dolu hücrelerin (i, u) koordinatları
+    rows = np.repeat(np.arange(inc.m), np.diff(B.indptr))
+    cols = B.indices
+
+    # (B·C)[i, u] değerleri, yalnızca u ∈ Φ(e_i) için, parça parça
+    chunk = plan.tile or SPARSE_SUPPORT_CHUNK
+    support_vals = np.empty(len(cols), dtype=np.int64)
+    for start in range(0, len(cols), chunk):
+        stop = start + chunk
+        r, c = rows[start:stop], cols[start:stop]
+        if plan.order == "cooccurrence":
+            left = B[r]
+            right = K[c] if K is not None else (BT[c] @ B).tocsr()
+            if any_set and K is None:
+                right.data = np.ones_like(right.data)
+        else:
+            left = K[r] if K is not None else (B[r] @ BT).tocsr()
+            right = BT[c]
+        support_vals[start:stop] = np.asarray(
+            left.multiply(right).sum(axis=1), dtype=np.int64).ravel()
+        if progress:
+            progress(min(stop, len(cols)), len(cols))
+
+    groups = {}
+    for g in np.unique(gamma):
+        if g <= 0:
+            continue
+        selector = (gamma == g).astype(np.int64)
+        t = np.asarray(BT @ selector, dtype=np.int64)
+        if any_set:
+            total = _binary_cooccurrence_times(B, BT, t, K)
+        else:
+            total = np.asarray(BT @ (B @ t), dtype=np.int64).ravel()
+        in_group = selector[rows].astype(bool)
+        total -= np.bincount(cols[in_group], weights=support_vals[in_group],
+                             minlength=n).astype(np.int64)
+        groups[int(g)] = total
+    return groups
+
+
+def _binary_cooccurrence_times(B, BT, t, C_bin=None):
+    """(C > 0)·t; C_bin yoksa C satırları parça parça üretilir."""
+    if C_bin is not None:
+        return np.asarray(C_bin @ t, dtype=np.int64).ravel()
+    n = BT.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for start in range(0, n, SPARSE_SUPPORT_CHUNK):
+        stop = min(start + SPARSE_SUPPORT_CHUNK, n)
+        C_rows = (BT[start:stop] @ B).tocsr()
+        C_rows.data = np.ones_like(C_rows.data)
+        out[start:stop] = np.asarray(C_rows @ t, dtype=np.int64).ravel()
+    return out
+
+
+# Ortak paydalı skor payları bu sınırın altındaysa int64, değilse Python int
+_INT64_SAFE_LIMIT = 2 ** 62
+
+
+class ExactScores:
+    """
+    Skorların ortak paydalı tam sayı gösterimi.
+
+    S(u_j) = numerators[j] / denominator
+
+    Sıralama ve eşitlik kontrolleri tam sayılar üzerinden yapılır;
+    Fraction nesneleri yalnızca istendiğinde (gösterim) oluşturulur.
+    """
+
+    __slots__ = ('numerators', 'denominator', 'elements')
+
+    def __init__(self, numerators, denominator, elements):
+        self.numerators = numerators
+        self.denominator = int(denominator)
+        self.elements = list(elements)
+
+    @classmethod
+    def from_fractions(cls, scores, elements):
+        """{u: Fraction} skor sözlüğünden ortak paydalı gösterime geçer."""
+        elements = list(elements)
+        denominator = 1
+        for u in elements:
+            d = Fraction(scores[u]).denominator
+            denominator = denominator * d // gcd(denominator, d)
+        numerators = np.array(
+            [int(Fraction(scores[u]) * denominator) for u in elements], dtype=object)
+        return cls(numerators, denominator, elements)
+
+    def fraction(self, j):
+        """j. elemanın skoru (Fraction, tembel)."""
+        return Fraction(int(self.numerators[j]), self.denominator)
+
+    def to_dict(self):
+        """{u: Fraction} sözlüğü."""
+        return {u: self.fraction(j) for j, u in enumerate(self.elements)}
+
+    def to_float(self):
+        """Gösterim için float skor vektörü."""
+        if self.numerators.dtype == object:
+            return np.array([int(x) / self.denominator for x in self.numerators], dtype=np.float64)
+        return self.numerators / self.denominator
+
+    def ranking(self):
+        """
+        Skora göre azalan sıralama (eşitlikte eleman etiketine göre).
+
+        Returns:
+            Eleman indeksleri dizisi
+        """
+        labels = [str(u) for u in self.elements]
+        label_rank = np.empty(len(labels), dtype=np.int64)
+        label_rank[np.argsort(np.array(labels, dtype=object), kind='stable')] = np.arange(len(labels))
+        if self.numerators.dtype != object:
+            return np.lexsort((label_rank, -self.numerators))
+        # Python int payları: float dönüşümü (taşmasın diye ortak kaydırmayla) monoton
+        # (azalmayan) olduğundan float sırası tam sıralamayla çelişmez; yalnızca float
+        # değeri eşit olan ardışık gruplar tam sayılarla sıralanır
+        if len(labels) == 0:
+            return np.array([], dtype=np.int64)
+        bits = max(int(self.numerators.max()).bit_length(), int(self.numerators.min()).bit_length())
+        shift = max(0, bits - 1000)
+        values = (self.numerators >> shift).astype(np.float64)
+        order = np.lexsort((label_rank, -values))
+        sorted_values = values[order]
+        edges = np.flatnonzero(np.diff(sorted_values) != 0) + 1
+        starts = np.concatenate(([0], edges))
+        stops = np.concatenate((edges, [len(order)]))
+        for start, stop in zip(starts[stops - starts > 1].tolist(), stops[stops - starts > 1].tolist()):
+            group = order[start:stop]
+            if (self.numerators[group] == self.numerators[group[0]]).all():
+                continue  # tam eşitlik: etiket sırası zaten doğru
+            order[start:stop] = sorted(group.tolist(), key=lambda j: (-int(self.numerators[j]), label_rank[j]))
+        return order
+
+    def top_k(self, k):
+        """
+        En yüksek skorlu k elemanın indeksleri, tam sıralama yapılmadan.
+
+        Kısmi seçim (argpartition / heap) ile k. en yüksek skor bulunur; bu
+        skora eşit olan tüm elemanlar da sonuca eklenir (kesim noktasındaki
+        eşitlik grubu bölünmez), bu yüzden sonuç k'dan uzun olabilir.
+        Yalnızca seçilen elemanlar ranking() düzeninde sıralanır.
+
+        Returns:
+            Eleman indeksleri dizisi (skora göre azalan, eşitlikte etikete göre)
+        """
+        n = len(self.elements)
+        if n == 0 or k <= 0:
+            return np.array([], dtype=np.int64)
+        k = min(k, n)
+        if self.numerators.dtype == object:
+            values = [int(x) for x in self.numerators]
+            threshold = heapq.nlargest(k, values)[-1]
+            selected = [j for j, x in enumerate(values) if x >= threshold]
+        else:
+            threshold = np.partition(self.numerators, n - k)[n - k]
+            selected = np.flatnonzero(self.numerators >= threshold).tolist()
+        return np.array(
+            sorted(selected, key=lambda j: (-int(self.numerators[j]), str(self.elements[j]))),
+            dtype=np.int64)
+
+    def best(self):
+        """En yüksek skora sahip elemanların indeksleri (tam eşitlik)."""
+        return self.top_k(1)
+
+
+# Yoğun skor hesabında tek seferde işlenen eleman (sütun) sayısı
+SCORE_CHUNK_COLUMNS = 1024
+
+
+def _chunked_weighted_delta_sums(inc, weights, any_set=False, plan=None, progress=None):
+    """
+    Yoğun backend: Σ_i weights[i]·δ(u, e_i) vektörünü m×n D matrisini
+    oluşturmadan bloklar hâlinde hesaplar.
+
+    cooccurrence planı: her eleman sütunu bloğu J için D_J = B·(Bᵀ·B[:, J]).
+    overlap planı: O = B·Bᵀ bir kez (bloklu planda satır blokları hâlinde)
+    oluşturulur ve D_J = O·B[:, J] ya da D_R = (B[R]·Bᵀ)·B hesaplanır.
+    B ve O çarpım tipine döngüden önce bir kez dönüştürülür; bunun dışındaki
+    ek bellek kullanımı blok boyutu ve bellek bütçesiyle sınırlıdır.
+    """
+    if plan is None:
+        plan = plan_delta(inc, any_set=any_set)
+    m, n = inc.B.shape
+    # Tüm çarpımların sınırı ≤ m·n: B bloklarda yeniden dönüştürülmez
+    B = _exact_operand(inc.B, m * n + 1)
+    use_object = weights.dtype == object
+    if use_object:
+        # Python int ağırlıklar yalnızca γ grup toplamlarına uygulanır;
+        # satırlar önce int64 ile gruplanır (aynı γ ⇒ aynı ağırlık)
+        group_weights, group_of = np.unique(weights, return_inverse=True)
+        grouping = np.zeros((len(group_weights), m), dtype=np.int64)
+        grouping[group_of.ravel(), np.arange(m)] = 1
+
+    def weighted(D_part, rows=slice(None)):
+        if use_object:
+            return group_weights @ _exact_matmul(
+                grouping[:, rows], D_part, bound=m * m * n + 1).astype(object)
+        return weights[rows] @ D_part
+
+    totals = np.zeros(n, dtype=object if use_object else np.int64)
+
+    if plan.order == "overlap" and plan.tile is not None:
+        # O bütçeye sığmıyor: parametre satırı blokları
+        for start in range(0, m, plan.tile):
+            R = slice(start, min(start + plan.tile, m))
+            D_R = _exact_matmul(_exact_matmul(B[R], B.T, bound=n + 1), B, bound=m * n + 1)
+            D_R[B[R] != 0] = 0
+            totals = totals + weighted(D_R, R)
+            if progress:
+                progress(R.stop, m)
+        return totals
+
+    O = _exact_operand(_exact_matmul(B, B.T, bound=n + 1), m * n + 1) if plan.order == "overlap" else None
+    chunk = min(plan.tile or SCORE_CHUNK_COLUMNS, SCORE_CHUNK_COLUMNS)
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        if O is not None:
+            D_J = _exact_matmul(O, B[:, start:stop], bound=m * n + 1)
+        else:
+            C_J = _exact_matmul(B.T, B[:, start:stop], bound=m + 1)
+            if any_set:
+                C_J = (C_J > 0).astype(np.int64)
+            D_J = _exact_matmul(B, C_J, bound=m * n + 1)
+        D_J[B[:, start:stop] != 0] = 0
+        totals[start:stop] = weighted(D_J)
+        if progress:
+            progress(stop, n)
+    return totals
+
+
+def exact_scores(inc, D=None, any_set=False, plan=None, progress=None):
+    """
+    Skorları ortak payda üzerinden tam sayı aritmetiğiyle hesaplar.
+
+    S(u) = |{e_i : u ∈ Φ(e_i)}| + Σ_γ (Σ_{γ(e_i)=γ} δ(u, e_i)) / γ
+
+    Ortak payda L = ekok(γ değerleri); pay = sayaç·L + Σ_γ (L/γ)·toplam_γ.
+    Her üyelik değeri ≤ 1 olduğundan pay ≤ m·L; bu sınır int64'e sığmıyorsa
+    Python int (object) dizisi kullanılır.
+
+    D verilmezse üyelik/δ matrisi oluşturulmaz: sütun toplamları doğrudan
+    biriktirilir (yoğun girişte sütun blokları, seyrek girişte CSR çarpımları).
+    Ek bellek kullanımı O(n) mertebesindedir.
+
+    Args:
+        any_set: True ise RMVC-csv.py'deki "break" semantiği kullanılır;
+                 {u, v} çifti en az bir kümede birlikteyse 1 kez sayılır
+                 (D verildiğinde yok sayılır)
+        plan: Hazır DeltaPlan (None: plan_delta(inc, any_set))
+        progress: progress(tamamlanan, toplam) geri çağrısı (sütun blokları
+                  veya dolu hücre parçaları işlendikçe)
+
+    Returns:
+        ExactScores
+    """
+    gamma = gamma_vector(inc)
+    counts = inc.element_counts()
+
+    denominator = 1
+    for g in np.unique(gamma):
+        if g > 0:
+            denominator = denominator * int(g) // gcd(denominator, int(g))
+    use_object = max(inc.m, 1) * denominator >= _INT64_SAFE_LIMIT
+
+    if D is None and not inc.is_sparse:
+        weights = np.zeros(inc.m, dtype=object if use_object else np.int64)
+        for i, g in enumerate(gamma.tolist()):
+            if g > 0:
+                weights[i] = denominator // g
+        numerators = counts.astype(weights.dtype) * denominator
+        totals = _chunked_weighted_delta_sums(inc, weights, any_set, plan, progress)
+        return ExactScores(numerators + totals, denominator, inc.elements)
+
+    if D is None:
+        groups = _sparse_grouped_delta_sums(inc, any_set, plan, progress)
+    else:
+        groups = _grouped_column_sums(D, gamma)
+
+    if not use_object:
+        numerators = counts.astype(np.int64) * denominator
+        for g, col in groups.items():
+            numerators += col * (denominator // g)
+    else:
+        numerators = counts.astype(object) * denominator
+        for g, col in groups.items():
+            numerators = numerators + col.astype(object) * (denominator // g)
+
+    return ExactScores(numerators, denominator, inc.elements)
+
+
+def top_k_scores(E_named, U, k, any_set=False, elements=None, memory_budget=None, progress=None):
+    """
+    Tam üyelik matrisi oluşturmadan en iyi k elemanı döndürür.
+
+    Skorlar sütun toplamları olarak O(n) bellekle biriktirilir, seçim
+    kısmi sıralamayla yapılır (ExactScores.top_k). Backend, küme
+    boyutlarına göre choose_backend ile, çarpım sırası plan_delta ile seçilir.
+
+    Returns:
+        exact_scores: ExactScores (tüm elemanların skorları)
+        top: En iyi k eleman indeksi (kesimdeki eşitlik grubu dahil)
+    """
+    backend = choose_backend(soft_set_sizes(E_named), len(U))
+    inc = build_incidence(E_named, U, elements=elements, sparse=(backend == "sparse"))
+    plan = plan_delta(inc, any_set=any_set, memory_budget=memory_budget)
+    scores = exact_scores(inc, any_set=any_set, plan=plan, progress=progress)
+    return scores, scores.top_k(k)
+
+
+def score_fractions(inc, D=None):
+    """
+    S(u) = Σ_{e_i} M(u, e_i) skorlarını kesir olarak hesaplar.
+
+    Üyelik matrisi oluşturulmaz: u ∈ Φ(e_i) hücreleri sütun toplamından (1),
+    diğerleri aynı γ'ya sahip satırların δ toplamlarından gelir. Seyrek
+    girişte D de oluşturulmaz ve hiçbir ara sonuç yoğunlaştırılmaz.
+
+    Returns:
+        {u: Fraction}
+    """
+    return exact_scores(inc, D).to_dict()
+
+
+class MembershipRow(Mapping):
+    """ExactMembership'in tek satırı için {u: Fraction} ile uyumlu görünüm."""
+
+    __slots__ = ('_matrix', '_i')
+
+    def __init__(self, matrix, i):
+        self._matrix = matrix
+        self._i = i
+
+    def __getitem__(self, u):
+        return self._matrix.fraction(self._i, self._matrix.incidence.element_index()[u])
+
+    def __contains__(self, u):
+        return u in self._matrix.incidence.element_index()
+
+    def __iter__(self):
+        return iter(self._matrix.incidence.elements)
+
+    def __len__(self):
+        return self._matrix.incidence.n
+
+
+class ExactMembership(Mapping):
+    """
+    Üyelik matrisinin kesirsiz tam gösterimi.
+
+    M[i, u] = 1                  eğer B[i, u] = 1
+    M[i, u] = D[i, u] / γ[i]     eğer B[i, u] = 0 ve γ[i] > 0
+    M[i, u] = 0                  diğer durumlarda
+
+    Hücre başına nesne tutulmaz: δ payları m×n tam sayı dizisinde, etiketler
+    insidans matrisinin indeks tablolarındadır (O(1) satır/sütun erişimi).
+    Referans {e_i: {u: Fraction}} sözlüğüyle uyumlu salt-okunur bir
+    görünümdür: membership[e_i][u] kesri tembel üretir. info verilirse
+    E_info kayıtları (ParamInfoView) aynı insidans matrisi üzerinden tutulur.
+    """
+
+    __slots__ = ('incidence', 'D', 'gamma', 'info')
+
+    def __init__(self, incidence, D, gamma, info=None):
+        self.incidence = incidence
+        self.D = D
+        self.gamma = gamma
+        self.info = info
+
+    def __getitem__(self, e_i):
+        return MembershipRow(self, self.incidence.param_index()[e_i])
+
+    def __contains__(self, e_i):
+        return e_i in self.incidence.param_index()
+
+    def __iter__(self):
+        return iter(self.incidence.param_keys)
+
+    def __len__(self):
+        return self.incidence.m
+
+    def fraction(self, i, j):
+        """M[i, j] değeri (Fraction, tembel)."""
+        if self.incidence.B[i, j]:
+            return Fraction(1, 1)
+        g = int(self.gamma[i])
+        if g <= 0:
+            return Fraction(0, 1)
+        return Fraction(int(self.D[i, j]), g)
+
+    def row(self, e_i):
+        """e_i satırının float üyelik değerleri (n)."""
+        return self.float_block(rows=[self.incidence.param_index()[e_i]])[0]
+
+    def column(self, u):
+        """u elemanının tüm parametrelerdeki float üyelik değerleri (m)."""
+        return self.float_block(cols=[self.incidence.element_index()[u]])[:, 0]
+
+    def float_matrix(self):
+        """Gösterim için m×n float üyelik matrisi."""
+        return self.float_block()
+
+    def float_block(self, rows=None, cols=None):
+        """
+        Seçilen satır/sütunların float üyelik değerleri.
+
+        rows, cols: İndeks dizileri (None: tümü). Yalnızca istenen dilim
+        okunur; bellek eşlemeli D ve B'de diskten o hücreler gelir.
+        """
+        B = self.incidence.B
+        D = self.D
+        gamma = np.asarray(self.gamma)
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.intp)
+            B, D, gamma = B[rows], D[rows], gamma[rows]
+        if cols is not None:
+            cols = np.asarray(cols, dtype=np.intp)
+            B, D = B[:, cols], D[:, cols]
+        if self.incidence.is_sparse:
+            B = B.toarray()
+            D = D.toarray()
+        gamma = gamma.astype(np.float64)[:, None]
+        values = np.divide(D, gamma, out=np.zeros(D.shape, dtype=np.float64), where=gamma > 0)
+        values[np.asarray(B).astype(bool)] = 1.0
+        return values
+
+    def to_dataframe(self, rows=None, cols=None):
+        """
+        Float üyelik değerlerinden DataFrame (satırlar e_i, sütunlar u).
+
+        Değer dizisi kopyalanmadan sarılır; rows/cols indeks dizileriyle
+        yalnızca bir dilim istenebilir.
+        """
+        keys = self.incidence.param_keys
+        elements = self.incidence.elements
+        index = pd.Index(keys if rows is None else [keys[i] for i in rows], name='SETS')
+        columns = elements if cols is None else [elements[j] for j in cols]
+        return pd.DataFrame(self.float_block(rows, cols), index=index, columns=columns, copy=False)
+
+    def scores(self):
+        """Skorlar (ExactScores)."""
+        return exact_scores(self.incidence, self.D)
+
+
+def exact_membership(inc, progress=None):
+    """
+    δ payları ve γ paydalarıyla tam üyelik matrisini hesaplar.
+
+    progress verilirse satır blokları tamamlandıkça çağrılır (delta_matrix).
+    """
+    return ExactMembership(inc, delta_matrix(inc, progress=progress), gamma_vector(inc))
+
+
+def create_membership_matrix_numpy(E_named, U):
+    """
+    `create_membership_matrix` ile aynı çıktıyı NumPy backend ile üretir.
+
+    Satırlar = Parametreler (e_i), Sütunlar = Elemanlar (u)
+    """
+    inc = build_incidence(E_named, U)
+    return membership_fractions(inc)
+
+
+def create_membership_matrix_sparse(E_named, U):
+    """
+    `create_membership_matrix` ile aynı çıktıyı seyrek (CSR) backend ile üretir.
+    """
+    inc = build_incidence(E_named, U, sparse=True)
+    return membership_fractions(inc)
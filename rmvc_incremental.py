@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Artımlı RMVC Motoru
+===================
+Firma × ürün matrisinde birkaç hücre değiştiğinde üyelik matrisini ve
+skorları baştan hesaplamadan günceller.
+
+Tutulan durum:
+    B: m×n insidans matrisi
+    O = B·Bᵀ: parametre örtüşmeleri, O[i, k] = |Φ(e_i) ∩ Φ(e_k)|
+    P = B·C: maskelenmemiş δ matrisi (C = Bᵀ·B)
+        u ∉ Φ(e_i) için P[i, u] = δ(u, e_i)
+    T_s: |Φ(e_i)| = s olan satırların δ sütun toplamları
+        S(u) = |Ψ(u)| + Σ_s T_s[u] / (s·(m - 1))
+
+Bir hücre (e_i, u) değiştiğinde C yalnızca u satır/sütununda değişir:
+    P[:, u]    += O[:, i] + B[:, u]
+    P[Ψ(u), Φ(e_i)] += 1
+    P[i, :]    += C'[u, :]
+Dolayısıyla maliyet dokunulan kümelerin (Ψ(u), Φ(e_i)) boyutuyla orantılıdır.
+m değiştiğinde γ'lar değişse de T_s boyuta göre gruplandığından yeniden
+hesaplama gerekmez; ortak payda skor okunurken kurulur.
+"""
+
+import numpy as np
+from math import gcd
+
+from rmvc_engine import (
+    ExactMembership,
+    ExactScores,
+    IncidenceMatrix,
+    build_incidence,
+    cooccurrence_matrix,
+    delta_matrix,
+)
+
+
+class IncrementalRMVC:
+    """
+    Parametre/eleman ekleme ve hücre değiştirme işlemlerini destekleyen
+    durum tutan RMVC motoru.
+
+    Kullanım:
+        engine = IncrementalRMVC.from_soft_set(E_named, U)
+        engine.set_cell('e_3', '7', 1)
+        engine.add_parameter('e_11', {'2', '5'})
+        scores = engine.scores()          # ExactScores
+    """
+
+    def __init__(self, elements=()):
+        self.param_keys = []      # slot -> parametre etiketi (boş slot: None)
+        self.elements = []        # sütun -> eleman etiketi
+        self._param_index = {}
+        self._element_index = {}
+        self._free_slots = []
+
+        self.B = np.zeros((0, 0), dtype=np.uint8)
+        self.P = np.zeros((0, 0), dtype=np.int64)
+        self.O = np.zeros((0, 0), dtype=np.int64)
+        self.sizes = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.T = {}               # |Φ| -> δ sütun toplamları
+        self._size_counts = {}    # |Φ| -> bu boyuttaki parametre sayısı
+
+        for u in elements:
+            self.add_element(u)
+
+    # ------------------------------------------------------------------
+    # Oluşturma
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_soft_set(cls, E_named, U, elements=None):
+        """E_named / U yapısından tam hesaplamayla başlangıç durumu kurar."""
+        inc = build_incidence(E_named, U, elements=elements)
+        engine = cls()
+        engine.param_keys = list(inc.param_keys)
+        engine.elements = list(inc.elements)
+        engine._param_index = {e: i for i, e in enumerate(engine.param_keys)}
+        engine._element_index = {u: j for j, u in enumerate(engine.elements)}
+
+        engine.B = inc.B.copy()
+        engine.P = delta_matrix(inc, C=cooccurrence_matrix(inc.B), mask_members=False)
+        engine.O = inc.B.astype(np.int64) @ inc.B.T.astype(np.int64)
+        engine.sizes = inc.set_sizes()
+        engine.counts = inc.element_counts()
+        for s in engine.sizes.tolist():
+            engine._size_counts[s] = engine._size_counts.get(s, 0) + 1
+        engine._add_rows(range(inc.m), 1)
+        return engine
+
+    # ------------------------------------------------------------------
+    # Durum bilgisi
+    # ------------------------------------------------------------------
+
+    @property
+    def m(self):
+        """Aktif parametre sayısı."""
+        return len(self._param_index)
+
+    @property
+    def n(self):
+        """Eleman sayısı."""
+        return len(self.elements)
+
+    def _active_slots(self):
+        return [self._param_index[e] for e in self.active_params()]
+
+    def active_params(self):
+        """Aktif parametre etiketleri (eklenme sırasıyla)."""
+        return [e for e in self.param_keys if e is not None]
+
+    def to_soft_set(self):
+        """Güncel durumu E_named sözlüğü olarak döndürür."""
+        return {
+            e: {self.elements[j] for j in np.flatnonzero(self.B[self._param_index[e], :self.n])}
+            for e in self.active_params()
+        }
+
+    # ------------------------------------------------------------------
+    # Kapasite yönetimi (amorti O(1) büyüme)
+    # ------------------------------------------------------------------
+
+    def _ensure_capacity(self, rows, cols):
+        cap_m, cap_n = self.B.shape
+        new_m = cap_m if rows <= cap_m else max(rows, 2 * cap_m, 4)
+        new_n = cap_n if cols <= cap_n else max(cols, 2 * cap_n, 4)
+        if (new_m, new_n) == (cap_m, cap_n):
+            return
+
+        def grow(a, shape):
+            out = np.zeros(shape, dtype=a.dtype)
+            out[tuple(slice(0, k) for k in a.shape)] = a
+            return out
+
+        self.B = grow(self.B, (new_m, new_n))
+        self.P = grow(self.P, (new_m, new_n))
+        self.O = grow(self.O, (new_m, new_m))
+        self.sizes = grow(self.sizes, (new_m,))
+        self.counts = grow(self.counts, (new_n,))
+        self.T = {s: grow(t, (new_n,)) for s, t in self.T.items()}
+
+    # ------------------------------------------------------------------
+    # T_s katkı yönetimi
+    # ------------------------------------------------------------------
+
+    def _t_vector(self, s):
+        if s not in self.T:
+            self.T[s] = np.zeros(self.B.shape[1], dtype=np.int64)
+        return self.T[s]
+
+    def _add_rows(self, rows, sign):
+        """Verilen satırların tüm δ katkılarını T'ye ekler (sign=-1: çıkarır)."""
+        for k in rows:
+            s = int(self.sizes[k])
+            if s > 0:
+                self._t_vector(s)[:] += sign * self.P[k] * (1 - self.B[k])
+
+    def _add_columns(self, rows, cols, sign):
+        """rows × cols bloğunun δ katkılarını T'ye ekler (sign=-1: çıkarır)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if len(rows) == 0 or len(cols) == 0:
+            return
+        sizes = self.sizes[rows]
+        block = self.P[np.ix_(rows, cols)] * (1 - self.B[np.ix_(rows, cols)])
+        for s in np.unique(sizes):
+            if s > 0:
+                contrib = block[sizes == s].sum(axis=0)
+                self._t_vector(int(s))[cols] += sign * contrib
+
+    def _resize_row(self, i, new_size):
+        old = int(self.sizes[i])
+        self._size_counts[old] -= 1
+        if self._size_counts[old] == 0:
+            del self._size_counts[old]
+            self.T.pop(old, None)
+        self._size_counts[new_size] = self._size_counts.get(new_size, 0) + 1
+        self.sizes[i] = new_size
+
+    # ------------------------------------------------------------------
+    # Güncellemeler
+    # ------------------------------------------------------------------
+
+    def set_cell(self, e, u, value):
+        """
+        (e, u) hücresini 0/1 yapar.
+
+        Maliyet: O(|Ψ(u)|·n + |Ψ(u)|·|Φ(e)| + m)
+        """
+        i = self._param_index[e]
+        j = self._element_index[u]
+        value = 1 if value else 0
+        if int(self.B[i, j]) == value:
+            return
+
+        others = np.flatnonzero(self.B[:, j])  # Ψ(u)
+        touched = np.union1d(others, [i])
+        untouched = np.setdiff1d(self._active_slots(), touched)
+
+        # Etkilenen satırların ve u sütununun eski katkılarını çıkar
+        self._add_rows(touched, -1)
+        self._add_columns(untouched, [j], -1)
+
+        if value == 1:
+            psi = others
+            phi = np.flatnonzero(self.B[i])
+            self.P[:, j] += self.O[:, i] + self.B[:, j]
+            self.P[np.ix_(psi, phi)] += 1
+            self.B[i, j] = 1
+            self.O[i, psi] += 1
+            self.O[psi, i] += 1
+            self.O[i, i] += 1
+            self.P[i] += self.B[touched].sum(axis=0, dtype=np.int64)
+            self.counts[j] += 1
+            self._resize_row(i, int(self.sizes[i]) + 1)
+        else:
+            # Ekleme formülünün tersi: C'[u, :] eski durumdan okunur
+            self.P[i] -= self.B[others].sum(axis=0, dtype=np.int64)
+            self.B[i, j] = 0
+            psi = np.setdiff1d(others, [i])
+            self.O[i, psi] -= 1
+            self.O[psi, i] -= 1
+            self.O[i, i] -= 1
+            phi = np.flatnonzero(self.B[i])
+            self.P[:, j] -= self.O[:, i] + self.B[:, j]
+            self.P[np.ix_(psi, phi)] -= 1
+            self.counts[j] -= 1
+            self._resize_row(i, int(self.sizes[i]) - 1)
+
+        self._add_rows(touched, 1)
+        self._add_columns(untouched, [j], 1)
+
+    def add_parameter(self, e, members=()):
+        """
+        Yeni bir parametre (satır) ekler.
+
+        Maliyet: O(m·|Φ(e)| + |{k : Φ(e_k) ∩ Φ(e) ≠ ∅}|·n)
+        """
+        if e in self._param_index:
+            raise ValueError(f"Parametre zaten mevcut: {e}")
+        cols = np.array(sorted({self._element_index[u] for u in members}), dtype=np.int64)
+        active = self._active_slots()
+
+        if self._free_slots:
+            i = self._free_slots.pop()
+            self.param_keys[i] = e
+        else:
+            i = len(self.param_keys)
+            self._ensure_capacity(i + 1, self.B.shape[1])
+            self.param_keys.append(e)
+
+        self._add_columns(active, cols, -1)
+
+        # O_new[k] = |Φ(e_k) ∩ Φ(e)|; C' = C + b·bᵀ
+        overlap = self.B[:, cols].sum(axis=1, dtype=np.int64)
+        self.P[:, cols] += overlap[:, None]
+        related = np.flatnonzero(overlap)
+        self.P[i] = overlap[related] @ self.B[related].astype(np.int64) if len(related) else 0
+        self.P[i, cols] += len(cols)
+
+        self.O[i, :] = overlap
+        self.O[:, i] = overlap
+        self.O[i, i] = len(cols)
+        self.B[i, cols] = 1
+        self.counts[cols] += 1
+        self.sizes[i] = 0
+        self._size_counts[0] = self._size_counts.get(0, 0) + 1
+        self._param_index[e] = i
+        self._resize_row(i, len(cols))
+
+        self._add_columns(active, cols, 1)
+        self._add_rows([i], 1)
+
+    def remove_parameter(self, e):
+        """
+        Bir parametreyi (satırı) kaldırır.
+
+        Maliyet: O(m·|Φ(e)| + n)
+        """
+        i = self._param_index[e]
+        cols = np.flatnonzero(self.B[i])
+        others = [k for k in self._active_slots() if k != i]
+
+        self._add_columns(others, cols, -1)
+        self._add_rows([i], -1)
+
+        self.P[:, cols] -= self.O[:, i][:, None]
+        self.counts[cols] -= 1
+        self._resize_row(i, 0)
+        self._size_counts[0] -= 1
+        if self._size_counts[0] == 0:
+            del self._size_counts[0]
+            self.T.pop(0, None)
+
+        self.B[i] = 0
+        self.P[i] = 0
+        self.O[i, :] = 0
+        self.O[:, i] = 0
+        del self._param_index[e]
+        self.param_keys[i] = None
+        self._free_slots.append(i)
+
+        self._add_columns(others, cols, 1)
+
+    def add_element(self, u, params=()):
+        """
+        Yeni bir eleman (sütun) ekler.
+
+        Maliyet: O(|Ψ(u)|·n + m·|Ψ(u)|)
+        """
+        if u in self._element_index:
+            raise ValueError(f"Eleman zaten mevcut: {u}")
+        j = len(self.elements)
+        self._ensure_capacity(self.B.shape[0], j + 1)
+        self.elements.append(u)
+        self._element_index[u] = j
+
+        rows = np.array(sorted({self._param_index[e] for e in params}), dtype=np.int64)
+        if len(rows) == 0:
+            return
+        others = np.setdiff1d(self._active_slots(), rows)
+
+        self._add_rows(rows, -1)
+
+        # C'[u, v] = Σ_{e_k ∈ Ψ(u)} B[k, v]
+        c_u = self.B[rows].sum(axis=0, dtype=np.int64)
+        self.P[rows] += c_u
+        self.P[:, j] = self.O[:, rows].sum(axis=1)
+        self.P[rows, j] += len(rows)
+        self.O[np.ix_(rows, rows)] += 1
+        self.B[rows, j] = 1
+        self.counts[j] = len(rows)
+        for k in rows:
+            self._resize_row(k, int(self.sizes[k]) + 1)
+
+        self._add_rows(rows, 1)
+        self._add_columns(others, [j], 1)
+
+    # ------------------------------------------------------------------
+    # Sonuçlar
+    # ------------------------------------------------------------------
+
+    def delta(self, e, u):
+        """δ(u, e) değeri - O(1)."""
+        i = self._param_index[e]
+        j = self._element_index[u]
+        return 0 if self.B[i, j] else int(self.P[i, j])
+
+    def scores(self):
+        """
+        Güncel skorlar (ExactScores) - O(#farklı |Φ| · n).
+
+        Tam hesaplamayla aynı ortak payda ve paylar üretilir.
+        """
+        n = self.n
+        m = self.m
+        groups = {}
+        if m > 1:
+            for s, t in self.T.items():
+                if s > 0:
+                    groups[s * (m - 1)] = t[:n]
+
+        denominator = 1
+        for g in groups:
+            denominator = denominator * g // gcd(denominator, g)
+
+        if max(m, 1) * denominator < 2 ** 62:
+            numerators = self.counts[:n].astype(np.int64) * denominator
+            for g, t in groups.items():
+                numerators = numerators + t * (denominator // g)
+        else:
+            numerators = self.counts[:n].astype(object) * denominator
+            for g, t in groups.items():
+                numerators = numerators + t.astype(object) * (denominator // g)
+        return ExactScores(numerators, denominator, self.elements)
+
+    def membership(self):
+        """Aktif parametreler için tam üyelik matrisi (ExactMembership)."""
+        slots = self._active_slots()
+        n = self.n
+        inc = IncidenceMatrix(self.B[slots, :n].copy(), self.active_params(), self.elements)
+        D = self.P[slots, :n] * (1 - inc.B)
+        gamma = self.sizes[slots] * max(self.m - 1, 0)
+        return ExactMembership(inc, D, gamma)
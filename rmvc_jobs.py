@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Arka Plan İşleri - İlerleme, ETA ve İptal
+==============================================
+Streamlit betiği her etkileşimde baştan çalışır; uzun bir hesap betiğin
+içinde yürütülürse arayüz donar ve hesap durdurulamaz. Bu modül hesabı
+paylaşılan bir iş parçacığı havuzunda yürütür:
+
+    - JobRunner havuzu sunucu ömrü boyunca bir kez kurulur (rmvc_app_v2
+      st.cache_resource ile paylaştırır); her yeniden çalıştırmada yeni
+      havuz açılmaz.
+    - Aynı anahtarla gelen ikinci istek çalışan işe bağlanır, hesap
+      yinelenmez. İşe bağlanan oturumlar abone olarak sayılır; bir oturum
+      ayrıldığında (detach) iş yalnızca son abone de ayrılırsa iptal edilir.
+    - Biten iş (sonucu önbelleğe yazıldıktan sonra) havuzun listesinden
+      kendiliğinden çıkarılır; sekmesi kapanan oturumun işi ve sonucu
+      sunucu ömrü boyunca tutulmaz. Yeniden çalıştırma sonucu önbellekte
+      bulur.
+    - Motor fonksiyonları progress(tamamlanan, toplam) geri çağrısıyla
+      parametre satırı blokları bittikçe ilerleme bildirir; iptal edilen
+      işin geri çağrısı JobCancelled fırlatır ve hesap bir sonraki blokta
+      durur.
+
+NumPy/BLAS çarpımları GIL'i bıraktığı için iş parçacıkları yeterlidir;
+süreç havuzu gerekmez ve sonuçlar kopyalanmadan döner.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Paylaşılan havuzdaki iş parçacığı sayısı
+DEFAULT_JOB_WORKERS = 2
+
+
+class JobCancelled(Exception):
+    """İş kullanıcı tarafından iptal edildi."""
+
+
+class Job:
+    """
+    Havuzda yürüyen tek hesap.
+
+    Attributes:
+        key: İş anahtarı (önbellek anahtarıyla aynı)
+        done, total: Son bildirilen ilerleme
+        started: Başlangıç zamanı (time.monotonic)
+        subscribers: İşi bekleyen abone (oturum) kimlikleri
+    """
+
+    __slots__ = ('key', 'done', 'total', 'started', 'future', 'subscribers', '_cancel')
+
+    def __init__(self, key):
+        self.key = key
+        self.done = 0
+        self.total = 0
+        self.started = time.monotonic()
+        self.future = None
+        self.subscribers = set()
+        self._cancel = threading.Event()
+
+    def progress(self, done, total):
+        """Motor geri çağrısı; iptal istenmişse JobCancelled fırlatır."""
+        if self._cancel.is_set():
+            raise JobCancelled(self.key)
+        self.done = done
+        self.total = total
+
+    def cancel(self):
+        """İptal ister; hesap bir sonraki ilerleme bildiriminde durur."""
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        return self.future is not None and self.future.done()
+
+    @property
+    def fraction(self):
+        """Tamamlanan oran (0..1)."""
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def eta(self):
+        """Kalan süre tahmini (saniye); henüz ilerleme yoksa None."""
+        if not self.done or not self.total:
+            return None
+        return self.elapsed() * (self.total - self.done) / self.done
+
+    def result(self, timeout=None):
+        """Sonucu bekler; iptal edilmişse JobCancelled fırlatır."""
+        try:
+            return self.future.result(timeout)
+        except Exception as e:  # future.cancel() → CancelledError
+            if self.cancelled:
+                raise JobCancelled(self.key) from e
+            raise
+
+
+class JobRunner:
+    """
+    Anahtarlı işler için paylaşılan iş parçacığı havuzu.
+
+    Yalnızca süren işler tutulur: iş bittiğinde (done callback) listeden
+    çıkarılır. Bekleyen oturumlar sonucu ellerindeki Job'dan alır.
+    """
+
+    __slots__ = ('_pool', '_jobs', '_lock')
+
+    def __init__(self, max_workers=DEFAULT_JOB_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rmvc-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, subscriber=None):
+        """
+        fn(progress) hesabını başlatır; aynı anahtarla iptal edilmemiş bir
+        iş varsa onu döndürür. subscriber verilirse işin abonelerine eklenir
+        (aynı abonenin tekrar bağlanması sayıyı artırmaz).
+        """
+        new = False
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.cancelled:
+                job = Job(key)
+                job.future = self._pool.submit(fn, job.progress)
+                self._jobs[key] = job
+                new = True
+            if subscriber is not None:
+                job.subscribers.add(subscriber)
+        if new:
+            # Kilit dışında: iş zaten bittiyse geri çağrı hemen burada çalışır
+            job.future.add_done_callback(lambda _, job=job: self._forget(job))
+        return job
+
+    def _forget(self, job):
+        """Biten işi (yerine yenisi konmadıysa) listeden çıkarır."""
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def detach(self, key, subscriber):
+        """
+        Aboneyi anahtarın işinden ayırır; başka abone kalmadıysa işi iptal
+        edip listeden çıkarır.
+
+        Returns:
+            İş iptal edildiyse True
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return False
+            job.subscribers.discard(subscriber)
+            if job.subscribers:
+                return False
+            del self._jobs[key]
+        job.cancel()
+        return True
+
+    def cancel(self, key):
+        """Anahtarın işini (abonelerden bağımsız) iptal edip listeden çıkarır."""
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.cancel()
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Paralel Hesaplama - Süreç Havuzu + Paylaşımlı Bellek
+=========================================================
+Birliktelik verisi oluşturulduktan sonra her parametre satırı (e_i)
+bağımsızdır. Bu modül satırları bloklara bölüp süreç havuzunda hesaplar:
+
+    - İnsidans matrisi B ve birliktelik matrisi K, multiprocessing.shared_memory
+      üzerinden salt-okunur paylaşılır (sözlükler pickle edilmez).
+    - Çarpım sırası rmvc_engine.plan_delta ile seçilir: K = O = B·Bᵀ
+      (m×m örtüşme) ise blok satırları D_R = O[R]·B, K = C = Bᵀ·B
+      (n×n birliktelik) ise D_R = B[R]·C olarak hesaplanır.
+    - Her işçi kendi bloğunun kısmi skor vektörünü Σ_{i∈R} w_i·D[i, :]
+      döndürür; ana süreç bunları blok sırasıyla tam sayı olarak toplar.
+    - K bellek bütçesini aşarsa paylaşılmaz: O satırları her blokta
+      B[R]·Bᵀ olarak üretilir; C gerekiyorsa işler eleman sütunu
+      bloklarına (D_J = B·C[:, J]) bölünür.
+
+Tüm aritmetik tam sayı olduğundan sonuçlar işçi sayısından bağımsızdır ve
+seri hesaplamayla (rmvc_engine.exact_scores) birebir aynıdır.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd
+from multiprocessing import shared_memory
+
+from rmvc_engine import ExactScores, _INT64_SAFE_LIMIT, _exact_matmul, gamma_vector, plan_delta
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+# Bir bloğun D_R ara matrisinde izin verilen hücre sayısı (|R|·n)
+PARALLEL_BLOCK_CELLS = 1 << 22
+
+# İşçi başına düşen blok sayısı (yük dengesi için)
+_BLOCKS_PER_WORKER = 4
+
+
+def _share_array(arr, segments):
+    """Diziyi paylaşımlı belleğe kopyalar; (ad, şekil, dtype) tanımını döndürür."""
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    segments.append(shm)
+    return (shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach_array(desc, segments):
+    name, shape, dtype = desc
+    shm = shared_memory.SharedMemory(name=name)
+    segments.append(shm)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _share_matrix(M, segments):
+    """Yoğun dizi veya CSR matrisi paylaşımlı belleğe taşır."""
+    if sp is not None and sp.issparse(M):
+        M = M.tocsr()
+        return ('csr', M.shape, tuple(_share_array(a, segments)
+                                      for a in (M.data, M.indices, M.indptr)))
+    return ('dense', M.shape, _share_array(M, segments))
+
+
+def _attach_matrix(desc, segments):
+    kind, shape, parts = desc
+    if kind == 'csr':
+        data, indices, indptr = (_attach_array(p, segments) for p in parts)
+        return sp.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+    return _attach_array(parts, segments)
+
+
+# İşçi süreç durumu (initializer ile bir kez doldurulur)
+_worker = {}
+
+
+def _init_worker(B_desc, K_desc, weights, overlap, any_set):
+    segments = []
+    _worker['segments'] = segments
+    _worker['B'] = _attach_matrix(B_desc, segments)
+    _worker['K'] = _attach_matrix(K_desc, segments) if K_desc is not None else None
+    _worker['weights'] = weights
+    _worker['overlap'] = overlap
+    _worker['any_set'] = any_set
+
+
+def _weighted_block_sum(D, weights):
+    """Σ_i weights[i]·D[i, :] (tam sayı); Python int ağırlıklar γ'ya göre gruplanır."""
+    if weights.dtype != object:
+        return np.asarray(D.T @ weights, dtype=np.int64).ravel()
+    group_weights, group_of = np.unique(weights, return_inverse=True)
+    totals = np.zeros(D.shape[1], dtype=object)
+    for g, w in enumerate(group_weights):
+        rows = np.flatnonzero(group_of.ravel() == g)
+        col = np.asarray(D[rows].sum(axis=0), dtype=np.int64).ravel()
+        totals = totals + col.astype(object) * w
+    return totals
+
+
+def _is_sparse(M):
+    return sp is not None and sp.issparse(M)
+
+
+def _block_scores(task, B, K, weights, overlap, any_set):
+    """
+    Bir işin kısmi skor payları.
+
+    ("rows", start, stop): parametre satırları [start, stop) - n uzunluğunda vektör
+    ("cols", start, stop): eleman sütunları [start, stop) - yalnızca bu sütunlar
+    """
+    kind, start, stop = task
+    m, n = B.shape
+    if kind == "cols":
+        B_J = B[:, start:stop]
+        if _is_sparse(B):
+            C_J = (B.T @ B_J).tocsr()
+            if any_set:
+                C_J.data = np.ones_like(C_J.data)
+            D = (B @ C_J).tocsr()
+            D = (D - D.multiply(B_J.astype(bool))).tocsr()
+        else:
+            C_J = _exact_matmul(B.T, B_J, bound=m + 1)
+            if any_set:
+                C_J = (C_J > 0).astype(np.int64)
+            D = _exact_matmul(B, C_J, bound=m * n + 1)
+            D[B_J.astype(bool)] = 0
+        return _weighted_block_sum(D, weights)
+
+    B_R = B[start:stop]
+    if _is_sparse(B):
+        if overlap:
+            O_R = K[start:stop] if K is not None else (B_R @ B.T)
+            D = O_R @ B
+        else:
+            D = B_R @ K
+        D = D.tocsr().astype(np.int64)
+        D = (D - D.multiply(B_R.astype(bool))).tocsr()
+    elif overlap:
+        O_R = K[start:stop] if K is not None else _exact_matmul(B_R, B.T, bound=n + 1)
+        D = _exact_matmul(O_R, B, bound=m * n + 1)
+        D[B_R.astype(bool)] = 0
+    else:
+        D = _exact_matmul(B_R, K, bound=m * n + 1)
+        D[B_R.astype(bool)] = 0
+    return _weighted_block_sum(D, weights[start:stop])
+
+
+def _run_block(task):
+    return _block_scores(task, _worker['B'], _worker['K'], _worker['weights'],
+                         _worker['overlap'], _worker['any_set'])
+
+
+def _cooccurrence_operand(B, plan, any_set):
+    """
+    İşçilerle paylaşılacak birliktelik matrisi K (plan bloklu ise None).
+    """
+    if plan.tile is not None:
+        return None
+    m, n = B.shape
+    overlap = plan.order == "overlap"
+    if _is_sparse(B):
+        K = ((B @ B.T) if overlap else (B.T @ B)).tocsr()
+        if any_set:
+            K.data = np.ones_like(K.data)
+        return K
+    if overlap:
+        return _exact_matmul(B, B.T, bound=n + 1)
+    K = _exact_matmul(B.T, B, bound=m + 1)
+    if any_set:
+        K = (K > 0).astype(np.int64)
+    return K
+
+
+def _tasks(m, n, workers, plan, block_rows=None):
+    """Satır blokları; C bütçeyi aşıyorsa eleman sütunu blokları."""
+    if plan.order == "cooccurrence" and plan.tile is not None:
+        step = min(plan.tile, max(1, -(-n // (workers * _BLOCKS_PER_WORKER))))
+        return [("cols", start, min(start + step, n)) for start in range(0, n, step)]
+    if block_rows is None:
+        block_rows = max(1, PARALLEL_BLOCK_CELLS // max(n, 1))
+        block_rows = min(block_rows, max(1, -(-m // (workers * _BLOCKS_PER_WORKER))))
+        if plan.tile is not None:
+            block_rows = min(block_rows, plan.tile)
+    return [("rows", start, min(start + block_rows, m)) for start in range(0, m, block_rows)]
+
+
+def parallel_exact_scores(inc, workers=None, any_set=False, block_rows=None, plan=None):
+    """
+    Skorları parametre satırı blokları hâlinde süreç havuzunda hesaplar.
+
+    Args:
+        inc: IncidenceMatrix (yoğun veya seyrek)
+        workers: İşçi süreç sayısı (None: os.cpu_count(); 1: havuz açılmaz)
+        any_set: True ise RMVC-csv.py'deki "break" semantiği
+        block_rows: Blok başına satır sayısı (None: bellek sınırına göre)
+        plan: Hazır DeltaPlan (None: plan_delta(inc, any_set))
+
+    Returns:
+        ExactScores - rmvc_engine.exact_scores ile birebir aynı
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, int(workers))
+
+    gamma = gamma_vector(inc)
+    counts = inc.element_counts()
+    denominator = 1
+    for g in np.unique(gamma):
+        if g > 0:
+            denominator = denominator * int(g) // gcd(denominator, int(g))
+    use_object = max(inc.m, 1) * denominator >= _INT64_SAFE_LIMIT
+
+    weights = np.zeros(inc.m, dtype=object if use_object else np.int64)
+    for i, g in enumerate(gamma.tolist()):
+        if g > 0:
+            weights[i] = denominator // g
+
+    numerators = counts.astype(weights.dtype) * denominator
+    if inc.m == 0 or inc.n == 0:
+        return ExactScores(numerators, denominator, inc.elements)
+
+    if plan is None:
+        plan = plan_delta(inc, any_set=any_set)
+    B = inc.B.tocsr().astype(np.int64) if inc.is_sparse else inc.B
+    K = _cooccurrence_operand(B, plan, any_set)
+    overlap = plan.order == "overlap"
+    tasks = _tasks(inc.m, inc.n, workers, plan, block_rows)
+
+    if workers == 1 or len(tasks) == 1:
+        partials = [_block_scores(task, B, K, weights, overlap, any_set) for task in tasks]
+    else:
+        segments = []
+        try:
+            B_desc = _share_matrix(B, segments)
+            K_desc = _share_matrix(K, segments) if K is not None else None
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                     initializer=_init_worker,
+                                     initargs=(B_desc, K_desc, weights, overlap, any_set)) as pool:
+                # map() sonuçları iş sırasıyla döndürür - indirgeme deterministiktir
+                partials = list(pool.map(_run_block, tasks))
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    if tasks and tasks[0][0] == "cols":
+        # Sütun blokları ayrık: kısmi sonuçlar yan yana eklenir
+        return ExactScores(numerators + np.concatenate(partials), denominator, inc.elements)
+    for part in partials:
+        numerators = numerators + part
+    return ExactScores(numerators, denominator, inc.elements)
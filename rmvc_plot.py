@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Grafik Özetleri - Sunucu Tarafı Örnekleme ve Dağılımlar
+============================================================
+Büyük üyelik matrislerini ve skor vektörlerini tarayıcıya hücre hücre
+göndermek yerine ekran çözünürlüğüne indirger:
+
+    - Isı haritası: satır ve sütunlar ardışık bloklara bölünür, her blok
+      en büyük (max) veya ortalama (mean) değeriyle temsil edilir. Tam
+      üyelik matrisi (ExactMembership) satır grupları hâlinde okunur;
+      bellek eşlemeli depoda yalnızca o grubun satırları diske erişir.
+    - Yakınlaştırma: seçilen satır/sütun penceresi ExactMembership.float_block
+      ile tembel dilimlenir.
+    - Skor grafikleri: np.histogram ile hesaplanmış histogram kutuları ve
+      önceden hesaplanmış kutu grafiği istatistikleri (aykırı değerlerin
+      yalnızca en uçtakileri çizilir).
+
+Fonksiyonlar yalnızca NumPy dizileri döndürür; Plotly şekilleri
+rmvc_app_v2 içinde kurulur.
+"""
+
+import numpy as np
+
+
+# Isı haritasında blok örneklemesiz gösterilen en fazla satır / sütun
+HEATMAP_MAX_ROWS = 100
+HEATMAP_MAX_COLS = 200
+
+# Bu hücre sayısının üzerinde hücre içi değer yazısı gösterilmez
+HEATMAP_TEXT_CELLS = 1000
+
+# Histogram kutu sayısı
+HISTOGRAM_BINS = 30
+
+# Kutu grafiğinde tek tek çizilen en fazla aykırı değer
+BOX_MAX_OUTLIERS = 500
+
+
+def block_edges(size, max_blocks):
+    """
+    0..size aralığını en fazla max_blocks ardışık bloğa bölen sınırlar.
+
+    Returns:
+        Artan int dizisi; edges[0] = 0, edges[-1] = size
+    """
+    blocks = max(1, min(size, max_blocks))
+    return np.unique(np.linspace(0, size, blocks + 1).round().astype(np.intp))
+
+
+def _reduce_axis(values, edges, how, axis):
+    starts = edges[:-1]
+    if how == "max":
+        return np.maximum.reduceat(values, starts, axis=axis)
+    sums = np.add.reduceat(values, starts, axis=axis)
+    counts = np.diff(edges).astype(np.float64)
+    return sums / (counts[:, None] if axis == 0 else counts[None, :])
+
+
+def downsample(values, max_rows=HEATMAP_MAX_ROWS, max_cols=HEATMAP_MAX_COLS, how="max"):
+    """
+    2 boyutlu diziyi blok max/ortalamayla en fazla max_rows × max_cols'a indirger.
+
+    Returns:
+        (özet matris, satır sınırları, sütun sınırları)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    row_edges = block_edges(values.shape[0], max_rows)
+    col_edges = block_edges(values.shape[1], max_cols)
+    reduced = _reduce_axis(values, row_edges, how, axis=0)
+    return _reduce_axis(reduced, col_edges, how, axis=1), row_edges, col_edges
+
+
+def downsample_membership(membership, row_order, col_order, max_rows=HEATMAP_MAX_ROWS,
+                          max_cols=HEATMAP_MAX_COLS, how="max"):
+    """
+    ExactMembership'i tam float matrisini kurmadan blok özetine indirger.
+
+    Her satır bloğu float_block ile ayrı okunur ve hemen sütun bloklarına
+    indirgenir; tepe bellek bir satır bloğu kadardır.
+
+    Args:
+        row_order, col_order: Gösterim sırasındaki satır/sütun indeksleri
+
+    Returns:
+        (özet matris, satır sınırları, sütun sınırları)
+    """
+    row_order = np.asarray(row_order, dtype=np.intp)
+    col_order = np.asarray(col_order, dtype=np.intp)
+    row_edges = block_edges(len(row_order), max_rows)
+    col_edges = block_edges(len(col_order), max_cols)
+    out = np.empty((len(row_edges) - 1, len(col_edges) - 1), dtype=np.float64)
+    for b, (start, stop) in enumerate(zip(row_edges[:-1], row_edges[1:])):
+        block = membership.float_block(row_order[start:stop], col_order)
+        row = block.max(axis=0) if how == "max" else block.mean(axis=0)
+        out[b] = _reduce_axis(row[None, :], col_edges, how, axis=1)[0]
+    return out, row_edges, col_edges
+
+
+def block_labels(labels, edges):
+    """Blok sınırları için 'ilk–son' etiketleri (tek elemanlı blokta etiketin kendisi)."""
+    out = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        first, last = labels[start], labels[stop - 1]
+        out.append(str(first) if stop - start == 1 else f"{first}–{last}")
+    return out
+
+
+def histogram(values, bins=HISTOGRAM_BINS):
+    """
+    Sunucu tarafı histogram.
+
+    Returns:
+        (kutu sayıları, kutu merkezleri, kutu genişliği)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values, bins=bins)
+    return counts, (edges[:-1] + edges[1:]) / 2, float(edges[1] - edges[0])
+
+
+def box_stats(values, max_outliers=BOX_MAX_OUTLIERS):
+    """
+    Kutu grafiği istatistikleri (Tukey çitleri, 1.5·IQR).
+
+    Returns:
+        {'q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean'} ve
+        çitlerin dışındaki değerlerden medyana en uzak max_outliers tanesi
+        için 'outliers' dizisi
+    """
+    values = np.asarray(values, dtype=np.float64)
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    lower, upper = (inside.min(), inside.max()) if len(inside) else (q1, q3)
+    outliers = values[(values < lower) | (values > upper)]
+    if len(outliers) > max_outliers:
+        outliers = outliers[np.argpartition(-np.abs(outliers - median), max_outliers - 1)[:max_outliers]]
+    return {
+        'q1': float(q1), 'median': float(median), 'q3': float(q3),
+        'lowerfence': float(lower), 'upperfence': float(upper),
+        'mean': float(values.mean()),
+        'outliers': outliers,
+    }
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Profil - Aşama Süreleri, Tepe Bellek ve İş Sayaçları
+=========================================================
+Yavaş bir çalıştırmada zamanın ayrıştırmaya mı, csv_to_soft_set
+dönüşümüne mi, δ / üyelik hesabına mı, skorlara mı yoksa grafiklere mi
+gittiğini gösterir:
+
+    - StageProfiler.stage(ad) bağlam yöneticisi aşamanın duvar saati
+      süresini, sürecin tepe RSS değerini (resource; Windows'ta yok) ve
+      tracemalloc açıksa aşama içindeki tepe Python/NumPy ayırmasını kaydeder.
+    - Aşamaya iş sayaçları eklenir (ör. ikili kontrol, üretilen hücre);
+      reference_pair_checks referans döngülerin ({u, v} ⊆ Φ(e_j) kontrolü)
+      eşdeğer iş miktarını küme boyutlarından hesaplar.
+    - cprofile=True ise aşamalar cProfile ile kaydedilir (aşamayı çalıştıran
+      iş parçacığında); rapora kümülatif süreye göre ilk fonksiyonlar eklenir.
+      trace_memory=True ise en çok canlı bellekle biten aşamanın sonunda
+      tracemalloc anlık görüntüsü alınır; rapora en çok bellek ayıran
+      satırlar (profil araçlarının kendi ayırmaları hariç) eklenir.
+
+Rapor (report) JSON'a yazılabilir bir sözlüktür; RMVC-csv.py --profile ve
+rmvc_app_v2 "Performans" paneli aynı raporu kullanır.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows: tepe RSS ölçülmez
+    resource = None
+
+
+# Raporda listelenen cProfile fonksiyonu / tracemalloc satırı sayısı
+PROFILE_TOP = 25
+
+
+def peak_rss_bytes():
+    """Sürecin şimdiye kadarki tepe RSS değeri (bayt; ölçülemiyorsa None)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reference_pair_checks(set_sizes, n):
+    """
+    Referans δ döngülerinin {u, v} ⊆ Φ(e_j) kontrol sayısı:
+    Σ_i |Φ(e_i)|·(n − |Φ(e_i)|)·m (break'siz döngü; break'li döngü için üst sınır).
+    """
+    sizes = np.asarray(set_sizes, dtype=np.int64)
+    return int(np.sum(sizes * (n - sizes))) * len(sizes)
+
+
+class Stage:
+    """Tek aşamanın ölçümü; counters iş sayaçlarıdır."""
+
+    __slots__ = ('name', 'seconds', 'rss_peak_bytes', 'traced_peak_bytes', 'counters', 'cached')
+
+    def __init__(self, name, counters=None, cached=False):
+        self.name = name
+        self.seconds = 0.0
+        self.rss_peak_bytes = None
+        self.traced_peak_bytes = None
+        self.counters = dict(counters or {})
+        self.cached = cached
+
+    def count(self, **counters):
+        """Sayaçları artırır (ör. stage.count(cells=m * n))."""
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + int(value)
+
+    def to_dict(self):
+        return {'name': self.name, 'seconds': self.seconds, 'rss_peak_bytes': self.rss_peak_bytes,
+                'traced_peak_bytes': self.traced_peak_bytes, 'counters': self.counters,
+                'cached': self.cached}
+
+    @classmethod
+    def from_dict(cls, d, cached=None):
+        stage = cls(d['name'], d.get('counters'), d.get('cached', False) if cached is None else cached)
+        stage.seconds = d.get('seconds', 0.0)
+        stage.rss_peak_bytes = d.get('rss_peak_bytes')
+        stage.traced_peak_bytes = d.get('traced_peak_bytes')
+        return stage
+
+
+class _NullStage:
+    """Profil kapalıyken stage() bağlamının döndürdüğü boş kayıt."""
+
+    __slots__ = ()
+
+    def count(self, **counters):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class StageProfiler:
+    """
+    Aşama bazlı profil kaydedici.
+
+    enabled=False ise stage() hiçbir şey ölçmez (çağıran kod profil
+    açık/kapalı ayrımı yapmadan aynı kalır).
+    """
+
+    __slots__ = ('enabled', 'stages', 'trace_memory', '_profile', '_lock', '_started_tracemalloc',
+                 '_snapshot', '_snapshot_bytes')
+
+    def __init__(self, enabled=True, cprofile=False, trace_memory=False):
+        self.enabled = enabled
+        self.stages = []
+        self.trace_memory = enabled and trace_memory
+        self._profile = cProfile.Profile() if enabled and cprofile else None
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._snapshot = None
+        self._snapshot_bytes = -1
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    @contextmanager
+    def stage(self, name, **counters):
+        """Aşamayı ölçer; bağlam Stage kaydını (sayaçlar için) verir."""
+        if not self.enabled:
+            yield _NULL_STAGE
+            return
+        stage = Stage(name, counters)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        profiling = False
+        if self._profile is not None:
+            try:
+                self._profile.enable()
+                profiling = True
+            except ValueError:  # başka bir profil aracı etkin
+                pass
+        started = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - started
+            if profiling:
+                self._profile.disable()
+            # İzleme başka bir profil tarafından durdurulmuş olabilir (eşzamanlı
+            # oturumlar); bu durumda anlık görüntü alınmaz
+            if self.trace_memory and tracemalloc.is_tracing():
+                current, stage.traced_peak_bytes = tracemalloc.get_traced_memory()
+                if current > self._snapshot_bytes:
+                    try:
+                        self._snapshot = tracemalloc.take_snapshot()
+                        self._snapshot_bytes = current
+                    except RuntimeError:  # izleme bu arada durdu
+                        pass
+            stage.rss_peak_bytes = peak_rss_bytes()
+            with self._lock:
+                self.stages.append(stage)
+
+    def add_report(self, report, cached=False):
+        """Başka bir profilin (ör. arka plan işinin) aşamalarını ekler."""
+        if not self.enabled or not report:
+            return
+        with self._lock:
+            self.stages.extend(Stage.from_dict(d, cached=cached or d.get('cached', False))
+                               for d in report['stages'])
+
+    def _cprofile_top(self):
+        out = io.StringIO()
+        pstats.Stats(self._profile, stream=out).sort_stats('cumulative').print_stats(PROFILE_TOP)
+        return out.getvalue()
+
+    def _tracemalloc_top(self):
+        snapshot = self._snapshot.filter_traces([
+            tracemalloc.Filter(False, module.__file__) for module in (cProfile, pstats, tracemalloc)
+        ] + [tracemalloc.Filter(False, __file__)])
+        stats = snapshot.statistics('lineno')[:PROFILE_TOP]
+        return [{'location': str(s.traceback[0]), 'bytes': s.size, 'blocks': s.count} for s in stats]
+
+    def report(self):
+        """
+        JSON'a yazılabilir rapor: stages, total_seconds, rss_peak_bytes ve
+        istenmişse cprofile (metin) / tracemalloc (en çok ayıran satırlar).
+        """
+        with self._lock:
+            stages = [s.to_dict() for s in self.stages]
+        report = {
+            'stages': stages,
+            'total_seconds': sum(s['seconds'] for s in stages if not s['cached']),
+            'rss_peak_bytes': peak_rss_bytes(),
+        }
+        if self._profile is not None:
+            try:
+                report['cprofile'] = self._cprofile_top()
+            except TypeError:  # hiçbir aşama kaydedilmedi
+                report['cprofile'] = ""
+        if self._snapshot is not None:
+            report['tracemalloc'] = self._tracemalloc_top()
+        return report
+
+    def close(self):
+        """Profilin başlattığı tracemalloc izlemesini durdurur."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def report_frame(report):
+    """
+    Rapor aşamalarının gösterim tablosu.
+
+    Returns:
+        DataFrame (Aşama, Süre (sn), Pay (%), Tepe bellek (MB), Sayaçlar, Önbellek)
+    """
+    import pandas as pd
+
+    stages = report['stages']
+    total = report['total_seconds'] or 1.0
+    rows = []
+    for s in stages:
+        peak = s['traced_peak_bytes'] if s['traced_peak_bytes'] is not None else s['rss_peak_bytes']
+        rows.append({
+            'Aşama': s['name'],
+            'Süre (sn)': s['seconds'],
+            'Pay (%)': 0.0 if s['cached'] else 100 * s['seconds'] / total,
+            'Tepe bellek (MB)': None if peak is None else peak / 1024 ** 2,
+            'Sayaçlar': ', '.join(f"{k}={v:,}" for k, v in s['counters'].items()),
+            'Önbellek': '✓' if s['cached'] else '',
+        })
+    return pd.DataFrame(rows, columns=['Aşama', 'Süre (sn)', 'Pay (%)', 'Tepe bellek (MB)', 'Sayaçlar',
+                                       'Önbellek'])
+
+
+def format_report(report):
+    """Konsol çıktısı için aşama tablosu (ve varsa cProfile özeti)."""
+    df = report_frame(report)
+    lines = [f"{'Aşama':<28}{'Süre (sn)':>11}{'Pay':>8}{'Tepe (MB)':>11}  Sayaçlar", "-" * 80]
+    for _, r in df.iterrows():
+        peak = "-" if r['Tepe bellek (MB)'] is None or r['Tepe bellek (MB)'] != r['Tepe bellek (MB)'] \
+            else f"{r['Tepe bellek (MB)']:.1f}"
+        lines.append(f"{r['Aşama']:<28}{r['Süre (sn)']:>11.4f}{r['Pay (%)']:>7.1f}%{peak:>11}  {r['Sayaçlar']}")
+    lines.append("-" * 80)
+    lines.append(f"{'Toplam':<28}{report['total_seconds']:>11.4f}")
+    return "\n".join(lines)
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
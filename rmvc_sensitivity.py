@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Duyarlılık Analizi - Bir Parametre / Eleman Çıkarıldığında Karar
+=====================================================================
+get_best_choices kararının tek bir parametreye (firma / kriter) ne kadar
+bağlı olduğunu gösterir: her e_j için e_j çıkarılmış soft setin skorları.
+Bunu m kez yeniden hesaplamak yerine tam hesabın paylaşılan birliktelik
+verisinden e_j'nin rank-1 katkısı çıkarılır (downdating):
+
+    C' = C − b_j·b_jᵀ, m' = m − 1 (γ' = |Φ(e_i)|·(m − 2))
+
+    i ≠ j ve u ∉ Φ(e_i) için δ'(u, e_i) = δ(u, e_i) − b_j(u)·Σ_{v ∈ Φ(e_i) ∩ Φ(e_j)} E[v, u]
+        count_all: E = 1            (her küme sayılır)
+        any_set:   E = [C = 1]      (break; yalnızca e_j'de birlikte olan ikililer kaybolur)
+
+L = ekok(|Φ(e_i)|), w_i = L/|Φ(e_i)| ve T(u) = Σ_i w_i·δ(u, e_i) (tam hesabın
+payı) ile e_j çıkarılınca ortak payda L·(m − 2) üzerinden:
+
+    N_j(u) = (sayaç(u) − b_j(u))·L·(m − 2) + T(u) − w_j·δ(u, e_j)
+             − b_j(u)·Σ_{v ∈ Φ(e_j)} P[v, u]
+    P[v, u] = E[v, u]·Σ_i w_i·B[i, v]·(1 − B[i, u])
+
+P toplamları yalnızca u ∈ Φ(e_j) hücrelerinde gerekir ve P kurulmadan
+hesaplanır (_support_sums); δ satırları parametre blokları hâlinde D = B·K
+olarak üretilir. Toplam maliyet birkaç tam hesap mertebesindedir (m kez
+yeniden hesaplamanın yerine) ve sonuçlar e_j çıkarılarak yapılan
+exact_scores hesabıyla birebir aynıdır.
+
+leave_one_element_out aynı fikri elemanlara uygular: v U'dan çıkarılınca C
+yeniden kurulmaz, v'nin satır/sütun katkısı çıkarılır (_ElementRemoval).
+n adet skor vektörü float olarak eleman blokları hâlinde üretilir; sıralama
+hata sınırı içinde eşit görünen gruplarda tam paylarla düzeltilir ve etki
+(diğer elemanların toplam skor kaybı) tam olarak hesaplanır.
+"""
+
+import numpy as np
+import pandas as pd
+from math import gcd
+
+from rmvc_engine import (
+    DEFAULT_MEMORY_BUDGET,
+    ExactScores,
+    _INT64_SAFE_LIMIT,
+    _exact_matmul,
+    cooccurrence_matrix,
+    exact_scores,
+)
+from rmvc_variants import rank_positions, spearman_rho
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+def _dense_rows(B, R):
+    """B[R] yoğun int64 olarak."""
+    part = B[R]
+    return part.toarray().astype(np.int64) if hasattr(part, 'toarray') else part.astype(np.int64)
+
+
+def _size_groups(sizes, L):
+    """Aynı küme boyutundaki parametre satırları ve ağırlıkları: [(L/s, satırlar)]."""
+    return [(L // s, np.flatnonzero(sizes == s)) for s in np.unique(sizes[sizes > 0]).tolist()]
+
+
+def _support_sums(B, C, rows, sizes, L, any_set, dtype, block):
+    """
+    s_j(u) = Σ_{v ∈ Φ(e_j)} P[v, u] değerleri, u ∈ Φ(e_j) için B'nin dolu
+    hücre sırasıyla (satır satır).
+
+    P n×n olarak kurulmaz:
+        count_all: s_j(u) = Σ_i w_i·O[i, j]·(1 − B[i, u]), O = B·Bᵀ
+                   (küme boyutu grupları × parametre blokları hâlinde matris çarpımı)
+        any_set:   C[v, u] = 1 ve u, v ∈ Φ(e_j) ise ikiliyi içeren tek küme e_j'dir,
+                   yani s_j(u) = Σ_{v ∈ Φ(e_j)} [C[v, u] = 1]·(Σ_i w_i·B[i, v] − w_j)
+                   (her e_j için yalnızca Φ(e_j) × Φ(e_j) alt matrisi)
+    Ağırlıklar (L/s) grup toplamlarına uygulanır; int64'e sığmayan paylarda
+    Python int çarpım yalnızca okunan hücrelerde yapılır.
+    """
+    m, n = B.shape
+    sparse = sp is not None and sp.issparse(B)
+    groups = _size_groups(sizes, L)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    support = np.zeros(int(offsets[-1]), dtype=dtype)
+
+    if not any_set:
+        O = (B @ B.T).tocsr() if sparse else _exact_matmul(B, B.T, bound=n + 1)
+        for start in range(0, m, block):
+            R = np.arange(start, min(start + block, m))
+            members = _dense_rows(B, R).astype(bool)
+            segment = slice(offsets[R[0]], offsets[R[-1] + 1])
+            O_R = O[R]
+            for w, G in groups:
+                O_RG = O_R[:, G]
+                if sparse:
+                    Z = (O_RG @ B[G]).toarray()
+                    totals = np.asarray(O_RG.sum(axis=1), dtype=np.int64).ravel()
+                else:
+                    Z = _exact_matmul(O_RG, B[G], bound=len(G) * n + 1)
+                    totals = O_RG.sum(axis=1)
+                values = np.repeat(totals, sizes[R]) - Z[members]
+                support[segment] += values.astype(dtype) * w
+        return support
+
+    weights = np.array([w for w, _ in groups], dtype=dtype)
+    col_sums = np.zeros((n, len(groups)), dtype=np.int64)
+    for g, (_, G) in enumerate(groups):
+        col_sums[:, g] = np.asarray(B[G].sum(axis=0), dtype=np.int64).ravel()
+    C_csr = C.tocsr() if sparse else None
+    for j, idx in enumerate(rows):
+        if len(idx) == 0:
+            continue
+        if sparse:
+            exclusive = C_csr[idx][:, idx].toarray() == 1
+        else:
+            exclusive = C[np.ix_(idx, idx)] == 1
+        sums = _exact_matmul(exclusive.T, col_sums[idx], bound=len(idx) * int(col_sums.max(initial=0)) + 1)
+        w_j = L // int(sizes[j])
+        support[offsets[j]:offsets[j + 1]] = sums.astype(dtype) @ weights - \
+            exclusive.sum(axis=0).astype(dtype) * w_j
+    return support
+
+
+def _parameter_blocks(inc, any_set=False, memory_budget=None, progress=None):
+    """
+    Bir parametre çıkarılmış skor paylarını parametre satırı blokları hâlinde üretir.
+
+    Yields:
+        (R, N_R, payda): N_R[k] = e_{R[k]} çıkarılınca skor payları
+    """
+    m, n = inc.m, inc.n
+    sizes = inc.set_sizes().astype(np.int64)
+    counts = inc.element_counts().astype(np.int64)
+    L = 1
+    for s in np.unique(sizes[sizes > 0]).tolist():
+        L = L * s // gcd(L, s)
+    # Paylar ≤ 2·m·L·(m − 1): int64'e sığmıyorsa Python int
+    use_object = 2 * max(m, 1) ** 2 * L >= _INT64_SAFE_LIMIT
+    dtype = object if use_object else np.int64
+
+    full = exact_scores(inc, any_set=any_set)
+    T = full.numerators - counts.astype(full.numerators.dtype) * full.denominator if m > 1 \
+        else np.zeros(n, dtype=np.int64)
+    T = T.astype(dtype)
+
+    if inc.is_sparse:
+        B = inc.B.tocsr().astype(np.int64)
+        B.sort_indices()
+    else:
+        B = inc.B.astype(np.int64)
+    C = cooccurrence_matrix(inc.B)
+    if any_set and inc.is_sparse:
+        K = C.copy()
+        K.data = np.ones_like(K.data)
+    else:
+        K = (C > 0).astype(np.int64) if any_set else C
+
+    weights = np.zeros(m, dtype=dtype)
+    for i, s in enumerate(sizes.tolist()):
+        if s > 0:
+            weights[i] = L // s
+    m_after = m - 1
+    denominator = L * (m_after - 1) if m_after > 1 else 1
+
+    block = max(1, int((memory_budget or DEFAULT_MEMORY_BUDGET) // (8 * 4 * max(n, 1))))
+    rows = [B.indices[B.indptr[j]:B.indptr[j + 1]] if inc.is_sparse else np.flatnonzero(B[j])
+            for j in range(m)]
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    if m_after > 1:
+        support = _support_sums(B, C, rows, sizes, L, any_set, dtype, block)
+    for start in range(0, m, block):
+        R = np.arange(start, min(start + block, m))
+        B_R = _dense_rows(B, R)
+        N_R = (counts[None, :] - B_R).astype(dtype)
+        if m_after > 1:
+            if inc.is_sparse:
+                D_R = (B[R] @ K).toarray()
+            else:
+                D_R = _exact_matmul(B_R, K, bound=m * n + 1)
+            D_R[B_R.astype(bool)] = 0
+            N_R = N_R * denominator + T[None, :] - weights[R][:, None] * D_R.astype(dtype)
+            for k, j in enumerate(R):
+                N_R[k, rows[j]] -= support[offsets[j]:offsets[j + 1]]
+        if progress:
+            progress(int(R[-1]) + 1, m)
+        yield R, N_R, denominator
+
+
+def leave_one_parameter_out(inc, any_set=False, names=None, memory_budget=None, progress=None):
+    """
+    Her parametre çıkarıldığında karar ve sıralamanın nasıl değiştiğini hesaplar.
+
+    Args:
+        inc: IncidenceMatrix (tam hesapta kullanılanla aynı parametre kümeleri)
+        any_set: True ise RMVC-csv.py'deki "break" semantiği
+        names: Parametre gösterim adları (None: param_keys)
+        memory_budget: Blok başına ara matris bayt sınırı
+        progress: progress(tamamlanan, toplam) geri çağrısı (parametre satırları)
+
+    Returns:
+        full: ExactScores (tüm parametrelerle)
+        table: DataFrame (Parametre, |Φ|, En iyi, Karar değişir, Kazananın
+               sırası, Sırası değişen, En büyük kayma, Spearman ρ); kararı
+               değiştiren parametreler önce, sonra en düşük ρ
+    """
+    full = exact_scores(inc, any_set=any_set)
+    base_rank = rank_positions(full)
+    base_best = full.best()
+    base_set = set(base_best.tolist())
+    names = list(inc.param_keys) if names is None else list(names)
+    sizes = inc.set_sizes()
+
+    rows = []
+    for R, N_R, denominator in _parameter_blocks(inc, any_set, memory_budget, progress):
+        for k, j in enumerate(R):
+            order = ExactScores(N_R[k], denominator, full.elements).ranking()
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[order] = np.arange(1, len(order) + 1)
+            leading = N_R[k][order] == N_R[k][order[0]]
+            best = order[:len(leading) if leading.all() else int(np.argmin(leading))]
+            shift = np.abs(ranks - base_rank)
+            rows.append({
+                'Parametre': str(names[j]),
+                '|Φ|': int(sizes[j]),
+                'En iyi': ', '.join(str(full.elements[u]) for u in best),
+                'Karar değişir': set(best.tolist()) != base_set,
+                'Kazananın sırası': int(ranks[base_best].min()),
+                'Sırası değişen': int(np.count_nonzero(shift)),
+                'En büyük kayma': int(shift.max()) if len(shift) else 0,
+                'Spearman ρ': spearman_rho(ranks, base_rank),
+            })
+    table = pd.DataFrame(rows, columns=['Parametre', '|Φ|', 'En iyi', 'Karar değişir', 'Kazananın sırası',
+                                        'Sırası değişen', 'En büyük kayma', 'Spearman ρ'])
+    table = table.sort_values(['Karar değişir', 'Spearman ρ'], ascending=[False, True], kind='stable')
+    return full, table.reset_index(drop=True)
+
+
+class _ElementRemoval:
+    """
+    Bir eleman U'dan çıkarıldığında skorlar (v hariç skor vektörleri).
+
+    v çıkarılınca C'nin v'siz ikilileri değişmez; e_i ∋ v kümelerinde
+    δ'(u, e_i) = δ(u, e_i) − K[u, v] ve |Φ(e_i)| bir azalır. L = ekok(|Φ|,
+    |Φ| − 1) ve ortak payda L·(m − 1) ile:
+
+        N'_v(u) = N(u) + Σ_i B[i, v]·(α_i·δ(u, e_i) − K[u, v]·β_i·(1 − B[i, u]))
+        α_i = L/(s_i·(s_i − 1)), β_i = L/(s_i − 1)      (s_i = 1: α_i = −L, β_i = 0)
+
+    Float yaklaşık değerler eleman blokları hâlinde iki matris çarpımıyla
+    (Bᵀ·(α∘D), Bᵀ·(β∘B)) üretilir; tam değerler (exact) yalnızca istenen
+    hücrelerde, v'yi içeren satırların küme boyutu grup toplamlarından Python
+    int ile hesaplanır.
+    """
+
+    __slots__ = ('inc', 'B', 'B_cols', 'K', 'D', 'sizes', 'denominator', 'numerators', 'scores', 'score_values',
+                 'column_class', 'n_classes',
+                 'a', 'b', 'col_b', 'alpha', 'beta', 'group_of', 'base_id', 'tolerance',
+                 '_influence_parts')
+
+    def __init__(self, inc, any_set=False, memory_budget=None):
+        self.inc = inc
+        m, n = inc.m, inc.n
+        sizes = inc.set_sizes().astype(np.int64)
+        self.sizes = sizes
+        full = exact_scores(inc, any_set=any_set)
+        L = 1
+        for s in np.unique(np.concatenate((sizes[sizes > 0], sizes[sizes > 1] - 1))).tolist():
+            L = L * s // gcd(L, s)
+        self.denominator = L * (m - 1) if m > 1 else 1
+        self.numerators = full.numerators.astype(object) * (self.denominator // full.denominator)
+        self.scores = full
+        self.score_values = full.to_float()
+        self.base_id = np.unique(self.numerators, return_inverse=True)[1].ravel()
+
+        # Küme boyutu grupları: tam ağırlıklar grup başına (Python int), float ağırlıklar satır başına
+        groups = np.unique(sizes[sizes > 0])
+        self.group_of = np.searchsorted(groups, sizes)
+        alpha, beta = [], []
+        for t in groups.tolist():
+            alpha.append((L // (t * (t - 1)) if t > 1 else -L) if m > 1 else 0)
+            beta.append((L // (t - 1) if t > 1 else 0) if m > 1 else 0)
+        self.alpha = np.array(alpha, dtype=object)
+        self.beta = np.array(beta, dtype=object)
+        scale = float(max(m - 1, 1))
+        with np.errstate(divide='ignore'):
+            self.a = np.where(sizes > 1, 1.0 / (sizes * (sizes - 1.0) * scale), -1.0 / scale)
+            self.b = np.where(sizes > 1, 1.0 / ((sizes - 1.0) * scale), 0.0)
+        if m <= 1:
+            self.a[:] = 0.0
+            self.b[:] = 0.0
+        self.a[sizes == 0] = 0.0
+
+        if inc.is_sparse:
+            B = inc.B.tocsr().astype(np.int64)
+            B.sort_indices()
+            self.B_cols = B.tocsc()
+        else:
+            B = inc.B.astype(np.int64)
+            self.B_cols = B
+        self.B = B
+        # Aynı B sütununa sahip elemanlar (ör. hiçbir kümede olmayanlar) aynı sınıfta
+        if inc.is_sparse:
+            cols = self.B_cols
+            classes = {}
+            self.column_class = np.array([
+                classes.setdefault(cols.indices[cols.indptr[u]:cols.indptr[u + 1]].tobytes(), len(classes))
+                for u in range(n)], dtype=np.int64)
+        else:
+            self.column_class = np.unique(np.packbits(B.astype(bool), axis=0).T, axis=0,
+                                          return_inverse=True)[1].ravel().astype(np.int64)
+        self.n_classes = int(self.column_class.max(initial=-1)) + 1
+        C = cooccurrence_matrix(inc.B)
+        if any_set and inc.is_sparse:
+            K = C.copy()
+            K.data = np.ones_like(K.data)
+        else:
+            K = (C > 0).astype(np.int64) if any_set else C
+        self.K = K.tocsr() if inc.is_sparse else K
+        self.col_b = np.asarray(B.T @ self.b, dtype=np.float64).ravel()
+
+        # D = B·K (u ∈ Φ(e_i) hücreleri 0) ve etki için grup toplamları
+        G = len(groups)
+        grouping = np.zeros((G, m), dtype=np.int64)
+        grouping[self.group_of[sizes > 0], np.flatnonzero(sizes > 0)] = 1
+        D = np.zeros((m, n), dtype=np.float64)
+        own = np.zeros((G, n), dtype=np.int64)  # Σ_{i ∈ g} B[i, v]·(B·K)[i, v]
+        block = max(1, int((memory_budget or DEFAULT_MEMORY_BUDGET) // (8 * 4 * max(n, 1))))
+        for start in range(0, m, block):
+            R = np.arange(start, min(start + block, m))
+            B_R = _dense_rows(B, R)
+            if inc.is_sparse:
+                D_R = (B[R] @ K).toarray()
+            else:
+                D_R = _exact_matmul(B_R, K, bound=m * n + 1)
+            own += _exact_matmul(grouping[:, R], D_R * B_R, bound=m * m * n + 1)
+            D_R[B_R.astype(bool)] = 0
+            D[R] = D_R
+        self.D = D
+        counts = np.asarray((B.T @ grouping.T).T if inc.is_sparse else _exact_matmul(grouping, B, bound=m + 1),
+                            dtype=np.int64)
+        row_totals = np.rint(D.sum(axis=1)).astype(np.int64)
+        weighted = B.multiply(row_totals[:, None]).tocsr() if inc.is_sparse else B * row_totals[:, None]
+        totals = np.asarray((weighted.T @ grouping.T).T if inc.is_sparse else
+                            _exact_matmul(grouping, weighted, bound=int(row_totals.sum()) + 1), dtype=np.int64)
+        k_sums = np.asarray(self.K.sum(axis=1), dtype=np.int64).ravel()
+        self._influence_parts = (k_sums[None, :] * counts - own, totals)
+
+        # Float değerlerin hata sınırı (m terimli çarpımlar, skorlar ≤ 2m + 1)
+        self.tolerance = 16 * max(m, 1) * (3 * max(m, 1) + 1) * 2.0 ** -53
+
+    def approximate(self, V):
+        """V elemanları çıkarılınca skorlar (float; satır k: V[k] çıkarıldı)."""
+        B_V = self.B_cols[:, V]
+        if self.inc.is_sparse:
+            A = np.asarray((B_V.multiply(self.a[:, None])).T @ self.D)
+            Q = ((B_V.multiply(self.b[:, None])).T @ self.B).toarray()
+            K_V = self.K[V].toarray()
+        else:
+            A = (B_V * self.a[:, None]).T @ self.D
+            Q = (B_V * self.b[:, None]).T @ self.B
+            K_V = self.K[V]
+        return self.score_values[None, :] + A - K_V * (self.col_b[V][:, None] - Q)
+
+    def exact(self, v, cells):
+        """v çıkarılınca cells elemanlarının tam skor payları (payda: self.denominator)."""
+        cells = np.asarray(cells, dtype=np.intp)
+        if self.inc.is_sparse:
+            rows = self.B_cols.indices[self.B_cols.indptr[v]:self.B_cols.indptr[v + 1]]
+            B_sub = self.B[rows][:, cells].toarray()
+            k_v = self.K[v][:, cells].toarray().ravel()
+        else:
+            rows = np.flatnonzero(self.B[:, v])
+            B_sub = self.B[np.ix_(rows, cells)]
+            k_v = self.K[v, cells]
+        if len(rows) == 0 or len(cells) == 0:
+            return self.numerators[cells]
+        groups, member = np.unique(self.group_of[rows], return_inverse=True)
+        grouping = np.zeros((len(groups), len(rows)), dtype=np.int64)
+        grouping[member.ravel(), np.arange(len(rows))] = 1
+        gained = grouping @ np.rint(self.D[np.ix_(rows, cells)]).astype(np.int64)
+        lost = (grouping @ (1 - B_sub)) * k_v[None, :].astype(np.int64)
+        # Aynı taban payı ve aynı grup toplamlarına sahip hücreler tek kez hesaplanır
+        features = np.vstack((self.base_id[cells][None, :], gained, lost)).T
+        unique, inverse = np.unique(features, axis=0, return_index=True, return_inverse=True)[1:]
+        values = self.numerators[cells[unique]] + \
+            self.alpha[groups] @ gained[:, unique].astype(object) - self.beta[groups] @ lost[:, unique].astype(object)
+        return np.asarray(values, dtype=object)[inverse.ravel()]
+
+    def influence(self):
+        """Σ_{u ≠ v} (S(u) − S'_v(u)) tam değerleri (ExactScores)."""
+        kept, totals = self._influence_parts
+        numerators = self.beta @ kept.astype(object) - self.alpha @ totals.astype(object)
+        return ExactScores(np.asarray(numerators, dtype=object), self.denominator, self.inc.elements)
+
+    def ranking(self, v, approximate, label_order, label_rank):
+        """
+        v çıkarılınca kalan elemanların sıralaması (ExactScores.ranking düzeni).
+
+        Float değerleri hata sınırı içinde yakın olan ardışık gruplar tam
+        paylarla yeniden sıralanır. B sütunları aynı olan elemanların skorları
+        her v için eşit olduğundan grup içinde sütun sınıfı başına bir tam
+        değer hesaplanır.
+
+        Args:
+            label_order: Etiket sırasıyla eleman indeksleri; label_rank: tersi
+
+        Returns:
+            order: eleman indeksleri; best: en yüksek tam skora sahip elemanlar
+        """
+        values = approximate.copy()
+        values[v] = -np.inf
+        order = label_order[np.argsort(-values[label_order], kind='stable')][:-1]
+        sorted_values = values[order]
+        tolerance = self.tolerance * (1 + float(np.abs(sorted_values).max(initial=0.0)))
+        near = np.diff(sorted_values) >= -tolerance
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], near, [False])).astype(np.int8)))
+        starts, stops = edges[::2], edges[1::2] + 1
+        best = order[:1]
+        if len(starts) == 0:
+            return order, best
+        # Tüm yakın grupların tam payları tek çağrıda; gruplar tek sıralamayla düzeltilir
+        lengths = stops - starts
+        run = np.repeat(np.arange(len(starts)), lengths)
+        positions = np.arange(len(run)) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        cells = order[positions]
+        _, first, representative = np.unique(run * self.n_classes + self.column_class[cells],
+                                             return_index=True, return_inverse=True)
+        exact = self.exact(v, cells[first])
+        value_rank = np.unique(exact, return_inverse=True)[1].ravel()[representative.ravel()]
+        key = np.lexsort((label_rank[cells], -value_rank, run))
+        order[positions] = cells[key]
+        if starts[0] == 0:
+            leading = key[:lengths[0]]
+            best = cells[leading[value_rank[leading] == value_rank[leading[0]]]]
+        return order, best
+
+
+def leave_one_element_out(inc, any_set=False, memory_budget=None, progress=None):
+    """
+    Her eleman U'dan çıkarıldığında diğer elemanların skorları ve sıralaması.
+
+    Parametre kümeleri aynı kalır (m değişmez; yalnızca v'yi içeren
+    kümelerin boyutu azalır).
+
+    Args:
+        inc: IncidenceMatrix
+        any_set: True ise RMVC-csv.py'deki "break" semantiği
+        memory_budget: Blok başına ara matris bayt sınırı
+        progress: progress(tamamlanan, toplam) geri çağrısı (elemanlar)
+
+    Returns:
+        full: ExactScores (tüm elemanlarla)
+        table: DataFrame (Eleman, Skor, Sıra, Etki, Karar değişir, En iyi
+               (v hariç), Sırası değişen, En büyük kayma, Spearman ρ); Etki =
+               v çıkarılınca diğer elemanların toplam skor kaybı, tam değerine
+               göre büyükten küçüğe
+    """
+    state = _ElementRemoval(inc, any_set=any_set, memory_budget=memory_budget)
+    full = state.scores
+    n = inc.n
+    labels = [str(u) for u in inc.elements]
+    label_order = np.argsort(np.array(labels, dtype=object), kind='stable')
+    label_rank = np.empty(n, dtype=np.int64)
+    label_rank[label_order] = np.arange(n)
+    base_order = full.ranking()
+    base_rank = rank_positions(full)
+    numerators = full.numerators
+    # v hariç taban karar: en yüksek tam skorlu diğer elemanlar
+    top = base_order[0]
+    first = base_order[numerators[base_order] == numerators[top]]
+    rest = base_order[len(first):]
+    second = rest[numerators[rest] == numerators[rest[0]]] if len(rest) else rest
+
+    influence = state.influence()
+    rows = []
+    block = max(1, int((memory_budget or DEFAULT_MEMORY_BUDGET) // (8 * 4 * max(n, 1))))
+    for start in range(0, n, block):
+        V = np.arange(start, min(start + block, n))
+        approximate = state.approximate(V)
+        for k, v in enumerate(V.tolist()):
+            order, best = state.ranking(v, approximate[k], label_order, label_rank)
+            ranks = np.empty(n, dtype=np.int64)
+            ranks[order] = np.arange(1, n)
+            others = np.ones(n, dtype=bool)
+            others[v] = False
+            before = base_rank - (base_rank > base_rank[v])
+            shift = np.abs(ranks - before)[others]
+            base_best = first[first != v] if len(first) > 1 or first[0] != v else second
+            rows.append({
+                'Eleman': labels[v],
+                'Sıra': int(base_rank[v]),
+                'Karar değişir': set(best.tolist()) != set(base_best.tolist()),
+                'En iyi (v hariç)': ', '.join(labels[u] for u in best),
+                'Sırası değişen': int(np.count_nonzero(shift)),
+                'En büyük kayma': int(shift.max()) if len(shift) else 0,
+                'Spearman ρ': spearman_rho(ranks[others], before[others]),
+            })
+        if progress:
+            progress(int(V[-1]) + 1, n)
+    table = pd.DataFrame(rows, columns=['Eleman', 'Sıra', 'Karar değişir', 'En iyi (v hariç)',
+                                        'Sırası değişen', 'En büyük kayma', 'Spearman ρ'])
+    table.insert(1, 'Skor', state.score_values)
+    table.insert(3, 'Etki', influence.to_float())
+    order = influence.ranking()
+    return full, table.iloc[order].reset_index(drop=True)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Sonuç Deposu - Kalıcı Sonuç Artefaktları
+=============================================
+Analiz edilmiş bir girdinin sonuçları, girdi özeti + hesaplama seçenekleri
+anahtarıyla (rmvc_cache.content_hash) diske yazılır. Sonraki çalıştırmalar
+(RMVC-csv.py veya web arayüzü) yeniden hesaplamak yerine artefaktı açar:
+
+    <depo>/<anahtar>.rmvcr/
+        meta.json        Biçim sürümü, seçenekler, etiketler, ortak payda
+        stats.npz        Sıkıştırılmış sütunlar: skor payları, |Φ(e_i)|,
+                         γ(e_i), toplam_deger
+        incidence.npy    m×n uint8 insidans matrisi          (yoğun üyelik)
+        delta.npy        m×n int64 δ payları                 (yoğun üyelik)
+        incidence_*.npy, delta_*.npy  CSR parçaları         (seyrek üyelik)
+
+Üyelik matrisi isteğe bağlıdır (konsol yalnızca skorları saklar). Büyük
+matrisler sıkıştırılmadan .npy olarak yazılır ve np.load(mmap_mode='r') ile
+eşlenir: ayrıntı görünümleri (eleman detayı, parametre analizi) yalnızca
+ihtiyaç duydukları satır/sütunları diskten okur. Artefakt geçici bir
+dizine yazılıp tek adımda yerine taşınır; yarım yazılmış sonuç okunmaz.
+
+Depo boyutu sınırlıdır: prune_store toplam boyut DEFAULT_STORE_LIMIT'i
+aşınca en uzun süredir kullanılmayan artefaktları siler (açılan artefaktın
+meta.json değişiklik zamanı kullanım zamanı olarak güncellenir).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+
+from rmvc_engine import ExactMembership, ExactScores, IncidenceMatrix, ParamInfoView
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+FORMAT_NAME = "rmvc-result"
+FORMAT_VERSION = 1
+RESULT_SUFFIX = ".rmvcr"
+
+# Varsayılan depo dizini (RMVC_STORE_DIR ortam değişkeniyle değiştirilebilir)
+DEFAULT_STORE_DIR = os.environ.get(
+    "RMVC_STORE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "rmvc"))
+
+# Depo boyut sınırı, bayt (RMVC_STORE_LIMIT_MB ortam değişkeniyle değiştirilebilir)
+DEFAULT_STORE_LIMIT = int(float(os.environ.get("RMVC_STORE_LIMIT_MB", 2048)) * 1024 ** 2)
+
+
+def result_path(key, store_dir=None):
+    """Anahtarın depodaki artefakt dizini."""
+    return os.path.join(store_dir or DEFAULT_STORE_DIR, key + RESULT_SUFFIX)
+
+
+def is_result(path):
+    """Yol tamamlanmış bir RMVC sonuç artefaktı mı?"""
+    return os.path.isfile(os.path.join(str(path), "meta.json"))
+
+
+def _save_matrix(tmp, name, M):
+    """Yoğun matrisi tek .npy, seyrek matrisi CSR parçaları olarak yazar."""
+    if sp is not None and sp.issparse(M):
+        M = M.tocsr()
+        for part in ("data", "indices", "indptr"):
+            np.save(os.path.join(tmp, f"{name}_{part}.npy"), getattr(M, part))
+        return "csr"
+    np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(M))
+    return "dense"
+
+
+def write_result(path, exact, param_keys, param_names=None, totals=None, membership=None,
+                 options=None):
+    """
+    Sonuçları artefakt dizinine yazar (varsa üzerine).
+
+    Args:
+        path: Hedef .rmvcr dizini
+        exact: ExactScores
+        param_keys: Hesaba giren parametre etiketleri (e_1, e_2, ...)
+        param_names: Özgün parametre adları (verilmezse param_keys)
+        totals: Parametre başına toplam_deger (verilmezse 0)
+        membership: ExactMembership (verilirse insidans ve δ payları saklanır)
+        options: Anahtara giren hesaplama seçenekleri (bilgi amaçlı)
+    """
+    m = len(param_keys)
+    numerators = np.asarray(exact.numerators)
+    big = numerators.dtype == object
+    stats = {
+        # Python int paylar ondalık metin olarak saklanır (pickle gerekmez)
+        "numerators": numerators.astype(str) if big else numerators.astype(np.int64),
+        "totals": np.zeros(m) if totals is None else np.asarray(totals, dtype=np.float64),
+    }
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".rmvcr-", dir=parent)
+    try:
+        layout = None
+        if membership is not None:
+            inc = membership.incidence
+            stats["set_sizes"] = inc.set_sizes()
+            stats["gamma"] = np.asarray(membership.gamma, dtype=np.int64)
+            layout = _save_matrix(tmp, "incidence", inc.B)
+            _save_matrix(tmp, "delta", membership.D)
+        np.savez_compressed(os.path.join(tmp, "stats.npz"), **stats)
+
+        meta = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "shape": [m, len(exact.elements)],
+            "param_keys": [str(k) for k in param_keys],
+            "param_names": [str(p) for p in (param_names if param_names is not None else param_keys)],
+            "elements": [str(u) for u in exact.elements],
+            "denominator": str(exact.denominator),
+            "big_numerators": bool(big),
+            "membership": layout,
+            "options": {k: repr(v) for k, v in (options or {}).items()},
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+class StoredResult:
+    """
+    Diskteki sonuç artefaktı.
+
+    Skorlar ve parametre istatistikleri küçük, sıkıştırılmış sütunlardır;
+    insidans ve δ payları bellek eşlemeli açılır, yalnızca erişilen
+    dilimler okunur.
+    """
+
+    __slots__ = ('path', 'meta', '_stats', '_mmap')
+
+    def __init__(self, path, mmap=True):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_NAME or meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen sonuç biçimi: {path}")
+        self.path = path
+        self.meta = meta
+        with np.load(os.path.join(path, "stats.npz")) as stats:
+            self._stats = {name: stats[name] for name in stats.files}
+        self._mmap = 'r' if mmap else None
+
+    @property
+    def m(self):
+        """Parametre sayısı."""
+        return self.meta["shape"][0]
+
+    @property
+    def n(self):
+        """Eleman sayısı."""
+        return self.meta["shape"][1]
+
+    @property
+    def has_membership(self):
+        """Üyelik matrisi (insidans + δ payları) saklanmış mı?"""
+        return self.meta["membership"] is not None
+
+    def scores(self):
+        """ExactScores."""
+        numerators = self._stats["numerators"]
+        if self.meta["big_numerators"]:
+            numerators = np.array([int(x) for x in numerators.tolist()], dtype=object)
+        return ExactScores(numerators, int(self.meta["denominator"]), self.meta["elements"])
+
+    def _load_matrix(self, name):
+        if self.meta["membership"] == "csr":
+            data, indices, indptr = (
+                np.load(os.path.join(self.path, f"{name}_{part}.npy"), mmap_mode=self._mmap)
+                for part in ("data", "indices", "indptr"))
+            return sp.csr_matrix((data, indices, indptr), shape=(self.m, self.n), copy=False)
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode=self._mmap)
+
+    def incidence(self):
+        """Bellek eşlemeli IncidenceMatrix (sütunlar skor sırasıyla aynı)."""
+        if not self.has_membership:
+            raise ValueError("Artefaktta üyelik matrisi saklanmamış")
+        return IncidenceMatrix(self._load_matrix("incidence"), self.meta["param_keys"],
+                               self.meta["elements"])
+
+    def membership(self):
+        """Bellek eşlemeli ExactMembership (info: aynı insidans üzerinde ParamInfoView)."""
+        inc = self.incidence()
+        return ExactMembership(inc, self._load_matrix("delta"), self._stats["gamma"],
+                               info=self.param_info(inc))
+
+    def param_info(self, incidence=None):
+        """E_info ile uyumlu ParamInfoView (|Φ(e_i)| saklanan sütundan okunur)."""
+        if incidence is None:
+            incidence = self.incidence()
+        return ParamInfoView(incidence, self.meta["param_names"], self._stats["totals"],
+                             sizes=self._stats["set_sizes"])
+
+
+def load_result(path, mmap=True):
+    """Sonuç artefaktını açar ve kullanım zamanını (LRU) günceller."""
+    result = StoredResult(path, mmap=mmap)
+    try:
+        os.utime(os.path.join(path, "meta.json"))
+    except OSError:  # salt okunur depo: LRU sırası güncellenmez
+        pass
+    return result
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def prune_store(store_dir=None, max_bytes=None, keep=None):
+    """
+    Depo boyutu max_bytes'ı aşıyorsa en uzun süredir kullanılmayan
+    artefaktları siler.
+
+    Args:
+        store_dir: Depo dizini (None: DEFAULT_STORE_DIR)
+        max_bytes: Boyut sınırı (None: DEFAULT_STORE_LIMIT)
+        keep: Silinmeyecek artefakt yolu (ör. yeni yazılan sonuç)
+
+    Returns:
+        Silinen artefakt yolları
+    """
+    store_dir = store_dir or DEFAULT_STORE_DIR
+    max_bytes = DEFAULT_STORE_LIMIT if max_bytes is None else max_bytes
+    keep = os.path.abspath(keep) if keep is not None else None
+    entries = []
+    try:
+        names = os.listdir(store_dir)
+    except OSError:
+        return []
+    for name in names:
+        path = os.path.join(store_dir, name)
+        # Yazılmakta olan geçici dizinler (.rmvcr-*) sayılmaz
+        if not name.endswith(RESULT_SUFFIX) or not is_result(path):
+            continue
+        try:
+            used = os.path.getmtime(os.path.join(path, "meta.json"))
+        except OSError:
+            used = time.time()
+        entries.append((used, path, _dir_size(path)))
+
+    total = sum(size for _, _, size in entries)
+    removed = []
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) == keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        if not os.path.exists(path):  # açık eşlemeler (Windows) silmeyi engelleyebilir
+            total -= size
+            removed.append(path)
+    return removed
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Akış (Streaming) Hattı - Bellekten Büyük CSV Dosyaları
+===========================================================
+CSV dosyası parça parça (chunk) iki kez okunur; dosyanın tamamı hiçbir
+zaman belleğe alınmaz.
+
+Satırlar = Parametreler (Hocanın formatı):
+    1. geçiş: C = Σ B_parçaᵀ·B_parça (n×n eleman birlikteliği) ve |Φ(e_i)|
+    2. geçiş: Her parçanın üyelik satırları D = B_parça·C ile üretilir,
+              skorlara eklenir ve istenirse doğrudan diske yazılır.
+
+Satırlar = Elemanlar:
+    1. geçiş: O = Σ B_parça·B_parçaᵀ (m×m parametre örtüşmesi) ve |Φ(e_i)|
+    2. geçiş: Her eleman parçasının üyelik sütunları D = O·B_parça ile
+              üretilir; bu elemanların skorları kesinleşir.
+
+any_set=True ("break" semantiği, {u, v} ikilisi en az bir kümede birlikte
+ise bir kez sayılır; RMVC-csv.py varsayılan yolu gibi):
+    Satırlar = Parametreler: 1. geçişte C yerine K = [C > 0] biriktirilir,
+              2. geçişte D = B_parça·K.
+    Satırlar = Elemanlar: K eleman×eleman olduğundan O ile ifade edilemez;
+              1. geçişte insidans B (scipy varsa CSR, bellek ~ dolu hücre
+              sayısı) tutulur, 2. geçişte D = B·[Bᵀ·B_parça > 0].
+
+Tepe bellek kullanımı girdi dosyasıyla değil, tutulan birliktelik
+yapısıyla (C veya O) sınırlıdır. Sütun filtreleme ve adlandırma kuralları
+rmvc_app_v2.csv_to_soft_set ile aynıdır.
+"""
+
+import csv
+import numpy as np
+import pandas as pd
+from math import gcd
+
+from rmvc_engine import ExactScores, _exact_matmul, _exact_operand, choose_backend
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+DEFAULT_CHUNKSIZE = 1000
+
+
+def _rewind(source):
+    """Dosya benzeri kaynağı ikinci geçiş için başa sarar."""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def _read_chunks(source, chunksize):
+    _rewind(source)
+    return pd.read_csv(source, index_col=0, chunksize=chunksize)
+
+
+def _is_label_column(col):
+    """csv_to_soft_set ile aynı: boş, NaN ve Unnamed sütunlar atlanır."""
+    col_str = str(col).strip()
+    return not (not col_str or col_str.lower() == 'nan' or col_str.startswith('Unnamed'))
+
+
+def _common_denominator(sizes, m):
+    """γ(e_i) = |Φ(e_i)|·(m-1) değerlerinin ekoku."""
+    denominator = 1
+    if m > 1:
+        for s in set(int(x) for x in sizes if x > 0):
+            g = s * (m - 1)
+            denominator = denominator * g // gcd(denominator, g)
+    return denominator
+
+
+def _score_terms(counts, D, gamma, denominator, use_object):
+    """
+    Bir parçanın skor paylarına katkısı:
+    counts·L + Σ_i D[i, :]·(L / γ_i)   (γ_i > 0)
+    """
+    weights = np.zeros(len(gamma), dtype=object if use_object else np.int64)
+    for i, g in enumerate(gamma.tolist()):
+        if g > 0:
+            weights[i] = denominator // g
+    if use_object:
+        D = np.asarray(D).astype(object)
+        return counts.astype(object) * denominator + weights @ D
+    return counts.astype(np.int64) * denominator + weights @ np.asarray(D, dtype=np.int64)
+
+
+def stream_rmvc_csv(source, rows_are_params=True, chunksize=DEFAULT_CHUNKSIZE,
+                    bos_filtrele=False, output=None, progress=None, sparse=None,
+                    original_labels=False, any_set=False):
+    """
+    CSV kaynağı üzerinde iki geçişli RMVC hesaplaması yapar.
+
+    Args:
+        source: Dosya yolu veya seek() destekleyen dosya benzeri nesne
+        rows_are_params: True ise satırlar=parametreler (Hocanın formatı)
+        chunksize: Parça başına okunacak satır sayısı
+        bos_filtrele: True ise boş parametre kümeleri hesaplamadan çıkarılır
+        output: Üyelik matrisinin yazılacağı dosya yolu (isteğe bağlı)
+        progress: progress(asama, islenen_satir, toplam_satir) geri çağrısı;
+                  1. geçişte toplam_satir None'dır
+        sparse: True ise C (n×n) seyrek formda biriktirilir (scipy gerekir);
+                False ise yoğun. None: scipy varsa seyrek başlanır, okunan
+                küme boyutlarına göre choose_backend yoğunu seçtiği anda C
+                yoğun forma geçirilir
+        original_labels: rows_are_params=True iken elemanları özgün sütun
+                         adlarıyla adlandırır (RMVC-csv.py'nin devrik okuma
+                         yolu gibi); False ise csv_to_soft_set gibi 1..n
+        any_set: True ise "break" semantiği (ikili en az bir kümede birlikte
+                 ise bir kez sayılır); False ise her kümede sayılır (v2)
+
+    Returns:
+        exact_scores: ExactScores (elemanlar varsayılan olarak csv_to_soft_set
+                      ile aynı adlandırılır)
+        E_info: {e_i: {'orijinal_ad', 'eleman_sayisi', 'toplam_deger'}}
+    """
+    if rows_are_params:
+        return _stream_param_rows(source, chunksize, bos_filtrele, output, progress, sparse,
+                                  original_labels, any_set)
+    return _stream_element_rows(source, chunksize, bos_filtrele, output, progress, any_set)
+
+
+def _stream_param_rows(source, chunksize, bos_filtrele, output, progress, sparse, original_labels,
+                       any_set):
+    if sparse and sp is None:
+        raise ImportError("Seyrek akış modu için scipy gerekli: pip install scipy")
+    auto = sparse is None
+    if auto:
+        sparse = sp is not None
+
+    # ---------------- 1. geçiş: C (any_set: [C > 0]) ve |Φ(e_i)| ----------------
+    C = None
+    columns = None
+    label_cols = None
+    has_numeric = None
+    param_names = []
+    sizes = []
+    totals = []
+    rows_done = 0
+
+    for chunk in _read_chunks(source, chunksize):
+        if columns is None:
+            columns = chunk.columns.tolist()
+            label_cols = np.array([_is_label_column(c) for c in columns], dtype=bool)
+            has_numeric = np.zeros(len(columns), dtype=bool)
+            n_all = len(columns)
+            C = sp.csr_matrix((n_all, n_all), dtype=np.int64) if sparse \
+                else np.zeros((n_all, n_all), dtype=bool if any_set else np.int64)
+
+        values = chunk.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        has_numeric |= ~np.isnan(values).all(axis=0)
+        mask = (values > 0) & label_cols
+        sizes.extend(mask.sum(axis=1).tolist())
+
+        # Σ |Φ(e_i)|² yalnızca artar: yoğuna geçiş tek yönlüdür
+        if auto and sparse and choose_backend(sizes, n_all) == "numpy":
+            C = C.toarray() > 0 if any_set else C.toarray()
+            sparse = False
+
+        if sparse:
+            B_chunk = sp.csr_matrix(mask, dtype=np.int64)
+            C = (C + (B_chunk.T @ B_chunk)).tocsr()
+            if any_set:
+                C.data = np.ones_like(C.data)
+        elif any_set:
+            C |= _exact_matmul(mask.T, mask, bound=len(mask) + 1) > 0
+        else:
+            C += _exact_matmul(mask.T, mask, bound=len(mask) + 1)
+
+        param_names.extend(str(p) for p in chunk.index)
+        totals.extend(np.where(mask, values, 0).sum(axis=1).tolist())
+        rows_done += len(chunk)
+        if progress:
+            progress(1, rows_done, None)
+
+    if columns is None:
+        return ExactScores(np.zeros(0, dtype=np.int64), 1, []), {}
+
+    # Geçerli sütunlar: etiket kuralı + en az bir sayısal değer
+    valid = np.flatnonzero(label_cols & has_numeric)
+    if sparse:
+        C = C.tocsr()[valid][:, valid].tocsr()
+    else:
+        C = C[np.ix_(valid, valid)]
+    n = len(valid)
+    if original_labels:
+        elements = [str(columns[j]) for j in valid]
+    else:
+        elements = [str(i) for i in range(1, n + 1)]
+
+    # Sayısal değeri olmayan sütunlarda > 0 hücre olamaz; |Φ(e_i)| kesindir
+    sizes = np.array(sizes, dtype=np.int64)
+    keep = sizes > 0 if bos_filtrele else np.ones(len(sizes), dtype=bool)
+    m = int(keep.sum())
+    total_rows = len(sizes)
+
+    denominator = _common_denominator(sizes[keep], m)
+    use_object = max(m, 1) * denominator >= 2 ** 62
+    numerators = np.zeros(n, dtype=object if use_object else np.int64)
+    if not sparse:
+        # 2. geçişte her parçayla çarpılır: çarpım tipine bir kez dönüştürülür
+        C = _exact_operand(C, m * n + 1)
+
+    E_info = {}
+    writer = None
+    out_file = None
+    if output is not None:
+        out_file = open(output, 'w', newline='', encoding='utf-8')
+        writer = csv.writer(out_file)
+        writer.writerow(['SETS'] + elements)
+
+    # ---------------- 2. geçiş: üyelik satırları ve skorlar ----------------
+    try:
+        row_offset = 0
+        for chunk in _read_chunks(source, chunksize):
+            values = chunk.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)[:, valid]
+            mask = values > 0
+            chunk_keep = keep[row_offset:row_offset + len(chunk)]
+            row_numbers = np.arange(row_offset, row_offset + len(chunk))[chunk_keep]
+            row_offset += len(chunk)
+            mask = mask[chunk_keep]
+
+            if sparse:
+                D = np.asarray((sp.csr_matrix(mask, dtype=np.int64) @ C).todense(), dtype=np.int64)
+            else:
+                D = _exact_matmul(mask, C, bound=m * n + 1)
+            D[mask] = 0
+            gamma = mask.sum(axis=1).astype(np.int64) * max(m - 1, 0)
+
+            numerators = numerators + _score_terms(mask.sum(axis=0), D, gamma, denominator, use_object)
+
+            for r, i in enumerate(row_numbers):
+                e_key = f"e_{i + 1}"
+                E_info[e_key] = {
+                    'orijinal_ad': param_names[i],
+                    'eleman_sayisi': int(mask[r].sum()),
+                    'toplam_deger': totals[i],
+                }
+                if writer is not None:
+                    g = gamma[r]
+                    row = np.where(mask[r], 1.0, D[r] / g if g > 0 else 0.0)
+                    writer.writerow([e_key] + [f"{x:.4f}" for x in row])
+
+            if progress:
+                progress(2, row_offset, total_rows)
+    finally:
+        if out_file is not None:
+            out_file.close()
+
+    return ExactScores(numerators, denominator, elements), E_info
+
+
+def _stream_element_rows(source, chunksize, bos_filtrele, output, progress, any_set):
+    # ---------------- 1. geçiş: O ve |Φ(e_i)| (any_set: insidans B) ----------------
+    O = None
+    B_parts = []
+    param_names = None
+    sizes = None
+    totals = None
+    rows_done = 0
+
+    for chunk in _read_chunks(source, chunksize):
+        if O is None:
+            param_names = [str(p) for p in chunk.columns]
+            m_all = len(param_names)
+            O = np.zeros((m_all, m_all), dtype=np.int64)
+            sizes = np.zeros(m_all, dtype=np.int64)
+            totals = np.zeros(m_all, dtype=np.float64)
+
+        values = chunk.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        mask = values > 0
+        if any_set:
+            B_parts.append(sp.csr_matrix(mask.T, dtype=np.int64) if sp is not None else mask.T)
+        else:
+            O += _exact_matmul(mask.T, mask, bound=len(mask) + 1)
+        sizes += mask.sum(axis=0)
+        totals += np.where(mask, values, 0).sum(axis=0)
+        rows_done += len(chunk)
+        if progress:
+            progress(1, rows_done, None)
+
+    if O is None:
+        return ExactScores(np.zeros(0, dtype=np.int64), 1, []), {}
+
+    keep = sizes > 0 if bos_filtrele else np.ones(len(sizes), dtype=bool)
+    kept = np.flatnonzero(keep)
+    m = len(kept)
+    total_rows = n = rows_done  # satırlar elemanlardır: O girdileri ≤ n
+    # 2. geçişte her parçayla çarpılan matris çarpım tipine bir kez dönüştürülür
+    if any_set:
+        B = sp.hstack(B_parts).tocsr()[kept] if sp is not None \
+            else _exact_operand(np.concatenate(B_parts, axis=1)[kept], max(m, n) + 1)
+        B_parts = None
+    else:
+        O = _exact_operand(O[np.ix_(kept, kept)], m * n + 1)
+    gamma = sizes[kept] * max(m - 1, 0)
+
+    denominator = _common_denominator(sizes[kept], m)
+    use_object = max(m, 1) * denominator >= 2 ** 62
+
+    E_info = {
+        f"e_{i + 1}": {
+            'orijinal_ad': param_names[i],
+            'eleman_sayisi': int(sizes[i]),
+            'toplam_deger': float(totals[i]),
+        }
+        for i in kept
+    }
+    param_keys = [f"e_{i + 1}" for i in kept]
+
+    writer = None
+    out_file = None
+    if output is not None:
+        # Satırlar = Elemanlar olduğundan üyelik matrisi devrik yazılır
+        out_file = open(output, 'w', newline='', encoding='utf-8')
+        writer = csv.writer(out_file)
+        writer.writerow(['ELEMAN'] + param_keys)
+
+    # ---------------- 2. geçiş: eleman sütunları ve skorlar ----------------
+    elements = []
+    parts = []
+    try:
+        rows_done = 0
+        for chunk in _read_chunks(source, chunksize):
+            values = chunk.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)[:, kept]
+            mask_t = (values > 0).T  # m × parça
+            if any_set and sp is not None:
+                K = (B.T @ sp.csr_matrix(mask_t, dtype=np.int64)).tocsr()  # n × parça
+                K.data = np.ones_like(K.data)
+                D = (B @ K).toarray()
+            elif any_set:
+                K = _exact_matmul(B.T, mask_t, bound=m + 1) > 0
+                D = _exact_matmul(B, K, bound=n + 1)
+            else:
+                D = _exact_matmul(O, mask_t, bound=m * n + 1)
+            D[mask_t] = 0
+
+            parts.append(_score_terms(mask_t.sum(axis=0), D, gamma, denominator, use_object))
+            labels = [str(u) for u in chunk.index]
+            elements.extend(labels)
+
+            if writer is not None:
+                safe_gamma = np.where(gamma > 0, gamma, 1)[:, None]
+                M = np.where(mask_t, 1.0, np.where(gamma[:, None] > 0, D / safe_gamma, 0.0))
+                for c, u in enumerate(labels):
+                    writer.writerow([u] + [f"{x:.4f}" for x in M[:, c]])
+
+            rows_done += len(chunk)
+            if progress:
+                progress(2, rows_done, total_rows)
+    finally:
+        if out_file is not None:
+            out_file.close()
+
+    numerators = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+    return ExactScores(numerators, denominator, elements), E_info
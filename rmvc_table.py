@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Tablo Sayfalama - Yalnızca Görünür Sayfanın Biçimlendirilmesi
+==================================================================
+Skor ve üyelik tabloları tamamı metne çevrilmeden gösterilir:
+
+    - Sıralama ve filtreleme indeks dizileri üzerinde (NumPy) yapılır;
+      eleman başına Python satırı oluşturulmaz.
+    - Yalnızca görünür sayfanın satırları DataFrame'e alınır; kesir metni
+      (ExactScores.fraction) yalnızca bu satırlar için üretilir.
+    - Ondalık basamaklar rmvc_app_v2'de st.column_config ile tarayıcıda
+      biçimlendirilir; sayılar metne çevrilmez.
+
+İndirme dosyaları (score_table) tüm satırları içerir ve önbellekte
+tutulur. Üyelik matrisi CSV'si (write_matrix_csv) ise yalnızca istendiğinde,
+satır blokları hâlinde yazılır; tam float matris oluşturulmaz.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Sayfa boyutu seçenekleri ve varsayılan
+PAGE_SIZES = (25, 50, 100, 250)
+DEFAULT_PAGE_SIZE = 50
+
+# Matris CSV'sinde bir blokta okunan en çok hücre
+MATRIX_CSV_BLOCK_CELLS = 1 << 20
+
+
+def page_count(total, page_size):
+    """Toplam satır için sayfa sayısı (boş tabloda 1)."""
+    return max(1, -(-total // page_size))
+
+
+def page_slice(total, page, page_size):
+    """0 tabanlı sayfanın satır dilimi (sayfa numarası aralığa kırpılır)."""
+    page = min(max(page, 0), page_count(total, page_size) - 1)
+    start = page * page_size
+    return slice(start, min(start + page_size, total))
+
+
+def filter_labels(indices, labels, query):
+    """
+    indices içinden etiketi query'yi içerenler (büyük/küçük harf duyarsız).
+
+    Args:
+        labels: Tüm etiketlerin str dizisi (indeksle erişilir)
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    if not query:
+        return indices
+    found = np.char.find(np.char.lower(np.asarray(labels, dtype=str)[indices]), query.lower())
+    return indices[found >= 0]
+
+
+def filter_range(indices, values, low=None, high=None):
+    """indices içinden değeri [low, high] aralığında olanlar."""
+    indices = np.asarray(indices, dtype=np.intp)
+    keep = np.ones(len(indices), dtype=bool)
+    if low is not None:
+        keep &= values[indices] >= low
+    if high is not None:
+        keep &= values[indices] <= high
+    return indices[keep]
+
+
+def score_ranks(order, n):
+    """Eleman indeksi → sıralamadaki yeri (1 tabanlı; sıralamada yoksa 0)."""
+    ranks = np.zeros(n, dtype=np.int64)
+    ranks[np.asarray(order, dtype=np.intp)] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def score_page(exact, rows, ranks, score_values, best_mask, with_fractions):
+    """
+    Skor tablosunun verilen eleman indeksleri için satırları.
+
+    Returns:
+        DataFrame (Sıra, Eleman, Skor (Kesir), Skor (Ondalık), Durum)
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    return pd.DataFrame({
+        'Sıra': ranks[rows],
+        'Eleman': np.asarray(exact.elements, dtype=object)[rows],
+        'Skor (Kesir)': [str(exact.fraction(j)) for j in rows] if with_fractions else '-',
+        'Skor (Ondalık)': score_values[rows],
+        'Durum': np.where(best_mask[rows], '⭐ EN İYİ', ''),
+    })
+
+
+def score_table(exact, order, with_fractions):
+    """İndirme için sıralı skor tablosunun tamamı (ondalıklar 4 basamak)."""
+    score_values = exact.to_float()
+    best_mask = np.zeros(len(exact.elements), dtype=bool)
+    best_mask[exact.best()] = True
+    df = score_page(exact, order, score_ranks(order, len(exact.elements)), score_values, best_mask,
+                    with_fractions)
+    df['Skor (Ondalık)'] = df['Skor (Ondalık)'].round(4)
+    return df
+
+
+def write_matrix_csv(f, membership, rows=None, cols=None, sums=None, float_format=None):
+    """
+    Üyelik matrisini satır blokları hâlinde CSV'ye yazar (ilk sütun SETS).
+
+    Her blok membership.float_block ile okunur; bellek eşlemeli depoda
+    diskten yalnızca o satırlar gelir.
+
+    Args:
+        f: Yazılabilir metin dosyası
+        membership: ExactMembership
+        rows, cols: Gösterim sırasındaki satır/sütun indeksleri (None: tümü)
+        sums: Verilirse cols sırasıyla "SUM s(x)" satırı eklenir
+        float_format: DataFrame.to_csv biçimi
+    """
+    incidence = membership.incidence
+    rows = np.arange(incidence.m) if rows is None else np.asarray(rows, dtype=np.intp)
+    cols = np.arange(incidence.n) if cols is None else np.asarray(cols, dtype=np.intp)
+    columns = [incidence.elements[j] for j in cols]
+    pd.DataFrame(columns=columns, index=pd.Index([], name='SETS')).to_csv(f)
+    block = max(1, MATRIX_CSV_BLOCK_CELLS // max(len(cols), 1))
+    for start in range(0, len(rows), block):
+        membership.to_dataframe(rows[start:start + block], cols).to_csv(
+            f, header=False, float_format=float_format)
+    if sums is not None:
+        pd.DataFrame([np.asarray(sums)], columns=columns, index=pd.Index(['SUM s(x)'], name='SETS')).to_csv(
+            f, header=False, float_format=float_format)
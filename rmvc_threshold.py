@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Eşik Taraması - İkilileştirme Eşiği Değişince Karar Ne Kadar Kararlı?
+=========================================================================
+csv_to_soft_set üyeliği "değer > 0" ile sabitler; oysa hücreler gerçek
+miktarlar (ciro, adet, ...) taşır. threshold_sweep aynı tablo için bir eşik
+listesinin skorlarını tek geçişte hesaplar:
+
+    - Genel eşik t:        u ∈ Φ(e_i) ⇔ değer(i, u) > t          (t = 0: temel)
+    - Parametre kantili q: u ∈ Φ(e_i) ⇔ değer(i, u) > 0 ve satırdaki pozitif
+                           değerlerin en az q oranı değer(i, u)'dan küçük
+                           (q = 0: temel)
+
+Hücre anahtarları (değer veya satır içi kantil) bir kez sıralanır; eşikler
+artan sırada işlendikçe hücreler yalnızca düşer. Düşen hücreler E ile
+(B' = B − E) birliktelik sayıları baştan kurulmaz, toplu güncellenir:
+
+    count_all: ΔO = −(E·Bᵀ + B'·Eᵀ), O = B·Bᵀ (rmvc_incremental gibi)
+               P' = B'·C' = O'·B' = P + ΔO·B − O'·E
+    any_set:   ΔC = −(Eᵀ·B + B'ᵀ·E), K = [C > 0]
+               P' = B'·K' = P − E·K − B'·Z   (Z: sayısı 0'a düşen ikililer)
+
+P = B·K maskesiz δ matrisidir; skor payları δ = P ∘ (1 − B) satırlarının küme
+boyutu grupları üzerinden tam toplanır (ortak payda L·(m − 1), exact_scores
+ile birebir aynı). Güncellemeler yalnızca düşen hücrelerin dokunduğu
+satır/sütunlarda iş yapar; any_set'te tüm taramanın çarpım işi tek bir B·K
+hesabı mertebesindedir. scipy yoksa her eşik exact_scores ile yeniden
+hesaplanır.
+
+sweep_summary ve rank_stability eşikler boyunca kararın ve sıralamanın
+kararlılığını tablo olarak verir.
+"""
+
+import numpy as np
+import pandas as pd
+from math import gcd
+
+from rmvc_engine import ExactScores, _INT64_SAFE_LIMIT, exact_scores, incidence_from_mask
+from rmvc_sensitivity import _size_groups
+from rmvc_variants import rank_positions, spearman_rho
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy opsiyonel
+    sp = None
+
+
+class SweepStep:
+    """Tek eşiğin sonucu: skorlar, dolu hücre ve boş küme sayıları."""
+
+    __slots__ = ('threshold', 'label', 'scores', 'cells', 'empty_sets')
+
+    def __init__(self, threshold, label, scores, cells, empty_sets):
+        self.threshold = threshold
+        self.label = label
+        self.scores = scores
+        self.cells = cells
+        self.empty_sets = empty_sets
+
+
+def cell_keys(values, per_parameter=False):
+    """
+    Pozitif hücrelerin satır/sütun indeksleri ve eşik anahtarları.
+
+    per_parameter=False: anahtar hücre değeridir (hücre t'de kalır ⇔ anahtar > t).
+    per_parameter=True: anahtar, satırdaki pozitif değerlerden hücre değerinden
+    küçük olanların oranıdır (hücre q'da kalır ⇔ anahtar ≥ q).
+
+    Returns:
+        (rows, cols, keys) - satır-öncelikli dolu hücre sırası
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rows, cols = np.nonzero(values > 0)  # NaN karşılaştırması False döner
+    v = values[rows, cols]
+    if not per_parameter:
+        return rows, cols, v
+    m = values.shape[0]
+    sizes = np.bincount(rows, minlength=m)
+    row_start = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    order = np.lexsort((v, rows))
+    r, x = rows[order], v[order]
+    # Eşit değerlerde "küçük olanlar" grubun ilk konumuna kadar sayılır
+    new_group = np.ones(len(r), dtype=bool)
+    new_group[1:] = (r[1:] != r[:-1]) | (x[1:] != x[:-1])
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(len(r)), 0))
+    keys = np.empty(len(r), dtype=np.float64)
+    keys[order] = (group_start - row_start[r]) / sizes[r]
+    return rows, cols, keys
+
+
+def _scores_from_delta(P, members, drop_empty, elements):
+    """Maskesiz P = B·K ve üyelik maskesinden tam skorlar (exact_scores ile aynı)."""
+    sizes = members.sum(axis=1, dtype=np.int64)
+    counts = members.sum(axis=0, dtype=np.int64)
+    m = int(np.count_nonzero(sizes)) if drop_empty else members.shape[0]
+    L = 1
+    for s in np.unique(sizes[sizes > 0]).tolist():
+        L = L * s // gcd(L, s)
+    # Pay ≤ 2·m·L·(m − 1): int64'e sığmıyorsa Python int
+    use_object = 2 * max(m, 1) ** 2 * L >= _INT64_SAFE_LIMIT
+    dtype = object if use_object else np.int64
+    if m <= 1:
+        # γ = 0: δ katkısı yok
+        return ExactScores(counts.astype(dtype), 1, elements)
+    D = np.where(members, 0, P)
+    totals = np.zeros(members.shape[1], dtype=dtype)
+    for w, rows in _size_groups(sizes, L):
+        group_sum = D[rows].sum(axis=0)
+        totals += group_sum.astype(object) * w if use_object else group_sum * w
+    denominator = L * (m - 1)
+    return ExactScores(counts.astype(dtype) * denominator + totals, denominator, elements)
+
+
+def _threshold_label(t, per_parameter):
+    return f"q={t:g}" if per_parameter else f"t={t:g}"
+
+
+def threshold_sweep(values, thresholds, per_parameter=False, any_set=False, drop_empty=False,
+                    elements=None, progress=None):
+    """
+    Eşik listesinin RMVC skorlarını tek geçişte hesaplar.
+
+    Args:
+        values: m×n özgün değerler (satırlar parametreler; NaN / ≤ 0 hücreler boş)
+        thresholds: Genel eşikler (≥ 0) veya per_parameter=True ise kantiller ([0, 1])
+        per_parameter: True ise eşikler parametre satırı içindeki kantillerdir
+        any_set: True ise "break" semantiği (ikili en az bir kümede birlikte)
+        drop_empty: True ise eşikte boşalan kümeler m'ye katılmaz
+        elements: Sütun etiketleri (None: 0..n−1)
+        progress: progress(tamamlanan, toplam) geri çağrısı (eşikler)
+
+    Returns:
+        Artan eşik sırasıyla SweepStep listesi
+    """
+    values = np.asarray(values, dtype=np.float64)
+    m, n = values.shape
+    elements = list(range(n)) if elements is None else list(elements)
+    thresholds = sorted({float(t) for t in thresholds})
+    if not thresholds:
+        raise ValueError("En az bir eşik gerekli")
+    if per_parameter and (thresholds[0] < 0 or thresholds[-1] > 1):
+        raise ValueError("Kantiller [0, 1] aralığında olmalı")
+    if not per_parameter and thresholds[0] < 0:
+        raise ValueError("Eşikler negatif olamaz (üyelik değer > 0 hücrelerle sınırlı)")
+
+    rows, cols, keys = cell_keys(values, per_parameter)
+    drop_order = np.argsort(keys, kind='stable')
+    rows, cols, keys = rows[drop_order], cols[drop_order], keys[drop_order]
+    # Genel eşik: anahtar ≤ t düşer; kantil: anahtar < q düşer
+    side = 'left' if per_parameter else 'right'
+    cutoffs = np.searchsorted(keys, thresholds, side=side)
+
+    members = np.zeros((m, n), dtype=bool)
+    members[rows, cols] = True
+    steps = []
+
+    if sp is None:
+        for k, (t, cut) in enumerate(zip(thresholds, cutoffs)):
+            members[rows[:cut], cols[:cut]] = False
+            sizes = members.sum(axis=1)
+            keep = np.flatnonzero(sizes > 0) if drop_empty else np.arange(m)
+            inc = incidence_from_mask(members[keep], [f"e_{i+1}" for i in keep], elements)
+            steps.append(SweepStep(t, _threshold_label(t, per_parameter),
+                                   exact_scores(inc, any_set=any_set),
+                                   len(keys) - int(cut), int(np.count_nonzero(sizes == 0))))
+            if progress:
+                progress(k + 1, len(thresholds))
+        return steps
+
+    def incidence(r, c):
+        return sp.csr_matrix((np.ones(len(r), dtype=np.int64), (r, c)), shape=(m, n))
+
+    B = incidence(rows, cols)
+    if any_set:
+        C = (B.T @ B).tocsr()
+        K = C.copy()
+        K.data = np.ones_like(K.data)
+        P = (B @ K).toarray()
+    else:
+        O = (B @ B.T).toarray()
+        P = (B.T @ O).T
+    done = 0
+    for k, (t, cut) in enumerate(zip(thresholds, cutoffs)):
+        if cut > done:
+            E = incidence(rows[done:cut], cols[done:cut])
+            members[rows[done:cut], cols[done:cut]] = False
+            B_old, B = B, incidence(rows[cut:], cols[cut:])
+            if any_set:
+                C = (C - E.T @ B_old - B.T @ E).tocsr()
+                C.eliminate_zeros()
+                K_new = C.copy()
+                K_new.data = np.ones_like(K_new.data)
+                update = (-(E @ K) - B @ (K - K_new)).tocoo()
+                K = K_new
+                # Toplam sonucu tekil koordinatlar taşır
+                P[update.row, update.col] += update.data
+            else:
+                dO = -(E @ B_old.T + B @ E.T)
+                O += dO.toarray()
+                P += (dO @ B_old).toarray() - (E.T @ O).T
+            done = int(cut)
+        sizes = members.sum(axis=1)
+        steps.append(SweepStep(t, _threshold_label(t, per_parameter),
+                               _scores_from_delta(P, members, drop_empty, elements),
+                               len(keys) - int(cut), int(np.count_nonzero(sizes == 0))))
+        if progress:
+            progress(k + 1, len(thresholds))
+    return steps
+
+
+def sweep_summary(steps):
+    """
+    Eşik başına karar ve sıralama kararlılığı özeti.
+
+    "En iyi aynı" ilk (en gevşek) eşiğe, "Sırası değişen" ve "En büyük kayma"
+    bir önceki eşiğe göredir.
+
+    Returns:
+        DataFrame (Eşik, Dolu hücre, Boş küme, En iyi, En iyi aynı,
+                   Sırası değişen, En büyük kayma, Spearman ρ (önceki),
+                   Spearman ρ (ilk))
+    """
+    rows = []
+    first_rank = prev_rank = None
+    first_best = None
+    for step in steps:
+        scores = step.scores
+        ranks = rank_positions(scores)
+        best = scores.best()
+        if first_rank is None:
+            first_rank = prev_rank = ranks
+            first_best = set(best.tolist())
+        shift = np.abs(ranks - prev_rank)
+        rows.append({
+            'Eşik': step.label,
+            'Dolu hücre': step.cells,
+            'Boş küme': step.empty_sets,
+            'En iyi': ', '.join(str(scores.elements[j]) for j in best),
+            'En iyi aynı': set(best.tolist()) == first_best,
+            'Sırası değişen': int(np.count_nonzero(shift)),
+            'En büyük kayma': int(shift.max()) if len(shift) else 0,
+            'Spearman ρ (önceki)': spearman_rho(ranks, prev_rank),
+            'Spearman ρ (ilk)': spearman_rho(ranks, first_rank),
+        })
+        prev_rank = ranks
+    return pd.DataFrame(rows)
+
+
+def rank_stability(steps):
+    """
+    Eleman bazında eşikler boyunca sıralar.
+
+    Returns:
+        DataFrame (ilk eşiğin sırasına göre; Eleman, Sıra (eşik)...,
+                   En iyi sıra, En kötü sıra, Sıra aralığı)
+    """
+    ranks = np.array([rank_positions(step.scores) for step in steps])
+    order = np.argsort(ranks[0])
+    elements = steps[0].scores.elements
+    data = {'Eleman': [str(elements[j]) for j in order]}
+    for step, r in zip(steps, ranks):
+        data[f'Sıra ({step.label})'] = r[order]
+    data['En iyi sıra'] = ranks.min(axis=0)[order]
+    data['En kötü sıra'] = ranks.max(axis=0)[order]
+    data['Sıra aralığı'] = data['En kötü sıra'] - data['En iyi sıra']
+    return pd.DataFrame(data)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC Varyantları - δ Semantikleri ve Boş Kümeler Tek Geçişte
+============================================================
+Depodaki uygulamalar δ'yı farklı tanımlar:
+
+    - count_all: {u, v} ikilisi her kümede ayrı sayılır (rmvc_app_v2,
+      RMVC-git.py): D = B·C, C = Bᵀ·B
+    - any_set: ikili en az bir kümede birlikteyse 1 kez sayılır
+      (RMVC-csv.py'deki break): D = B·(C > 0)
+
+ve boş parametre kümelerini m'ye dahil eder veya çıkarır (γ = |Φ|·(m − 1)
+değişir). Dört varyant için hesabı dört kez çalıştırmak yerine
+variant_scores hepsini tek geçişte hesaplar:
+
+    - C = Bᵀ·B eleman sütunu blokları hâlinde bir kez üretilir; aynı C_J
+      bloğundan hem B·C_J hem B·(C_J > 0) hesaplanır.
+    - Boş kümelerin B satırı sıfır olduğundan δ payları değişmez; m yalnızca
+      paydayı etkiler. L = ekok(|Φ(e_i)|) ile T(u) = Σ_i (L/|Φ(e_i)|)·δ(u, e_i)
+      her semantik için bir kez toplanır ve
+          S(u) = sayaç(u) + T(u) / (L·(m − 1))
+      her iki m değeri için aynı T'den elde edilir. Sonuçlar exact_scores ile
+      birebir aynıdır (aynı ortak payda).
+
+ranking_diffs ve variant_summary varyantların sıralama farklarını tablo
+olarak verir.
+"""
+
+import numpy as np
+import pandas as pd
+from math import gcd
+
+from rmvc_engine import SCORE_CHUNK_COLUMNS, ExactScores, _INT64_SAFE_LIMIT, _exact_matmul, plan_delta
+
+
+# Varyant adı → (any_set, boş kümeler hariç)
+DELTA_VARIANTS = {
+    "count_all": (False, False),
+    "count_all_nonempty": (False, True),
+    "any_set": (True, False),
+    "any_set_nonempty": (True, True),
+}
+
+VARIANT_LABELS = {
+    "count_all": "Her küme sayılır, boş kümeler dahil (rmvc_app_v2, RMVC-git.py)",
+    "count_all_nonempty": "Her küme sayılır, boş kümeler hariç (rmvc_app_v2 + filtre)",
+    "any_set": "En az bir küme (break), boş kümeler dahil",
+    "any_set_nonempty": "En az bir küme (break), boş kümeler hariç (RMVC-csv.py)",
+}
+
+# Sıralama farklarının karşılaştırıldığı varsayılan varyant
+DEFAULT_BASELINE = "count_all"
+
+
+def _shared_delta_sums(inc, weights, semantics, tile=None, progress=None):
+    """
+    Σ_i weights[i]·δ(u, e_i) vektörlerini istenen semantikler için, C
+    bloklarını paylaşarak hesaplar.
+
+    Returns:
+        {any_set: n uzunluğunda vektör}
+    """
+    B = inc.B
+    m, n = inc.m, inc.n
+    use_object = weights.dtype == object
+    if use_object:
+        # Python int ağırlıklar yalnızca grup toplamlarına uygulanır (aynı ağırlık ⇒ aynı grup)
+        group_weights, group_of = np.unique(weights, return_inverse=True)
+        grouping = np.zeros((len(group_weights), m), dtype=np.int64)
+        grouping[group_of.ravel(), np.arange(m)] = 1
+
+    if inc.is_sparse:
+        B = B.tocsr().astype(np.int64)
+        BT = B.T.tocsr()
+        B_cols = B.tocsc()
+        members = B.astype(bool).tocsc()
+    else:
+        members = B.astype(bool)
+
+    def weighted(D_J):
+        if inc.is_sparse:
+            if not use_object:
+                return np.asarray(D_J.T @ weights, dtype=np.int64).ravel()
+            sums = np.asarray(D_J.T @ grouping.T, dtype=np.int64).T
+        elif not use_object:
+            return weights @ D_J
+        else:
+            sums = _exact_matmul(grouping, D_J, bound=m * m * n + 1)
+        return group_weights @ sums.astype(object)
+
+    totals = {a: np.zeros(n, dtype=object if use_object else np.int64) for a in semantics}
+    chunk = min(tile or SCORE_CHUNK_COLUMNS, SCORE_CHUNK_COLUMNS)
+    for start in range(0, n, chunk):
+        J = slice(start, min(start + chunk, n))
+        if inc.is_sparse:
+            C_J = (BT @ B_cols[:, J]).tocsc()
+        else:
+            C_J = _exact_matmul(B.T, B[:, J], bound=m + 1)
+        for any_set in semantics:
+            K = C_J
+            if any_set and inc.is_sparse:
+                K = C_J.copy()
+                K.data = np.ones_like(K.data)
+            elif any_set:
+                K = (C_J > 0).astype(np.int64)
+            if inc.is_sparse:
+                D_J = (B @ K).tocsr()
+                D_J = (D_J - D_J.multiply(members[:, J])).tocsr()
+            else:
+                D_J = _exact_matmul(B, K, bound=m * n + 1)
+                D_J[members[:, J]] = 0
+            totals[any_set][J] = weighted(D_J)
+        if progress:
+            progress(J.stop, n)
+    return totals
+
+
+def variant_scores(inc, variants=None, memory_budget=None, progress=None):
+    """
+    δ semantiği × boş küme varyantlarının skorlarını tek geçişte hesaplar.
+
+    Args:
+        inc: Boş parametre satırlarını da içeren IncidenceMatrix (boş
+             kümeler zaten çıkarılmışsa "dahil" ve "hariç" varyantları aynıdır)
+        variants: DELTA_VARIANTS adları (None: tümü)
+        memory_budget: C blokları için bayt sınırı (plan_delta)
+        progress: progress(tamamlanan, toplam) geri çağrısı (eleman sütunları)
+
+    Returns:
+        {varyant adı: ExactScores}
+    """
+    variants = tuple(DELTA_VARIANTS) if variants is None else tuple(variants)
+    for name in variants:
+        if name not in DELTA_VARIANTS:
+            raise ValueError(f"Bilinmeyen varyant: {name}")
+
+    sizes = inc.set_sizes().astype(np.int64)
+    counts = inc.element_counts()
+    m_all, m_nonempty = inc.m, int(np.count_nonzero(sizes))
+    L = 1
+    for s in np.unique(sizes[sizes > 0]).tolist():
+        L = L * s // gcd(L, s)
+    # Pay ≤ 2·m·L·(m − 1): int64'e sığmıyorsa Python int
+    use_object = 2 * max(m_all, 1) ** 2 * L >= _INT64_SAFE_LIMIT
+    dtype = object if use_object else np.int64
+    weights = np.zeros(m_all, dtype=dtype)
+    for i, s in enumerate(sizes.tolist()):
+        if s > 0:
+            weights[i] = L // s
+
+    semantics = sorted({DELTA_VARIANTS[name][0] for name in variants})
+    plan = plan_delta(inc, any_set=True, memory_budget=memory_budget)
+    totals = _shared_delta_sums(inc, weights, semantics, plan.tile, progress)
+
+    results = {}
+    for name in variants:
+        any_set, nonempty_only = DELTA_VARIANTS[name]
+        m = m_nonempty if nonempty_only else m_all
+        if m <= 1:
+            # γ = 0: δ katkısı yok (exact_scores ile aynı)
+            results[name] = ExactScores(counts.astype(dtype), 1, inc.elements)
+            continue
+        denominator = L * (m - 1)
+        results[name] = ExactScores(counts.astype(dtype) * denominator + totals[any_set],
+                                    denominator, inc.elements)
+    return results
+
+
+def rank_positions(scores):
+    """Eleman indeksine göre 1'den başlayan sıra numaraları (ranking() düzeni)."""
+    order = scores.ranking()
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def spearman_rho(a, b):
+    """Eşitliksiz iki sıralamanın Spearman korelasyonu."""
+    n = len(a)
+    if n < 2:
+        return 1.0
+    d = np.asarray(a, dtype=np.float64) - np.asarray(b, dtype=np.float64)
+    return float(1 - 6 * np.sum(d * d) / (n * (n * n - 1)))
+
+
+def ranking_diffs(results, baseline=DEFAULT_BASELINE):
+    """
+    Eleman bazında varyant sıraları, skorları ve temel varyanta göre sıra farkı.
+
+    Returns:
+        DataFrame (temel varyant sırasına göre; Δ sıra > 0: eleman geriledi)
+    """
+    base_rank = rank_positions(results[baseline])
+    order = np.argsort(base_rank)
+    elements = results[baseline].elements
+    data = {'Eleman': [str(elements[j]) for j in order]}
+    for name, scores in results.items():
+        ranks = rank_positions(scores)
+        data[f'Sıra ({name})'] = ranks[order]
+        data[f'Skor ({name})'] = scores.to_float()[order]
+        if name != baseline:
+            data[f'Δ sıra ({name})'] = (ranks - base_rank)[order]
+    return pd.DataFrame(data)
+
+
+def variant_summary(results, baseline=DEFAULT_BASELINE):
+    """
+    Varyant başına karar ve temel varyanta göre sıralama farkı özeti.
+
+    Returns:
+        DataFrame (Varyant, Açıklama, En iyi, En iyi aynı, Sırası değişen,
+                   En büyük kayma, Spearman ρ)
+    """
+    base_rank = rank_positions(results[baseline])
+    base_best = set(results[baseline].best().tolist())
+    rows = []
+    for name, scores in results.items():
+        ranks = rank_positions(scores)
+        shift = np.abs(ranks - base_rank)
+        best = scores.best()
+        rows.append({
+            'Varyant': name,
+            'Açıklama': VARIANT_LABELS[name],
+            'En iyi': ', '.join(str(scores.elements[j]) for j in best),
+            'En iyi aynı': set(best.tolist()) == base_best,
+            'Sırası değişen': int(np.count_nonzero(shift)),
+            'En büyük kayma': int(shift.max()) if len(shift) else 0,
+            'Spearman ρ': spearman_rho(ranks, base_rank),
+        })
+    return pd.DataFrame(rows)
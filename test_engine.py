@@ -0,0 +1,850 @@
+# -*- coding: utf-8 -*-
+"""
+RMVC motoru testi - Vektörize backend ile referans döngülerin karşılaştırması
+"""
+
+import os
+import sys
+import random
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from fractions import Fraction
+from io import StringIO
+
+from rmvc_engine import (
+    DeltaPlan,
+    ExactScores,
+    ParamInfoView,
+    SoftSetView,
+    build_incidence,
+    create_membership_matrix_numpy,
+    create_membership_matrix_sparse,
+    delta_matrix,
+    element_sort_key,
+    exact_membership,
+    exact_scores,
+    incidence_from_mask,
+    membership_fractions,
+    natural_elements,
+    param_sort_key,
+    plan_delta,
+    score_fractions,
+)
+from rmvc_batch import collect_inputs, run_batch
+from rmvc_bench import BENCH_STAGES, compare, run_benchmark, synthetic_table
+from rmvc_bitset import create_membership_matrix_bitset
+from rmvc_cache import ResultCache, content_hash
+import rmvc_dataset
+from rmvc_dataset import convert_table, load_dataset
+from rmvc_incremental import IncrementalRMVC
+from rmvc_jobs import JobCancelled, JobRunner
+from rmvc_parallel import parallel_exact_scores
+from rmvc_profile import StageProfiler, reference_pair_checks, report_frame
+from rmvc_plot import box_stats, downsample, downsample_membership, histogram
+from rmvc_sensitivity import _ElementRemoval, _parameter_blocks, leave_one_element_out, leave_one_parameter_out
+from rmvc_store import is_result, load_result, prune_store, result_path, write_result
+import rmvc_table
+from rmvc_table import filter_labels, filter_range, page_count, page_slice, score_table, write_matrix_csv
+import rmvc_threshold
+from rmvc_threshold import cell_keys, rank_stability, sweep_summary, threshold_sweep
+from rmvc_stream import stream_rmvc_csv
+from rmvc_variants import DELTA_VARIANTS, ranking_diffs, variant_scores, variant_summary
+
+
+# Referans (rmvc_app_v2.py ile aynı) - break YOK
+def delta_function(e_i, E_named, U):
+    phi_e_i = E_named[e_i]
+    not_in_phi = U - phi_e_i
+    results = {}
+    for u in not_in_phi:
+        delta_sum = 0
+        for v in phi_e_i:
+            pair = {u, v}
+            for e_j, phi_e_j in E_named.items():
+                if pair.issubset(phi_e_j):
+                    delta_sum += 1
+        results[u] = delta_sum
+    return results
+
+
+def calculate_scores(membership_matrix, U):
+    return {u: sum((row[u] for row in membership_matrix.values()), Fraction(0)) for u in U}
+
+
+def create_membership_matrix(E_named, U):
+    m = len(E_named)
+    membership_matrix = {}
+    for e_i, phi_e_i in E_named.items():
+        delta_results = delta_function(e_i, E_named, U)
+        gamma = len(phi_e_i) * (m - 1)
+        membership_matrix[e_i] = {}
+        for u in U:
+            if u in phi_e_i:
+                membership_matrix[e_i][u] = Fraction(1, 1)
+            elif gamma > 0 and u in delta_results:
+                membership_matrix[e_i][u] = Fraction(delta_results[u], gamma)
+            else:
+                membership_matrix[e_i][u] = Fraction(0, 1)
+    return membership_matrix
+
+
+all_pass = True
+
+
+def check(name, ok):
+    global all_pass
+    if not ok:
+        all_pass = False
+    print(f"{'✅' if ok else '❌'} {name}")
+
+
+# Example 1 (Makale)
+U = {'1', '2', '3', '4', '5'}
+E_named = {
+    'e_1': {'1', '2', '3', '5'},
+    'e_2': {'2', '4', '5'},
+    'e_3': {'1', '3', '4'},
+    'e_4': {'1', '2', '5'}
+}
+check("Example 1 - NumPy = Referans",
+      create_membership_matrix_numpy(E_named, U) == create_membership_matrix(E_named, U))
+
+# 10x10 CSV (Hocanın formatı, boş kümeler dahil)
+df = pd.read_csv("RMVC_Firma_Urun_Matrisi_10x10_Binary.csv", index_col=0)
+U = set(str(c) for c in df.columns)
+E_named = {str(firma): set(str(c) for c in df.columns if df.loc[firma, c] > 0) for firma in df.index}
+check("10x10 CSV - NumPy = Referans",
+      create_membership_matrix_numpy(E_named, U) == create_membership_matrix(E_named, U))
+
+# Rastgele soft set'ler (boş kümeler ve m=1 dahil)
+rng = random.Random(42)
+for trial in range(20):
+    m = rng.randint(1, 8)
+    n = rng.randint(1, 12)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    expected = create_membership_matrix(E_named, U)
+    expected_scores = calculate_scores(expected, U)
+    check(f"Rastgele #{trial} (m={m}, n={n}) - NumPy",
+          create_membership_matrix_numpy(E_named, U) == expected)
+    check(f"Rastgele #{trial} (m={m}, n={n}) - Seyrek",
+          create_membership_matrix_sparse(E_named, U) == expected)
+    check(f"Rastgele #{trial} (m={m}, n={n}) - Bitset",
+          create_membership_matrix_bitset(E_named, U) == expected)
+    check(f"Rastgele #{trial} (m={m}, n={n}) - Seyrek skorlar",
+          score_fractions(build_incidence(E_named, U, sparse=True)) == expected_scores)
+    
+    # Tam mod: sıralama ve eşitlik tam sayılar üzerinden
+    exact = exact_scores(build_incidence(E_named, U))
+    expected_order = [u for u, s in sorted(expected_scores.items(), key=lambda x: (-x[1], x[0]))]
+    best = max(expected_scores.values())
+    check(f"Rastgele #{trial} (m={m}, n={n}) - Tam mod sıralama",
+          [exact.elements[j] for j in exact.ranking()] == expected_order
+          and {exact.elements[j] for j in exact.best()} == {u for u, s in expected_scores.items() if s == best})
+    
+    # İlk k: kesimdeki eşitlik grubu dahil, tam sıralamanın ön eki
+    k = rng.randint(1, n)
+    cutoff = expected_scores[expected_order[k - 1]]
+    check(f"Rastgele #{trial} (m={m}, n={n}) - İlk {k}",
+          [exact.elements[j] for j in exact.top_k(k)]
+          == [u for u in expected_order if expected_scores[u] >= cutoff])
+
+# Artımlı motor: her güncellemeden sonra tam hesaplamayla aynı skorlar
+for trial in range(5):
+    U = {str(i) for i in range(1, 9)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(5)}
+    engine = IncrementalRMVC.from_soft_set(E_named, U)
+    ok = True
+    for step in range(25):
+        params = engine.active_params()
+        op = rng.random()
+        if op < 0.6:
+            engine.set_cell(rng.choice(params), rng.choice(engine.elements), rng.random() < 0.5)
+        elif op < 0.75:
+            engine.add_parameter(f"x_{trial}_{step}", {u for u in engine.elements if rng.random() < 0.4})
+        elif op < 0.85 and len(params) > 2:
+            engine.remove_parameter(rng.choice(params))
+        else:
+            engine.add_element(f"u_{step}", [e for e in params if rng.random() < 0.4])
+        current = engine.to_soft_set()
+        expected_scores = calculate_scores(create_membership_matrix(current, set(engine.elements)),
+                                           set(engine.elements))
+        ok = ok and engine.scores().to_dict() == expected_scores
+    check(f"Artımlı motor #{trial} - 25 güncelleme", ok)
+
+# Akış modu: iki yönde, küçük parçalarla tam hesaplamayla aynı skorlar
+for trial in range(5):
+    m = rng.randint(2, 7)
+    n = rng.randint(2, 10)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    expected_scores = calculate_scores(create_membership_matrix(E_named, U), U)
+    grid = pd.DataFrame([[int(u in E_named[e]) for u in sorted(U, key=int)] for e in E_named],
+                        index=list(E_named), columns=sorted(U, key=int))
+    by_params, _ = stream_rmvc_csv(StringIO(grid.to_csv()), rows_are_params=True, chunksize=2)
+    by_elements, _ = stream_rmvc_csv(StringIO(grid.T.to_csv()), rows_are_params=False, chunksize=3)
+    ok = by_params.to_dict() == expected_scores and by_elements.to_dict() == expected_scores
+    # "break" semantiği: iki yön de exact_scores(any_set=True) ile aynı
+    expected_any = exact_scores(build_incidence(E_named, U), any_set=True).to_dict()
+    for sparse in (None, False):
+        by_params, _ = stream_rmvc_csv(StringIO(grid.to_csv()), rows_are_params=True, chunksize=2,
+                                       sparse=sparse, any_set=True)
+        ok = ok and by_params.to_dict() == expected_any
+    by_elements, _ = stream_rmvc_csv(StringIO(grid.T.to_csv()), rows_are_params=False, chunksize=3,
+                                     any_set=True)
+    check(f"Akış modu #{trial} (m={m}, n={n}) - iki yön, iki δ semantiği",
+          ok and by_elements.to_dict() == expected_any)
+
+# Akış modu C biriktirme: seyrek başlayıp yoğunlaşan dosyada otomatik seçim yoğuna geçer
+n = 20
+U = {str(i) for i in range(1, n + 1)}
+E_named = {f"e_{i+1}": {str(i + 1)} for i in range(4)}
+E_named.update({f"e_{i+1}": {u for u in U if rng.random() < 0.8} for i in range(4, 9)})
+expected_scores = calculate_scores(create_membership_matrix(E_named, U), U)
+grid = pd.DataFrame([[int(u in E_named[e]) for u in sorted(U, key=int)] for e in E_named],
+                    index=list(E_named), columns=sorted(U, key=int))
+ok = True
+for sparse in (None, False, True):
+    scores, _ = stream_rmvc_csv(StringIO(grid.to_csv()), rows_are_params=True, chunksize=2, sparse=sparse)
+    ok = ok and scores.to_dict() == expected_scores
+check("Akış modu - seyrek/yoğun/otomatik C biriktirme", ok)
+
+# Komut satırı: --stream ve varsayılan yol aynı dosyada aynı eleman etiketleri ve sonuçları verir
+# (ikililer birden çok kümede birlikte: iki δ semantiği burada farklı karar verir)
+cli = os.path.join(os.path.dirname(os.path.abspath(__file__)), "RMVC-csv.py")
+kumeler = [set(k) for k in ("ABD", "ACDF", "ABDF", "D", "", "ADEF", "ABCDEF")]
+grid = pd.DataFrame([[int(u in k) for u in "ABCDEF"] for k in kumeler],
+                    index=[f"f{i}" for i in range(len(kumeler))], columns=list("ABCDEF"))
+with tempfile.TemporaryDirectory() as tmp:
+    yol = os.path.join(tmp, "urunler.csv")
+    grid.to_csv(yol)
+    ciktilar = []
+    for ek in ([], ["--stream", "--chunksize", "2"]):
+        sonuc = subprocess.run([sys.executable, cli, yol, "--rows-are-params"] + ek,
+                               capture_output=True, text=True, encoding="utf-8")
+        ciktilar.append(sonuc.stdout.partition("📈 ELEMAN SKORLARI")[2] if sonuc.returncode == 0 else None)
+    her_kume, _ = stream_rmvc_csv(yol, rows_are_params=True, bos_filtrele=True, original_labels=True)
+    break_, _ = stream_rmvc_csv(yol, rows_are_params=True, bos_filtrele=True, original_labels=True,
+                                any_set=True)
+    # Veri iki semantiği ayırt eder: her kümede sayımda A ve D eşit, break'te yalnızca D
+    ok = her_kume.best().tolist() == [0, 3] and break_.best().tolist() == [3]
+    check("Komut satırı - --stream ve varsayılan yol aynı etiketler ve sonuçlar",
+          ok and ciktilar[0] is not None and "['D']" in ciktilar[0] and ciktilar[0] == ciktilar[1])
+
+# Hesap planı: iki çarpım sırası ve bütçe aşımında bloklu hesap aynı sonucu verir
+for trial in range(5):
+    m = rng.randint(2, 10)
+    n = rng.randint(2, 10)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    expected = create_membership_matrix(E_named, U)
+    expected_scores = calculate_scores(expected, U)
+    ok = True
+    for sparse in (False, True):
+        inc = build_incidence(E_named, U, sparse=sparse)
+        for budget in (None, 1):
+            plan = plan_delta(inc, memory_budget=budget)
+            ok = ok and (budget is None or plan.tile is not None)
+            if not sparse:
+                # Yoğun: O (m×m) yalnızca m < n iken daha ucuz; bütçe 1 bayt → 1'lik bloklar
+                ok = ok and plan.order == ("overlap" if m < n else "cooccurrence")
+                ok = ok and plan.tile == (None if budget is None else 1)
+            ok = ok and membership_fractions(inc, delta_matrix(inc, plan=plan)) == expected
+            ok = ok and exact_scores(inc, plan=plan).to_dict() == expected_scores
+    check(f"Hesap planı #{trial} (m={m}, n={n}) - sıra ve bloklama", ok)
+
+# Hesap planı kararı: sıra m/n ile değişir, break her zaman C kullanır, blok boyutu bütçeden gelir
+ok = True
+for m, n, order in ((3, 12, "overlap"), (12, 3, "cooccurrence")):
+    inc = incidence_from_mask([[(i + j) % 3 == 0 for j in range(n)] for i in range(m)],
+                              [f"e_{i+1}" for i in range(m)], [str(j) for j in range(n)])
+    side = min(m, n)
+    ara = 8 * side * side  # seçilen ara matrisin (O veya C) yoğun boyutu
+    ok = ok and plan_delta(inc).order == order and plan_delta(inc).tile is None
+    ok = ok and plan_delta(inc, any_set=True).order == "cooccurrence"
+    ok = ok and plan_delta(inc, memory_budget=ara).tile is None
+    plan = plan_delta(inc, memory_budget=ara - 1)
+    ok = ok and plan.order == order and plan.tile == side - 1
+    ok = ok and plan_delta(inc, memory_budget=8 * side * 2).tile == 2
+    ok = ok and exact_scores(inc, plan=plan).to_dict() == exact_scores(inc).to_dict()
+check("Hesap planı - sıra seçimi ve bütçeden blok boyutu", ok)
+
+# İkili veri seti: iki yönde dönüştür, bellek eşlemeli aç, aynı soft set ve skorlar
+with tempfile.TemporaryDirectory() as tmp:
+    for trial in range(4):
+        m = rng.randint(2, 7)
+        n = rng.randint(2, 10)
+        U = {str(i) for i in range(1, n + 1)}
+        E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+        expected_scores = calculate_scores(create_membership_matrix(E_named, U), U)
+        grid = pd.DataFrame([[rng.randint(1, 9) if u in E_named[e] else 0 for u in sorted(U, key=int)]
+                             for e in E_named], index=list(E_named), columns=sorted(U, key=int))
+        ok = True
+        for rows_are_params, layout in ((True, "bits"), (False, "csr")):
+            path = os.path.join(tmp, f"veri_{trial}_{layout}.rmvcd")
+            convert_table(grid if rows_are_params else grid.T, path,
+                          rows_are_params=rows_are_params, keep_values=True, layout=layout)
+            dataset = load_dataset(path)
+            inc = dataset.incidence()
+            ok = ok and inc.to_soft_set() == E_named
+            ok = ok and exact_scores(inc).to_dict() == expected_scores
+            ok = ok and sorted(dataset.values().tolist()) == sorted(v for v in grid.to_numpy().ravel() if v > 0)
+            ok = ok and np.array_equal(dataset.value_matrix(), grid.to_numpy(dtype=float))
+            # csr düzeni yoğunlaştırılmadan CSR olarak açılır
+            ok = ok and inc.is_sparse == (layout == "csr" and rmvc_dataset.sp is not None)
+            # Satır blokları (bits düzeninde unpackbits) ve satır alt kümeleri: blok
+            # boyutu sonucu değiştirmez, yalnızca istenen satırlar açılır
+            tam = grid.to_numpy(dtype=float)
+            dolu_satirlar = np.flatnonzero((tam > 0).any(axis=1))
+            eski = rmvc_dataset.UNPACK_BLOCK_CELLS
+            try:
+                for blok in (eski, 1):
+                    rmvc_dataset.UNPACK_BLOCK_CELLS = blok
+                    ok = ok and np.array_equal(dataset.set_sizes(), (tam > 0).sum(axis=1))
+                    ok = ok and np.array_equal(dataset.value_matrix(rows=[m - 1, 0]), tam[[m - 1, 0]])
+                    satir, sutun = dataset.cell_indices()
+                    ok = ok and np.array_equal(tam[satir, sutun], dataset.values())
+                    for sparse in (False, True) if rmvc_dataset.sp is not None else (False,):
+                        kept = dataset.incidence(sparse=sparse, drop_empty=True)
+                        B = kept.B.toarray() if kept.is_sparse else kept.B
+                        ok = ok and kept.is_sparse == sparse and np.array_equal(B, tam[dolu_satirlar] > 0)
+                        ok = ok and kept.param_keys == [f"e_{i+1}" for i in dolu_satirlar]
+            finally:
+                rmvc_dataset.UNPACK_BLOCK_CELLS = eski
+        check(f"İkili veri seti #{trial} (m={m}, n={n}) - iki yön", ok)
+
+# Tembel görünümler: SoftSetView / ParamInfoView sözlüklerle aynı, insidans yeniden kurulmaz
+for trial in range(5):
+    m = rng.randint(2, 8)
+    n = rng.randint(2, 10)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    elements = sorted(U, key=int)
+    mask = [[u in E_named[e] for u in elements] for e in E_named]
+    ok = True
+    for sparse in (False, True):
+        inc = incidence_from_mask(mask, list(E_named), elements, sparse=sparse)
+        view = SoftSetView(inc)
+        info = ParamInfoView(inc, [f"p{i}" for i in range(m)], [float(len(E_named[e])) for e in E_named])
+        ok = ok and dict(view.items()) == E_named and len(view) == m
+        ok = ok and all(info[e]['elemanlar'] == E_named[e] and info[e]['eleman_sayisi'] == len(E_named[e])
+                        for e in E_named)
+        filtered = {e: phi for e, phi in E_named.items() if phi}
+        ok = ok and dict(view.nonempty().items()) == filtered and list(info.subset(filtered)) == list(filtered)
+        ok = ok and exact_scores(build_incidence(view, U, sparse=not sparse)).to_dict() == \
+            exact_scores(build_incidence(E_named, U)).to_dict()
+    check(f"Tembel görünüm #{trial} (m={m}, n={n}) - sözlük ile aynı", ok)
+
+# Sonuç önbelleği: seçenekler anahtara girer, bayt sınırında en eski kayıt atılır,
+# kapasiteyi aşan kayıt 2·kapasiteye kadar tek kişilik ayrı yuvada kalır (tekrar çalıştırma
+# yeniden hesaplamaz), daha büyüğü saklanmaz
+cache = ResultCache(max_bytes=3000)
+calls = []
+key_a = content_hash(b"a,b\n1,2", rows_are_params=True, bos_filtrele=False)
+ok = key_a == content_hash(b"a,b\n1,2", bos_filtrele=False, rows_are_params=True)
+ok = ok and key_a != content_hash(b"a,b\n1,2", rows_are_params=True, bos_filtrele=True)
+for key in ("k1", "k2", "k1", "k3"):
+    cache.get_or_compute(key, lambda key=key: calls.append(key) or bytes(1000))
+ok = ok and calls == ["k1", "k2", "k3"] and "k1" in cache and "k2" not in cache
+ok = ok and cache.nbytes <= cache.max_bytes and cache.hits == 1
+cache.put("dev", bytes(5000))
+ok = ok and "dev" in cache and "k1" in cache and "k3" in cache and cache.nbytes <= cache.max_bytes
+for _ in range(2):
+    cache.get_or_compute("dev", lambda: calls.append("dev") or bytes(5000))
+ok = ok and "dev" not in calls
+cache.get_or_compute("dev2", lambda: calls.append("dev2") or bytes(5500))
+ok = ok and "dev2" in cache and "dev" not in cache and "k1" in cache
+cache.put("dev3", bytes(7000))  # > 2·max_bytes: saklanmaz, yuvadaki kayıt kalır
+ok = ok and "dev3" not in cache and "dev2" in cache
+cache.clear()
+ok = ok and "dev2" not in cache and len(cache) == 0
+check("Sonuç önbelleği - anahtar, LRU tahliyesi ve sınırlı büyük kayıt yuvası", ok)
+
+# Sonuç deposu: skorlar, kesirler ve parametre bilgisi diskten aynen okunur
+with tempfile.TemporaryDirectory() as tmp:
+    for trial in range(4):
+        m = rng.randint(2, 7)
+        n = rng.randint(2, 10)
+        U = {str(i) for i in range(1, n + 1)}
+        E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+        ok = True
+        for sparse in (False, True):
+            membership = exact_membership(build_incidence(E_named, U, sparse=sparse))
+            exact = membership.scores()
+            if trial == 3:
+                # Python int paylar (object) metin olarak saklanır
+                exact = ExactScores(exact.numerators.astype(object) * 2 ** 70, exact.denominator * 2 ** 70,
+                                    exact.elements)
+            path = write_result(os.path.join(tmp, f"sonuc_{trial}_{sparse}.rmvcr"), exact,
+                                membership.incidence.param_keys, totals=list(range(m)),
+                                membership=membership, options={"sparse": sparse})
+            stored = load_result(path)
+            ok = ok and stored.scores().to_dict() == exact.to_dict()
+            loaded = stored.membership()
+            ok = ok and all(loaded.fraction(i, j) == membership.fraction(i, j)
+                            for i in range(m) for j in range(n))
+            info = stored.param_info()
+            ok = ok and all(info[e]['elemanlar'] == E_named[e] and info[e]['toplam_deger'] == i
+                            for i, e in enumerate(E_named))
+        check(f"Sonuç deposu #{trial} (m={m}, n={n}) - yoğun ve seyrek", ok)
+
+# Depo boyut sınırı: en uzun süredir kullanılmayan sonuçlar silinir, yeni yazılan korunur
+with tempfile.TemporaryDirectory() as tmp:
+    membership = exact_membership(build_incidence({"e_1": {"1", "2"}, "e_2": {"2", "3"}}, {"1", "2", "3"}))
+    yollar = [write_result(result_path(f"k{i}", tmp), membership.scores(), ["e_1", "e_2"],
+                           membership=membership) for i in range(4)]
+    for i, yol in enumerate(yollar):
+        os.utime(os.path.join(yol, "meta.json"), (1000 + i, 1000 + i))
+    load_result(yollar[0])  # açılan sonuç en son kullanılan olur
+    boyut = sum(os.path.getsize(os.path.join(kok, f)) for kok, _, fs in os.walk(yollar[1]) for f in fs)
+    silinen = prune_store(tmp, max_bytes=2 * boyut, keep=yollar[1])
+    ok = sorted(silinen) == sorted([yollar[2], yollar[3]])
+    ok = ok and all(is_result(y) for y in yollar[:2]) and prune_store(tmp, max_bytes=2 * boyut) == []
+    ok = ok and prune_store(tmp, max_bytes=0, keep=yollar[0]) == [yollar[1]] and is_result(yollar[0])
+    check("Sonuç deposu - boyut sınırı ve LRU temizliği", ok)
+
+# Paralel mod: blok bölme ve indirgeme seri sonuçla birebir aynı
+for trial in range(5):
+    m = rng.randint(2, 12)
+    n = rng.randint(2, 12)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    ok = True
+    for sparse in (False, True):
+        inc = build_incidence(E_named, U, sparse=sparse)
+        for any_set in (False, True):
+            serial = exact_scores(inc, any_set=any_set)
+            blocked = parallel_exact_scores(inc, workers=1, any_set=any_set, block_rows=2)
+            ok = ok and blocked.to_dict() == serial.to_dict()
+            if __name__ == "__main__":
+                pooled = parallel_exact_scores(inc, workers=3, any_set=any_set, block_rows=1)
+                ok = ok and pooled.to_dict() == serial.to_dict()
+    check(f"Paralel mod #{trial} (m={m}, n={n}) - seri ile aynı", ok)
+
+# İlerleme bildirimi: bloklu hesap sonucu değiştirmez, iptal hesabı durdurur
+for trial in range(5):
+    m = rng.randint(2, 12)
+    n = rng.randint(2, 12)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    ok = True
+    for sparse in (False, True):
+        inc = build_incidence(E_named, U, sparse=sparse)
+        for order in ("cooccurrence", "overlap"):
+            for tile in (None, 3):
+                plan = DeltaPlan(order, None if sparse else tile, {}, "test")
+                seen = []
+                D = delta_matrix(inc, plan=plan, progress=lambda d, t: seen.append((d, t)))
+                expected = delta_matrix(inc, plan=plan)
+                if sparse:
+                    D, expected = D.toarray(), expected.toarray()
+                ok = ok and (D == expected).all() and bool(seen) and seen[-1][0] == seen[-1][1]
+        for any_set in (False, True):
+            seen = []
+            scores = exact_scores(inc, any_set=any_set, progress=lambda d, t: seen.append(d))
+            ok = ok and scores.to_dict() == exact_scores(inc, any_set=any_set).to_dict()
+        ok = ok and exact_membership(inc, progress=lambda d, t: None).scores().to_dict() \
+            == exact_membership(inc).scores().to_dict()
+
+    runner = JobRunner(max_workers=1)
+    devam = threading.Event()
+    def skorla(progress):
+        devam.wait(5)
+        return exact_membership(build_incidence(E_named, U), progress=progress).scores()
+    job = runner.submit("k", skorla)
+    ok = ok and runner.submit("k", None) is job  # aynı anahtar çalışan işe bağlanır
+    devam.set()
+    ok = ok and job.result().to_dict() == exact_membership(build_incidence(E_named, U)).scores().to_dict()
+    # Biten iş listeden kendiliğinden çıkar (geri çağrı sonuçtan hemen sonra çalışır)
+    for _ in range(100):
+        if runner.get("k") is None:
+            break
+        time.sleep(0.01)
+    ok = ok and runner.get("k") is None and len(runner) == 0
+
+    def iptal_edilen(progress):
+        runner.cancel("iptal")
+        progress(1, m)
+    job = runner.submit("iptal", iptal_edilen)
+    try:
+        job.result()
+        ok = False
+    except JobCancelled:
+        ok = ok and runner.get("iptal") is None
+
+    # Paylaşılan iş: yalnızca son abone ayrılınca iptal edilir
+    baslat, bitir = threading.Event(), threading.Event()
+    def paylasilan(progress):
+        baslat.set()
+        bitir.wait(5)
+        progress(1, 1)
+        return "bitti"
+    job = runner.submit("ortak", paylasilan, "oturum_a")
+    ok = ok and runner.submit("ortak", None, "oturum_b") is job
+    ok = ok and runner.submit("ortak", None, "oturum_a") is job and job.subscribers == {"oturum_a", "oturum_b"}
+    baslat.wait(5)
+    ok = ok and not runner.detach("ortak", "oturum_a") and not job.cancelled and runner.get("ortak") is job
+    ok = ok and runner.detach("ortak", "oturum_b") and job.cancelled and runner.get("ortak") is None
+    bitir.set()
+    try:
+        job.result()
+        ok = False
+    except JobCancelled:
+        pass
+    runner.shutdown()
+    check(f"İlerleme ve iptal #{trial} (m={m}, n={n})", ok)
+
+# Grafik özetleri: blok max/ortalama, tembel dilim ve dağılımlar
+for trial in range(5):
+    m = rng.randint(2, 15)
+    n = rng.randint(2, 15)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    ok = True
+    for sparse in (False, True):
+        em = exact_membership(build_incidence(E_named, U, sparse=sparse))
+        full = em.float_matrix()
+        rows = rng.sample(range(m), rng.randint(1, m))
+        cols = rng.sample(range(n), rng.randint(1, n))
+        ok = ok and np.array_equal(em.float_block(rows, cols), full[np.ix_(rows, cols)])
+        for how in ("max", "mean"):
+            max_rows, max_cols = rng.randint(1, m), rng.randint(1, n)
+            ozet, r_edges, c_edges = downsample(full, max_rows, max_cols, how=how)
+            reduce = np.max if how == "max" else np.mean
+            naive = np.array([[reduce(full[r0:r1, c0:c1]) for c0, c1 in zip(c_edges[:-1], c_edges[1:])]
+                              for r0, r1 in zip(r_edges[:-1], r_edges[1:])])
+            ok = ok and ozet.shape[0] <= max_rows and ozet.shape[1] <= max_cols and np.allclose(ozet, naive)
+            lazy, _, _ = downsample_membership(em, np.arange(m), np.arange(n), max_rows, max_cols, how=how)
+            ok = ok and np.allclose(lazy, ozet)
+    values = np.array([rng.random() * 5 for _ in range(n)] + [50.0])
+    counts, centers, width = histogram(values, bins=7)
+    ok = ok and counts.sum() == len(values) and len(centers) == 7
+    stats = box_stats(values, max_outliers=1)
+    ok = ok and np.isclose(stats['median'], np.median(values)) and 50.0 in stats['outliers'] \
+        and len(stats['outliers']) == 1 and stats['upperfence'] < 50.0
+    check(f"Grafik özetleri #{trial} (m={m}, n={n})", ok)
+
+# Sayfalı tablolar: sayfalar tabloyu bölüşür, tam tablo satır satır kurulanla aynı
+for trial in range(5):
+    m = rng.randint(2, 10)
+    n = rng.randint(2, 40)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    exact = exact_scores(build_incidence(E_named, U))
+    order = exact.ranking()
+    size = rng.randint(1, 10)
+    pages = [order[page_slice(n, p, size)] for p in range(page_count(n, size))]
+    ok = np.array_equal(np.concatenate(pages), order) and all(len(p) <= size for p in pages)
+    values = exact.to_float()
+    best = set(exact.best().tolist())
+    expected = pd.DataFrame([{
+        'Sıra': i, 'Eleman': exact.elements[j], 'Skor (Kesir)': str(exact.fraction(j)),
+        'Skor (Ondalık)': round(float(values[j]), 4), 'Durum': '⭐ EN İYİ' if j in best else ''
+    } for i, j in enumerate(order, 1)])
+    table = score_table(exact, order, with_fractions=True)
+    ok = ok and table.astype(str).equals(expected.astype(str))
+    query = str(rng.randint(1, n))
+    ok = ok and filter_labels(order, exact.elements, query).tolist() == \
+        [j for j in order if query in exact.elements[j]]
+    ok = ok and filter_range(order, values, low=values.mean()).tolist() == \
+        [j for j in order if values[j] >= values.mean()]
+    check(f"Sayfalı tablo #{trial} (m={m}, n={n})", ok)
+
+# Matris CSV'si satır blokları hâlinde: tam DataFrame'in CSV'siyle aynı (SUM satırı dahil)
+membership = exact_membership(build_incidence(E_named, U))
+rows, cols = membership.incidence.param_order(), membership.incidence.element_order()
+sums = exact.to_float()[cols]
+blok_sinir, rmvc_table.MATRIX_CSV_BLOCK_CELLS = rmvc_table.MATRIX_CSV_BLOCK_CELLS, 7
+out = StringIO()
+write_matrix_csv(out, membership, rows, cols, sums=sums)
+rmvc_table.MATRIX_CSV_BLOCK_CELLS = blok_sinir
+tam = membership.to_dataframe(rows, cols)
+expected = pd.concat([tam, pd.DataFrame([sums], columns=tam.columns,
+                                   index=pd.Index(['SUM s(x)'], name='SETS'))]).to_csv()
+check("Matris CSV'si (satır blokları)", out.getvalue() == expected)
+
+# Dizi tabanlı üyelik matrisi: sözlük görünümü ve DataFrame referansla aynı
+for trial in range(5):
+    m = rng.randint(2, 10)
+    n = rng.randint(2, 10)
+    U = {str(i) for i in range(1, n + 1)}
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    expected = create_membership_matrix(E_named, U)
+    ok = True
+    for sparse in (False, True):
+        em = exact_membership(build_incidence(E_named, U, sparse=sparse))
+        ok = ok and em == expected and len(em) == m and all(
+            dict(em[e_i]) == expected[e_i] and em[e_i].get(u) == expected[e_i][u]
+            for e_i in E_named for u in U)
+        u = rng.choice(sorted(U))
+        ok = ok and np.allclose(em.column(u), [float(expected[e_i][u]) for e_i in em])
+        ok = ok and np.allclose(em.row("e_1"), [float(expected["e_1"][v]) for v in em.incidence.elements])
+        df = em.to_dataframe()
+        ok = ok and list(df.index) == list(em) and list(df.columns) == em.incidence.elements
+        ok = ok and np.array_equal(df.to_numpy(), em.float_matrix())
+    with tempfile.TemporaryDirectory() as tmp:
+        inc = build_incidence(E_named, U)
+        em = exact_membership(inc)
+        path = write_result(os.path.join(tmp, "r.rmvcr"), em.scores(), inc.param_keys,
+                            param_names=[k.upper() for k in inc.param_keys], membership=em)
+        stored = load_result(path).membership()
+        ok = ok and stored == expected and stored.info.incidence is stored.incidence
+        ok = ok and all(stored.info[e]['orijinal_ad'] == e.upper() for e in E_named)
+    check(f"Üyelik matrisi görünümü #{trial} (m={m}, n={n})", ok)
+
+# Doğal sıralama: permütasyonlar etiket sıralamasıyla aynı, karışık etiketlerde hata yok
+for trial in range(5):
+    m = rng.randint(2, 12)
+    n = rng.randint(2, 15)
+    labels = [str(i) for i in range(1, n + 1)] + ["b", "a"][:trial % 3]
+    rng.shuffle(labels)
+    U = set(labels)
+    E_named = {f"e_{i+1}": {u for u in U if rng.random() < 0.4} for i in range(m)}
+    keys = list(E_named)
+    rng.shuffle(keys)
+    inc = build_incidence({k: E_named[k] for k in keys}, U, elements=labels, sparse=trial % 2 == 1)
+    natural = sorted(labels, key=element_sort_key)
+    ok = [inc.elements[j] for j in inc.element_order()] == natural
+    ok = ok and [inc.param_keys[i] for i in inc.param_order()] == sorted(keys, key=param_sort_key)
+    ok = ok and [natural.index(u) for u in inc.elements] == inc.element_ranks().tolist()
+    ok = ok and natural_elements(SoftSetView(inc), U) == natural == natural_elements(E_named, U)
+    ordered = inc.natural_columns()
+    ok = ok and ordered.elements == natural and ordered.element_order().tolist() == list(range(len(U)))
+    ok = ok and ordered.to_soft_set() == E_named and ordered.natural_columns() is ordered
+    ok = ok and sorted(["e_10", "x", "e_2", 7], key=param_sort_key) == ["e_2", 7, "e_10", "x"]
+    check(f"Doğal sıralama #{trial} (m={m}, n={len(U)})", ok)
+
+# Toplu çalıştırma: çıktılar seri hesapla aynı, hatalar kayda yazılır, değişmeyenler atlanır
+with tempfile.TemporaryDirectory() as tmp:
+    girdiler = os.path.join(tmp, "girdiler")
+    os.makedirs(girdiler)
+    beklenen = {}
+    for f in range(3):
+        m, n = rng.randint(2, 8), rng.randint(2, 12)
+        table = pd.DataFrame([[rng.randint(0, 1) * rng.randint(1, 9) for _ in range(m)] for _ in range(n)],
+                             index=[f"r{j}" for j in range(n)], columns=[f"c{i}" for i in range(m)])
+        table.iloc[0] = 1  # en az iki boş olmayan küme
+        path = os.path.join(girdiler, f"bolge{f}.csv")
+        table.to_csv(path)
+        mask = table.to_numpy().T > 0
+        keep = np.flatnonzero(mask.any(axis=1))
+        inc = incidence_from_mask(mask[keep], [f"e_{i+1}" for i in keep], list(table.index))
+        beklenen[path] = exact_scores(inc, any_set=True)
+    with open(os.path.join(girdiler, "bozuk.csv"), "w") as f:
+        f.write("id,c1\nx,1\n")
+    paths = collect_inputs(os.path.join(girdiler, "*.csv"))
+    out = os.path.join(tmp, "cikti")
+    records = run_batch(paths, out, workers=2)
+    ok = [r["status"] for r in records] == ["ok" if p in beklenen else "error" for p in paths]
+    for r in records:
+        if r["status"] == "ok":
+            sc = pd.read_csv(r["outputs"]["scores"], dtype={'element': str})
+            exact = beklenen[r["input"]]
+            ref = exact.to_dict()
+            ok = ok and all(Fraction(fr) == ref[u] for u, fr in zip(sc['element'], sc['fraction']))
+            ok = ok and list(sc['element']) == [exact.elements[j] for j in exact.ranking()]
+    summary = pd.read_csv(os.path.join(out, "summary.csv"))
+    ok = ok and list(summary['status']) == [r["status"] for r in records]
+    ilk = paths[1]
+    with open(ilk, "a") as f:
+        f.write("r_yeni," + ",".join("1" for _ in range(len(pd.read_csv(ilk).columns) - 1)) + "\n")
+    records = run_batch(paths, out, workers=1)
+    ok = ok and [r["status"] for r in records] == [
+        "error" if p not in beklenen else "ok" if p == ilk else "skipped" for p in paths]
+    ok = ok and all(r["best"] for r in records if r["status"] == "skipped")
+    check("Toplu çalıştırma", ok)
+
+# Sentetik üreteç ve ölçekleme testi: tekrarlanabilir tablo, motorlar tutarlı, gerileme yakalanır
+table = synthetic_table(20, 60, density=0.1, skew=1.5, empty_share=0.25, seed=7)
+ok = table.shape == (60, 20) and table.equals(synthetic_table(20, 60, density=0.1, skew=1.5,
+                                                              empty_share=0.25, seed=7))
+ok = ok and int(((table > 0).sum(axis=0) == 0).sum()) == 5 and (table.to_numpy() >= 0).all()
+report = run_benchmark(sizes=[(8, 30), (12, 60)], density=0.2, empty_share=0.1, repeat=1)
+ok = ok and all(r["consistent"] and set(r["stages"]) == set(BENCH_STAGES) for r in report["results"])
+slower = {"meta": report["meta"], "results": [
+    dict(r, stages={k: {"min": v["min"] * 3 + 0.01, "median": v["median"]} for k, v in r["stages"].items()})
+    for r in report["results"]]}
+diff = compare(report, slower)
+ok = ok and len(diff) == 2 * 3 * len(BENCH_STAGES) and diff["regression"].all()
+ok = ok and not compare(report, report)["regression"].any()
+check("Sentetik veri ve ölçekleme testi", ok)
+
+# Aşama profili: aşamalar ve sayaçlar kaydedilir, önbellekten gelen aşamalar toplama
+# katılmaz, kapalı profil hiçbir şey kaydetmez; ikili kontrol sayısı referans döngüyle aynı
+prof = StageProfiler()
+with prof.stage("okuma", rows=3) as asama:
+    asama.count(cells=6)
+    asama.count(cells=4)
+is_profili = StageProfiler()
+with is_profili.stage("skorlar"):
+    sum(range(1000))
+prof.add_report(is_profili.report(), cached=True)
+rapor = prof.report()
+ok = [s["name"] for s in rapor["stages"]] == ["okuma", "skorlar"]
+ok = ok and rapor["stages"][0]["counters"] == {"rows": 3, "cells": 10} and rapor["stages"][1]["cached"]
+ok = ok and rapor["total_seconds"] == rapor["stages"][0]["seconds"]
+ok = ok and list(report_frame(rapor)["Önbellek"]) == ["", "✓"]
+kapali = StageProfiler(enabled=False)
+with kapali.stage("x") as asama:
+    asama.count(cells=1)
+ok = ok and kapali.report()["stages"] == []
+kumeler = [{'1', '2', '3', '5'}, {'2', '4', '5'}, {'1', '3', '4'}, {'1', '2', '5'}]
+kontrol = sum(1 for ei in kumeler for _ in kumeler for u in ei for v in "12345" if v not in ei)
+ok = ok and reference_pair_checks([len(k) for k in kumeler], 5) == kontrol
+# tracemalloc: izlemeyi açan profil kapatır; izleme aşama içinde başka bir profil
+# tarafından durdurulursa anlık görüntü alınmadan devam edilir
+bellek = StageProfiler(trace_memory=True)
+with bellek.stage("a"):
+    tracemalloc.stop()
+with bellek.stage("b"):
+    pass
+ok = ok and len(bellek.report()["stages"]) == 2 and "tracemalloc" not in bellek.report()
+bellek.close()
+bellek = StageProfiler(trace_memory=True)
+with bellek.stage("c"):
+    [0] * 1000
+ok = ok and tracemalloc.is_tracing() and bellek.report()["tracemalloc"]
+bellek.close()
+ok = ok and not tracemalloc.is_tracing()
+check("Aşama profili", ok)
+
+# Varyantlar: tek geçişteki dört varyant ayrı exact_scores çalıştırmalarıyla birebir aynı
+rng = np.random.default_rng(22)
+ok = True
+for trial in range(12):
+    m, n = int(rng.integers(2, 15)), int(rng.integers(2, 25))
+    mask = rng.random((m, n)) < 0.3
+    mask[rng.random(m) < 0.25] = False
+    keep = np.flatnonzero(mask.any(axis=1))
+    for sparse in (False, True):
+        inc = incidence_from_mask(mask, [f"e_{i+1}" for i in range(m)], [str(j) for j in range(n)], sparse=sparse)
+        inc_dolu = incidence_from_mask(mask[keep], [f"e_{i+1}" for i in keep], [str(j) for j in range(n)],
+                                       sparse=sparse)
+        sonuclar = variant_scores(inc, memory_budget=4096 if trial % 2 else None)
+        for ad, (any_set, bos_haric) in DELTA_VARIANTS.items():
+            ref = exact_scores(inc_dolu if bos_haric else inc, any_set=any_set)
+            ok = ok and sonuclar[ad].to_dict() == ref.to_dict()
+farklar = ranking_diffs(sonuclar)
+ozet = variant_summary(sonuclar)
+ok = ok and len(farklar) == n and list(ozet['Varyant']) == list(DELTA_VARIANTS)
+ok = ok and (farklar['Δ sıra (any_set)'] == farklar['Sıra (any_set)'] - farklar['Sıra (count_all)']).all()
+check("Varyantlar (tek geçiş)", ok)
+
+# Duyarlılık: e_j'nin katkısı çıkarılarak bulunan skorlar e_j'siz exact_scores ile birebir aynı
+# (son deneme: küme boyutları 1..m, paylar Python int)
+rng = np.random.default_rng(23)
+ok = True
+for trial in range(9):
+    if trial < 8:
+        m, n = int(rng.integers(2, 12)), int(rng.integers(2, 25))
+        mask = rng.random((m, n)) < 0.35
+    else:
+        m, n = 40, 60
+        mask = np.zeros((m, n), dtype=bool)
+        for i in range(m):
+            mask[i, rng.choice(n, i + 1, replace=False)] = True
+    for sparse in (False, True):
+        for any_set in (False, True):
+            inc = incidence_from_mask(mask, [f"e_{i+1}" for i in range(m)], [str(j) for j in range(n)],
+                                      sparse=sparse)
+            for R, N_R, payda in _parameter_blocks(inc, any_set, memory_budget=2048 if trial % 2 else None):
+                for k, j in enumerate(R):
+                    keep = [i for i in range(m) if i != j]
+                    ref = exact_scores(incidence_from_mask(mask[keep], [f"e_{i+1}" for i in keep],
+                                                           [str(x) for x in range(n)], sparse=sparse),
+                                       any_set=any_set)
+                    ok = ok and ref.to_dict() == {u: Fraction(int(N_R[k][x]), payda)
+                                                  for x, u in enumerate(inc.elements)}
+full, tablo = leave_one_parameter_out(inc, any_set=True)
+degisir = tablo['Karar değişir'].to_numpy()
+ok = ok and len(tablo) == inc.m and (degisir | (tablo['Kazananın sırası'] == 1)).all()
+ok = ok and (np.diff(degisir.astype(int)) <= 0).all()
+check("Duyarlılık (bir parametre çıkarılınca)", ok)
+
+# Eleman etkisi: v çıkarılınca tam paylar, sıralama ve etki v'siz exact_scores ile aynı
+# (eşit sütunlu / boş sütunlu elemanlarla eşitlikler; son deneme Python int ağırlıklar)
+rng = np.random.default_rng(24)
+ok = True
+for trial in range(7):
+    if trial < 6:
+        m, n = int(rng.integers(1, 9)), int(rng.integers(2, 14))
+        mask = rng.random((m, n)) < 0.4
+        mask[:, 1] = mask[:, 0]
+        mask[:, rng.random(n) < 0.2] = False
+    else:
+        m, n = 30, 40
+        mask = np.zeros((m, n), dtype=bool)
+        for i in range(m):
+            mask[i, rng.choice(n, i % 25 + 1, replace=False)] = True
+    for sparse in (False, True):
+        for any_set in (False, True):
+            inc = incidence_from_mask(mask, [f"e_{i+1}" for i in range(m)], [f"u{j}" for j in range(n)],
+                                      sparse=sparse)
+            durum = _ElementRemoval(inc, any_set=any_set, memory_budget=2048)
+            etki = durum.influence()
+            tam = exact_scores(inc, any_set=any_set).to_dict()
+            yaklasik = durum.approximate(np.arange(n))
+            etiket_sirasi = np.argsort(np.array(inc.elements, dtype=object), kind='stable')
+            etiket_rank = np.empty(n, dtype=np.int64)
+            etiket_rank[etiket_sirasi] = np.arange(n)
+            for v in range(n):
+                keep = [j for j in range(n) if j != v]
+                ref = exact_scores(incidence_from_mask(mask[:, keep], [f"e_{i+1}" for i in range(m)],
+                                                       [f"u{j}" for j in keep], sparse=sparse), any_set=any_set)
+                ok = ok and ref.to_dict() == {inc.elements[j]: Fraction(int(x), durum.denominator)
+                                              for j, x in zip(keep, durum.exact(v, keep))}
+                sira, en_iyi = durum.ranking(v, yaklasik[v], etiket_sirasi, etiket_rank)
+                ok = ok and [inc.elements[j] for j in sira] == [ref.elements[j] for j in ref.ranking()]
+                ok = ok and [inc.elements[j] for j in en_iyi] == [ref.elements[j] for j in ref.best()]
+                ok = ok and Fraction(int(etki.numerators[v]), etki.denominator) == \
+                    sum(tam[u] - s for u, s in ref.to_dict().items())
+_, tablo = leave_one_element_out(inc, memory_budget=2048)
+ok = ok and len(tablo) == n and (np.diff(tablo['Etki'].to_numpy()) <= 1e-12).all()
+check("Eleman etkisi (bir eleman çıkarılınca)", ok)
+
+# Eşik taraması: her eşiğin skorları eşikle ikilileştirilmiş maskenin exact_scores sonucuyla
+# birebir aynı (toplu güncelleme ve scipy'siz yeniden hesaplama yolu; eşit değerli hücreler)
+rng = np.random.default_rng(25)
+ok = True
+for trial in range(8):
+    m, n = int(rng.integers(1, 9)), int(rng.integers(2, 15))
+    degerler = rng.integers(-1, 6, (m, n)).astype(float)
+    degerler[rng.random((m, n)) < 0.1] = np.nan
+    kantil = trial % 2 == 1
+    esikler = [0, 0.25, 0.5, 1] if kantil else [3, 0, 1, 2, 5]
+    satir, sutun, anahtar = cell_keys(degerler, per_parameter=kantil)
+    for any_set in (False, True):
+        for bos_haric in (False, True):
+            for yol in (rmvc_threshold.sp, None):
+                onceki, rmvc_threshold.sp = rmvc_threshold.sp, yol
+                adimlar = threshold_sweep(degerler, esikler, per_parameter=kantil, any_set=any_set,
+                                          drop_empty=bos_haric)
+                rmvc_threshold.sp = onceki
+                ok = ok and [a.threshold for a in adimlar] == sorted(esikler)
+                for a in adimlar:
+                    mask = np.zeros((m, n), dtype=bool)
+                    kalan = anahtar >= a.threshold if kantil else anahtar > a.threshold
+                    mask[satir[kalan], sutun[kalan]] = True
+                    if not kantil:
+                        ok = ok and (mask == (np.nan_to_num(degerler, nan=0) > a.threshold)).all()
+                    keep = np.flatnonzero(mask.any(axis=1)) if bos_haric else np.arange(m)
+                    ref = exact_scores(incidence_from_mask(mask[keep], [f"e_{i+1}" for i in keep],
+                                                           list(range(n))), any_set=any_set)
+                    ok = ok and a.scores.to_dict() == ref.to_dict() and a.cells == int(mask.sum())
+ok = ok and np.allclose(cell_keys(np.array([[4., 0, 4, 1, 2]]), per_parameter=True)[2], [0.5, 0.5, 0, 0.25])
+ozet, tablo = sweep_summary(adimlar), rank_stability(adimlar)
+ok = ok and ozet['Spearman ρ (ilk)'].iloc[0] == 1.0 and len(tablo) == n
+ok = ok and (tablo['Sıra aralığı'] == tablo['En kötü sıra'] - tablo['En iyi sıra']).all()
+check("Eşik taraması (tek geçiş)", ok)
+
+print()
+if all_pass:
+    print('🎉 TÜM MOTORLAR REFERANS İLE UYUŞUYOR!')
+else:
+    print('⚠️ Bazı sonuçlar uyuşmuyor')
+    sys.exit(1)